@@ -4,11 +4,15 @@ Exception Handlers - カスタム例外ハンドラー
 アプリケーション固有の例外を適切なHTTPレスポンスに変換します。
 """
 
+from typing import Any, Dict
+
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
 
 from app.core.logging import get_logger
 from app.models.exceptions import (
+    InvalidQueryError,
+    JockeyDataException,
     JockeyNotFoundError,
     PickleDeserializeError,
     S3AccessError,
@@ -18,6 +22,43 @@ from app.models.exceptions import (
 logger = get_logger(__name__)
 
 
+def jockey_error_content(exc: JockeyDataException) -> Dict[str, Any]:
+    """
+    騎手ごとの取得エラーを一括取得レスポンスのエラー内容に変換
+
+    各例外ハンドラーと同じステータスコード・メッセージを使用します。
+
+    Args:
+        exc: JockeyDataException例外
+
+    Returns:
+        status・error・message を含む辞書
+    """
+    if isinstance(exc, JockeyNotFoundError):
+        return {
+            "status": status.HTTP_404_NOT_FOUND,
+            "error": "Not Found",
+            "message": f"Jockey with ID '{exc.jockey_id}' not found",
+        }
+    if isinstance(exc, InvalidQueryError):
+        return {
+            "status": status.HTTP_400_BAD_REQUEST,
+            "error": "Bad Request",
+            "message": exc.message,
+        }
+    if isinstance(exc, S3AccessError):
+        return {
+            "status": status.HTTP_500_INTERNAL_SERVER_ERROR,
+            "error": "Internal Server Error",
+            "message": "Failed to access S3 storage. Please try again later.",
+        }
+    return {
+        "status": status.HTTP_500_INTERNAL_SERVER_ERROR,
+        "error": "Internal Server Error",
+        "message": "Failed to process jockey data. Please try again later.",
+    }
+
+
 async def jockey_not_found_handler(
     request: Request, exc: JockeyNotFoundError
 ) -> JSONResponse:
@@ -50,6 +91,37 @@ async def jockey_not_found_handler(
     )
 
 
+async def invalid_query_handler(
+    request: Request, exc: InvalidQueryError
+) -> JSONResponse:
+    """
+    InvalidQueryError を 400 Bad Request レスポンスに変換
+
+    Args:
+        request: HTTPリクエスト
+        exc: InvalidQueryError例外
+
+    Returns:
+        400 HTTPレスポンス
+    """
+    logger.warning(
+        "Invalid query",
+        extra={
+            "error": exc.message,
+            "path": request.url.path,
+            "method": request.method,
+        }
+    )
+
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={
+            "error": "Bad Request",
+            "message": exc.message,
+        }
+    )
+
+
 async def s3_access_error_handler(
     request: Request, exc: S3AccessError
 ) -> JSONResponse:
@@ -2,46 +2,396 @@
 Jockey API Router - 騎手データ取得エンドポイント
 
 騎手IDに基づいてレースデータを取得するAPIエンドポイントを提供します。
+
+レスポンスの生成方式は環境変数JOCKEY_RESPONSE_MODEで切り替えます。
+
+- raw（デフォルト）: 列単位でエンコードしたJSONバイト列（キャッシュ対象）を
+  そのままResponseとして返却
+- model: レコードリストをresponse_modelと同じ方法（pydanticによる検証・JSON互換への変換）で
+  スレッドプール上でエンコードして返却（大きなレコードリストでイベントループを止めないため）
+- stream: DataFrameをJOCKEY_STREAM_BATCH_ROWS行ごとにエンコードし、
+  StreamingResponseとしてチャンク転送（Lambda Function URLのRESPONSE_STREAM向け）
+
+いずれの方式でもレスポンスボディはバイト単位で一致します。
+
+クエリパラメータで返却する列（fields）・日付範囲（from / to）・
+等価条件（filter）を指定できます。条件はJSONエンコードの前に適用され、
+Feather・Parquet形式では必要な列のみがデコードされます。
+
+limit（・cursor）を指定すると、日付・レース番号の降順にlimit行ずつ返却し、
+次ページのカーソルをX-Next-Cursorヘッダーで返します。
+
+レスポンスには取得元S3オブジェクトのETag・Last-Modifiedと、環境変数
+JOCKEY_CACHE_CONTROLのCache-Controlヘッダーを付与します。If-None-Matchが
+最新のETagに一致する場合は、JSONのデコード・エンコードを行わずに304を返します。
+
+POST /api/jockeys:batch は複数の騎手データを並行して取得し、
+1つのJSONオブジェクトとして返却します。
+
+S3へのアクセス方式は環境変数JOCKEY_S3_ACCESS_MODEで切り替えます。
+
+- sync（デフォルト）: boto3による同期アクセスをスレッドプールで実行
+- async: aiobotocoreによる非同期アクセスをイベントループ上で実行
+  （スレッドプールのスロットを消費せずに多数のS3リクエストを同時に実行できます）
+
+コールドスタートを短縮するため、pandas・boto3に依存するサービス層のモジュールは
+モジュールの読み込み時ではなく、最初のリクエスト（または起動後のプリロード）で読み込みます。
 """
 
-from typing import Any, List
+from datetime import date, timezone
+from email.utils import format_datetime
+from typing import TYPE_CHECKING, Annotated, Any, Dict, List, Optional
 
-from fastapi import APIRouter, Path
+from fastapi import APIRouter, Header, Path, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import TypeAdapter
 
+from app.api.exception_handlers import jockey_error_content
+from app.core.config import get_env_int, get_env_str
 from app.core.logging import get_logger
-from app.services.jockey_service import JockeyService
+from app.core.timing import STAGE_RESPONSE, stage
+from app.infrastructure.dependencies import get_hit_counter
+from app.models.batch import BatchItem, JockeyBatchRequest
+from app.models.page import JockeyPage, ObjectVersion
+from app.models.query import JockeyQuery, parse_jockey_query
+
+if TYPE_CHECKING:
+    from app.services.jockey_service import JockeyService
 
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/api", tags=["jockey"])
 
+RESPONSE_MODE_MODEL = "model"
+RESPONSE_MODE_RAW = "raw"
+RESPONSE_MODE_STREAM = "stream"
+RESPONSE_MODES = (RESPONSE_MODE_MODEL, RESPONSE_MODE_RAW, RESPONSE_MODE_STREAM)
+
+DEFAULT_STREAM_BATCH_ROWS = 500
+
+S3_ACCESS_MODE_SYNC = "sync"
+S3_ACCESS_MODE_ASYNC = "async"
+S3_ACCESS_MODES = (S3_ACCESS_MODE_SYNC, S3_ACCESS_MODE_ASYNC)
+
+# 次ページのカーソルを返すレスポンスヘッダー
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# modelモードのレスポンスの型（response_modelと同じ）
+JockeyRecords = List[dict[str, Any]]
+_records_adapter: TypeAdapter[JockeyRecords] = TypeAdapter(JockeyRecords)
+
+# 騎手データのレスポンスのCache-Control（キャッシュを許可し、利用時は毎回再検証させる）
+DEFAULT_CACHE_CONTROL = "public, no-cache"
+
+# 単体取得・一括取得で共通の列選択・行フィルタのクエリパラメータ
+FieldsQuery = Annotated[
+    Optional[str], Query(description="返却する列名のカンマ区切り（例: 日付,開催,着 順）")
+]
+DateFromQuery = Annotated[
+    Optional[date], Query(alias="from", description="日付の下限（YYYY-MM-DD、この日を含む）")
+]
+DateToQuery = Annotated[
+    Optional[date], Query(alias="to", description="日付の上限（YYYY-MM-DD、この日を含む）")
+]
+FiltersQuery = Annotated[
+    Optional[List[str]],
+    Query(alias="filter", description="等価条件「列名:値」（例: 開催:船橋、複数指定可）"),
+]
+
+
+def get_response_mode() -> str:
+    """
+    レスポンス生成方式を取得
+
+    Returns:
+        "raw"・"model"・"stream" のいずれか（不明な値の場合は "raw"）
+    """
+    mode = get_env_str("JOCKEY_RESPONSE_MODE", RESPONSE_MODE_RAW).lower()
+    if mode not in RESPONSE_MODES:
+        return RESPONSE_MODE_RAW
+    return mode
+
+
+def get_s3_access_mode() -> str:
+    """
+    S3へのアクセス方式を取得
+
+    Returns:
+        "sync" または "async"（不明な値の場合、aiobotocoreが
+        インストールされていない場合は "sync"）
+    """
+    from app.infrastructure.s3_accessor import is_async_available
+
+    mode = get_env_str("JOCKEY_S3_ACCESS_MODE", S3_ACCESS_MODE_SYNC).lower()
+    if mode not in S3_ACCESS_MODES:
+        return S3_ACCESS_MODE_SYNC
+    if mode == S3_ACCESS_MODE_ASYNC and not is_async_available():
+        logger.warning("aiobotocore is not installed; falling back to sync S3 access")
+        return S3_ACCESS_MODE_SYNC
+    return mode
+
+
+def _create_service() -> "JockeyService":
+    """
+    JockeyServiceを生成
+
+    サービス層のモジュール（pandas・boto3）は初回の呼び出し時に読み込みます。
+    初回はSSM Parameter Storeへのアクセスも発生するため、スレッドから呼び出してください。
+    """
+    from app.services.jockey_service import JockeyService
+
+    return JockeyService()
+
+
+async def _get_page(
+    service: "JockeyService", jockey_id: str, query: JockeyQuery, use_async: bool
+) -> JockeyPage:
+    """アクセス方式に応じて条件を適用済みのDataFrameを取得"""
+    if use_async:
+        return await service.get_jockey_page_async(jockey_id, query)
+    return await run_in_threadpool(service.get_jockey_page, jockey_id, query)
+
 
-@router.get("/jockey/{jockey_id}", response_model=List[dict[str, Any]])
-def get_jockey_data(
-    jockey_id: str = Path(..., description="騎手ID（例: 05339）")
-) -> List[dict[str, Any]]:
+def _model_response(service: "JockeyService", page: JockeyPage, jockey_id: str) -> JSONResponse:
+    """
+    modelモードのレスポンスを生成（スレッドプールから呼び出す）
+
+    レコードへの変換からJSONへのエンコードまでをイベントループの外で行います。
+    """
+    records = service.dataframe_to_json(page.data, jockey_id)
+    with stage(STAGE_RESPONSE):
+        # FastAPIのresponse_modelと同様に検証し、JSON互換の値（NaN → null など）に変換する
+        content = _records_adapter.dump_python(
+            _records_adapter.validate_python(records), mode="json"
+        )
+        response = JSONResponse(
+            content,
+            headers={**_cursor_headers(page.next_cursor), **_validator_headers(page.version)},
+        )
+    logger.info(
+        "API request completed",
+        extra={"jockey_id": jockey_id, "record_count": len(records)}
+    )
+    return response
+
+
+def _cursor_headers(next_cursor: Optional[str]) -> Dict[str, str]:
+    """次ページのカーソルを返すレスポンスヘッダーを生成"""
+    return {NEXT_CURSOR_HEADER: next_cursor} if next_cursor is not None else {}
+
+
+def _parse_if_none_match(value: Optional[str]) -> List[str]:
+    """If-None-MatchヘッダーをETagのリストに分割（弱いETagの "W/" は除去して比較する）"""
+    if not value:
+        return []
+    etags = []
+    for part in value.split(","):
+        etag = part.strip()
+        if etag.startswith("W/"):
+            etag = etag[2:]
+        if etag:
+            etags.append(etag)
+    return etags
+
+
+def _validator_headers(version: ObjectVersion) -> Dict[str, str]:
+    """取得元オブジェクトのバージョン情報からキャッシュ関連のレスポンスヘッダーを生成"""
+    headers = {"Cache-Control": get_env_str("JOCKEY_CACHE_CONTROL", DEFAULT_CACHE_CONTROL)}
+    if version.etag is not None:
+        headers["ETag"] = version.etag
+    if version.last_modified is not None:
+        headers["Last-Modified"] = format_datetime(
+            version.last_modified.astimezone(timezone.utc), usegmt=True
+        )
+    return headers
+
+
+def _not_modified_response(version: ObjectVersion, etags: List[str]) -> Optional[Response]:
+    """ETagがIf-None-Matchに一致する場合は304レスポンスを生成"""
+    if version.etag is None or version.etag not in etags:
+        return None
+    return Response(status_code=304, headers=_validator_headers(version))
+
+
+@router.get("/jockey/{jockey_id}", response_model=JockeyRecords)
+async def get_jockey_data(
+    jockey_id: str = Path(..., description="騎手ID（例: 05339）"),
+    fields: FieldsQuery = None,
+    date_from: DateFromQuery = None,
+    date_to: DateToQuery = None,
+    filters: FiltersQuery = None,
+    limit: Annotated[
+        Optional[int], Query(description="1ページあたりの行数（指定時は日付の降順でページ分割）")
+    ] = None,
+    cursor: Annotated[
+        Optional[str], Query(description="前ページのX-Next-Cursorヘッダーの値")
+    ] = None,
+    if_none_match: Annotated[
+        Optional[str], Header(description="前回のレスポンスのETagヘッダーの値")
+    ] = None,
+) -> Response:
     """
     騎手IDに基づいてレースデータを取得
 
     Args:
         jockey_id: 騎手ID
+        fields: 返却する列名のカンマ区切り
+        date_from: 日付の下限
+        date_to: 日付の上限
+        filters: "列名:値" 形式の等価条件のリスト
+        limit: 1ページあたりの行数
+        cursor: 次ページのカーソル
+        if_none_match: クライアントが保持するレスポンスのETag
 
     Returns:
-        レースデータのJSONリスト
+        レースデータのJSONリスト（次ページが存在する場合はX-Next-Cursorヘッダー付き）。
+        If-None-Matchが最新のETagに一致する場合はボディなしの304
 
     Raises:
         HTTPException: データ取得エラー時
+            - 400: クエリパラメータが不正な場合
             - 404: 騎手データが見つからない場合
             - 500: S3接続エラーまたはデータ処理エラー
             - 503: SSM設定取得エラー
     """
     logger.info("API request received", extra={"jockey_id": jockey_id})
 
-    service = JockeyService()
-    result = service.get_jockey_data(jockey_id)
+    query = parse_jockey_query(fields, date_from, date_to, filters, limit, cursor)
+    result = await _jockey_data_response(jockey_id, query, if_none_match)
+    # 存在しない騎手IDでリクエスト数の集計が増え続けないよう、取得に成功した場合のみ記録する
+    get_hit_counter().record(jockey_id)
+    return result
+
+
+async def _jockey_data_response(
+    jockey_id: str, query: JockeyQuery, if_none_match: Optional[str]
+) -> Response:
+    """
+    レスポンス生成方式・S3へのアクセス方式に応じて騎手データのレスポンスを生成
+
+    Args:
+        jockey_id: 騎手ID
+        query: 取得条件
+        if_none_match: クライアントが保持するレスポンスのETag
+
+    Returns:
+        JSONResponse（modelモード）・Response・StreamingResponse、またはボディなしの304
+    """
+    use_async = get_s3_access_mode() == S3_ACCESS_MODE_ASYNC
+    # 初回はSSM Parameter Storeへのアクセスが発生するためスレッドで初期化する
+    service = await run_in_threadpool(_create_service)
+    response_mode = get_response_mode()
+
+    etags = _parse_if_none_match(if_none_match)
+    if etags:
+        # キャッシュ済みのバージョン情報（またはS3の条件付き取得）のみで判定する
+        if use_async:
+            version = await service.check_not_modified_async(jockey_id, query, etags)
+        else:
+            version = await run_in_threadpool(service.check_not_modified, jockey_id, query, etags)
+        if version is not None:
+            logger.info("API request not modified", extra={"jockey_id": jockey_id})
+            return Response(status_code=304, headers=_validator_headers(version))
+
+    if response_mode == RESPONSE_MODE_STREAM:
+        page = await _get_page(service, jockey_id, query, use_async)
+        not_modified = _not_modified_response(page.version, etags)
+        if not_modified is not None:
+            return not_modified
+        chunks = service.stream_dataframe_json(
+            page.data,
+            jockey_id,
+            batch_rows=get_env_int("JOCKEY_STREAM_BATCH_ROWS", DEFAULT_STREAM_BATCH_ROWS),
+        )
+        logger.info("API request streaming started", extra={"jockey_id": jockey_id})
+        return StreamingResponse(
+            chunks,
+            media_type="application/json",
+            headers={**_cursor_headers(page.next_cursor), **_validator_headers(page.version)},
+        )
+
+    if response_mode == RESPONSE_MODE_RAW:
+        if use_async:
+            encoded = await service.get_jockey_page_json_async(jockey_id, query)
+        else:
+            encoded = await run_in_threadpool(service.get_jockey_page_json, jockey_id, query)
+        not_modified = _not_modified_response(encoded.version, etags)
+        if not_modified is not None:
+            return not_modified
+        logger.info(
+            "API request completed",
+            extra={"jockey_id": jockey_id, "size": len(encoded.body)}
+        )
+        return Response(
+            content=encoded.body,
+            media_type="application/json",
+            headers={**_cursor_headers(encoded.next_cursor), **_validator_headers(encoded.version)},
+        )
+
+    page = await _get_page(service, jockey_id, query, use_async)
+    not_modified = _not_modified_response(page.version, etags)
+    if not_modified is not None:
+        return not_modified
+    return await run_in_threadpool(_model_response, service, page, jockey_id)
+
+
+@router.post("/jockeys:batch")
+async def get_jockeys_batch(
+    request: JockeyBatchRequest,
+    fields: FieldsQuery = None,
+    date_from: DateFromQuery = None,
+    date_to: DateToQuery = None,
+    filters: FiltersQuery = None,
+) -> Response:
+    """
+    複数の騎手IDのレースデータを一括取得
+
+    騎手ごとのS3取得・デシリアライズ・JSON変換をワーカープールで並行に実行し、
+    エンコード済みのJSONをそのまま連結して返却します（JOCKEY_RESPONSE_MODEに
+    関係なく同一の形式）。騎手ごとの失敗はerrorsに含め、他の騎手の結果は返却します。
+
+    Args:
+        request: 騎手IDのリストを含むリクエストボディ
+        fields: 返却する列名のカンマ区切り
+        date_from: 日付の下限
+        date_to: 日付の上限
+        filters: "列名:値" 形式の等価条件のリスト
+
+    Returns:
+        {"results": {騎手ID: [...]}, "errors": {騎手ID: {"status", "error", "message"}}}
+
+    Raises:
+        HTTPException: データ取得エラー時
+            - 400: クエリパラメータが不正な場合
+            - 422: リクエストボディが不正な場合
+            - 503: SSM設定取得エラー
+    """
+    logger.info("Batch API request received", extra={"requested": len(request.ids)})
+
+    query = parse_jockey_query(fields, date_from, date_to, filters)
+    service = await run_in_threadpool(_create_service)
+    items: List[BatchItem]
+    if get_s3_access_mode() == S3_ACCESS_MODE_ASYNC:
+        items = await service.get_jockeys_data_json_async(request.ids, query)
+    else:
+        items = await run_in_threadpool(service.get_jockeys_data_json, request.ids, query)
+
+    results = [(item.jockey_id, item.body) for item in items if item.body is not None]
+    hit_counter = get_hit_counter()
+    for jockey_id, _ in results:
+        hit_counter.record(jockey_id)
+    errors = {
+        item.jockey_id: jockey_error_content(item.error)
+        for item in items
+        if item.error is not None
+    }
+    from app.services.json_encoder import encode_batch_json
+
+    body = encode_batch_json(results, errors)
 
     logger.info(
-        "API request completed",
-        extra={"jockey_id": jockey_id, "record_count": len(result)}
+        "Batch API request completed",
+        extra={"succeeded": len(results), "failed": len(errors), "size": len(body)}
     )
-    return result
+    return Response(content=body, media_type="application/json")
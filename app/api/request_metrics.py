@@ -0,0 +1,70 @@
+"""
+Request Metrics Middleware - ルートごとのリクエストの所要時間のメトリクス
+
+リクエストの受信からレスポンスの送信完了までの所要時間を、ルートのパステンプレート
+（例: "/api/jockey/{jockey_id}"）・メソッド・ステータスごとにメトリクス（app.core.metrics）へ
+記録します。騎手IDなどのパスパラメータをラベルに含めないため、系列の数はルートの数で抑えられます。
+"""
+
+import time
+
+from app.api.server_timing import ASGIApp, Message, Receive, Scope, Send
+from app.core.metrics import observe_request
+
+# どのルートにも一致しなかったリクエストのラベル
+UNMATCHED_ROUTE = "unmatched"
+
+
+def route_label(scope: Scope) -> str:
+    """
+    リクエストが一致したルートのパステンプレートを取得
+
+    Args:
+        scope: ASGIのスコープ（ルーティング後）
+
+    Returns:
+        ルートのパステンプレート（一致しなかった場合は "unmatched"）
+    """
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    return path if isinstance(path, str) else UNMATCHED_ROUTE
+
+
+class RequestMetricsMiddleware:
+    """
+    ルートごとのリクエストの所要時間をメトリクスに記録するASGIミドルウェア
+
+    ストリーミングレスポンスではボディの送信完了までを含みます。
+    アプリケーションが例外を送出した場合はステータス500として記録します。
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        RequestMetricsMiddlewareの初期化
+
+        Args:
+            app: ASGIアプリケーション
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """ASGIのエントリーポイント"""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            observe_request(
+                route_label(scope), scope["method"], status, time.perf_counter() - started
+            )
@@ -0,0 +1,80 @@
+"""
+Server-Timing Middleware - 処理段階ごとの所要時間のレスポンスヘッダー
+
+リクエストごとに処理段階の計測（app.core.timing）を開始し、レスポンスの送信開始時に
+Server-Timingヘッダー（例: "s3;dur=12.3, deserialize;dur=4.5, total;dur=20.1"）を
+付与します。環境変数JOCKEY_STAGE_TIMINGがfalseの場合は計測を行いません。
+"""
+
+import time
+from typing import Any, Awaitable, Callable, MutableMapping
+
+from app.core.config import get_env_bool
+from app.core.timing import (
+    STAGE_TOTAL,
+    end_request_timings,
+    observe_stage,
+    start_request_timings,
+)
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+SERVER_TIMING_HEADER = "Server-Timing"
+
+
+def is_stage_timing_enabled() -> bool:
+    """
+    処理段階の計測が有効かどうか
+
+    Returns:
+        JOCKEY_STAGE_TIMING（デフォルト: true）の値
+    """
+    return get_env_bool("JOCKEY_STAGE_TIMING", True)
+
+
+class ServerTimingMiddleware:
+    """
+    処理段階ごとの所要時間をServer-Timingヘッダーで返却するASGIミドルウェア
+
+    ヘッダーはレスポンスの送信開始時に確定するため、ストリーミングレスポンスの
+    ボディの生成時間は含まれません。
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        ServerTimingMiddlewareの初期化
+
+        Args:
+            app: ASGIアプリケーション
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """ASGIのエントリーポイント"""
+        if scope["type"] != "http" or not is_stage_timing_enabled():
+            await self.app(scope, receive, send)
+            return
+
+        timings, token = start_request_timings()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                total = time.perf_counter() - timings.started
+                observe_stage(STAGE_TOTAL, total)
+                headers = list(message.get("headers", []))
+                headers.append(
+                    (SERVER_TIMING_HEADER.lower().encode("latin-1"),
+                     timings.server_timing(total).encode("latin-1"))
+                )
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            end_request_timings(token)
+
@@ -0,0 +1,332 @@
+"""
+In-Process Cache
+
+エントリ数・合計バイト数・TTLで制限されたスレッドセーフなLRUキャッシュを提供
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+from app.core.logging import get_logger
+from app.core.metrics import record_cache_lookup
+
+logger = get_logger(__name__)
+
+V = TypeVar("V")
+
+
+class _CacheEntry(Generic[V]):
+    """キャッシュエントリ（値・サイズ・有効期限）"""
+
+    __slots__ = ("value", "size", "expires_at")
+
+    def __init__(self, value: V, size: int, expires_at: Optional[float]):
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+
+
+class _InFlightLoad(Generic[V]):
+    """同一キーに対する実行中のロード処理"""
+
+    __slots__ = ("event", "value", "error")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.value: Optional[V] = None
+        self.error: Optional[BaseException] = None
+
+
+class TTLCache(Generic[V]):
+    """
+    TTL付きLRUキャッシュ
+
+    - 最大エントリ数と最大合計バイト数を超えた場合は最も古く使われたエントリから削除
+    - エントリごとにTTLを持ち、期限切れのエントリはミスとして扱う
+    - 同一キーへの同時ミスは1回のロードにまとめる（他の呼び出しは結果を待機）
+    - 期限切れのエントリは再検証関数で検証し、変更がなければ再読み込みせずに有効期限を延長
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: int,
+        ttl_seconds: float,
+        sizeof: Callable[[V], int],
+        name: str = "cache",
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        TTLCacheの初期化
+
+        Args:
+            max_entries: 最大エントリ数（0以下でキャッシュ無効）
+            max_bytes: 最大合計バイト数（0以下で無制限）
+            ttl_seconds: エントリの有効期間（秒、0以下で無期限）
+            sizeof: 値のバイト数を見積もる関数
+            name: ログ出力用のキャッシュ名
+            clock: 単調増加する時刻を返す関数（テスト用に差し替え可能）
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.name = name
+        self._sizeof = sizeof
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, _CacheEntry[V]]" = OrderedDict()
+        self._inflight: Dict[Hashable, _InFlightLoad[V]] = {}
+        self._lock = threading.Lock()
+        self._total_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._revalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        """キャッシュが有効かどうか"""
+        return self.max_entries > 0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """
+        キャッシュから値を取得
+
+        Args:
+            key: キャッシュキー
+
+        Returns:
+            キャッシュされた値（存在しない・期限切れの場合はNone）
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is None:
+                self._misses += 1
+                record_cache_lookup(self.name, False)
+                return None
+            self._hits += 1
+            record_cache_lookup(self.name, True)
+            return entry.value
+
+    def peek(self, key: Hashable) -> Optional[V]:
+        """
+        統計情報とLRU順を更新せずに有効な値を参照
+
+        Args:
+            key: キャッシュキー
+
+        Returns:
+            キャッシュされた値（存在しない・期限切れの場合はNone）
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._is_expired(entry):
+                return None
+            return entry.value
+
+    def get_stale(self, key: Hashable) -> Optional[V]:
+        """
+        期限切れを含めてキャッシュされた値を参照（再検証用）
+
+        統計情報とLRU順は更新しません。期限切れのエントリは次の get で削除されるため、
+        get の前に呼び出してください。
+
+        Args:
+            key: キャッシュキー
+
+        Returns:
+            キャッシュされた値（存在しない場合はNone）
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry.value if entry is not None else None
+
+    def record_revalidation(self) -> None:
+        """期限切れのエントリを再検証して再利用したことを記録"""
+        with self._lock:
+            self._revalidations += 1
+
+    def put(self, key: Hashable, value: V) -> None:
+        """
+        値をキャッシュに格納
+
+        値のサイズが最大合計バイト数を超える場合は格納しません。
+
+        Args:
+            key: キャッシュキー
+            value: 格納する値
+        """
+        if not self.enabled:
+            return
+
+        size = self._sizeof(value)
+        if self.max_bytes > 0 and size > self.max_bytes:
+            logger.warning(
+                "Value too large to cache",
+                extra={"cache": self.name, "key": str(key), "size": size, "max_bytes": self.max_bytes}
+            )
+            return
+
+        expires_at = self._clock() + self.ttl_seconds if self.ttl_seconds > 0 else None
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._total_bytes -= old.size
+            self._entries[key] = _CacheEntry(value, size, expires_at)
+            self._total_bytes += size
+            self._evict_if_needed()
+
+    def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], V],
+        revalidate: Optional[Callable[[V], V]] = None,
+    ) -> V:
+        """
+        キャッシュから値を取得し、存在しなければloaderで読み込んで格納
+
+        同一キーに対する同時ミスでは最初の呼び出しのみがloaderを実行し、
+        他の呼び出しはその結果（または例外）を共有します。
+
+        revalidate を指定した場合、期限切れのエントリはloaderの代わりに
+        revalidate(期限切れの値) で検証します。revalidate が期限切れの値を
+        そのまま返した場合は、再読み込みせずに有効期限を延長したものとして記録します。
+
+        Args:
+            key: キャッシュキー
+            loader: 値を読み込む関数
+            revalidate: 期限切れの値を検証し、格納する値を返す関数（省略時はloaderで再読み込み）
+
+        Returns:
+            キャッシュされた値または読み込んだ値
+
+        Raises:
+            Exception: loaderが送出した例外
+        """
+        if not self.enabled:
+            return loader()
+
+        with self._lock:
+            stale = self._entries.get(key)
+            entry = self._lookup(key)
+            if entry is not None:
+                self._hits += 1
+                record_cache_lookup(self.name, True)
+                return entry.value
+
+            self._misses += 1
+            record_cache_lookup(self.name, False)
+            inflight = self._inflight.get(key)
+            is_leader = inflight is None
+            if inflight is None:
+                inflight = _InFlightLoad()
+                self._inflight[key] = inflight
+
+        if not is_leader:
+            logger.debug("Waiting for in-flight cache load", extra={"cache": self.name, "key": str(key)})
+            inflight.event.wait()
+            if inflight.error is not None:
+                raise inflight.error
+            return inflight.value  # type: ignore[return-value]
+
+        try:
+            if revalidate is not None and stale is not None:
+                value = revalidate(stale.value)
+                if value is stale.value:
+                    self.record_revalidation()
+            else:
+                value = loader()
+            inflight.value = value
+            self.put(key, value)
+            return value
+        except BaseException as e:
+            inflight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            inflight.event.set()
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        指定キーのエントリを削除
+
+        Args:
+            key: キャッシュキー
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._total_bytes -= entry.size
+
+    def clear(self) -> None:
+        """全エントリを削除（統計情報は保持）"""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        キャッシュの統計情報を取得
+
+        Returns:
+            ヒット数・ミス数・削除数・エントリ数・合計バイト数などの辞書
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "name": self.name,
+                "enabled": self.enabled,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "revalidations": self._revalidations,
+                "entries": len(self._entries),
+                "total_bytes": self._total_bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _lookup(self, key: Hashable) -> Optional[_CacheEntry[V]]:
+        """有効なエントリを取得してLRU順を更新（ロック取得済みで呼び出すこと）"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if self._is_expired(entry):
+            del self._entries[key]
+            self._total_bytes -= entry.size
+            self._expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _is_expired(self, entry: _CacheEntry[V]) -> bool:
+        """エントリが期限切れかどうか（ロック取得済みで呼び出すこと）"""
+        return entry.expires_at is not None and entry.expires_at <= self._clock()
+
+    def _evict_if_needed(self) -> None:
+        """上限を超えたエントリをLRU順に削除（ロック取得済みで呼び出すこと）"""
+        while self._entries and (
+            len(self._entries) > self.max_entries
+            or (self.max_bytes > 0 and self._total_bytes > self.max_bytes)
+        ):
+            evicted_key, evicted = self._entries.popitem(last=False)
+            self._total_bytes -= evicted.size
+            self._evictions += 1
+            logger.debug(
+                "Evicted cache entry",
+                extra={"cache": self.name, "key": str(evicted_key), "size": evicted.size}
+            )
@@ -0,0 +1,111 @@
+"""
+Application Configuration
+
+環境変数からアプリケーション設定を読み込むヘルパーを提供
+"""
+
+import os
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_TRUE_VALUES = {"1", "true", "yes", "on"}
+_FALSE_VALUES = {"0", "false", "no", "off"}
+
+
+def get_env_str(name: str, default: str) -> str:
+    """
+    環境変数を文字列として取得
+
+    Args:
+        name: 環境変数名
+        default: 未設定時のデフォルト値
+
+    Returns:
+        環境変数の値
+    """
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    return value.strip()
+
+
+def get_env_int(name: str, default: int) -> int:
+    """
+    環境変数を整数として取得
+
+    不正な値が設定されている場合は警告を出してデフォルト値を使用します。
+
+    Args:
+        name: 環境変数名
+        default: 未設定時のデフォルト値
+
+    Returns:
+        環境変数の値
+    """
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(
+            "Invalid integer environment variable, using default",
+            extra={"variable": name, "value": value, "default": default}
+        )
+        return default
+
+
+def get_env_float(name: str, default: float) -> float:
+    """
+    環境変数を浮動小数点数として取得
+
+    不正な値が設定されている場合は警告を出してデフォルト値を使用します。
+
+    Args:
+        name: 環境変数名
+        default: 未設定時のデフォルト値
+
+    Returns:
+        環境変数の値
+    """
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning(
+            "Invalid float environment variable, using default",
+            extra={"variable": name, "value": value, "default": default}
+        )
+        return default
+
+
+def get_env_bool(name: str, default: bool) -> bool:
+    """
+    環境変数を真偽値として取得
+
+    "1", "true", "yes", "on" を真、"0", "false", "no", "off" を偽として扱います。
+
+    Args:
+        name: 環境変数名
+        default: 未設定時のデフォルト値
+
+    Returns:
+        環境変数の値
+    """
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    normalized = value.strip().lower()
+    if normalized in _TRUE_VALUES:
+        return True
+    if normalized in _FALSE_VALUES:
+        return False
+    logger.warning(
+        "Invalid boolean environment variable, using default",
+        extra={"variable": name, "value": value, "default": default}
+    )
+    return default
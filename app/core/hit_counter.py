@@ -0,0 +1,150 @@
+"""
+Hit Counter - キーごとのリクエスト数の集計
+
+騎手IDごとのリクエスト数を集計し、JSONファイルに永続化します。
+起動時のプリウォームで、リクエスト数の多い騎手を選ぶために使用します。
+"""
+
+import fcntl
+import json
+import os
+import tempfile
+import threading
+from collections import Counter
+from typing import List, Optional
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class HitCounter:
+    """
+    キーごとのリクエスト数を集計するカウンター
+
+    path を指定した場合は、初期化時にファイルから集計済みの値を読み込み、
+    save でファイルに書き出します。複数のワーカープロセスが同じファイルに書き出すため、
+    save ではロックファイル（flock）で排他したうえで、ファイルの値に前回の書き出し以降の
+    増分を加算し、リクエスト数の多い max_keys 件のみを書き出します
+    （一時ファイルへの書き込み後に os.replace で置き換え）。
+    path がNoneの場合は集計を行いません。
+    """
+
+    def __init__(self, path: Optional[str] = None, max_keys: int = 1000):
+        """
+        HitCounterの初期化
+
+        Args:
+            path: 集計結果を永続化するJSONファイルのパス（Noneの場合は無効）
+            max_keys: ファイルに保持するキー数の上限（リクエスト数の多い順）
+        """
+        self.path = path
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        # ファイルの値と前回の書き出し以降の増分の合計（most_common用）
+        self._counts: Counter[str] = Counter()
+        # 前回の書き出し以降の増分（save でファイルの値に加算する）
+        self._pending: Counter[str] = Counter()
+        if path is not None:
+            self._counts.update(self._load(path))
+
+    @property
+    def enabled(self) -> bool:
+        """集計が有効かどうか"""
+        return self.path is not None
+
+    def record(self, key: str) -> None:
+        """
+        リクエストを1件記録
+
+        Args:
+            key: キー（騎手ID）
+        """
+        if self.path is None:
+            return
+        with self._lock:
+            self._counts[key] += 1
+            self._pending[key] += 1
+            if len(self._counts) > 2 * self.max_keys:
+                self._counts = _top(self._counts, self.max_keys)
+
+    def most_common(self, n: int) -> List[str]:
+        """
+        リクエスト数の多い順にキーを取得
+
+        Args:
+            n: 取得する件数
+
+        Returns:
+            キーのリスト
+        """
+        with self._lock:
+            return [key for key, _ in self._counts.most_common(n)]
+
+    def save(self) -> bool:
+        """
+        前回の書き出し以降の増分をファイルの値に加算して書き出し（増分がない場合は何もしない）
+
+        Returns:
+            書き出した場合はTrue
+        """
+        if self.path is None:
+            return False
+        with self._lock:
+            if not self._pending:
+                return False
+            pending = self._pending
+            self._pending = Counter()
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with open(self.path + ".lock", "a") as lock_file:
+                # 他のワーカープロセスの書き出しとの間で読み込みから置き換えまでを排他する
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                merged = _top(self._load(self.path) + pending, self.max_keys)
+                fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        json.dump(dict(merged), f, ensure_ascii=False)
+                    os.replace(temp_path, self.path)
+                except BaseException:
+                    os.unlink(temp_path)
+                    raise
+        except OSError as e:
+            with self._lock:
+                self._pending.update(pending)
+            logger.warning(
+                "Failed to save hit counts",
+                extra={"path": self.path, "error": str(e)}
+            )
+            return False
+
+        with self._lock:
+            # 書き出し中に記録された増分はファイルの値に加えて反映する
+            self._counts = merged + self._pending
+        logger.info("Hit counts saved", extra={"path": self.path, "keys": len(merged)})
+        return True
+
+    def _load(self, path: str) -> "Counter[str]":
+        """ファイルから集計済みの値を読み込み（存在しない・不正な場合は0件）"""
+        try:
+            with open(path, encoding="utf-8") as f:
+                loaded = json.load(f)
+        except FileNotFoundError:
+            return Counter()
+        except (OSError, ValueError) as e:
+            logger.warning("Failed to load hit counts", extra={"path": path, "error": str(e)})
+            return Counter()
+
+        if not isinstance(loaded, dict):
+            logger.warning("Ignoring malformed hit counts file", extra={"path": path})
+            return Counter()
+        return Counter(
+            {str(key): count for key, count in loaded.items() if isinstance(count, int)}
+        )
+
+
+def _top(counts: "Counter[str]", n: int) -> "Counter[str]":
+    """リクエスト数の多い n 件のみを残したCounter"""
+    return Counter(dict(counts.most_common(n)))
@@ -2,23 +2,88 @@
 Logging Configuration
 
 構造化ログとログレベルの設定を提供
+
+キューモード（queue_size を指定）では、リクエストを処理するスレッドはログレコードを
+上限付きのキューに追加するだけで、フォーマットと標準出力への書き込みは
+バックグラウンドのスレッド（QueueListener）で行います。キューが満杯の場合は
+レコードを破棄して件数を数えます。
+
+sample_rates を指定すると、ロガーごとにINFO以下のレコードをN件に1件だけ出力します
+（WARNING以上は常に出力）。
 """
 
+import atexit
+import itertools
+import json
 import logging
+import queue
 import sys
-from typing import Any, Dict
+import threading
+from json.encoder import encode_basestring
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+DEFAULT_LOG_QUEUE_MAX_SIZE = 10000
+
+# LogRecordの標準の属性と各レコードの先頭に出力するフィールド
+# （これ以外の属性は extra で渡されたフィールドとして出力する）
+_RESERVED_FIELDS = frozenset(
+    logging.LogRecord("", logging.NOTSET, "", 0, "", None, None).__dict__
+) | {"message", "asctime", "timestamp", "level", "logger"}
 
 
 class StructuredFormatter(logging.Formatter):
     """
     構造化ログフォーマッター（JSON形式）
 
-    CloudWatch Logsで解析しやすい形式でログを出力
+    CloudWatch Logs Insightsで解析できるよう、1レコードを1行のJSONとして出力します。
+    extra で渡されたフィールドはすべて出力し、JSONに変換できない値は str() で文字列にします。
+
+    ログの出力はリクエストごとに発生するため、タイムスタンプ（秒単位）と
+    レベル・ロガー名のJSON断片をキャッシュし、レコードごとには
+    メッセージと extra のフィールドのみをエンコードします。
     """
 
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None):
+        """
+        StructuredFormatterの初期化
+
+        Args:
+            fmt: フォーマット文字列（logging.Formatterとの互換性のため。出力には使用しない）
+            datefmt: タイムスタンプの書式（Noneの場合は "%Y-%m-%d %H:%M:%S,ミリ秒"）
+        """
+        super().__init__(fmt=fmt, datefmt=datefmt)
+        self._encoder = json.JSONEncoder(
+            ensure_ascii=False, separators=(",", ":"), default=str
+        )
+        # (秒, フォーマット済みのタイムスタンプ)
+        self._time_cache: Tuple[int, str] = (-1, "")
+        # (レベル名, ロガー名) ごとの '"level":...,"logger":...' のJSON断片
+        self._header_cache: Dict[Tuple[str, str], str] = {}
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """
+        ログレコードの作成時刻をフォーマット（同じ秒のレコードではキャッシュを再利用）
+
+        Args:
+            record: ログレコード
+            datefmt: タイムスタンプの書式
+
+        Returns:
+            フォーマット済みのタイムスタンプ
+        """
+        second = int(record.created)
+        cached_second, formatted = self._time_cache
+        if cached_second != second:
+            formatted = super().formatTime(record, datefmt or self.default_time_format)
+            self._time_cache = (second, formatted)
+        if datefmt is None and self.default_msec_format:
+            return self.default_msec_format % (formatted, record.msecs)
+        return formatted
+
     def format(self, record: logging.LogRecord) -> str:
         """
-        ログレコードを構造化形式（JSON風）で出力
+        ログレコードを1行のJSONで出力
 
         Args:
             record: ログレコード
@@ -26,44 +91,230 @@ class StructuredFormatter(logging.Formatter):
         Returns:
             フォーマット済みログメッセージ
         """
-        log_data: Dict[str, Any] = {
-            "timestamp": self.formatTime(record, self.datefmt),
-            "level": record.levelname,
-            "logger": record.name,
-            "message": record.getMessage(),
+        header = self._header_cache.get((record.levelname, record.name))
+        if header is None:
+            header = self._encode({"level": record.levelname, "logger": record.name})[1:-1]
+            self._header_cache[(record.levelname, record.name)] = header
+
+        # 追加のフィールド（extra）をすべて含める（標準のフィールドは上書きしない）
+        fields: Dict[str, Any] = {
+            key: value
+            for key, value in record.__dict__.items()
+            if key not in _RESERVED_FIELDS
         }
 
-        # 追加のフィールド（extra）を含める
-        if hasattr(record, "jockey_id"):
-            log_data["jockey_id"] = record.jockey_id
-        if hasattr(record, "bucket"):
-            log_data["bucket"] = record.bucket
-        if hasattr(record, "key"):
-            log_data["key"] = record.key
-        if hasattr(record, "error"):
-            log_data["error"] = record.error
+        # 例外情報を含める（フォーマット結果はレコードにキャッシュされる）
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            fields["exception"] = record.exc_text
+        if record.stack_info:
+            fields["stack"] = self.formatStack(record.stack_info)
+
+        parts = [
+            '{"timestamp":',
+            encode_basestring(self.formatTime(record, self.datefmt)),
+            ",",
+            header,
+            ',"message":',
+            encode_basestring(record.getMessage()),
+        ]
+        if fields:
+            parts.append(",")
+            parts.append(self._encode(fields)[1:-1])
+        parts.append("}")
+        return "".join(parts)
 
-        # 例外情報を含める
-        if record.exc_info:
-            log_data["exception"] = self.formatException(record.exc_info)
+    def _encode(self, fields: Dict[str, Any]) -> str:
+        """辞書をJSONにエンコード（循環参照などでエンコードできない値は repr() で文字列にする）"""
+        try:
+            return "".join(self._encoder.iterencode(fields, _one_shot=True))
+        except (TypeError, ValueError):
+            safe_fields: Dict[str, Any] = {}
+            for key, value in fields.items():
+                try:
+                    self._encoder.encode(value)
+                    safe_fields[key] = value
+                except (TypeError, ValueError):
+                    safe_fields[key] = repr(value)
+            return self._encoder.encode(safe_fields)
 
-        return str(log_data)
 
+class SamplingFilter(logging.Filter):
+    """
+    ロガーごとにINFO以下のレコードをN件に1件だけ通すフィルター
 
-def setup_logging(log_level: str = "INFO") -> logging.Logger:
+    WARNING以上のレコードは常に通します。ロガー名が一致しない場合は、
+    親のロガー名（"app.services" など）の設定を使用します。
+    """
+
+    def __init__(self, rates: Dict[str, int]):
+        """
+        SamplingFilterの初期化
+
+        Args:
+            rates: ロガー名ごとのN（1以下の場合は間引かない）
+        """
+        super().__init__()
+        self.rates = {name: rate for name, rate in rates.items() if rate > 1}
+        self._counters: Dict[str, Iterator[int]] = {}
+        self._rate_cache: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._sampled_out = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        レコードを出力するかどうかを判定
+
+        Args:
+            record: ログレコード
+
+        Returns:
+            出力する場合はTrue
+        """
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self._rate_cache.get(record.name)
+        if rate is None:
+            rate = self._resolve_rate(record.name)
+        if rate <= 1:
+            return True
+
+        counter = self._counters.get(record.name)
+        if counter is None:
+            with self._lock:
+                counter = self._counters.setdefault(record.name, itertools.count())
+        # itertools.count の next() はGILの下でアトミック
+        if next(counter) % rate == 0:
+            return True
+        with self._lock:
+            self._sampled_out += 1
+        return False
+
+    @property
+    def sampled_out(self) -> int:
+        """間引いたレコード数"""
+        with self._lock:
+            return self._sampled_out
+
+    def _resolve_rate(self, name: str) -> int:
+        """ロガー名（または最も近い親のロガー名）のNを取得してキャッシュ"""
+        candidate = name
+        rate = 1
+        while candidate:
+            if candidate in self.rates:
+                rate = self.rates[candidate]
+                break
+            candidate = candidate.rpartition(".")[0]
+        self._rate_cache[name] = rate
+        return rate
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    上限付きのキューにレコードを追加し、満杯の場合は破棄して件数を数えるQueueHandler
+
+    フォーマットはQueueListenerのスレッドで行うため、ここではメッセージの引数の
+    埋め込みのみを行います（例外情報はそのまま渡す）。
+    """
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]"):
+        """
+        DroppingQueueHandlerの初期化
+
+        Args:
+            log_queue: 上限付きのキュー
+        """
+        super().__init__(log_queue)
+        self._lock = threading.Lock()
+        self._dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        キューに追加するレコードを準備（引数を埋め込んだメッセージに置き換える）
+
+        Args:
+            record: ログレコード
+
+        Returns:
+            キューに追加するレコード
+        """
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """
+        レコードをキューに追加（満杯の場合は破棄）
+
+        Args:
+            record: ログレコード
+        """
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self._dropped += 1
+
+    @property
+    def dropped(self) -> int:
+        """キューが満杯のため破棄したレコード数"""
+        with self._lock:
+            return self._dropped
+
+
+# キューモードのQueueListenerとハンドラー、サンプリングのフィルター
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[DroppingQueueHandler] = None
+_sampling_filter: Optional[SamplingFilter] = None
+_pipeline_lock = threading.Lock()
+
+
+def parse_sample_rates(value: str) -> Dict[str, int]:
+    """
+    サンプリングの設定を解析
+
+    Args:
+        value: "ロガー名=N" のカンマ区切り（例: "app.infrastructure.s3_accessor=10"）
+
+    Returns:
+        ロガー名ごとのNの辞書（不正な項目は無視する）
+    """
+    rates: Dict[str, int] = {}
+    for item in value.split(","):
+        name, _, rate = item.partition("=")
+        name = name.strip()
+        try:
+            rates[name] = int(rate)
+        except ValueError:
+            continue
+    return {name: rate for name, rate in rates.items() if name and rate > 0}
+
+
+def setup_logging(
+    log_level: str = "INFO",
+    queue_size: Optional[int] = None,
+    sample_rates: Optional[Dict[str, int]] = None,
+) -> logging.Logger:
     """
     アプリケーションのログ設定を初期化
 
     Args:
         log_level: ログレベル（DEBUG, INFO, WARNING, ERROR, CRITICAL）
+        queue_size: キューモードのキューの上限（Noneの場合は呼び出し元のスレッドで直接出力）
+        sample_rates: ロガー名ごとのINFO以下のレコードを出力する間隔N
 
     Returns:
         設定済みのルートロガー
     """
+    global _listener, _queue_handler, _sampling_filter
+
     # ルートロガーの取得
     logger = logging.getLogger()
 
-    # 既存のハンドラーをクリア
+    # 既存のハンドラーをクリア（キューモードのリスナーは停止して残りを出力する）
+    shutdown_logging()
     logger.handlers.clear()
 
     # ログレベルの設定
@@ -80,12 +331,67 @@ def setup_logging(log_level: str = "INFO") -> logging.Logger:
     )
     console_handler.setFormatter(formatter)
 
+    handler: logging.Handler = console_handler
+    queue_handler = None
+    listener = None
+    if queue_size is not None:
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=max(queue_size, 1))
+        queue_handler = DroppingQueueHandler(log_queue)
+        listener = QueueListener(log_queue, console_handler, respect_handler_level=True)
+        listener.start()
+        handler = queue_handler
+
+    # サンプリングは呼び出し元のスレッドで判定し、間引いたレコードはキューに追加しない
+    sampling_filter = SamplingFilter(sample_rates) if sample_rates else None
+    if sampling_filter is not None:
+        handler.addFilter(sampling_filter)
+
+    with _pipeline_lock:
+        _listener, _queue_handler, _sampling_filter = listener, queue_handler, sampling_filter
+
     # ハンドラーをロガーに追加
-    logger.addHandler(console_handler)
+    logger.addHandler(handler)
 
     return logger
 
 
+def shutdown_logging() -> None:
+    """
+    キューモードのQueueListenerを停止（キューに残っているレコードは出力してから停止）
+
+    キューモードでない場合は何もしません。
+    """
+    global _listener
+
+    with _pipeline_lock:
+        listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
+
+
+def get_logging_stats() -> Dict[str, Any]:
+    """
+    ログ出力の統計情報を取得
+
+    Returns:
+        キューモードかどうか・キュー内のレコード数・キューの上限・
+        破棄したレコード数・サンプリングで間引いたレコード数の辞書
+    """
+    with _pipeline_lock:
+        queue_handler, sampling_filter = _queue_handler, _sampling_filter
+    log_queue = queue_handler.queue if queue_handler is not None else None
+    return {
+        "queue": queue_handler is not None,
+        "queued": log_queue.qsize() if isinstance(log_queue, queue.Queue) else 0,
+        "max_queue_size": log_queue.maxsize if isinstance(log_queue, queue.Queue) else 0,
+        "dropped": queue_handler.dropped if queue_handler is not None else 0,
+        "sampled_out": sampling_filter.sampled_out if sampling_filter is not None else 0,
+    }
+
+
+atexit.register(shutdown_logging)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     名前付きロガーを取得
@@ -0,0 +1,266 @@
+"""
+Metrics - Prometheus形式のメトリクス
+
+リクエストの所要時間（ルートごと）、処理段階ごとの所要時間（app.core.timing）、
+S3 GetObjectの所要時間・結果・転送バイト数、デシリアライズしたDataFrameの行数、
+キャッシュのヒット・ミスを記録し、/metrics でOpenMetrics（Prometheus）形式で出力します。
+
+オプション依存関係のprometheus-clientが必要です（`uv sync --extra metrics`）。
+インストールされていない場合、または環境変数JOCKEY_METRICSがfalseの場合は記録を行いません。
+
+`uvicorn --workers N` などの複数プロセス構成では、環境変数PROMETHEUS_MULTIPROC_DIRに
+プロセス間で共有するディレクトリを設定してください（prometheus-clientのmultiprocessモード）。
+各プロセスの値はディレクトリ内のファイルに書き込まれ、/metrics で合算して出力します。
+
+prometheus-clientのモジュールとメトリクスは最初の記録時に生成します（コールドスタートの短縮のため）。
+"""
+
+import importlib.util
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.config import get_env_bool
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+METRICS_NAMESPACE = "jockey"
+
+# 所要時間のヒストグラムのバケット（秒）
+LATENCY_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+# DataFrameの行数のヒストグラムのバケット
+ROW_BUCKETS = (10, 100, 500, 1000, 2500, 5000, 10000, 50000, 100000)
+
+# S3 GetObjectの結果
+S3_OUTCOME_OK = "ok"
+S3_OUTCOME_NOT_MODIFIED = "not_modified"
+S3_OUTCOME_NOT_FOUND = "not_found"
+S3_OUTCOME_ERROR = "error"
+
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+
+def is_metrics_available() -> bool:
+    """
+    prometheus-clientがインストールされているかどうかを判定
+
+    Returns:
+        インストールされている場合はTrue
+    """
+    return importlib.util.find_spec("prometheus_client") is not None
+
+
+def is_multiprocess() -> bool:
+    """
+    multiprocessモード（PROMETHEUS_MULTIPROC_DIRが設定されている）かどうか
+
+    Returns:
+        multiprocessモードの場合はTrue
+    """
+    return bool(os.environ.get(MULTIPROC_DIR_ENV))
+
+
+class _Metrics:
+    """メトリクスの定義（ラベルの値ごとの子メトリクスをキャッシュして記録のコストを抑える）"""
+
+    def __init__(self) -> None:
+        from prometheus_client import CollectorRegistry, Counter, Histogram
+
+        self.registry = CollectorRegistry(auto_describe=True)
+        self.request_duration = Histogram(
+            "http_request_duration_seconds",
+            "HTTPリクエストの所要時間（ルート・メソッド・ステータスごと）",
+            ["route", "method", "status"],
+            namespace=METRICS_NAMESPACE,
+            buckets=LATENCY_BUCKETS,
+            registry=self.registry,
+        )
+        self.stage_duration = Histogram(
+            "stage_duration_seconds",
+            "リクエスト内の処理段階ごとの所要時間（s3・deserialize・encodeなど）",
+            ["stage"],
+            namespace=METRICS_NAMESPACE,
+            buckets=LATENCY_BUCKETS,
+            registry=self.registry,
+        )
+        self.s3_duration = Histogram(
+            "s3_get_object_duration_seconds",
+            "S3 GetObjectの所要時間（結果ごと: ok・not_modified・not_found・error）",
+            ["outcome"],
+            namespace=METRICS_NAMESPACE,
+            buckets=LATENCY_BUCKETS,
+            registry=self.registry,
+        )
+        self.s3_bytes = Counter(
+            "s3_received_bytes",
+            "S3 GetObjectで受信したボディのバイト数",
+            namespace=METRICS_NAMESPACE,
+            registry=self.registry,
+        )
+        self.dataframe_rows = Histogram(
+            "dataframe_rows",
+            "デシリアライズしたDataFrameの行数",
+            namespace=METRICS_NAMESPACE,
+            buckets=ROW_BUCKETS,
+            registry=self.registry,
+        )
+        self.cache_lookups = Counter(
+            "cache_lookups",
+            "プロセス内キャッシュの参照回数（キャッシュ・結果（hit・miss）ごと）",
+            ["cache", "result"],
+            namespace=METRICS_NAMESPACE,
+            registry=self.registry,
+        )
+        self._children: Dict[Tuple[Any, ...], Any] = {}
+
+    def child(self, metric: Any, *labels: str) -> Any:
+        """ラベルの値に対応する子メトリクスを取得（キャッシュ済みの場合は再利用）"""
+        key = (id(metric), *labels)
+        child = self._children.get(key)
+        if child is None:
+            child = metric.labels(*labels)
+            self._children[key] = child
+        return child
+
+
+# グローバルなメトリクス（None: 未生成、False: 無効）
+_metrics: Any = None
+_metrics_lock = threading.Lock()
+
+
+def _get_metrics() -> Optional[_Metrics]:
+    """メトリクスを取得（最初の呼び出し時に生成、無効な場合はNone）"""
+    global _metrics
+
+    metrics = _metrics
+    if metrics is None:
+        with _metrics_lock:
+            if _metrics is None:
+                if get_env_bool("JOCKEY_METRICS", True) and is_metrics_available():
+                    _metrics = _Metrics()
+                    logger.info(
+                        "Metrics enabled", extra={"multiprocess": is_multiprocess()}
+                    )
+                else:
+                    _metrics = False
+            metrics = _metrics
+    return metrics or None
+
+
+def observe_request(route: str, method: str, status: int, elapsed: float) -> None:
+    """
+    HTTPリクエストの所要時間を記録
+
+    Args:
+        route: ルートのパステンプレート（例: "/api/jockey/{jockey_id}"）
+        method: HTTPメソッド
+        status: レスポンスのステータスコード
+        elapsed: 所要時間（秒）
+    """
+    metrics = _get_metrics()
+    if metrics is not None:
+        metrics.child(metrics.request_duration, route, method, str(status)).observe(elapsed)
+
+
+def observe_stage_duration(stage: str, elapsed: float) -> None:
+    """
+    処理段階の所要時間を記録
+
+    Args:
+        stage: 処理段階の名前
+        elapsed: 所要時間（秒）
+    """
+    metrics = _get_metrics()
+    if metrics is not None:
+        metrics.child(metrics.stage_duration, stage).observe(elapsed)
+
+
+def observe_s3_get_object(outcome: str, elapsed: float, received_bytes: int = 0) -> None:
+    """
+    S3 GetObjectの所要時間・結果・受信バイト数を記録
+
+    Args:
+        outcome: 結果（ok・not_modified・not_found・error）
+        elapsed: 所要時間（秒）
+        received_bytes: S3から受信したボディのバイト数
+    """
+    metrics = _get_metrics()
+    if metrics is None:
+        return
+    metrics.child(metrics.s3_duration, outcome).observe(elapsed)
+    if received_bytes:
+        metrics.s3_bytes.inc(received_bytes)
+
+
+def observe_dataframe_rows(rows: int) -> None:
+    """
+    デシリアライズしたDataFrameの行数を記録
+
+    Args:
+        rows: 行数
+    """
+    metrics = _get_metrics()
+    if metrics is not None:
+        metrics.dataframe_rows.observe(rows)
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    """
+    プロセス内キャッシュの参照結果を記録
+
+    Args:
+        cache: キャッシュ名
+        hit: ヒットした場合はTrue
+    """
+    metrics = _get_metrics()
+    if metrics is not None:
+        metrics.child(metrics.cache_lookups, cache, "hit" if hit else "miss").inc()
+
+
+def generate_metrics() -> Optional[Tuple[bytes, str]]:
+    """
+    メトリクスをPrometheusのテキスト形式で出力
+
+    multiprocessモードでは、すべてのプロセスが書き込んだ値を合算して出力します。
+
+    Returns:
+        (出力, Content-Type)（メトリクスが無効な場合はNone）
+    """
+    metrics = _get_metrics()
+    if metrics is None:
+        return None
+
+    from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, generate_latest
+
+    registry = metrics.registry
+    if is_multiprocess():
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead() -> None:
+    """
+    終了するプロセスのmultiprocessモードのファイルを整理（アプリケーション終了時）
+
+    multiprocessモードでない場合、メトリクスが無効な場合は何もしません。
+    """
+    if not is_multiprocess() or _get_metrics() is None:
+        return
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(os.getpid())
+
+
+def reset_metrics() -> None:
+    """
+    メトリクスを破棄して次回の記録時に再生成（主にテスト用）
+    """
+    global _metrics
+    with _metrics_lock:
+        _metrics = None
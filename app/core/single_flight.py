@@ -0,0 +1,198 @@
+"""
+Single Flight - 同一キーに対する同時呼び出しの集約
+
+同じキーに対して実行中の処理がある場合、後から呼び出した側は新たに処理を実行せず、
+実行中の処理の結果（または例外）を共有します。結果はキャッシュしないため、
+処理の完了後の呼び出しでは再び実行されます。
+"""
+
+import asyncio
+import copy
+import threading
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Hashable, NoReturn, Optional, TypeVar
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class _Call:
+    """同一キーに対する実行中の同期呼び出し"""
+
+    __slots__ = ("event", "value", "error")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    同一キーに対する同時呼び出しを1回の実行にまとめる
+
+    - do: 最初の呼び出しのスレッドで関数を実行し、他のスレッドは完了を待機
+    - do_async: 最初の呼び出しでコルーチンをタスクとして開始し、同じイベントループの
+      他の呼び出しは同じタスクを待機（呼び出し元がキャンセルされてもタスクは継続）
+
+    同期版と非同期版の実行中の呼び出しは共有しません。返却される値は呼び出し元の間で
+    共有されるため、変更しないでください。例外は、待機していた呼び出しには元の例外を
+    __cause__ とする複製を送出します（複製できない場合は元の例外）。
+    """
+
+    def __init__(self, name: str = "single_flight"):
+        """
+        SingleFlightの初期化
+
+        Args:
+            name: ログ出力・統計情報用の名前
+        """
+        self.name = name
+        self._calls: Dict[Hashable, _Call] = {}
+        self._tasks: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        self._lock = threading.Lock()
+        self._executions = 0
+        self._shared = 0
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        """
+        キーに対して実行中の呼び出しがなければ func を実行し、あればその結果を待機
+
+        Args:
+            key: 呼び出しを集約するキー
+            func: 実行する関数
+
+        Returns:
+            func の戻り値（実行中の呼び出しの結果を含む）
+
+        Raises:
+            Exception: func が送出した例外（実行中の呼び出しの例外の場合はその複製）
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                self._executions += 1
+            else:
+                self._shared += 1
+
+        if not is_leader:
+            logger.debug("Waiting for in-flight call", extra={"flight": self.name, "key": str(key)})
+            call.event.wait()
+            if call.error is not None:
+                _raise_shared(call.error)
+            return call.value  # type: ignore[no-any-return]
+
+        try:
+            call.value = func()
+            return call.value  # type: ignore[no-any-return]
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+
+    async def do_async(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        do の非同期版
+
+        実行中の呼び出しが別のイベントループのものの場合は、集約せずに実行します。
+
+        Args:
+            key: 呼び出しを集約するキー
+            func: コルーチンを返す関数
+
+        Returns:
+            func のコルーチンの戻り値（実行中の呼び出しの結果を含む）
+
+        Raises:
+            Exception: コルーチンが送出した例外（実行中の呼び出しの例外の場合はその複製）
+        """
+        loop = asyncio.get_running_loop()
+        is_shared = False
+        with self._lock:
+            task = self._tasks.get(key)
+            if task is not None and task.get_loop() is loop:
+                is_shared = True
+                self._shared += 1
+                logger.debug(
+                    "Waiting for in-flight call", extra={"flight": self.name, "key": str(key)}
+                )
+            elif task is None:
+                task = loop.create_task(_run(func))
+                task.add_done_callback(partial(self._forget_task, key))
+                self._tasks[key] = task
+                self._executions += 1
+            else:
+                task = None
+
+        if task is None:
+            return await func()
+        if not is_shared:
+            return await asyncio.shield(task)  # type: ignore[no-any-return]
+        try:
+            return await asyncio.shield(task)  # type: ignore[no-any-return]
+        except Exception as e:
+            _raise_shared(e)
+
+    def _forget_task(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        """完了したタスクを削除（待機していた呼び出し元がすべてキャンセルされた場合も例外を回収）"""
+        with self._lock:
+            if self._tasks.get(key) is task:
+                del self._tasks[key]
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        統計情報を取得
+
+        Returns:
+            実行中の呼び出し数・実行回数・実行中の呼び出しの結果を共有した回数の辞書
+        """
+        with self._lock:
+            return {
+                "name": self.name,
+                "in_flight": len(self._calls) + len(self._tasks),
+                "executions": self._executions,
+                "shared": self._shared,
+            }
+
+
+async def _run(func: Callable[[], Awaitable[T]]) -> T:
+    """func のコルーチンを実行（create_task に渡すため）"""
+    return await func()
+
+
+def _raise_shared(error: BaseException) -> NoReturn:
+    """
+    実行中の呼び出しの例外を待機していた呼び出し元で送出
+
+    同じ例外オブジェクトを複数の呼び出し元で送出すると __traceback__ が互いに書き換えられるため、
+    Exception は複製を元の例外に連鎖させて送出します。複製できない例外（コンストラクタの引数が
+    args と異なるなど）と、Exception 以外（KeyboardInterrupt など）は元の例外をそのまま送出します。
+    """
+    copied = _copy_error(error)
+    if copied is error:
+        raise error
+    raise copied from error
+
+
+def _copy_error(error: BaseException) -> BaseException:
+    """例外の複製（型・args が一致する複製を作れない場合は元の例外）"""
+    if not isinstance(error, Exception):
+        return error
+    try:
+        copied = copy.copy(error)
+    except Exception:
+        return error
+    if type(copied) is not type(error) or copied.args != error.args:
+        return error
+    return copied
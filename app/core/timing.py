@@ -0,0 +1,234 @@
+"""
+Stage Timing - リクエスト内の処理段階ごとの所要時間の計測
+
+リクエストごとに RequestTimings をコンテキスト変数に設定し、stage() で囲んだ
+処理段階（S3取得・デシリアライズ・条件の適用・JSONエンコードなど）の所要時間を
+time.perf_counter で計測して合計します。計測結果はServer-Timingヘッダーとして返却します。
+
+処理段階ごとのヒストグラムとメトリクス（/metrics）には、リクエストのコンテキスト外
+（プリウォームなど）やServer-Timingの計測が無効な場合も記録します。
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
+
+from app.core.metrics import observe_stage_duration
+
+# ヒストグラムのバケットの上限（ミリ秒、最後のバケットは上限なし）
+DEFAULT_BUCKETS_MS: Tuple[float, ...] = (
+    1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 2500.0, 5000.0
+)
+
+# 処理段階の名前
+STAGE_S3 = "s3"
+STAGE_DESERIALIZE = "deserialize"
+STAGE_QUERY = "query"
+STAGE_ENCODE = "encode"
+STAGE_TO_RECORDS = "to_records"
+STAGE_RESPONSE = "response"
+STAGE_OFFLOAD = "offload"
+STAGE_TOTAL = "total"
+
+
+class StageHistogram:
+    """
+    処理段階の所要時間のヒストグラム（スレッドセーフ）
+
+    バケットごとの件数は累積ではなく、各バケットに含まれる件数を保持します。
+    """
+
+    def __init__(self, buckets_ms: Sequence[float] = DEFAULT_BUCKETS_MS):
+        """
+        StageHistogramの初期化
+
+        Args:
+            buckets_ms: バケットの上限（ミリ秒、昇順）
+        """
+        self.buckets_ms = tuple(buckets_ms)
+        self._lock = threading.Lock()
+        self._counts = [0] * (len(self.buckets_ms) + 1)
+        self._count = 0
+        self._sum_ms = 0.0
+
+    def observe(self, elapsed_ms: float) -> None:
+        """
+        所要時間を1件記録
+
+        Args:
+            elapsed_ms: 所要時間（ミリ秒）
+        """
+        index = bisect_left(self.buckets_ms, elapsed_ms)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum_ms += elapsed_ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        ヒストグラムの現在の値を取得
+
+        Returns:
+            件数・合計（ミリ秒）・バケットの上限ごとの件数（"+Inf" は上限なし）の辞書
+        """
+        with self._lock:
+            counts = list(self._counts)
+            count, sum_ms = self._count, self._sum_ms
+        labels = [f"{upper:g}" for upper in self.buckets_ms] + ["+Inf"]
+        return {
+            "count": count,
+            "sum_ms": round(sum_ms, 3),
+            "buckets": dict(zip(labels, counts, strict=True)),
+        }
+
+
+class RequestTimings:
+    """
+    1リクエストの処理段階ごとの所要時間の合計
+
+    一括取得ではワーカースレッドから並行して記録されるため、同じ処理段階の
+    合計はリクエストの経過時間を超える場合があります。
+    """
+
+    def __init__(self) -> None:
+        """RequestTimingsの初期化"""
+        self.started = time.perf_counter()
+        self._lock = threading.Lock()
+        self._stages: Dict[str, float] = {}
+
+    def add(self, name: str, elapsed: float) -> None:
+        """
+        処理段階の所要時間を加算
+
+        Args:
+            name: 処理段階の名前
+            elapsed: 所要時間（秒）
+        """
+        with self._lock:
+            self._stages[name] = self._stages.get(name, 0.0) + elapsed
+
+    def stages(self) -> Dict[str, float]:
+        """
+        処理段階ごとの所要時間の合計を取得
+
+        Returns:
+            処理段階の名前と所要時間（秒）の辞書（最初に記録した順）
+        """
+        with self._lock:
+            return dict(self._stages)
+
+    def server_timing(self, total: Optional[float] = None) -> str:
+        """
+        Server-Timingヘッダーの値を生成
+
+        Args:
+            total: リクエスト全体の所要時間（秒、指定時は "total" として含める）
+
+        Returns:
+            "s3;dur=12.3, deserialize;dur=4.5" 形式の文字列（ミリ秒）
+        """
+        stages = self.stages()
+        if total is not None:
+            stages[STAGE_TOTAL] = total
+        return ", ".join(f"{name};dur={elapsed * 1000:.1f}" for name, elapsed in stages.items())
+
+
+_current_timings: ContextVar[Optional[RequestTimings]] = ContextVar(
+    "request_timings", default=None
+)
+
+# 処理段階ごとのヒストグラム
+_histograms: Dict[str, StageHistogram] = {}
+_histograms_lock = threading.Lock()
+
+
+def start_request_timings() -> Tuple[RequestTimings, Any]:
+    """
+    現在のコンテキストで処理段階の計測を開始
+
+    Returns:
+        (RequestTimings, end_request_timings に渡すトークン)
+    """
+    timings = RequestTimings()
+    return timings, _current_timings.set(timings)
+
+
+def end_request_timings(token: Any) -> None:
+    """
+    start_request_timings で開始した計測を終了
+
+    Args:
+        token: start_request_timings が返したトークン
+    """
+    _current_timings.reset(token)
+
+
+def current_timings() -> Optional[RequestTimings]:
+    """
+    現在のリクエストの RequestTimings を取得
+
+    Returns:
+        RequestTimings（リクエストのコンテキスト外・計測が無効な場合はNone）
+    """
+    return _current_timings.get()
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """
+    処理段階の所要時間を計測するコンテキストマネージャー
+
+    ヒストグラムとメトリクスに記録し、リクエストのコンテキスト内の場合は現在のリクエストの
+    合計にも加算します（例外で終了した場合も記録）。
+
+    Args:
+        name: 処理段階の名前
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        timings = _current_timings.get()
+        if timings is not None:
+            timings.add(name, elapsed)
+        observe_stage(name, elapsed)
+
+
+def observe_stage(name: str, elapsed: float) -> None:
+    """
+    処理段階の所要時間をヒストグラムとメトリクス（/metrics）に記録
+
+    Args:
+        name: 処理段階の名前
+        elapsed: 所要時間（秒）
+    """
+    histogram = _histograms.get(name)
+    if histogram is None:
+        with _histograms_lock:
+            histogram = _histograms.setdefault(name, StageHistogram())
+    histogram.observe(elapsed * 1000)
+    observe_stage_duration(name, elapsed)
+
+
+def get_stage_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    処理段階ごとのヒストグラムを取得
+
+    Returns:
+        処理段階の名前とヒストグラムの値の辞書
+    """
+    with _histograms_lock:
+        histograms = dict(_histograms)
+    return {name: histogram.snapshot() for name, histogram in histograms.items()}
+
+
+def reset_stage_stats() -> None:
+    """
+    処理段階ごとのヒストグラムをリセット（主にテスト用）
+    """
+    with _histograms_lock:
+        _histograms.clear()
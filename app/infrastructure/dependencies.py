@@ -2,24 +2,62 @@
 Dependency Injection - グローバルな依存関係の管理
 
 Lambda Web Adapterのコールドスタート最適化のため、
-S3Accessorをグローバルスコープで初期化します。
+S3Accessorと騎手データキャッシュ・レスポンスキャッシュ、同時リクエストの集約、
+一括取得用のワーカープール、騎手IDごとのリクエスト数のカウンターを
+グローバルスコープで初期化します。
+
+S3Accessor（boto3）のモジュールは最初の get_s3_accessor の呼び出し時に読み込みます。
 """
 
 import threading
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
+from app.core.cache import TTLCache
+from app.core.config import get_env_float, get_env_int, get_env_str
+from app.core.hit_counter import HitCounter
 from app.core.logging import get_logger
-from app.infrastructure.s3_accessor import S3Accessor
+from app.core.single_flight import SingleFlight
 from app.models.exceptions import SSMConfigError
+from app.models.page import EncodedPage, VersionedFrame
+
+if TYPE_CHECKING:
+    from app.infrastructure.s3_accessor import S3Accessor
 
 logger = get_logger(__name__)
 
 # グローバルなS3Accessorインスタンス
-_s3_accessor: Optional[S3Accessor] = None
+_s3_accessor: Optional["S3Accessor"] = None
 _lock = threading.Lock()
 
+# グローバルな騎手DataFrameキャッシュ
+_jockey_cache: Optional[TTLCache[VersionedFrame]] = None
+_cache_lock = threading.Lock()
+
+# グローバルなエンコード済みJSONレスポンスキャッシュ
+_response_cache: Optional[TTLCache[EncodedPage]] = None
+
+# グローバルな同一騎手・条件への同時リクエストの集約
+_single_flight: Optional[SingleFlight] = None
+_single_flight_lock = threading.Lock()
+
+# グローバルな一括取得用ワーカープール
+_batch_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+# グローバルな騎手IDごとのリクエスト数のカウンター
+_hit_counter: Optional[HitCounter] = None
+_hit_counter_lock = threading.Lock()
+
+DEFAULT_CACHE_MAX_ENTRIES = 100
+DEFAULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_CACHE_TTL_SECONDS = 3600.0
+DEFAULT_RESPONSE_CACHE_MAX_BYTES = 128 * 1024 * 1024
+DEFAULT_BATCH_MAX_WORKERS = 8
+DEFAULT_HIT_COUNTS_MAX_KEYS = 1000
 
-def get_s3_accessor() -> S3Accessor:
+
+def get_s3_accessor() -> "S3Accessor":
     """
     S3Accessorのシングルトンインスタンスを取得
 
@@ -38,6 +76,8 @@ def get_s3_accessor() -> S3Accessor:
         if _s3_accessor is None:
             logger.info("Initializing S3Accessor (first time)")
             try:
+                from app.infrastructure.s3_accessor import S3Accessor
+
                 _s3_accessor = S3Accessor()
                 logger.info("S3Accessor initialized successfully")
             except SSMConfigError as e:
@@ -52,6 +92,56 @@ def get_s3_accessor() -> S3Accessor:
     return _s3_accessor
 
 
+def get_s3_pool_stats() -> Optional[Dict[str, Any]]:
+    """
+    S3コネクションプールの使用状況を取得
+
+    S3Accessorを初期化せずに参照します。
+
+    Returns:
+        同時実行数の統計情報の辞書（S3Accessorが未初期化の場合はNone）
+    """
+    accessor = _s3_accessor
+    return accessor.pool_stats() if accessor is not None else None
+
+
+def get_s3_read_stats() -> Optional[Dict[str, Any]]:
+    """
+    S3レスポンスボディの読み込みで確保したバイト数の統計情報を取得
+
+    S3Accessorを初期化せずに参照します。
+
+    Returns:
+        統計情報の辞書（S3Accessorが未初期化の場合はNone）
+    """
+    accessor = _s3_accessor
+    return accessor.read_stats() if accessor is not None else None
+
+
+def get_s3_disk_cache_stats() -> Optional[Dict[str, Any]]:
+    """
+    S3オブジェクトのディスクキャッシュの統計情報を取得
+
+    S3Accessorを初期化せずに参照します。
+
+    Returns:
+        統計情報の辞書（S3Accessorが未初期化・ディスクキャッシュが無効の場合はNone）
+    """
+    accessor = _s3_accessor
+    return accessor.disk_cache_stats() if accessor is not None else None
+
+
+async def close_s3_accessor_async() -> None:
+    """
+    S3Accessorの非同期S3クライアントを閉じる（アプリケーション終了時）
+
+    S3Accessorが未初期化の場合は何もしません。
+    """
+    accessor = _s3_accessor
+    if accessor is not None:
+        await accessor.aclose()
+
+
 def reset_s3_accessor() -> None:
     """
     S3Accessorインスタンスをリセット（主にテスト用）
@@ -60,3 +150,207 @@ def reset_s3_accessor() -> None:
     with _lock:
         _s3_accessor = None
         logger.info("S3Accessor instance reset")
+
+
+def _dataframe_nbytes(frame: VersionedFrame) -> int:
+    """DataFrameのメモリ使用量（文字列を含む）をバイト数で見積もる"""
+    return int(frame.data.memory_usage(deep=True).sum())
+
+
+def get_jockey_cache() -> TTLCache[VersionedFrame]:
+    """
+    デシリアライズ済み騎手DataFrameキャッシュのシングルトンインスタンスを取得
+
+    上限値は以下の環境変数で設定します。
+
+    - JOCKEY_CACHE_MAX_ENTRIES: 最大エントリ数（デフォルト: 100、0でキャッシュ無効）
+    - JOCKEY_CACHE_MAX_BYTES: 最大合計バイト数（デフォルト: 256MiB）
+    - JOCKEY_CACHE_TTL_SECONDS: エントリの有効期間（デフォルト: 3600秒）
+
+    Returns:
+        TTLCacheインスタンス
+    """
+    global _jockey_cache
+
+    with _cache_lock:
+        if _jockey_cache is None:
+            _jockey_cache = TTLCache(
+                max_entries=get_env_int("JOCKEY_CACHE_MAX_ENTRIES", DEFAULT_CACHE_MAX_ENTRIES),
+                max_bytes=get_env_int("JOCKEY_CACHE_MAX_BYTES", DEFAULT_CACHE_MAX_BYTES),
+                ttl_seconds=get_env_float("JOCKEY_CACHE_TTL_SECONDS", DEFAULT_CACHE_TTL_SECONDS),
+                sizeof=_dataframe_nbytes,
+                name="jockey_dataframe",
+            )
+            logger.info(
+                "Jockey cache initialized",
+                extra={
+                    "max_entries": _jockey_cache.max_entries,
+                    "max_bytes": _jockey_cache.max_bytes,
+                    "ttl_seconds": _jockey_cache.ttl_seconds,
+                }
+            )
+
+    return _jockey_cache
+
+
+def reset_jockey_cache() -> None:
+    """
+    騎手データキャッシュをリセット（主にテスト用）
+    """
+    global _jockey_cache
+    with _cache_lock:
+        _jockey_cache = None
+        logger.info("Jockey cache reset")
+
+
+def _encoded_page_nbytes(page: EncodedPage) -> int:
+    """エンコード済みレスポンスのボディのバイト数"""
+    return len(page.body)
+
+
+def get_response_cache() -> TTLCache[EncodedPage]:
+    """
+    エンコード済みJSONレスポンスキャッシュのシングルトンインスタンスを取得
+
+    上限値は以下の環境変数で設定します。
+
+    - JOCKEY_RESPONSE_CACHE_MAX_ENTRIES: 最大エントリ数（デフォルト: 100、0でキャッシュ無効）
+    - JOCKEY_RESPONSE_CACHE_MAX_BYTES: 最大合計バイト数（デフォルト: 128MiB）
+    - JOCKEY_RESPONSE_CACHE_TTL_SECONDS: エントリの有効期間（デフォルト: 3600秒）
+
+    Returns:
+        TTLCacheインスタンス
+    """
+    global _response_cache
+
+    with _cache_lock:
+        if _response_cache is None:
+            _response_cache = TTLCache(
+                max_entries=get_env_int(
+                    "JOCKEY_RESPONSE_CACHE_MAX_ENTRIES", DEFAULT_CACHE_MAX_ENTRIES
+                ),
+                max_bytes=get_env_int(
+                    "JOCKEY_RESPONSE_CACHE_MAX_BYTES", DEFAULT_RESPONSE_CACHE_MAX_BYTES
+                ),
+                ttl_seconds=get_env_float(
+                    "JOCKEY_RESPONSE_CACHE_TTL_SECONDS", DEFAULT_CACHE_TTL_SECONDS
+                ),
+                sizeof=_encoded_page_nbytes,
+                name="jockey_response",
+            )
+            logger.info(
+                "Response cache initialized",
+                extra={
+                    "max_entries": _response_cache.max_entries,
+                    "max_bytes": _response_cache.max_bytes,
+                    "ttl_seconds": _response_cache.ttl_seconds,
+                }
+            )
+
+    return _response_cache
+
+
+def reset_response_cache() -> None:
+    """
+    レスポンスキャッシュをリセット（主にテスト用）
+    """
+    global _response_cache
+    with _cache_lock:
+        _response_cache = None
+        logger.info("Response cache reset")
+
+
+def get_single_flight() -> SingleFlight:
+    """
+    同一騎手・条件への同時リクエストを集約するSingleFlightのシングルトンインスタンスを取得
+
+    Returns:
+        SingleFlightインスタンス
+    """
+    global _single_flight
+
+    with _single_flight_lock:
+        if _single_flight is None:
+            _single_flight = SingleFlight(name="jockey")
+
+    return _single_flight
+
+
+def reset_single_flight() -> None:
+    """
+    SingleFlightをリセット（主にテスト用）
+    """
+    global _single_flight
+    with _single_flight_lock:
+        _single_flight = None
+
+
+def get_batch_executor() -> ThreadPoolExecutor:
+    """
+    一括取得用ワーカープールのシングルトンインスタンスを取得
+
+    ワーカー数は環境変数 JOCKEY_BATCH_MAX_WORKERS で設定します（デフォルト: 8）。
+    S3クライアントのコネクションプール（S3_MAX_POOL_CONNECTIONS）を超えない値にしてください。
+
+    Returns:
+        ThreadPoolExecutorインスタンス
+    """
+    global _batch_executor
+
+    with _executor_lock:
+        if _batch_executor is None:
+            max_workers = max(get_env_int("JOCKEY_BATCH_MAX_WORKERS", DEFAULT_BATCH_MAX_WORKERS), 1)
+            _batch_executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="jockey-batch"
+            )
+            logger.info("Batch executor initialized", extra={"max_workers": max_workers})
+
+    return _batch_executor
+
+
+def reset_batch_executor() -> None:
+    """
+    一括取得用ワーカープールをリセット（主にテスト用）
+    """
+    global _batch_executor
+    with _executor_lock:
+        if _batch_executor is not None:
+            _batch_executor.shutdown(wait=True)
+        _batch_executor = None
+        logger.info("Batch executor reset")
+
+
+def get_hit_counter() -> HitCounter:
+    """
+    騎手IDごとのリクエスト数のカウンターのシングルトンインスタンスを取得
+
+    環境変数 JOCKEY_HIT_COUNTS_FILE に集計結果を永続化するファイルのパスを設定します
+    （未設定の場合は集計を行いません）。ファイルに保持するキー数の上限は
+    JOCKEY_HIT_COUNTS_MAX_KEYS で設定します。
+
+    Returns:
+        HitCounterインスタンス
+    """
+    global _hit_counter
+
+    with _hit_counter_lock:
+        if _hit_counter is None:
+            path = get_env_str("JOCKEY_HIT_COUNTS_FILE", "") or None
+            _hit_counter = HitCounter(
+                path,
+                max_keys=get_env_int("JOCKEY_HIT_COUNTS_MAX_KEYS", DEFAULT_HIT_COUNTS_MAX_KEYS),
+            )
+            if path is not None:
+                logger.info("Hit counter initialized", extra={"path": path})
+
+    return _hit_counter
+
+
+def reset_hit_counter() -> None:
+    """
+    リクエスト数のカウンターをリセット（主にテスト用）
+    """
+    global _hit_counter
+    with _hit_counter_lock:
+        _hit_counter = None
+        logger.info("Hit counter reset")
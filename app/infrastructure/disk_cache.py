@@ -0,0 +1,412 @@
+"""
+Disk Cache - S3オブジェクトのローカルディスクキャッシュ
+
+S3から取得したオブジェクトを、S3キーとETagごとにローカルディスク（/tmp など）へ
+保存する2段目のキャッシュを提供します。プロセスの再起動でプロセス内キャッシュが
+空になっても、S3へは条件付き取得（ボディの転送なし）のみで済みます。
+
+- ファイルは同じディレクトリの一時ファイルに書き込んだ後に os.replace で配置するため、
+  他のプロセスが書きかけのファイルを読むことはありません
+- 大きなファイルはmmapで読み込み、ページキャッシュ上のデータをコピーせずにデコーダーへ渡します。
+  デコード後は release_mapped_data でmmapを閉じます。小さなファイルはバッファへコピーします
+- 合計バイト数が上限を超えた場合は、最終アクセス日時（mtime）の古いファイルから削除します。
+  合計バイト数は書き込みのたびに加算して見積もり、見積もりが上限を超えた場合のみ
+  ディレクトリを走査します（他のプロセスの書き込みは次回の走査で反映されます）。
+  走査・削除はロックファイル（flock）で排他するため、複数のワーカープロセスで
+  同じディレクトリを共有できます
+"""
+
+import fcntl
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from app.core.config import get_env_int, get_env_str
+from app.core.logging import get_logger
+from app.core.metrics import record_cache_lookup
+
+logger = get_logger(__name__)
+
+DEFAULT_DISK_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# mmapで読み込むオブジェクトの最小バイト数（これより小さいオブジェクトはバッファへコピー）
+DEFAULT_MMAP_MIN_BYTES = 1024 * 1024
+
+# メトリクスのキャッシュ名
+DISK_CACHE_NAME = "disk"
+
+# ファイル先頭のヘッダー（マジックナンバー + メタデータのバイト数）
+_MAGIC = b"JDC1"
+_HEADER = struct.Struct("<4sI")
+
+_ENTRY_SUFFIX = ".obj"
+_TEMP_SUFFIX = ".tmp"
+_LOCK_FILE_NAME = ".lock"
+
+# 書き込み途中で終了したプロセスの一時ファイルを削除するまでの経過時間（秒）
+_STALE_TEMP_SECONDS = 3600.0
+
+
+class DiskCacheEntry(NamedTuple):
+    """
+    ディスクキャッシュから読み込んだオブジェクト
+
+    Attributes:
+        data: オブジェクトのデータ（小さなファイルはbytearray、大きなファイルはmmapへのmemoryview）
+        etag: オブジェクトのETag
+        last_modified: オブジェクトの最終更新日時
+    """
+
+    data: Union[bytearray, memoryview]
+    etag: str
+    last_modified: Optional[datetime]
+
+
+def release_mapped_data(data: Any) -> None:
+    """
+    mmapしたオブジェクトのデータの参照を解放し、mmapを閉じる
+
+    mmap以外のデータ・解放済みのデータでは何もしません。デコード結果（Arrowのゼロコピー変換など）が
+    まだ参照している場合は閉じず、その参照がなくなった時点でマッピングが解放されます。
+
+    Args:
+        data: DiskCacheEntry.data（S3Object.data）
+    """
+    if not isinstance(data, memoryview):
+        return
+    try:
+        mapped = data.obj
+        data.release()
+    except (ValueError, BufferError):
+        return
+    if isinstance(mapped, mmap.mmap):
+        try:
+            mapped.close()
+        except BufferError:
+            pass
+
+
+def _digest(value: str) -> str:
+    """ファイル名に使用するハッシュ値"""
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()[:32]
+
+
+class DiskCache:
+    """
+    S3キーとETagごとにオブジェクトを保存するディスクキャッシュ
+
+    ファイルは {directory}/{S3キーのハッシュ}/{ETagのハッシュ}.obj に保存され、
+    S3キーごとに最新のETagのファイルのみが保持されます。
+    """
+
+    def __init__(
+        self, directory: str, max_bytes: int, mmap_min_bytes: int = DEFAULT_MMAP_MIN_BYTES
+    ):
+        """
+        DiskCacheの初期化
+
+        Args:
+            directory: キャッシュディレクトリ（存在しない場合は作成）
+            max_bytes: 最大合計バイト数
+            mmap_min_bytes: mmapで読み込むオブジェクトの最小バイト数
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.mmap_min_bytes = mmap_min_bytes
+        os.makedirs(directory, exist_ok=True)
+        self._lock_path = os.path.join(directory, _LOCK_FILE_NAME)
+        self._stats_lock = threading.Lock()
+        # ディレクトリの合計バイト数の見積もり（None: 未走査）
+        self._total_bytes: Optional[int] = None
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._evictions = 0
+
+    def get(self, key: str) -> Optional[DiskCacheEntry]:
+        """
+        キーに対応する最新のオブジェクトを読み込み
+
+        読み込んだファイルの最終アクセス日時を更新します（LRU順）。
+        読み込みに失敗した場合はミスとして扱います。
+
+        Args:
+            key: キャッシュキー（バケット名を含むS3キー）
+
+        Returns:
+            読み込んだオブジェクト（存在しない場合はNone）
+        """
+        path = self._latest_path(key)
+        entry = self._read(path) if path is not None else None
+        with self._stats_lock:
+            if entry is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        record_cache_lookup(DISK_CACHE_NAME, entry is not None)
+        return entry
+
+    def put(
+        self, key: str, etag: str, last_modified: Optional[datetime], data: Any
+    ) -> None:
+        """
+        オブジェクトを保存し、同じキーの古いETagのファイルを削除
+
+        書き込みに失敗した場合は警告を出して何もしません。
+
+        Args:
+            key: キャッシュキー（バケット名を含むS3キー）
+            etag: オブジェクトのETag
+            last_modified: オブジェクトの最終更新日時
+            data: オブジェクトのデータ（bytes-likeオブジェクト）
+        """
+        size = memoryview(data).nbytes
+        if size > self.max_bytes:
+            logger.debug(
+                "Object too large for disk cache",
+                extra={"key": key, "size": size, "max_bytes": self.max_bytes}
+            )
+            return
+
+        metadata = json.dumps({
+            "key": key,
+            "etag": etag,
+            "last_modified": last_modified.isoformat() if last_modified is not None else None,
+        }).encode("utf-8")
+
+        key_dir = os.path.join(self.directory, _digest(key))
+        path = os.path.join(key_dir, _digest(etag) + _ENTRY_SUFFIX)
+        try:
+            os.makedirs(key_dir, exist_ok=True)
+            replaced = self._file_size(path)
+            fd, temp_path = tempfile.mkstemp(dir=key_dir, suffix=_TEMP_SUFFIX)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(_HEADER.pack(_MAGIC, len(metadata)))
+                    f.write(metadata)
+                    f.write(data)
+                os.replace(temp_path, path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+
+            removed = self._remove_other_versions(key_dir, path)
+            with self._stats_lock:
+                self._writes += 1
+            self._evict_if_needed(_HEADER.size + len(metadata) + size - replaced - removed)
+
+        except OSError as e:
+            logger.warning(
+                "Failed to write disk cache entry",
+                extra={"key": key, "error": str(e)}
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        ディスクキャッシュの統計情報を取得（このプロセスでの操作のみ）
+
+        Returns:
+            ディレクトリ・ヒット数・ミス数・書き込み数・削除数・最大合計バイト数の辞書
+        """
+        with self._stats_lock:
+            lookups = self._hits + self._misses
+            return {
+                "directory": self.directory,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+                "writes": self._writes,
+                "evictions": self._evictions,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _latest_path(self, key: str) -> Optional[str]:
+        """キーに対応するファイルのうち最終アクセス日時が最も新しいもの"""
+        latest: Optional[Tuple[int, str]] = None
+        try:
+            with os.scandir(os.path.join(self.directory, _digest(key))) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(_ENTRY_SUFFIX):
+                        continue
+                    candidate = (entry.stat().st_mtime_ns, entry.path)
+                    if latest is None or candidate > latest:
+                        latest = candidate
+        except FileNotFoundError:
+            return None
+        return latest[1] if latest is not None else None
+
+    def _read(self, path: str) -> Optional[DiskCacheEntry]:
+        """ファイルのヘッダーを解析し、データをバッファへコピー（大きなファイルはmmap）"""
+        try:
+            with open(path, "rb") as f:
+                header = f.read(_HEADER.size)
+                if len(header) < _HEADER.size:
+                    return None
+                magic, metadata_size = _HEADER.unpack(header)
+                if magic != _MAGIC:
+                    return None
+                metadata = json.loads(f.read(metadata_size))
+                start = _HEADER.size + metadata_size
+                size = os.fstat(f.fileno()).st_size - start
+                if size < 0:
+                    return None
+                data = self._read_data(f, start, size)
+            os.utime(path)
+        except (OSError, ValueError):
+            # 他のプロセスに削除された場合や壊れたファイルはミスとして扱う
+            return None
+
+        if data is None:
+            return None
+        last_modified = metadata.get("last_modified")
+        return DiskCacheEntry(
+            data,
+            metadata["etag"],
+            datetime.fromisoformat(last_modified) if last_modified else None,
+        )
+
+    def _read_data(
+        self, f: Any, start: int, size: int
+    ) -> Optional[Union[bytearray, memoryview]]:
+        """ヘッダーの後のデータを読み込み（mmap_min_bytes 以上の場合はmmap）"""
+        if size >= self.mmap_min_bytes:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            return memoryview(mapped)[start:]
+
+        data = bytearray(size)
+        view = memoryview(data)
+        offset = 0
+        while offset < size:
+            read = f.readinto(view[offset:])
+            if not read:
+                # 読み込み中に切り詰められたファイルはミスとして扱う
+                return None
+            offset += read
+        return data
+
+    def _file_size(self, path: str) -> int:
+        """ファイルのバイト数（存在しない場合は0）"""
+        try:
+            return os.stat(path).st_size
+        except FileNotFoundError:
+            return 0
+
+    def _remove_other_versions(self, key_dir: str, path: str) -> int:
+        """同じキーの古いETagのファイルを削除し、削除したバイト数を返す"""
+        with os.scandir(key_dir) as entries:
+            others = [
+                entry.path
+                for entry in entries
+                if entry.name.endswith(_ENTRY_SUFFIX) and entry.path != path
+            ]
+        removed = 0
+        for other in others:
+            removed += self._file_size(other)
+            self._unlink(other)
+        return removed
+
+    def _evict_if_needed(self, written: int) -> None:
+        """
+        合計バイト数の見積もりが上限を超えた場合に走査し、最終アクセス日時の古い順に削除
+
+        Args:
+            written: 今回の書き込みで増加したバイト数（置き換え・削除したファイルの分を除く）
+        """
+        with self._stats_lock:
+            if self._total_bytes is not None:
+                self._total_bytes += written
+                if self._total_bytes <= self.max_bytes:
+                    return
+
+        with open(self._lock_path, "a") as lock_file:
+            # 複数プロセスが同時に走査・削除しないように排他する
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            files, total_bytes = self._scan()
+            if total_bytes <= self.max_bytes:
+                with self._stats_lock:
+                    self._total_bytes = total_bytes
+                return
+
+            files.sort()
+            evicted = 0
+            for _, size, path in files:
+                if total_bytes <= self.max_bytes:
+                    break
+                self._unlink(path)
+                total_bytes -= size
+                evicted += 1
+
+        with self._stats_lock:
+            self._total_bytes = total_bytes
+            self._evictions += evicted
+        logger.info(
+            "Evicted disk cache entries",
+            extra={"evicted": evicted, "total_bytes": total_bytes, "max_bytes": self.max_bytes}
+        )
+
+    def _scan(self) -> Tuple[List[Tuple[int, int, str]], int]:
+        """キャッシュファイルの (mtime, サイズ, パス) のリストと合計バイト数を取得"""
+        files: List[Tuple[int, int, str]] = []
+        total_bytes = 0
+        stale_before = time.time() - _STALE_TEMP_SECONDS
+        with os.scandir(self.directory) as key_dirs:
+            for key_dir in key_dirs:
+                if not key_dir.is_dir():
+                    continue
+                with os.scandir(key_dir.path) as entries:
+                    for entry in entries:
+                        try:
+                            stat = entry.stat()
+                        except FileNotFoundError:
+                            continue
+                        if entry.name.endswith(_ENTRY_SUFFIX):
+                            files.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                            total_bytes += stat.st_size
+                        elif entry.name.endswith(_TEMP_SUFFIX) and stat.st_mtime < stale_before:
+                            self._unlink(entry.path)
+        return files, total_bytes
+
+    def _unlink(self, path: str) -> None:
+        """ファイルを削除（他のプロセスが削除済みの場合は無視）"""
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+def build_disk_cache() -> Optional[DiskCache]:
+    """
+    環境変数からディスクキャッシュを生成
+
+    - S3_DISK_CACHE_DIR: キャッシュディレクトリ（未設定の場合はディスクキャッシュ無効）
+    - S3_DISK_CACHE_MAX_BYTES: 最大合計バイト数（デフォルト: 512MiB）
+
+    Returns:
+        DiskCacheインスタンス（無効な場合・ディレクトリを作成できない場合はNone）
+    """
+    directory = get_env_str("S3_DISK_CACHE_DIR", "")
+    if not directory:
+        return None
+
+    max_bytes = get_env_int("S3_DISK_CACHE_MAX_BYTES", DEFAULT_DISK_CACHE_MAX_BYTES)
+    try:
+        disk_cache = DiskCache(directory, max_bytes)
+    except OSError as e:
+        logger.warning(
+            "Failed to initialize disk cache, continuing without it",
+            extra={"directory": directory, "error": str(e)}
+        )
+        return None
+
+    logger.info(
+        "Disk cache initialized",
+        extra={"directory": directory, "max_bytes": max_bytes}
+    )
+    return disk_cache
@@ -4,94 +4,652 @@ S3Accessor - AWS S3とSSM Parameter Storeへのアクセスを提供
 既存のs3_accessor.pyを改良し、ログ機能と例外処理を強化したバージョン
 """
 
+import asyncio
+import importlib.util
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AsyncExitStack, contextmanager
+from datetime import datetime
+from email.utils import parsedate_to_datetime
 from io import BytesIO
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 
+from app.core.config import get_env_bool, get_env_float, get_env_int, get_env_str
 from app.core.logging import get_logger
+from app.core.metrics import (
+    S3_OUTCOME_ERROR,
+    S3_OUTCOME_NOT_FOUND,
+    S3_OUTCOME_NOT_MODIFIED,
+    S3_OUTCOME_OK,
+    observe_s3_get_object,
+)
+from app.infrastructure.disk_cache import DiskCache, build_disk_cache
+from app.infrastructure.s3_config import build_config_cache, resolve_s3_config
+from app.infrastructure.storage_formats import STORAGE_FORMAT_PICKLE, serialize_dataframe
 from app.models.exceptions import S3AccessError, SSMConfigError
+from app.models.page import ObjectVersion
 
 logger = get_logger(__name__)
 
+DEFAULT_MAX_POOL_CONNECTIONS = 10
+DEFAULT_CONNECT_TIMEOUT_SECONDS = 60.0
+DEFAULT_READ_TIMEOUT_SECONDS = 60.0
+DEFAULT_RETRY_MODE = "standard"
+DEFAULT_MAX_ATTEMPTS = 3
+RETRY_MODES = ("legacy", "standard", "adaptive")
+
+# レスポンスボディを事前確保したバッファへ読み込む際の1回あたりの読み込みサイズ
+READ_CHUNK_BYTES = 64 * 1024
+
+DEFAULT_MULTIPART_PART_BYTES = 8 * 1024 * 1024
+DEFAULT_MULTIPART_CONCURRENCY = 4
+
+# オブジェクトのデータ（S3・ディスクキャッシュから読み込んだbytearray・bytes、またはディスクキャッシュをmmapしたmemoryview）
+ObjectData = Union[bytearray, bytes, memoryview]
+
+
+def build_client_config(endpoint_url: Optional[str] = None) -> Config:
+    """
+    環境変数からS3クライアントのbotocore設定を生成
+
+    - S3_MAX_POOL_CONNECTIONS: コネクションプールの最大接続数（デフォルト: 10）
+    - S3_CONNECT_TIMEOUT_SECONDS: 接続タイムアウト（デフォルト: 60秒）
+    - S3_READ_TIMEOUT_SECONDS: 読み込みタイムアウト（デフォルト: 60秒）
+    - S3_RETRY_MODE: リトライ方式（legacy / standard / adaptive、デフォルト: standard）
+    - S3_MAX_ATTEMPTS: 初回を含む最大試行回数（デフォルト: 3）
+    - S3_TCP_KEEPALIVE: TCPキープアライブを有効にするか（デフォルト: true）
+
+    Args:
+        endpoint_url: S3互換エンドポイント（指定時はパス形式でアクセス）
+
+    Returns:
+        botocoreのConfigインスタンス
+    """
+    retry_mode = get_env_str("S3_RETRY_MODE", DEFAULT_RETRY_MODE).lower()
+    if retry_mode not in RETRY_MODES:
+        logger.warning(
+            "Invalid S3 retry mode, using default",
+            extra={"retry_mode": retry_mode, "default": DEFAULT_RETRY_MODE}
+        )
+        retry_mode = DEFAULT_RETRY_MODE
+
+    options: Dict[str, Any] = {
+        "max_pool_connections": max(
+            get_env_int("S3_MAX_POOL_CONNECTIONS", DEFAULT_MAX_POOL_CONNECTIONS), 1
+        ),
+        "connect_timeout": get_env_float(
+            "S3_CONNECT_TIMEOUT_SECONDS", DEFAULT_CONNECT_TIMEOUT_SECONDS
+        ),
+        "read_timeout": get_env_float("S3_READ_TIMEOUT_SECONDS", DEFAULT_READ_TIMEOUT_SECONDS),
+        "retries": {
+            "mode": retry_mode,
+            "total_max_attempts": max(get_env_int("S3_MAX_ATTEMPTS", DEFAULT_MAX_ATTEMPTS), 1),
+        },
+        "tcp_keepalive": get_env_bool("S3_TCP_KEEPALIVE", True),
+    }
+    if endpoint_url:
+        options["s3"] = {"addressing_style": "path"}
+    return Config(**options)
+
+
+class PoolUsage:
+    """
+    S3リクエストの同時実行数の計測
+
+    コネクションプールの最大接続数に対する同時実行数を記録し、
+    プールが飽和した状態で開始されたリクエスト数（接続待ちが発生しうる数）を数えます。
+    """
+
+    def __init__(self, max_connections: int):
+        """
+        PoolUsageの初期化
+
+        Args:
+            max_connections: コネクションプールの最大接続数
+        """
+        self.max_connections = max_connections
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._requests = 0
+        self._saturated_requests = 0
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        """リクエストの実行中を記録するコンテキストマネージャー"""
+        with self._lock:
+            if self._in_flight >= self.max_connections:
+                self._saturated_requests += 1
+            self._in_flight += 1
+            self._requests += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        同時実行数の統計情報を取得
+
+        Returns:
+            最大接続数・実行中・ピーク・総リクエスト数・飽和時のリクエスト数の辞書
+        """
+        with self._lock:
+            return {
+                "max_pool_connections": self.max_connections,
+                "in_flight": self._in_flight,
+                "peak_in_flight": self._peak_in_flight,
+                "requests": self._requests,
+                "saturated_requests": self._saturated_requests,
+                "utilization": self._in_flight / self.max_connections,
+            }
+
+
+class ReadAllocations:
+    """
+    S3レスポンスボディの読み込みで確保したバイト数の計測
+
+    ContentLengthから事前確保したバッファに読み込んだリクエストと、
+    ContentLengthが不明でボディ全体を read() したリクエストを区別して記録します。
+    """
+
+    def __init__(self) -> None:
+        """ReadAllocationsの初期化"""
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._preallocated_requests = 0
+        self._allocated_bytes = 0
+        self._max_allocated_bytes = 0
+
+    def record(self, allocated_bytes: int, preallocated: bool) -> None:
+        """
+        1リクエストで確保したバイト数を記録
+
+        Args:
+            allocated_bytes: ボディのために確保したバイト数
+            preallocated: 事前確保したバッファに読み込んだかどうか
+        """
+        with self._lock:
+            self._requests += 1
+            if preallocated:
+                self._preallocated_requests += 1
+            self._allocated_bytes += allocated_bytes
+            self._max_allocated_bytes = max(self._max_allocated_bytes, allocated_bytes)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        確保したバイト数の統計情報を取得
+
+        Returns:
+            リクエスト数・事前確保したリクエスト数・合計/リクエストあたり平均/最大バイト数の辞書
+        """
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "preallocated_requests": self._preallocated_requests,
+                "allocated_bytes": self._allocated_bytes,
+                "allocated_bytes_per_request": (
+                    self._allocated_bytes / self._requests if self._requests else 0.0
+                ),
+                "max_allocated_bytes": self._max_allocated_bytes,
+            }
+
+
+def _content_length(response: Dict[str, Any]) -> Optional[int]:
+    """GetObjectのレスポンスのContentLength（不明な場合はNone）"""
+    content_length = response.get("ContentLength")
+    return content_length if isinstance(content_length, int) and content_length >= 0 else None
+
+
+def _check_read_length(read_bytes: int, content_length: int) -> None:
+    """読み込んだバイト数がContentLengthに一致することを確認"""
+    if read_bytes != content_length:
+        raise IOError(
+            f"Incomplete response body: read {read_bytes} of {content_length} bytes"
+        )
+
+
+def read_body_into(body: Any, view: memoryview) -> None:
+    """
+    S3レスポンスボディを指定したバッファ全体にREAD_CHUNK_BYTESずつ読み込み
+
+    Args:
+        body: botocoreのStreamingBody
+        view: 読み込み先のバッファ（ボディと同じ大きさ）
+
+    Raises:
+        IOError: バッファを埋める前にストリームが終了した場合
+    """
+    offset = 0
+    while offset < len(view):
+        read_bytes = body.readinto(view[offset:offset + READ_CHUNK_BYTES])
+        if not read_bytes:
+            break
+        offset += read_bytes
+    _check_read_length(offset, len(view))
+
+
+def read_body(body: Any, content_length: Optional[int]) -> ObjectData:
+    """
+    S3レスポンスボディをContentLengthの大きさのバッファに読み込み
+
+    bytearrayを1つだけ確保し、READ_CHUNK_BYTESずつ readinto することで、
+    ボディ全体の bytes の生成とデコーダーへ渡す際のコピーを避けます。
+    ContentLengthが不明な場合は read() で全体を読み込みます。
+
+    Args:
+        body: botocoreのStreamingBody
+        content_length: GetObjectのレスポンスのContentLength
+
+    Returns:
+        読み込んだデータ
+
+    Raises:
+        IOError: ContentLengthより前にストリームが終了した場合
+    """
+    if content_length is None:
+        data: bytes = body.read()
+        return data
+
+    buffer = bytearray(content_length)
+    read_body_into(body, memoryview(buffer))
+    return buffer
+
+
+async def read_body_into_async(body: Any, view: memoryview) -> None:
+    """
+    read_body_into の非同期版（aiobotocoreのStreamingBody）
+
+    Args:
+        body: aiobotocoreのStreamingBody
+        view: 読み込み先のバッファ（ボディと同じ大きさ）
+
+    Raises:
+        IOError: バッファを埋める前にストリームが終了した場合
+    """
+    offset = 0
+    while offset < len(view):
+        read_bytes = await body.readinto(view[offset:offset + READ_CHUNK_BYTES])
+        if not read_bytes:
+            break
+        offset += read_bytes
+    _check_read_length(offset, len(view))
+
+
+async def read_body_async(body: Any, content_length: Optional[int]) -> ObjectData:
+    """
+    read_body の非同期版（aiobotocoreのStreamingBody）
+
+    Args:
+        body: aiobotocoreのStreamingBody
+        content_length: GetObjectのレスポンスのContentLength
+
+    Returns:
+        読み込んだデータ
+
+    Raises:
+        IOError: ContentLengthより前にストリームが終了した場合
+    """
+    if content_length is None:
+        data: bytes = await body.read()
+        return data
+
+    buffer = bytearray(content_length)
+    await read_body_into_async(body, memoryview(buffer))
+    return buffer
+
+
+class MultipartConfig(NamedTuple):
+    """
+    大きなオブジェクトを複数のRange取得で並行にダウンロードする設定
+
+    先頭の threshold_bytes を1回目のGetObjectで取得し、オブジェクトがそれより大きい場合は
+    残りを part_bytes ごとのRange取得で concurrency 並列に取得します。
+
+    Attributes:
+        threshold_bytes: マルチパート取得を行うオブジェクトサイズの閾値（0の場合は無効）
+        part_bytes: 2つ目以降のパートのバイト数
+        concurrency: パートの同時取得数
+    """
+
+    threshold_bytes: int = 0
+    part_bytes: int = DEFAULT_MULTIPART_PART_BYTES
+    concurrency: int = DEFAULT_MULTIPART_CONCURRENCY
+
+    @property
+    def enabled(self) -> bool:
+        """マルチパート取得が有効かどうか"""
+        return self.threshold_bytes > 0
+
+    @property
+    def first_range(self) -> str:
+        """1回目のGetObjectのRangeヘッダー"""
+        return f"bytes=0-{self.threshold_bytes - 1}"
+
+    def part_ranges(self, start: int, size: int) -> List[Tuple[int, int]]:
+        """
+        残りのパートのバイト範囲のリスト
+
+        Args:
+            start: 2つ目のパートの開始位置（1回目に取得したバイト数）
+            size: オブジェクトのサイズ
+
+        Returns:
+            (開始位置, 終了位置（含まない）) のリスト
+        """
+        return [
+            (part_start, min(part_start + self.part_bytes, size))
+            for part_start in range(start, size, self.part_bytes)
+        ]
+
+
+def build_multipart_config() -> MultipartConfig:
+    """
+    環境変数からマルチパート取得の設定を生成
+
+    - S3_MULTIPART_THRESHOLD_BYTES: マルチパート取得を行うサイズの閾値（デフォルト: 0 = 無効）
+    - S3_MULTIPART_PART_BYTES: パートのバイト数（デフォルト: 8MiB）
+    - S3_MULTIPART_CONCURRENCY: パートの同時取得数（デフォルト: 4）
+
+    Returns:
+        MultipartConfigインスタンス
+    """
+    return MultipartConfig(
+        threshold_bytes=max(get_env_int("S3_MULTIPART_THRESHOLD_BYTES", 0), 0),
+        part_bytes=max(
+            get_env_int("S3_MULTIPART_PART_BYTES", DEFAULT_MULTIPART_PART_BYTES), READ_CHUNK_BYTES
+        ),
+        concurrency=max(
+            get_env_int("S3_MULTIPART_CONCURRENCY", DEFAULT_MULTIPART_CONCURRENCY), 1
+        ),
+    )
+
+
+def _object_size(response: Dict[str, Any]) -> Optional[int]:
+    """
+    Range取得のレスポンスのContentRange（bytes 0-99/1000）からオブジェクト全体のサイズを取得
+
+    Returns:
+        オブジェクトのサイズ（ContentRangeがない場合はNone）
+    """
+    content_range = response.get("ContentRange")
+    if not isinstance(content_range, str) or "/" not in content_range:
+        return None
+    total = content_range.rsplit("/", 1)[1]
+    return int(total) if total.isdigit() else None
+
+
+class S3Object(NamedTuple):
+    """
+    S3から取得したオブジェクトとメタデータ
+
+    Attributes:
+        data: バイナリデータ（条件付き取得でオブジェクトが変更されていない場合はNone）
+        etag: オブジェクトのETag（引用符を含む）
+        last_modified: オブジェクトの最終更新日時
+    """
+
+    data: Optional[ObjectData]
+    etag: Optional[str] = None
+    last_modified: Optional[datetime] = None
+
+    @property
+    def not_modified(self) -> bool:
+        """条件付き取得でオブジェクトが変更されていなかったかどうか"""
+        return self.data is None
+
+    @property
+    def version(self) -> ObjectVersion:
+        """オブジェクトのバージョン情報"""
+        return ObjectVersion(self.etag, self.last_modified)
+
+
+def _not_modified_object(error: ClientError, if_none_match: Optional[str]) -> Optional[S3Object]:
+    """
+    条件付き取得の304応答をS3Objectに変換
+
+    Args:
+        error: GetObjectで送出されたClientError
+        if_none_match: リクエストで指定したETag
+
+    Returns:
+        data=NoneのS3Object（304応答でない場合はNone）
+    """
+    metadata = error.response.get("ResponseMetadata", {})
+    error_code = error.response.get("Error", {}).get("Code")
+    if metadata.get("HTTPStatusCode") != 304 and error_code not in ("304", "NotModified"):
+        return None
+
+    headers = metadata.get("HTTPHeaders", {})
+    last_modified = None
+    if headers.get("last-modified"):
+        try:
+            last_modified = parsedate_to_datetime(headers["last-modified"])
+        except (TypeError, ValueError):
+            last_modified = None
+    return S3Object(None, headers.get("etag", if_none_match), last_modified)
+
+
+def is_async_available() -> bool:
+    """
+    非同期S3アクセス（aiobotocore）が利用可能かどうかを判定
+
+    Returns:
+        aiobotocoreがインストールされている場合はTrue
+    """
+    return importlib.util.find_spec("aiobotocore") is not None
+
 
 class S3Accessor:
     """
     AWS S3とSSM Parameter Storeへのアクセスを提供するクラス
 
     SSM Parameter Storeから認証情報を取得し、S3クライアントを初期化します。
+
+    同期メソッド（get_object など）はboto3を、非同期メソッド（get_object_async など）は
+    オプション依存関係のaiobotocore（`uv sync --extra async`）を使用します。
+    非同期クライアントは最初の呼び出し時にイベントループごとに作成されます。
+
+    環境変数S3_DISK_CACHE_DIRが設定されている場合は、取得したオブジェクトを
+    ローカルディスクにも保存します（DiskCache を参照）。ディスクキャッシュにある
+    オブジェクトはETagによる条件付き取得で検証し、変更されていなければ
+    ボディを転送せずにディスク上のファイルのデータを返します。
+
+    環境変数S3_MULTIPART_THRESHOLD_BYTESを設定すると、それより大きなオブジェクトを
+    複数のRange取得で並行にダウンロードし、1つのバッファに組み立てます（MultipartConfig を参照）。
     """
 
-    def __init__(self):
+    def __init__(self) -> None:
         """
         S3Accessorの初期化
 
-        環境変数AWS_REGIONを使用してSSMクライアントを作成し、
-        必要な認証情報をSSM Parameter Storeから取得します。
+        認証情報・リージョン・バケット名を環境変数・ローカルの設定キャッシュ・
+        SSM Parameter Store（1回のGetParameters）の順に解決します（resolve_s3_config を参照）。
+        SSMクライアントは環境変数AWS_REGIONのリージョンで、SSMへのアクセスが必要な場合にのみ作成します。
+        環境変数S3_ENDPOINT_URLが設定されている場合は、そのエンドポイント
+        （MinIOやローカルのスタブサーバーなど）にパス形式でアクセスします。
+
+        初期化の所要時間の内訳（設定の解決・S3クライアントの作成）をログに出力します。
 
         Raises:
             SSMConfigError: SSM Parameter Store認証情報の取得に失敗した場合
         """
         try:
-            aws_region = os.environ.get("AWS_REGION", "ap-northeast-1")
-            logger.info(f"Initializing S3Accessor with region: {aws_region}")
+            started = time.perf_counter()
+            self.aws_region = os.environ.get("AWS_REGION", "ap-northeast-1")
+            logger.info(f"Initializing S3Accessor with region: {self.aws_region}")
+            self._ssm_client: Any = None
 
-            self.ssm_client = boto3.client("ssm", region_name=aws_region)
+            config, config_source = resolve_s3_config(self.get_parameters, build_config_cache())
+            self.aws_access_key_id = config.access_key_id
+            self.aws_secret_access_key = config.secret_access_key
+            self.region_name = config.region_name
+            self.bucket_name = config.bucket_name
+            config_resolved = time.perf_counter()
 
-            # SSM Parameter Storeから認証情報を取得
-            self.aws_access_key_id = self.get_parameter("ACCESS_KEY")
-            self.aws_secret_access_key = self.get_parameter("SECRET_ACCESS_KEY")
-            self.region_name = self.get_parameter("REGION_NAME")
-            self.bucket_name = self.get_parameter("BUCKET_NAME")
+            self.endpoint_url = get_env_str("S3_ENDPOINT_URL", "") or None
+            self.client_config = build_client_config(self.endpoint_url)
+            self.pool_usage = PoolUsage(self.client_config.max_pool_connections)
+            self.read_allocations = ReadAllocations()
+            self.multipart_config = build_multipart_config()
+            self._multipart_executor: Optional[ThreadPoolExecutor] = None
+            self._multipart_executor_lock = threading.Lock()
+            self.disk_cache: Optional[DiskCache] = build_disk_cache()
 
             # S3クライアントの初期化
-            self.client = boto3.client(
-                "s3",
-                aws_access_key_id=self.aws_access_key_id,
-                aws_secret_access_key=self.aws_secret_access_key,
-                region_name=self.region_name,
-            )
+            client_started = time.perf_counter()
+            self.client = boto3.client("s3", **self._client_kwargs())
+            client_created = time.perf_counter()
+
+            # 非同期S3クライアント（最初の非同期呼び出し時に作成）
+            self._async_client: Any = None
+            self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+            self._async_client_lock: Optional[asyncio.Lock] = None
+            self._async_exit_stack: Optional[AsyncExitStack] = None
 
             logger.info(
                 "S3Accessor initialized successfully",
-                extra={"bucket": self.bucket_name, "region": self.region_name}
+                extra={
+                    "bucket": self.bucket_name,
+                    "region": self.region_name,
+                    "max_pool_connections": self.client_config.max_pool_connections,
+                    "retry_mode": self.client_config.retries["mode"],
+                    "multipart_threshold_bytes": self.multipart_config.threshold_bytes,
+                    "config_source": config_source,
+                    "config_ms": round((config_resolved - started) * 1000, 2),
+                    "s3_client_ms": round((client_created - client_started) * 1000, 2),
+                    "total_ms": round((time.perf_counter() - started) * 1000, 2),
+                }
             )
 
         except Exception as e:
             logger.error(f"Failed to initialize S3Accessor: {e}")
             raise SSMConfigError("S3Accessor initialization", e) from e
 
-    def get_parameter(self, name: str) -> str:
+    def _client_kwargs(self) -> Dict[str, Any]:
+        """同期・非同期のS3クライアントで共通の初期化引数を生成"""
+        kwargs: Dict[str, Any] = {
+            "aws_access_key_id": self.aws_access_key_id,
+            "aws_secret_access_key": self.aws_secret_access_key,
+            "region_name": self.region_name,
+            "config": self.client_config,
+        }
+        if self.endpoint_url:
+            kwargs["endpoint_url"] = self.endpoint_url
+        return kwargs
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """
+        S3コネクションプールの使用状況を取得
+
+        Returns:
+            同時実行数の統計情報の辞書（PoolUsage.stats を参照）
         """
-        SSM Parameter Storeからパラメータを取得
+        return self.pool_usage.stats()
+
+    def read_stats(self) -> Dict[str, Any]:
+        """
+        S3レスポンスボディの読み込みで確保したバイト数の統計情報を取得
+
+        Returns:
+            確保したバイト数の統計情報の辞書（ReadAllocations.stats を参照）
+        """
+        return self.read_allocations.stats()
+
+    def disk_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        ディスクキャッシュの統計情報を取得
+
+        Returns:
+            統計情報の辞書（ディスクキャッシュが無効の場合はNone）
+        """
+        return self.disk_cache.stats() if self.disk_cache is not None else None
+
+    def _disk_cache_key(self, key: str) -> str:
+        """ディスクキャッシュのキー（バケット名を含むS3キー）"""
+        return f"{self.bucket_name}/{key}"
+
+    def _lookup_disk_cache(self, key: str, if_none_match: Optional[str]) -> Optional[S3Object]:
+        """
+        条件付き取得の検証対象とするディスクキャッシュのオブジェクトを取得
+
+        呼び出し元がETagを指定した場合（呼び出し元が最新のデータを保持している場合）は
+        ディスクキャッシュを参照しません。
+        """
+        if self.disk_cache is None or if_none_match is not None:
+            return None
+        entry = self.disk_cache.get(self._disk_cache_key(key))
+        if entry is None:
+            return None
+        return S3Object(entry.data, entry.etag, entry.last_modified)
+
+    def _store_disk_cache(self, key: str, s3_object: S3Object) -> None:
+        """取得したオブジェクトをディスクキャッシュに保存"""
+        if self.disk_cache is None or s3_object.data is None or s3_object.etag is None:
+            return
+        self.disk_cache.put(
+            self._disk_cache_key(key), s3_object.etag, s3_object.last_modified, s3_object.data
+        )
+
+    @property
+    def ssm_client(self) -> Any:
+        """SSMクライアント（最初の参照時に作成）"""
+        if self._ssm_client is None:
+            self._ssm_client = boto3.client("ssm", region_name=self.aws_region)
+        return self._ssm_client
+
+    def get_parameters(self, names: List[str]) -> Dict[str, str]:
+        """
+        SSM Parameter Storeから複数のパラメータを1回のGetParametersで取得
 
         Args:
-            name: パラメータ名
+            names: パラメータ名のリスト（最大10件）
 
         Returns:
-            パラメータ値
+            パラメータ名と値の辞書
 
         Raises:
-            SSMConfigError: パラメータ取得に失敗した場合
+            SSMConfigError: 取得に失敗した場合、または存在しないパラメータがある場合
         """
+        started = time.perf_counter()
         try:
-            response = self.ssm_client.get_parameter(Name=name, WithDecryption=True)
-            logger.debug(f"Retrieved SSM parameter: {name}")
-            value: str = response["Parameter"]["Value"]
-            return value
+            response = self.ssm_client.get_parameters(Names=names, WithDecryption=True)
         except ClientError as e:
             logger.error(
-                "Failed to get SSM parameter",
-                extra={"parameter": name, "error": str(e)}
+                "Failed to get SSM parameters",
+                extra={"parameters": names, "error": str(e)}
             )
-            raise SSMConfigError(name, e) from e
+            raise SSMConfigError(", ".join(names), e) from e
         except Exception as e:
-            logger.error(f"Unexpected error getting SSM parameter: {e}")
-            raise SSMConfigError(name, e) from e
+            logger.error(f"Unexpected error getting SSM parameters: {e}")
+            raise SSMConfigError(", ".join(names), e) from e
+
+        invalid = response.get("InvalidParameters", [])
+        if invalid:
+            logger.error("SSM parameters not found", extra={"parameters": invalid})
+            raise SSMConfigError(", ".join(invalid), Exception("Parameter not found"))
 
-    def get_object(self, key: str) -> Optional[bytes]:
+        values: Dict[str, str] = {
+            parameter["Name"]: parameter["Value"] for parameter in response["Parameters"]
+        }
+        logger.info(
+            "Retrieved SSM parameters",
+            extra={
+                "parameters": names,
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+            }
+        )
+        return values
+
+    def get_object(self, key: str) -> Optional[ObjectData]:
         """
         S3からオブジェクトを取得
 
@@ -104,17 +662,57 @@ class S3Accessor:
         Raises:
             S3AccessError: S3接続エラーが発生した場合
         """
+        s3_object = self.get_object_with_metadata(key)
+        return s3_object.data if s3_object is not None else None
+
+    def get_object_with_metadata(
+        self, key: str, if_none_match: Optional[str] = None
+    ) -> Optional[S3Object]:
+        """
+        S3からオブジェクトをETag・最終更新日時とともに取得
+
+        if_none_match を指定すると条件付き取得（GetObjectのIfNoneMatch）を行い、
+        オブジェクトが変更されていない場合はボディを転送せずに data=None の
+        S3Objectを返します。
+
+        ディスクキャッシュが有効な場合、if_none_match を省略するとディスクキャッシュの
+        ETagで条件付き取得を行い、変更されていなければディスクキャッシュのデータを返します。
+
+        Args:
+            key: S3オブジェクトキー
+            if_none_match: 手元のオブジェクトのETag（省略時は無条件に取得）
+
+        Returns:
+            取得したオブジェクト（オブジェクトが存在しない場合はNone）
+
+        Raises:
+            S3AccessError: S3接続エラーが発生した場合
+        """
+        cached = self._lookup_disk_cache(key, if_none_match)
+        request = self._get_object_request(key, if_none_match, cached)
+        outcome, received_bytes = S3_OUTCOME_ERROR, 0
+        started = time.perf_counter()
+
         try:
             logger.info("Fetching object from S3", extra={"bucket": self.bucket_name, "key": key})
-            response = self.client.get_object(Bucket=self.bucket_name, Key=key)
-            data: bytes = response["Body"].read()
+            response, data = self._get_object_body(request)
+            outcome, received_bytes = S3_OUTCOME_OK, len(data)
+            self.read_allocations.record(len(data), preallocated=isinstance(data, bytearray))
             logger.info("Successfully fetched object", extra={"bucket": self.bucket_name, "key": key, "size": len(data)})
-            return data
+            s3_object = S3Object(data, response.get("ETag"), response.get("LastModified"))
+            self._store_disk_cache(key, s3_object)
+            return s3_object
 
         except ClientError as e:
+            not_modified = _not_modified_object(e, request.get("IfNoneMatch"))
+            if not_modified is not None:
+                outcome = S3_OUTCOME_NOT_MODIFIED
+                return self._not_modified_result(key, not_modified, cached)
+
             error_code = e.response.get("Error", {}).get("Code", "Unknown")
 
             if error_code == "NoSuchKey":
+                outcome = S3_OUTCOME_NOT_FOUND
                 # ファイルが存在しない場合はNoneを返す（404相当）
                 logger.warning(
                     "Object not found in S3",
@@ -153,6 +751,396 @@ class S3Accessor:
                 key=key
             ) from e
 
+        finally:
+            observe_s3_get_object(outcome, time.perf_counter() - started, received_bytes)
+
+    def _get_object_body(self, request: Dict[str, Any]) -> Tuple[Dict[str, Any], ObjectData]:
+        """
+        GetObjectを実行してボディを読み込み
+
+        マルチパート取得が有効な場合は先頭の threshold_bytes をRange取得し、
+        オブジェクトがそれより大きければ残りのパートを並行に取得して1つのバッファに組み立てます。
+
+        Args:
+            request: GetObjectのリクエストパラメータ
+
+        Returns:
+            (1回目のGetObjectのレスポンス, オブジェクトのデータ)
+        """
+        multipart = self.multipart_config
+        if not multipart.enabled:
+            return self._get_whole_object(request)
+
+        try:
+            with self.pool_usage.track():
+                response = self.client.get_object(**request, Range=multipart.first_range)
+                size = _object_size(response)
+                content_length = _content_length(response)
+                if size is None or content_length is None or size <= content_length:
+                    return response, read_body(response["Body"], content_length)
+                buffer = bytearray(size)
+                view = memoryview(buffer)
+                read_body_into(response["Body"], view[:content_length])
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "InvalidRange":
+                raise
+            # 空のオブジェクトはRange取得できないため通常の取得を行う
+            return self._get_whole_object(request)
+
+        parts = multipart.part_ranges(content_length, size)
+        logger.info(
+            "Fetching object parts from S3",
+            extra={"bucket": self.bucket_name, "key": request["Key"], "size": size, "parts": len(parts)}
+        )
+        etag = response.get("ETag")
+        executor = self._get_multipart_executor()
+        list(executor.map(lambda part: self._get_part(request, etag, view, part), parts))
+        return response, buffer
+
+    def _get_whole_object(self, request: Dict[str, Any]) -> Tuple[Dict[str, Any], ObjectData]:
+        """1回のGetObjectでオブジェクト全体を取得"""
+        with self.pool_usage.track():
+            response = self.client.get_object(**request)
+            return response, read_body(response["Body"], _content_length(response))
+
+    def _get_part(
+        self,
+        request: Dict[str, Any],
+        etag: Optional[str],
+        view: memoryview,
+        part: Tuple[int, int],
+    ) -> None:
+        """
+        パートをRange取得してバッファの対応する位置に読み込み
+
+        1回目の取得とETagが異なる場合（取得中にオブジェクトが更新された場合）は
+        IfMatchの条件によりClientError（PreconditionFailed）となります。
+        """
+        start, end = part
+        with self.pool_usage.track():
+            response = self.client.get_object(**self._part_request(request, etag, part))
+            read_body_into(response["Body"], view[start:end])
+
+    def _part_request(
+        self, request: Dict[str, Any], etag: Optional[str], part: Tuple[int, int]
+    ) -> Dict[str, Any]:
+        """パートのGetObjectのリクエストパラメータを生成"""
+        start, end = part
+        part_request: Dict[str, Any] = {
+            "Bucket": request["Bucket"],
+            "Key": request["Key"],
+            "Range": f"bytes={start}-{end - 1}",
+        }
+        if etag is not None:
+            part_request["IfMatch"] = etag
+        return part_request
+
+    def _get_multipart_executor(self) -> ThreadPoolExecutor:
+        """パートの並行取得に使用するスレッドプールを取得（最初の呼び出し時に作成）"""
+        with self._multipart_executor_lock:
+            if self._multipart_executor is None:
+                self._multipart_executor = ThreadPoolExecutor(
+                    max_workers=self.multipart_config.concurrency,
+                    thread_name_prefix="s3-multipart",
+                )
+            return self._multipart_executor
+
+    def _get_object_request(
+        self, key: str, if_none_match: Optional[str], cached: Optional[S3Object]
+    ) -> Dict[str, Any]:
+        """GetObjectのリクエストパラメータを生成（ディスクキャッシュがあればそのETagで条件付き取得）"""
+        request: Dict[str, Any] = {"Bucket": self.bucket_name, "Key": key}
+        if cached is not None:
+            request["IfNoneMatch"] = cached.etag
+        elif if_none_match is not None:
+            request["IfNoneMatch"] = if_none_match
+        return request
+
+    def _not_modified_result(
+        self, key: str, not_modified: S3Object, cached: Optional[S3Object]
+    ) -> S3Object:
+        """条件付き取得の304応答に対する結果（ディスクキャッシュの検証の場合はそのデータ）"""
+        if cached is not None:
+            logger.info(
+                "Serving object from disk cache",
+                extra={"bucket": self.bucket_name, "key": key, "etag": cached.etag}
+            )
+            return cached
+        logger.info(
+            "Object not modified",
+            extra={"bucket": self.bucket_name, "key": key, "etag": not_modified.etag}
+        )
+        return not_modified
+
+    async def _get_object_body_async(
+        self, client: Any, request: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], ObjectData]:
+        """
+        _get_object_body の非同期版（パートは concurrency 並列で取得）
+
+        いずれかのパートの取得に失敗した場合は、残りのパートの取得をキャンセルして
+        最初に失敗したパートの例外を送出します。
+
+        Args:
+            client: aiobotocoreのS3クライアント
+            request: GetObjectのリクエストパラメータ
+
+        Returns:
+            (1回目のGetObjectのレスポンス, オブジェクトのデータ)
+        """
+        multipart = self.multipart_config
+        if not multipart.enabled:
+            return await self._get_whole_object_async(client, request)
+
+        try:
+            with self.pool_usage.track():
+                response = await client.get_object(**request, Range=multipart.first_range)
+                size = _object_size(response)
+                content_length = _content_length(response)
+                body = response["Body"]
+                async with body:
+                    if size is None or content_length is None or size <= content_length:
+                        return response, await read_body_async(body, content_length)
+                    buffer = bytearray(size)
+                    view = memoryview(buffer)
+                    await read_body_into_async(body, view[:content_length])
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "InvalidRange":
+                raise
+            return await self._get_whole_object_async(client, request)
+
+        parts = multipart.part_ranges(content_length, size)
+        logger.info(
+            "Fetching object parts from S3 (async)",
+            extra={"bucket": self.bucket_name, "key": request["Key"], "size": size, "parts": len(parts)}
+        )
+        etag = response.get("ETag")
+        semaphore = asyncio.Semaphore(multipart.concurrency)
+
+        async def get_part(part: Tuple[int, int]) -> None:
+            start, end = part
+            async with semaphore:
+                with self.pool_usage.track():
+                    part_response = await client.get_object(
+                        **self._part_request(request, etag, part)
+                    )
+                    part_body = part_response["Body"]
+                    async with part_body:
+                        await read_body_into_async(part_body, view[start:end])
+
+        tasks = [asyncio.create_task(get_part(part)) for part in parts]
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            # 失敗したパートがある場合（または呼び出し元がキャンセルされた場合）は、
+            # 残りのパートの取得を中止して接続を解放する
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        for task in tasks:
+            error = None if task.cancelled() else task.exception()
+            if error is not None:
+                raise error
+        return response, buffer
+
+    async def _get_whole_object_async(
+        self, client: Any, request: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], ObjectData]:
+        """1回のGetObjectでオブジェクト全体を非同期に取得"""
+        with self.pool_usage.track():
+            response = await client.get_object(**request)
+            body = response["Body"]
+            async with body:
+                return response, await read_body_async(body, _content_length(response))
+
+    async def get_async_client(self) -> Any:
+        """
+        実行中のイベントループに対応する非同期S3クライアントを取得
+
+        イベントループが変わった場合（テストなど）は新しいクライアントを作成します。
+
+        Returns:
+            aiobotocoreのS3クライアント
+
+        Raises:
+            S3AccessError: aiobotocoreがインストールされていない場合
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is not None and self._async_client_loop is loop:
+            return self._async_client
+
+        if self._async_client_loop is not loop or self._async_client_lock is None:
+            self._async_client_lock = asyncio.Lock()
+            self._async_client_loop = loop
+            self._async_client = None
+
+        async with self._async_client_lock:
+            if self._async_client is None:
+                if not is_async_available():
+                    raise S3AccessError("aiobotocore is not installed", bucket=self.bucket_name)
+
+                from aiobotocore.session import get_session
+
+                exit_stack = AsyncExitStack()
+                self._async_client = await exit_stack.enter_async_context(
+                    get_session().create_client("s3", **self._client_kwargs())
+                )
+                self._async_exit_stack = exit_stack
+                logger.info("Async S3 client initialized", extra={"bucket": self.bucket_name})
+
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """非同期S3クライアントを閉じる（アプリケーション終了時）"""
+        exit_stack = self._async_exit_stack
+        self._async_client = None
+        self._async_client_loop = None
+        self._async_client_lock = None
+        self._async_exit_stack = None
+        if exit_stack is not None:
+            await exit_stack.aclose()
+            logger.info("Async S3 client closed", extra={"bucket": self.bucket_name})
+
+    async def get_object_async(self, key: str) -> Optional[ObjectData]:
+        """
+        S3からオブジェクトを非同期に取得
+
+        エラー処理は get_object と同一です。
+
+        Args:
+            key: S3オブジェクトキー
+
+        Returns:
+            バイナリデータ（オブジェクトが存在しない場合はNone）
+
+        Raises:
+            S3AccessError: S3接続エラーが発生した場合
+        """
+        s3_object = await self.get_object_with_metadata_async(key)
+        return s3_object.data if s3_object is not None else None
+
+    async def get_object_with_metadata_async(
+        self, key: str, if_none_match: Optional[str] = None
+    ) -> Optional[S3Object]:
+        """
+        get_object_with_metadata の非同期版
+
+        Args:
+            key: S3オブジェクトキー
+            if_none_match: 手元のオブジェクトのETag（省略時は無条件に取得）
+
+        Returns:
+            取得したオブジェクト（オブジェクトが存在しない場合はNone）
+
+        Raises:
+            S3AccessError: S3接続エラーが発生した場合
+        """
+        cached = self._lookup_disk_cache(key, if_none_match)
+        request = self._get_object_request(key, if_none_match, cached)
+        outcome, received_bytes = S3_OUTCOME_ERROR, 0
+        started = time.perf_counter()
+
+        try:
+            client = await self.get_async_client()
+            logger.info("Fetching object from S3 (async)", extra={"bucket": self.bucket_name, "key": key})
+            response, data = await self._get_object_body_async(client, request)
+            outcome, received_bytes = S3_OUTCOME_OK, len(data)
+            self.read_allocations.record(len(data), preallocated=isinstance(data, bytearray))
+            logger.info(
+                "Successfully fetched object (async)",
+                extra={"bucket": self.bucket_name, "key": key, "size": len(data)}
+            )
+            s3_object = S3Object(data, response.get("ETag"), response.get("LastModified"))
+            # 書き込みはイベントループをブロックしないようにスレッドで実行する
+            await asyncio.to_thread(self._store_disk_cache, key, s3_object)
+            return s3_object
+
+        except ClientError as e:
+            not_modified = _not_modified_object(e, request.get("IfNoneMatch"))
+            if not_modified is not None:
+                outcome = S3_OUTCOME_NOT_MODIFIED
+                return self._not_modified_result(key, not_modified, cached)
+
+            error_code = e.response.get("Error", {}).get("Code", "Unknown")
+
+            if error_code == "NoSuchKey":
+                outcome = S3_OUTCOME_NOT_FOUND
+                logger.warning(
+                    "Object not found in S3",
+                    extra={"bucket": self.bucket_name, "key": key}
+                )
+                return None
+
+            logger.error(
+                "S3 access error",
+                extra={
+                    "bucket": self.bucket_name,
+                    "key": key,
+                    "error_code": error_code,
+                    "error": str(e)
+                }
+            )
+            raise S3AccessError(
+                f"Failed to get object from S3: {error_code}",
+                bucket=self.bucket_name,
+                key=key
+            ) from e
+
+        except S3AccessError:
+            raise
+
+        except NoCredentialsError as e:
+            logger.error(f"AWS credentials not found: {e}")
+            raise S3AccessError("AWS credentials not found", bucket=self.bucket_name, key=key) from e
+
+        except Exception as e:
+            logger.error(
+                "Unexpected error getting object from S3",
+                extra={"bucket": self.bucket_name, "key": key, "error": str(e)}
+            )
+            raise S3AccessError(
+                f"Unexpected error: {str(e)}",
+                bucket=self.bucket_name,
+                key=key
+            ) from e
+
+        finally:
+            observe_s3_get_object(outcome, time.perf_counter() - started, received_bytes)
+
+    async def list_objects_async(self, prefix: str, delimiter: str = "/") -> List[Dict[str, Any]]:
+        """
+        S3バケット内のオブジェクトを非同期にリスト表示
+
+        Args:
+            prefix: オブジェクトキーのプレフィックス
+            delimiter: 区切り文字（デフォルト: "/"）
+
+        Returns:
+            オブジェクトのリスト（エラー時は空のリスト）
+        """
+        objects: List[Dict[str, Any]] = []
+
+        try:
+            client = await self.get_async_client()
+            paginator = client.get_paginator("list_objects_v2")
+            async for page in paginator.paginate(
+                Bucket=self.bucket_name, Prefix=prefix, Delimiter=delimiter
+            ):
+                objects.extend(page.get("Contents", []))
+
+            logger.info(
+                "Listed objects in S3 (async)",
+                extra={"bucket": self.bucket_name, "prefix": prefix, "count": len(objects)}
+            )
+            return objects
+
+        except Exception as e:
+            logger.error(
+                "Error listing objects",
+                extra={"bucket": self.bucket_name, "prefix": prefix, "error": str(e)}
+            )
+            return []
+
     def list_objects(self, prefix: str, delimiter: str = "/") -> List[Dict[str, Any]]:
         """
         S3バケット内のオブジェクトをリスト表示
@@ -305,19 +1293,33 @@ class S3Accessor:
                 key=key,
             ) from e
 
-    def upload_dataframe(self, df, key: str) -> None:
+    def upload_dataframe(
+        self,
+        df,
+        key: str,
+        storage_format: str = STORAGE_FORMAT_PICKLE,
+        compression: Optional[str] = None,
+    ) -> None:
         """
-        pandas DataFrameをpickle形式でS3にアップロード
+        pandas DataFrameを指定形式でS3にアップロード
 
         Args:
             df: pandas DataFrame
             key: S3バケット内のオブジェクトキー
+            storage_format: 保存形式（pickle / feather / parquet、デフォルト: pickle）
+            compression: 圧縮方式（省略時は形式ごとのデフォルト）
         """
         try:
-            buffer = BytesIO()
-            df.to_pickle(buffer)
-            buffer.seek(0)
+            buffer = BytesIO(serialize_dataframe(df, storage_format, compression))
             self.upload_fileobj(buffer, key)
-            logger.info("Uploaded DataFrame to S3", extra={"bucket": self.bucket_name, "key": key})
+            logger.info(
+                "Uploaded DataFrame to S3",
+                extra={
+                    "bucket": self.bucket_name,
+                    "key": key,
+                    "storage_format": storage_format,
+                    "size": buffer.getbuffer().nbytes,
+                }
+            )
         except Exception as e:
             logger.error(f"Error uploading DataFrame: {e}")
@@ -0,0 +1,235 @@
+"""
+S3 Config - S3Accessorの接続設定の解決
+
+S3の認証情報・リージョン・バケット名を以下の順に解決します。
+
+1. 環境変数（S3_ACCESS_KEY_ID / S3_SECRET_ACCESS_KEY / S3_REGION_NAME / S3_BUCKET_NAME）
+2. ローカルの設定キャッシュ（S3_CONFIG_CACHE_FILE、有効期限内の場合）
+3. SSM Parameter Store（未解決の項目のみを1回のGetParametersで取得）
+
+設定キャッシュはパーミッション0600のファイルに書き込みます。S3_CONFIG_CACHE_KEY
+（Fernetキー）を設定した場合は暗号化します（オプション依存関係のcryptographyが必要、
+`uv sync --extra crypto`）。
+"""
+
+import importlib.util
+import json
+import os
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from app.core.config import get_env_float, get_env_str
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_CONFIG_CACHE_TTL_SECONDS = 3600.0
+
+CONFIG_SOURCE_ENV = "env"
+CONFIG_SOURCE_CACHE = "cache"
+CONFIG_SOURCE_SSM = "ssm"
+
+
+class S3Config(NamedTuple):
+    """
+    S3Accessorの接続設定
+
+    Attributes:
+        access_key_id: AWSアクセスキーID
+        secret_access_key: AWSシークレットアクセスキー
+        region_name: S3バケットのリージョン
+        bucket_name: S3バケット名
+    """
+
+    access_key_id: str
+    secret_access_key: str
+    region_name: str
+    bucket_name: str
+
+
+# 項目ごとのSSMパラメータ名
+SSM_PARAMETER_NAMES: Dict[str, str] = {
+    "access_key_id": "ACCESS_KEY",
+    "secret_access_key": "SECRET_ACCESS_KEY",
+    "region_name": "REGION_NAME",
+    "bucket_name": "BUCKET_NAME",
+}
+
+# 項目ごとの上書き用の環境変数名
+ENV_OVERRIDES: Dict[str, str] = {
+    "access_key_id": "S3_ACCESS_KEY_ID",
+    "secret_access_key": "S3_SECRET_ACCESS_KEY",
+    "region_name": "S3_REGION_NAME",
+    "bucket_name": "S3_BUCKET_NAME",
+}
+
+
+def is_encryption_available() -> bool:
+    """
+    設定キャッシュの暗号化（cryptography）が利用可能かどうかを判定
+
+    Returns:
+        cryptographyがインストールされている場合はTrue
+    """
+    return importlib.util.find_spec("cryptography") is not None
+
+
+class ConfigCache:
+    """
+    SSM Parameter Storeから取得した設定のローカルキャッシュ
+
+    有効期限とともにJSONで保存します。key を指定した場合はFernetで暗号化します。
+    読み込みに失敗した場合（存在しない・期限切れ・復号できない）はミスとして扱います。
+    """
+
+    def __init__(self, path: str, ttl_seconds: float, key: Optional[str] = None):
+        """
+        ConfigCacheの初期化
+
+        Args:
+            path: キャッシュファイルのパス
+            ttl_seconds: 有効期間（秒）
+            key: 暗号化に使用するFernetキー（Noneの場合は暗号化しない）
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._fernet: Any = None
+        if key is not None:
+            from cryptography.fernet import Fernet
+
+            self._fernet = Fernet(key.encode("ascii"))
+
+    @property
+    def encrypted(self) -> bool:
+        """暗号化するかどうか"""
+        return self._fernet is not None
+
+    def load(self) -> Optional[Dict[str, str]]:
+        """
+        有効期限内の設定を読み込み
+
+        Returns:
+            項目名と値の辞書（ミスの場合はNone）
+        """
+        try:
+            with open(self.path, "rb") as f:
+                content = f.read()
+            if self._fernet is not None:
+                content = self._fernet.decrypt(content)
+            cached = json.loads(content)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(
+                "Ignoring unreadable config cache",
+                extra={"path": self.path, "error": type(e).__name__}
+            )
+            return None
+
+        if not isinstance(cached, dict) or cached.get("expires_at", 0) <= time.time():
+            return None
+        values = cached.get("values")
+        return values if isinstance(values, dict) else None
+
+    def save(self, values: Dict[str, str]) -> None:
+        """
+        設定を有効期限とともに保存（パーミッション0600、書き込みに失敗した場合は警告のみ）
+
+        Args:
+            values: 項目名と値の辞書
+        """
+        content = json.dumps(
+            {"expires_at": time.time() + self.ttl_seconds, "values": values}
+        ).encode("utf-8")
+        if self._fernet is not None:
+            content = self._fernet.encrypt(content)
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        try:
+            os.makedirs(directory, exist_ok=True)
+            # mkstempは所有者のみ読み書き可能（0600）なファイルを作成する
+            fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(content)
+                os.replace(temp_path, self.path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError as e:
+            logger.warning(
+                "Failed to write config cache",
+                extra={"path": self.path, "error": str(e)}
+            )
+
+
+def build_config_cache() -> Optional[ConfigCache]:
+    """
+    環境変数から設定キャッシュを生成
+
+    - S3_CONFIG_CACHE_FILE: キャッシュファイルのパス（未設定の場合は無効）
+    - S3_CONFIG_CACHE_TTL_SECONDS: 有効期間（デフォルト: 3600秒）
+    - S3_CONFIG_CACHE_KEY: 暗号化に使用するFernetキー（未設定の場合は暗号化しない）
+
+    Returns:
+        ConfigCacheインスタンス（無効な場合・暗号化を指定したがcryptographyがない場合はNone）
+    """
+    path = get_env_str("S3_CONFIG_CACHE_FILE", "")
+    if not path:
+        return None
+
+    key = get_env_str("S3_CONFIG_CACHE_KEY", "") or None
+    if key is not None and not is_encryption_available():
+        logger.warning("cryptography is not installed; config cache disabled")
+        return None
+
+    ttl_seconds = get_env_float("S3_CONFIG_CACHE_TTL_SECONDS", DEFAULT_CONFIG_CACHE_TTL_SECONDS)
+    try:
+        return ConfigCache(path, ttl_seconds, key)
+    except ValueError as e:
+        logger.warning("Invalid config cache key; config cache disabled", extra={"error": str(e)})
+        return None
+
+
+def resolve_s3_config(
+    fetch_parameters: Callable[[List[str]], Dict[str, str]],
+    cache: Optional[ConfigCache] = None,
+) -> Tuple[S3Config, str]:
+    """
+    環境変数・設定キャッシュ・SSM Parameter Storeの順にS3Accessorの接続設定を解決
+
+    環境変数で上書きされていない項目のみをキャッシュまたはSSMから取得します。
+    SSMから取得した項目はキャッシュに保存します。
+
+    Args:
+        fetch_parameters: SSMパラメータ名のリストから値を取得する関数
+        cache: 設定キャッシュ（Noneの場合は使用しない）
+
+    Returns:
+        (接続設定, 取得元（env / cache / ssm）)
+
+    Raises:
+        SSMConfigError: SSM Parameter Storeからの取得に失敗した場合
+    """
+    values: Dict[str, str] = {}
+    for field, env_name in ENV_OVERRIDES.items():
+        value = get_env_str(env_name, "")
+        if value:
+            values[field] = value
+
+    missing = [field for field in S3Config._fields if field not in values]
+    if not missing:
+        return S3Config(**values), CONFIG_SOURCE_ENV
+
+    cached = cache.load() if cache is not None else None
+    if cached is not None and all(field in cached for field in missing):
+        values.update({field: cached[field] for field in missing})
+        return S3Config(**values), CONFIG_SOURCE_CACHE
+
+    fetched = fetch_parameters([SSM_PARAMETER_NAMES[field] for field in missing])
+    ssm_values = {field: fetched[SSM_PARAMETER_NAMES[field]] for field in missing}
+    if cache is not None:
+        cache.save(ssm_values)
+    values.update(ssm_values)
+    return S3Config(**values), CONFIG_SOURCE_SSM
@@ -0,0 +1,175 @@
+"""
+Storage Formats - DataFrameのシリアライズ形式
+
+S3に保存する騎手DataFrameの形式（pickle / Arrow IPC(Feather) / Parquet）ごとの
+シリアライズとデシリアライズを提供します。
+
+Feather・Parquetの読み書きにはオプション依存関係のpyarrowが必要です
+（`uv sync --extra columnar`）。
+"""
+
+import importlib.util
+import pickle
+from io import BytesIO
+from typing import Any, Dict, Optional, Sequence
+
+import pandas as pd
+
+STORAGE_FORMAT_PICKLE = "pickle"
+STORAGE_FORMAT_FEATHER = "feather"
+STORAGE_FORMAT_PARQUET = "parquet"
+STORAGE_FORMATS = (STORAGE_FORMAT_PICKLE, STORAGE_FORMAT_FEATHER, STORAGE_FORMAT_PARQUET)
+
+# 形式ごとのS3オブジェクトキーの拡張子
+FILE_EXTENSIONS: Dict[str, str] = {
+    STORAGE_FORMAT_PICKLE: "pickle",
+    STORAGE_FORMAT_FEATHER: "feather",
+    STORAGE_FORMAT_PARQUET: "parquet",
+}
+
+# 形式ごとのデフォルト圧縮方式
+DEFAULT_COMPRESSION: Dict[str, Optional[str]] = {
+    STORAGE_FORMAT_PICKLE: None,
+    STORAGE_FORMAT_FEATHER: "zstd",
+    STORAGE_FORMAT_PARQUET: "zstd",
+}
+
+
+class MissingColumnsError(KeyError):
+    """読み込み対象の列がデータに存在しない場合に発生する例外"""
+
+    def __init__(self, columns: Sequence[str]):
+        self.columns = list(columns)
+        super().__init__(f"Columns not found: {', '.join(self.columns)}")
+
+
+def is_format_available(storage_format: str) -> bool:
+    """
+    指定された形式が利用可能かどうかを判定
+
+    Args:
+        storage_format: 保存形式
+
+    Returns:
+        形式が既知で、必要な依存関係がインストールされている場合はTrue
+    """
+    if storage_format == STORAGE_FORMAT_PICKLE:
+        return True
+    if storage_format in (STORAGE_FORMAT_FEATHER, STORAGE_FORMAT_PARQUET):
+        return importlib.util.find_spec("pyarrow") is not None
+    return False
+
+
+def serialize_dataframe(
+    df: pd.DataFrame, storage_format: str, compression: Optional[str] = None
+) -> bytes:
+    """
+    DataFrameを指定形式のバイト列にシリアライズ
+
+    Args:
+        df: pandas DataFrame
+        storage_format: 保存形式（pickle / feather / parquet）
+        compression: 圧縮方式（省略時は形式ごとのデフォルト）
+
+    Returns:
+        シリアライズ済みのバイト列
+
+    Raises:
+        ValueError: 未知の形式が指定された場合
+    """
+    if compression is None:
+        compression = DEFAULT_COMPRESSION.get(storage_format)
+
+    if storage_format == STORAGE_FORMAT_PICKLE:
+        return pickle.dumps(df, protocol=pickle.HIGHEST_PROTOCOL)
+
+    buffer = BytesIO()
+    if storage_format == STORAGE_FORMAT_FEATHER:
+        import pyarrow.feather as feather
+
+        feather.write_feather(df, buffer, compression=compression or "uncompressed")
+    elif storage_format == STORAGE_FORMAT_PARQUET:
+        df.to_parquet(buffer, engine="pyarrow", compression=compression)
+    else:
+        raise ValueError(f"Unknown storage format: {storage_format}")
+    return buffer.getvalue()
+
+
+def deserialize_dataframe(
+    data: Any, storage_format: str, columns: Optional[Sequence[str]] = None
+) -> pd.DataFrame:
+    """
+    指定形式のバイト列をDataFrameにデシリアライズ
+
+    Feather・Parquetでは指定された列のみをデコードします。
+    pickleでは全体をデコードした後に列を選択します。
+
+    Args:
+        data: シリアライズ済みのバイト列（bytes-likeオブジェクト）
+        storage_format: 保存形式（pickle / feather / parquet）
+        columns: 読み込む列名のリスト（省略時は全列）
+
+    Returns:
+        pandas DataFrame
+
+    Raises:
+        ValueError: 未知の形式が指定された場合、またはDataFrame以外が格納されていた場合
+        MissingColumnsError: 指定された列が存在しない場合
+    """
+    if storage_format == STORAGE_FORMAT_PICKLE:
+        df = pickle.loads(data)
+        if not isinstance(df, pd.DataFrame):
+            raise ValueError(f"Expected DataFrame, got {type(df)}")
+        return select_columns(df, columns) if columns is not None else df
+
+    import pyarrow as pa
+
+    column_list = list(columns) if columns is not None else None
+    if storage_format == STORAGE_FORMAT_FEATHER:
+        import pyarrow.feather as feather
+        import pyarrow.ipc as ipc
+
+        if column_list is not None:
+            # フッターのスキーマのみを読み込んで列の存在を確認する
+            with ipc.open_file(pa.BufferReader(data)) as ipc_reader:
+                _check_columns(ipc_reader.schema.names, column_list)
+        table = feather.read_table(pa.BufferReader(data), columns=column_list)
+    elif storage_format == STORAGE_FORMAT_PARQUET:
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(pa.BufferReader(data))
+        _check_columns(parquet_file.schema_arrow.names, column_list)
+        table = parquet_file.read(columns=column_list, use_pandas_metadata=True)
+    else:
+        raise ValueError(f"Unknown storage format: {storage_format}")
+
+    result: pd.DataFrame = table.to_pandas()
+    return result
+
+
+def select_columns(df: pd.DataFrame, columns: Sequence[str]) -> pd.DataFrame:
+    """
+    DataFrameから指定された列を指定順で選択
+
+    Args:
+        df: pandas DataFrame
+        columns: 列名のリスト
+
+    Returns:
+        選択した列のみを持つDataFrame
+
+    Raises:
+        MissingColumnsError: 指定された列が存在しない場合
+    """
+    _check_columns(df.columns, columns)
+    return df[list(columns)]
+
+
+def _check_columns(available: Sequence[Any], columns: Optional[Sequence[str]]) -> None:
+    """指定された列がすべて存在することを確認"""
+    if columns is None:
+        return
+    available_set = set(available)
+    missing = [column for column in columns if column not in available_set]
+    if missing:
+        raise MissingColumnsError(missing)
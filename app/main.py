@@ -4,40 +4,117 @@ FastAPI Application Entry Point
 騎手データをS3から取得してJSON形式で返却するREST APIサーバー
 """
 
+import asyncio
 import os
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncIterator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 from app.api.exception_handlers import (
     general_exception_handler,
+    invalid_query_handler,
     jockey_not_found_handler,
     pickle_deserialize_error_handler,
     s3_access_error_handler,
     ssm_config_error_handler,
 )
+from app.api.jockey import NEXT_CURSOR_HEADER
 from app.api.jockey import router as jockey_router
-from app.core.logging import get_logger, setup_logging
+from app.api.request_metrics import RequestMetricsMiddleware
+from app.api.server_timing import SERVER_TIMING_HEADER, ServerTimingMiddleware
+from app.core.config import get_env_bool, get_env_int, get_env_str
+from app.core.logging import (
+    DEFAULT_LOG_QUEUE_MAX_SIZE,
+    get_logger,
+    get_logging_stats,
+    parse_sample_rates,
+    setup_logging,
+)
+from app.core.metrics import generate_metrics, mark_process_dead
+from app.core.timing import get_stage_stats
+from app.infrastructure.dependencies import (
+    close_s3_accessor_async,
+    get_hit_counter,
+    get_jockey_cache,
+    get_response_cache,
+    get_s3_disk_cache_stats,
+    get_s3_pool_stats,
+    get_s3_read_stats,
+    get_single_flight,
+)
 from app.models.exceptions import (
+    InvalidQueryError,
     JockeyNotFoundError,
     PickleDeserializeError,
     S3AccessError,
     SSMConfigError,
 )
+from app.services.decode_pool import shutdown_decode_pool
+from app.services.prewarm import (
+    get_prewarmer,
+    save_hit_counts_periodically,
+    start_module_preload,
+)
 
 # ロギングの初期化
 log_level = os.getenv("LOG_LEVEL", "INFO")
-setup_logging(log_level)
+setup_logging(
+    log_level,
+    queue_size=(
+        get_env_int("LOG_QUEUE_MAX_SIZE", DEFAULT_LOG_QUEUE_MAX_SIZE)
+        if get_env_bool("LOG_QUEUE_ENABLED", False)
+        else None
+    ),
+    sample_rates=parse_sample_rates(get_env_str("LOG_SAMPLE_RATES", "")),
+)
 logger = get_logger(__name__)
 
 logger.info("Starting Jockey Data API application")
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    アプリケーションのライフサイクル管理
+
+    起動時にサービス層のモジュール（pandas・boto3）の読み込み、キャッシュのプリウォーム
+    （有効な場合）と騎手IDごとのリクエスト数の定期的な書き出し（有効な場合）を
+    バックグラウンドで開始します。
+    終了時はそれらを停止してリクエスト数を書き出し、非同期S3クライアントのコネクションを閉じ、
+    デコード用のプロセスプールを停止して、メトリクスのmultiprocessモードのファイルを整理します。
+    """
+    start_module_preload()
+    prewarmer = get_prewarmer()
+    prewarmer.start()
+    hit_counter = get_hit_counter()
+    save_task = (
+        asyncio.create_task(save_hit_counts_periodically(hit_counter))
+        if hit_counter.enabled
+        else None
+    )
+
+    yield
+
+    await prewarmer.stop()
+    if save_task is not None:
+        save_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await save_task
+    await asyncio.to_thread(hit_counter.save)
+    await close_s3_accessor_async()
+    await asyncio.to_thread(shutdown_decode_pool)
+    mark_process_dead()
+
+
 # FastAPIアプリケーションの初期化
 app = FastAPI(
     title="Jockey Data API",
     description="騎手IDに基づいてS3からpickleファイルを取得し、JSON形式で返却するAPI",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # CORSミドルウェアの設定(全オリジンを許可)
@@ -47,13 +124,21 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag", SERVER_TIMING_HEADER],
 )
 
+# 処理段階ごとの所要時間をServer-Timingヘッダーで返却（JOCKEY_STAGE_TIMING=falseで無効）
+app.add_middleware(ServerTimingMiddleware)
+
+# ルートごとのリクエストの所要時間をメトリクスに記録（/metrics）
+app.add_middleware(RequestMetricsMiddleware)
+
 # APIルーターの登録
 app.include_router(jockey_router)
 
 # 例外ハンドラーの登録
 app.add_exception_handler(JockeyNotFoundError, jockey_not_found_handler)  # type: ignore[arg-type]
+app.add_exception_handler(InvalidQueryError, invalid_query_handler)  # type: ignore[arg-type]
 app.add_exception_handler(S3AccessError, s3_access_error_handler)  # type: ignore[arg-type]
 app.add_exception_handler(PickleDeserializeError, pickle_deserialize_error_handler)  # type: ignore[arg-type]
 app.add_exception_handler(SSMConfigError, ssm_config_error_handler)  # type: ignore[arg-type]
@@ -66,13 +151,77 @@ async def health_check():
     ヘルスチェックエンドポイント
 
     Returns:
-        dict: ステータス情報
+        dict: ステータス情報とキャッシュのプリウォームの進捗
     """
     return JSONResponse(
-        status_code=200, content={"status": "healthy", "service": "jockey-data-api"}
+        status_code=200,
+        content={
+            "status": "healthy",
+            "service": "jockey-data-api",
+            "warmup": get_prewarmer().progress(),
+        },
     )
 
 
+@app.get("/health/ready", tags=["health"])
+async def readiness_check():
+    """
+    レディネスチェックエンドポイント
+
+    JOCKEY_PREWARM_BLOCK_READINESSが有効な場合、キャッシュのプリウォームが
+    終了するまで503を返します。
+
+    Returns:
+        dict: レディネスの状態とキャッシュのプリウォームの進捗
+    """
+    prewarmer = get_prewarmer()
+    ready = prewarmer.ready
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"status": "ready" if ready else "warming_up", "warmup": prewarmer.progress()},
+    )
+
+
+@app.get("/health/stats", tags=["health"])
+async def health_stats():
+    """
+    キャッシュとS3コネクションプールの統計情報エンドポイント
+
+    Returns:
+        dict: キャッシュごとの統計情報、S3コネクションプールの使用状況、
+            S3レスポンスボディの読み込みで確保したバイト数、
+            S3オブジェクトのディスクキャッシュの統計情報、同時リクエストの集約の統計情報、ログ出力の統計情報、
+            処理段階ごとの所要時間のヒストグラム（ミリ秒）
+    """
+    return {
+        "caches": [get_jockey_cache().stats(), get_response_cache().stats()],
+        "s3_pool": get_s3_pool_stats(),
+        "s3_reads": get_s3_read_stats(),
+        "s3_disk_cache": get_s3_disk_cache_stats(),
+        "single_flight": get_single_flight().stats(),
+        "logging": get_logging_stats(),
+        "stages": get_stage_stats(),
+    }
+
+
+@app.get("/metrics", tags=["health"])
+async def metrics():
+    """
+    Prometheus形式のメトリクスエンドポイント
+
+    PROMETHEUS_MULTIPROC_DIRが設定されている場合は、すべてのワーカープロセスの値を合算します。
+
+    Returns:
+        Response: Prometheusのテキスト形式のメトリクス
+            （prometheus-clientが未インストール・JOCKEY_METRICS=falseの場合は404）
+    """
+    output = await asyncio.to_thread(generate_metrics)
+    if output is None:
+        return JSONResponse(status_code=404, content={"detail": "Metrics are disabled"})
+    body, content_type = output
+    return Response(content=body, media_type=content_type)
+
+
 @app.get("/", tags=["root"])
 async def root():
     """
@@ -0,0 +1,45 @@
+"""
+Batch Models
+
+複数騎手の一括取得リクエストと、騎手ごとの取得結果を定義
+"""
+
+from typing import List, NamedTuple, Optional
+
+from pydantic import BaseModel, Field
+
+from app.models.exceptions import JockeyDataException
+
+# 1リクエストで取得できる騎手IDの上限
+MAX_BATCH_IDS = 50
+
+
+class JockeyBatchRequest(BaseModel):
+    """
+    騎手データの一括取得リクエスト
+
+    Attributes:
+        ids: 騎手IDのリスト（重複は除外され、最初の出現順で返却）
+    """
+
+    ids: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_IDS,
+        description="騎手IDのリスト（例: [\"05339\", \"01170\"]）",
+    )
+
+
+class BatchItem(NamedTuple):
+    """
+    一括取得における騎手ごとの結果
+
+    Attributes:
+        jockey_id: 騎手ID
+        body: エンコード済みのJSONバイト列（失敗した場合はNone）
+        error: 取得に失敗した場合の例外（成功した場合はNone）
+    """
+
+    jockey_id: str
+    body: Optional[bytes] = None
+    error: Optional[JockeyDataException] = None
@@ -21,6 +21,20 @@ class JockeyNotFoundError(JockeyDataException):
         self.jockey_id = jockey_id
         super().__init__(f"Jockey with ID '{jockey_id}' not found")
 
+    def __reduce__(self):
+        # プロセスプールのワーカーから送出された場合も同じ引数で復元する
+        return (type(self), (self.jockey_id,))
+
+
+class InvalidQueryError(JockeyDataException):
+    """
+    クエリパラメータ（列名・フィルタ条件）が不正な場合に発生する例外
+    HTTPステータスコード: 400
+    """
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(message)
+
 
 class S3AccessError(JockeyDataException):
     """
@@ -32,6 +46,10 @@ class S3AccessError(JockeyDataException):
         self.key = key
         super().__init__(message)
 
+    def __reduce__(self):
+        # 複製・pickle化でバケット名・キーを失わないようにする
+        return (type(self), (self.args[0], self.bucket, self.key))
+
 
 class PickleDeserializeError(JockeyDataException):
     """
@@ -46,6 +64,11 @@ class PickleDeserializeError(JockeyDataException):
             message += f": {str(original_error)}"
         super().__init__(message)
 
+    def __reduce__(self):
+        # 元の例外はpickle化できるとは限らないため、メッセージのみを引き継ぐ
+        original_error = Exception(str(self.original_error)) if self.original_error else None
+        return (type(self), (self.jockey_id, original_error))
+
 
 class SSMConfigError(JockeyDataException):
     """
@@ -59,3 +82,9 @@ class SSMConfigError(JockeyDataException):
         if original_error:
             message += f": {str(original_error)}"
         super().__init__(message)
+
+    def __reduce__(self):
+        # メッセージを組み立て直すため、args ではなくパラメータ名と元の例外で復元する
+        # （元の例外はpickle化できるとは限らないため、メッセージのみを引き継ぐ）
+        original_error = Exception(str(self.original_error)) if self.original_error else None
+        return (type(self), (self.parameter_name, original_error))
@@ -0,0 +1,71 @@
+"""
+Page Models
+
+ページ単位で取得した騎手データと、そのエンコード済みレスポンスを定義
+"""
+
+from datetime import datetime
+from typing import TYPE_CHECKING, NamedTuple, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class ObjectVersion(NamedTuple):
+    """
+    騎手データの取得元S3オブジェクトのバージョン情報
+
+    レスポンスのETag・Last-Modifiedヘッダー（条件付きリクエストの検証子）として使用します。
+
+    Attributes:
+        etag: S3オブジェクトのETag（引用符を含む、不明な場合はNone）
+        last_modified: S3オブジェクトの最終更新日時（不明な場合はNone）
+    """
+
+    etag: Optional[str] = None
+    last_modified: Optional[datetime] = None
+
+
+class VersionedFrame(NamedTuple):
+    """
+    キャッシュに格納するデシリアライズ済みの騎手データ
+
+    Attributes:
+        data: デシリアライズ済みのDataFrame
+        storage_format: 取得元オブジェクトの保存形式
+        version: 取得元オブジェクトのバージョン情報
+    """
+
+    data: "pd.DataFrame"
+    storage_format: str
+    version: ObjectVersion = ObjectVersion()
+
+
+class JockeyPage(NamedTuple):
+    """
+    条件を適用した騎手データ
+
+    Attributes:
+        data: 条件を適用したDataFrame
+        next_cursor: 次ページのカーソル（ページネーションなし・最終ページの場合はNone）
+        version: 取得元オブジェクトのバージョン情報
+    """
+
+    data: "pd.DataFrame"
+    next_cursor: Optional[str] = None
+    version: ObjectVersion = ObjectVersion()
+
+
+class EncodedPage(NamedTuple):
+    """
+    エンコード済みのJSONレスポンス
+
+    Attributes:
+        body: UTF-8エンコード済みのJSONバイト列
+        next_cursor: 次ページのカーソル（ページネーションなし・最終ページの場合はNone）
+        version: 取得元オブジェクトのバージョン情報
+    """
+
+    body: bytes
+    next_cursor: Optional[str] = None
+    version: ObjectVersion = ObjectVersion()
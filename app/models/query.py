@@ -0,0 +1,140 @@
+"""
+Query Models
+
+騎手データ取得時の列選択・行フィルタ条件を表すモデルを定義
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import List, Optional, Sequence, Tuple
+
+from app.models.exceptions import InvalidQueryError
+
+# 日付範囲フィルタの対象列
+DATE_COLUMN = "日付"
+
+# ページネーションで同一日付内の順序を決める列
+RACE_NUMBER_COLUMN = "R"
+
+# ページネーションの1ページあたりの行数（デフォルト・上限）
+DEFAULT_PAGE_LIMIT = 100
+MAX_PAGE_LIMIT = 1000
+
+
+@dataclass(frozen=True)
+class JockeyQuery:
+    """
+    騎手データの取得条件
+
+    ハッシュ可能なため、キャッシュキーの一部として使用できます。
+
+    Attributes:
+        fields: 返却する列名（Noneの場合は全列）
+        date_from: 日付の下限（この日を含む）
+        date_to: 日付の上限（この日を含む）
+        filters: (列名, 値) の等価条件。同一列の複数条件はいずれかに一致（OR）
+        limit: 1ページあたりの行数（Noneの場合はページネーションなし）
+        cursor: 前ページで返却された次ページのカーソル
+    """
+
+    fields: Optional[Tuple[str, ...]] = None
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+    filters: Tuple[Tuple[str, str], ...] = ()
+    limit: Optional[int] = None
+    cursor: Optional[str] = None
+
+    @property
+    def is_default(self) -> bool:
+        """条件が指定されていない（全件・全列を返す）かどうか"""
+        return self == DEFAULT_QUERY
+
+    @property
+    def has_row_filters(self) -> bool:
+        """行を絞り込む条件が指定されているかどうか"""
+        return self.date_from is not None or self.date_to is not None or bool(self.filters)
+
+    @property
+    def is_paginated(self) -> bool:
+        """ページ単位で取得するかどうか"""
+        return self.limit is not None
+
+    def required_columns(self) -> Optional[Tuple[str, ...]]:
+        """
+        条件の評価と返却に必要な列名を取得
+
+        Returns:
+            必要な列名のタプル（全列が必要な場合はNone）
+        """
+        if self.fields is None:
+            return None
+
+        columns = list(self.fields)
+        if self.date_from is not None or self.date_to is not None:
+            columns.append(DATE_COLUMN)
+        columns.extend(column for column, _ in self.filters)
+        if self.is_paginated:
+            columns.extend((DATE_COLUMN, RACE_NUMBER_COLUMN))
+        return tuple(dict.fromkeys(columns))
+
+
+DEFAULT_QUERY = JockeyQuery()
+
+
+def parse_jockey_query(
+    fields: Optional[str] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    filters: Optional[Sequence[str]] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+) -> JockeyQuery:
+    """
+    クエリパラメータからJockeyQueryを生成
+
+    Args:
+        fields: カンマ区切りの列名（例: "日付,開催,着 順"）
+        date_from: 日付の下限
+        date_to: 日付の上限
+        filters: "列名:値" 形式の等価条件のリスト（例: ["開催:船橋", "馬 場:良"]）
+        limit: 1ページあたりの行数（1〜MAX_PAGE_LIMIT）
+        cursor: 次ページのカーソル（limit省略時はDEFAULT_PAGE_LIMIT行）
+
+    Returns:
+        JockeyQueryインスタンス
+
+    Raises:
+        InvalidQueryError: パラメータの形式が不正な場合
+    """
+    field_tuple: Optional[Tuple[str, ...]] = None
+    if fields is not None:
+        names = [name.strip() for name in fields.split(",") if name.strip()]
+        if not names:
+            raise InvalidQueryError("'fields' must contain at least one column name")
+        field_tuple = tuple(dict.fromkeys(names))
+
+    if date_from is not None and date_to is not None and date_from > date_to:
+        raise InvalidQueryError("'from' must be on or before 'to'")
+
+    parsed_filters: List[Tuple[str, str]] = []
+    for condition in filters or ():
+        column, separator, value = condition.partition(":")
+        if not separator or not column.strip():
+            raise InvalidQueryError(
+                f"Invalid filter '{condition}': expected '<column>:<value>'"
+            )
+        parsed_filters.append((column.strip(), value))
+
+    if limit is not None and not 1 <= limit <= MAX_PAGE_LIMIT:
+        raise InvalidQueryError(f"'limit' must be between 1 and {MAX_PAGE_LIMIT}")
+    if cursor is not None and limit is None:
+        limit = DEFAULT_PAGE_LIMIT
+
+    return JockeyQuery(
+        fields=field_tuple,
+        date_from=date_from,
+        date_to=date_to,
+        filters=tuple(parsed_filters),
+        limit=limit,
+        cursor=cursor,
+    )
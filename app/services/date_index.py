@@ -0,0 +1,205 @@
+"""
+Date Index - 騎手DataFrameの日付順インデックス
+
+日付（降順）とレース番号R（降順）で並べた行位置のインデックスを構築し、
+カーソルによるページ単位の取り出しを提供します。
+
+インデックスはDataFrameオブジェクトごとに1回だけ構築され、DataFrameが
+破棄されると（キャッシュから削除されると）一緒に破棄されます。
+ページの取り出しは二分探索とスライスのみで行われるため、
+行フィルタを伴わない場合はO(log n)です。
+"""
+
+import base64
+import binascii
+import threading
+import weakref
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.models.exceptions import InvalidQueryError
+from app.models.query import DATE_COLUMN, RACE_NUMBER_COLUMN
+
+# 日付（秒）に掛ける係数。レース番号はこの値未満に丸める
+_RACE_NUMBER_SCALE = 1000
+
+# 日付が欠損している行のソートキー（末尾に並べる）
+_MISSING_KEY = np.iinfo(np.int64).max
+
+_indexes: Dict[int, "DateIndex"] = {}
+_indexes_lock = threading.Lock()
+
+
+def encode_cursor(key: int, position: int) -> str:
+    """
+    ソートキーと位置から不透明なカーソル文字列を生成
+
+    Args:
+        key: 最後に返却した行のソートキー
+        position: 最後に返却した行のインデックス上の位置
+
+    Returns:
+        URLセーフなカーソル文字列
+    """
+    raw = f"{key}.{position}".encode("ascii")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[int, int]:
+    """
+    カーソル文字列をソートキーと位置に復元
+
+    Args:
+        cursor: encode_cursorで生成したカーソル文字列
+
+    Returns:
+        (ソートキー, 位置) のタプル
+
+    Raises:
+        InvalidQueryError: カーソルの形式が不正な場合
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key, position = base64.urlsafe_b64decode(padded).decode("ascii").split(".")
+        return int(key), int(position)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidQueryError(f"Invalid cursor: {cursor}") from e
+
+
+class DateIndex:
+    """
+    日付・レース番号の降順に並べた行位置のインデックス
+
+    Attributes:
+        order: ソート順に並べた行位置（DataFrame上の位置）
+        keys: orderの順に並べたソートキー（昇順）
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        DataFrameからインデックスを構築
+
+        Args:
+            df: 日付列とレース番号列を含むDataFrame
+
+        Raises:
+            InvalidQueryError: 日付列またはレース番号列が存在しない場合
+        """
+        if DATE_COLUMN not in df.columns or RACE_NUMBER_COLUMN not in df.columns:
+            raise InvalidQueryError(
+                f"Pagination requires '{DATE_COLUMN}' and '{RACE_NUMBER_COLUMN}' columns"
+            )
+
+        dates = df[DATE_COLUMN]
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            raise InvalidQueryError(f"Pagination requires a '{DATE_COLUMN}' date column")
+        if isinstance(dates.dtype, pd.DatetimeTZDtype):
+            dates = dates.dt.tz_localize(None)
+        date_values = dates.to_numpy().astype("datetime64[s]")
+        seconds = date_values.astype(np.int64)
+
+        race_numbers = (
+            pd.to_numeric(df[RACE_NUMBER_COLUMN], errors="coerce")
+            .fillna(0)
+            .clip(0, _RACE_NUMBER_SCALE - 1)
+            .to_numpy(dtype=np.int64)
+        )
+
+        # 降順に並べるためにキーを反転し、日付の欠損は末尾に並べる
+        sort_keys = -(seconds * _RACE_NUMBER_SCALE + race_numbers)
+        sort_keys[np.isnat(date_values)] = _MISSING_KEY
+
+        self.order: np.ndarray = np.argsort(sort_keys, kind="stable")
+        self.keys: np.ndarray = sort_keys[self.order]
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        mask: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, Optional[str]]:
+        """
+        カーソルの次の行から最大limit行の行位置を取得
+
+        Args:
+            limit: 1ページあたりの最大行数
+            cursor: 前ページで返却されたカーソル（省略時は先頭から）
+            mask: 行フィルタのマスク（DataFrame上の位置順、省略時は全行が対象）
+
+        Returns:
+            (DataFrame上の行位置の配列, 次ページのカーソル) のタプル。
+            次ページが存在しない場合、カーソルはNone
+
+        Raises:
+            InvalidQueryError: カーソルの形式が不正な場合
+        """
+        start = self._resume_position(cursor) if cursor is not None else 0
+
+        if mask is None:
+            positions = np.arange(start, min(start + limit, len(self.order)))
+            has_more = start + limit < len(self.order)
+        else:
+            # マスクに一致するインデックス上の位置から、start以降をlimit件取り出す
+            matched = np.flatnonzero(mask[self.order])
+            offset = int(np.searchsorted(matched, start))
+            positions = matched[offset:offset + limit]
+            has_more = offset + limit < len(matched)
+
+        next_cursor = None
+        if has_more and len(positions) > 0:
+            last = int(positions[-1])
+            next_cursor = encode_cursor(int(self.keys[last]), last)
+        return self.order[positions], next_cursor
+
+    def _resume_position(self, cursor: str) -> int:
+        """カーソルが指す行の次のインデックス上の位置を取得"""
+        key, position = decode_cursor(cursor)
+        first = int(np.searchsorted(self.keys, key, side="left"))
+        end = int(np.searchsorted(self.keys, key, side="right"))
+        if first <= position < end:
+            # 同一キーの行が複数ある場合は位置で続きを決める
+            return position + 1
+        return end
+
+
+def get_date_index(df: pd.DataFrame) -> DateIndex:
+    """
+    DataFrameに対応する日付インデックスを取得（未構築の場合は構築）
+
+    返却されるインデックスはDataFrameと同じ期間だけ保持されるため、
+    キャッシュ済みのDataFrameに対して呼び出してください。
+
+    Args:
+        df: 日付列とレース番号列を含むDataFrame
+
+    Returns:
+        DateIndexインスタンス
+
+    Raises:
+        InvalidQueryError: 日付列またはレース番号列が存在しない場合
+    """
+    key = id(df)
+    with _indexes_lock:
+        index = _indexes.get(key)
+    if index is not None:
+        return index
+
+    index = DateIndex(df)
+    with _indexes_lock:
+        existing = _indexes.get(key)
+        if existing is not None:
+            return existing
+        _indexes[key] = index
+    weakref.finalize(df, _discard_index, key)
+    return index
+
+
+def _discard_index(key: int) -> None:
+    """破棄されたDataFrameのインデックスを削除"""
+    with _indexes_lock:
+        _indexes.pop(key, None)
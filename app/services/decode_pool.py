@@ -0,0 +1,314 @@
+"""
+Decode Pool - 大きな騎手データのデコード・エンコードのプロセスプールへのオフロード
+
+pickle.loads や DataFrame → JSON の変換はGILを保持したまま実行されるため、大きな騎手データの
+処理中は同じワーカープロセスのスレッドプールで処理される他のリクエストが待たされます。
+
+JOCKEY_DECODE_POOL_WORKERS を設定すると、S3から取得したオブジェクトが
+JOCKEY_DECODE_POOL_THRESHOLD_BYTES 以上の場合は、デシリアライズ・条件の適用・JSONエンコードを
+プロセスプールで実行します。オブジェクトのデータとエンコード済みのJSONバイト列は共有メモリ
+（multiprocessing.shared_memory）で受け渡し、DataFrameはプロセス間で転送しません。
+そのため、オフロードした騎手のDataFrameはプロセス内キャッシュには格納されません
+（エンコード済みのレスポンスはキャッシュされます）。
+
+ワーカープロセスはspawnで起動します（スレッドを持つuvicornのワーカーからのforkを避けるため）。
+"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional, Sequence, Tuple
+
+from app.core.config import get_env_int
+from app.core.logging import get_logger, setup_logging
+
+if TYPE_CHECKING:
+    from app.infrastructure.s3_accessor import ObjectData
+    from app.models.query import JockeyQuery
+    from app.services.jockey_service import JockeyService
+
+logger = get_logger(__name__)
+
+DEFAULT_DECODE_POOL_THRESHOLD_BYTES = 1024 * 1024
+
+
+class DecodeTask(NamedTuple):
+    """
+    ワーカープロセスで実行するデコード・エンコードの内容
+
+    Attributes:
+        input_name: オブジェクトのデータを格納した共有メモリの名前
+        input_size: オブジェクトのデータのバイト数
+        jockey_id: 騎手ID（エラーログ用）
+        storage_format: オブジェクトの保存形式
+        decode_columns: デコードする列名（全列の場合はNone）
+        query: 取得条件
+    """
+
+    input_name: str
+    input_size: int
+    jockey_id: str
+    storage_format: str
+    decode_columns: Optional[Tuple[str, ...]]
+    query: "JockeyQuery"
+
+
+class DecodeResult(NamedTuple):
+    """
+    ワーカープロセスの実行結果
+
+    Attributes:
+        output_name: エンコード済みのJSONバイト列を格納した共有メモリの名前
+        output_size: JSONバイト列のバイト数
+        next_cursor: 次ページのカーソル
+    """
+
+    output_name: str
+    output_size: int
+    next_cursor: Optional[str]
+
+
+# ワーカープロセスで使用するJockeyService（S3・キャッシュは使用しない）
+_worker_service: Optional["JockeyService"] = None
+
+
+def _buffer(shared_memory: SharedMemory) -> memoryview:
+    """共有メモリのバッファ（close 前のみ有効）"""
+    buffer = shared_memory.buf
+    if buffer is None:
+        raise ValueError(f"Shared memory {shared_memory.name} is closed")
+    return buffer
+
+
+def _init_worker() -> None:
+    """ワーカープロセスの初期化（ログ設定とサービス層のモジュールの読み込み）"""
+    global _worker_service
+
+    setup_logging(os.getenv("LOG_LEVEL", "INFO"))
+    from app.services.jockey_service import JockeyService
+
+    _worker_service = JockeyService.for_worker()
+
+
+def _run_task(task: DecodeTask) -> DecodeResult:
+    """ワーカープロセスで共有メモリのオブジェクトをデコード・エンコードし、結果を共有メモリに書き込む"""
+    if _worker_service is None:
+        _init_worker()
+    assert _worker_service is not None
+
+    source = SharedMemory(name=task.input_name, track=False)
+    try:
+        data = _buffer(source)[:task.input_size]
+        try:
+            body, next_cursor = _worker_service.encode_object_page(
+                data, task.jockey_id, task.storage_format, task.decode_columns, task.query
+            )
+        finally:
+            data.release()
+    finally:
+        source.close()
+
+    # 親プロセスが読み込んだ後に削除する（ワーカーの終了時に削除されないよう追跡しない）
+    output = SharedMemory(create=True, size=max(len(body), 1), track=False)
+    try:
+        _buffer(output)[:len(body)] = body
+    finally:
+        output.close()
+    return DecodeResult(output.name, len(body), next_cursor)
+
+
+class DecodePool:
+    """
+    デコード・エンコードを実行するプロセスプール
+
+    共有メモリの作成・削除は親プロセスが行います（ワーカーが作成した結果の共有メモリも、
+    読み込んだ後に親プロセスが削除します）。
+    """
+
+    def __init__(self, max_workers: int, threshold_bytes: int):
+        """
+        DecodePoolの初期化
+
+        Args:
+            max_workers: ワーカープロセス数
+            threshold_bytes: オフロードするオブジェクトの最小バイト数
+        """
+        self.max_workers = max_workers
+        self.threshold_bytes = threshold_bytes
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+
+    def should_offload(self, size: int) -> bool:
+        """
+        オブジェクトをプロセスプールで処理するかどうか
+
+        Args:
+            size: オブジェクトのバイト数
+
+        Returns:
+            threshold_bytes 以上の場合はTrue
+        """
+        return size >= self.threshold_bytes
+
+    def encode_page(
+        self,
+        data: "ObjectData",
+        jockey_id: str,
+        storage_format: str,
+        decode_columns: Optional[Sequence[str]],
+        query: "JockeyQuery",
+    ) -> Tuple[bytes, Optional[str]]:
+        """
+        オブジェクトのデータをワーカープロセスでデコード・エンコード
+
+        Args:
+            data: S3から取得したオブジェクトのデータ
+            jockey_id: 騎手ID
+            storage_format: 保存形式
+            decode_columns: デコードする列名（全列の場合はNone）
+            query: 取得条件
+
+        Returns:
+            (エンコード済みのJSONバイト列, 次ページのカーソル)
+
+        Raises:
+            InvalidQueryError: 取得条件が不正な場合
+            PickleDeserializeError: デシリアライズまたはJSON変換に失敗した場合
+            BrokenProcessPool: ワーカープロセスが異常終了した場合
+        """
+        source, future = self._submit(data, jockey_id, storage_format, decode_columns, query)
+        try:
+            return self._read_result(future.result())
+        finally:
+            source.unlink()
+
+    async def encode_page_async(
+        self,
+        data: "ObjectData",
+        jockey_id: str,
+        storage_format: str,
+        decode_columns: Optional[Sequence[str]],
+        query: "JockeyQuery",
+    ) -> Tuple[bytes, Optional[str]]:
+        """
+        encode_page の非同期版（ワーカープロセスの完了をイベントループ上で待機）
+        """
+        source, future = self._submit(data, jockey_id, storage_format, decode_columns, query)
+        try:
+            result = await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # 待機を中断した場合も、ワーカーが作成した結果の共有メモリを削除する
+            future.add_done_callback(_discard_result)
+            raise
+        finally:
+            source.unlink()
+        return self._read_result(result)
+
+    def shutdown(self) -> None:
+        """ワーカープロセスを停止"""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _submit(
+        self,
+        data: "ObjectData",
+        jockey_id: str,
+        storage_format: str,
+        decode_columns: Optional[Sequence[str]],
+        query: "JockeyQuery",
+    ) -> Tuple[SharedMemory, "Future[Any]"]:
+        """オブジェクトのデータを共有メモリにコピーしてタスクを投入"""
+        size = len(data)
+        source = SharedMemory(create=True, size=max(size, 1))
+        try:
+            _buffer(source)[:size] = data
+            task = DecodeTask(
+                source.name,
+                size,
+                jockey_id,
+                storage_format,
+                tuple(decode_columns) if decode_columns is not None else None,
+                query,
+            )
+            future = self._executor.submit(_run_task, task)
+        except BaseException:
+            source.close()
+            source.unlink()
+            raise
+        source.close()
+        return source, future
+
+    def _read_result(self, result: DecodeResult) -> Tuple[bytes, Optional[str]]:
+        """結果の共有メモリからJSONバイト列を読み込んで削除"""
+        output = SharedMemory(name=result.output_name)
+        try:
+            body = bytes(_buffer(output)[:result.output_size])
+        finally:
+            output.close()
+            output.unlink()
+        return body, result.next_cursor
+
+
+def _discard_result(future: "Future[Any]") -> None:
+    """読み込まれなかった結果の共有メモリを削除"""
+    if future.cancelled() or future.exception() is not None:
+        return
+    output = SharedMemory(name=future.result().output_name)
+    output.close()
+    output.unlink()
+
+
+# グローバルなプロセスプール（None: 未初期化、False: 無効）
+_decode_pool: Any = None
+_decode_pool_lock = threading.Lock()
+
+
+def get_decode_pool() -> Optional[DecodePool]:
+    """
+    プロセスプールのシングルトンインスタンスを取得
+
+    - JOCKEY_DECODE_POOL_WORKERS: ワーカープロセス数（デフォルト: 0、0の場合は無効）
+    - JOCKEY_DECODE_POOL_THRESHOLD_BYTES: オフロードするオブジェクトの最小バイト数（デフォルト: 1 MiB）
+
+    Returns:
+        DecodePoolインスタンス（無効な場合はNone）
+    """
+    global _decode_pool
+
+    pool = _decode_pool
+    if pool is None:
+        with _decode_pool_lock:
+            if _decode_pool is None:
+                max_workers = get_env_int("JOCKEY_DECODE_POOL_WORKERS", 0)
+                if max_workers > 0:
+                    threshold = get_env_int(
+                        "JOCKEY_DECODE_POOL_THRESHOLD_BYTES", DEFAULT_DECODE_POOL_THRESHOLD_BYTES
+                    )
+                    _decode_pool = DecodePool(max_workers, threshold)
+                    logger.info(
+                        "Decode pool initialized",
+                        extra={"max_workers": max_workers, "threshold_bytes": threshold}
+                    )
+                else:
+                    _decode_pool = False
+            pool = _decode_pool
+    return pool or None
+
+
+def shutdown_decode_pool() -> None:
+    """
+    プロセスプールを停止（アプリケーション終了時・テスト用）
+
+    次回の get_decode_pool で環境変数を読み込み直します。
+    """
+    global _decode_pool
+    with _decode_pool_lock:
+        if _decode_pool:
+            _decode_pool.shutdown()
+            logger.info("Decode pool shut down")
+        _decode_pool = None
@@ -1,17 +1,74 @@
 """
 Jockey Service - 騎手データ取得のビジネスロジック
 
-S3から騎手のpickleデータを取得し、JSON形式に変換します。
+S3から騎手データ（pickle / Feather / Parquet）を取得し、JSON形式に変換します。
+デシリアライズ済みのDataFrameとエンコード済みのJSONレスポンスは
+プロセス内キャッシュに保持されます。
+
+キャッシュには取得元S3オブジェクトのETagを併せて保持し、期限切れのエントリは
+S3の条件付き取得（IfNoneMatch）で再検証します。オブジェクトが変更されていなければ
+ボディの転送・デシリアライズ・JSON変換を行わずに有効期限を延長します。
+
+同一騎手ID・条件への同時リクエストは、キャッシュの有無に関わらず1回の取得・変換にまとめ、
+結果（または例外）を共有します（SingleFlight）。
 """
 
+import asyncio
+import contextvars
+import json
+import math
 import pickle
-from typing import Any, List
+from concurrent.futures import Executor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Hashable, Iterator, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 
+from app.core.config import get_env_bool, get_env_str
 from app.core.logging import get_logger
-from app.infrastructure.dependencies import get_s3_accessor
-from app.models.exceptions import JockeyNotFoundError, PickleDeserializeError, S3AccessError
+from app.core.metrics import observe_dataframe_rows
+from app.core.timing import (
+    STAGE_DESERIALIZE,
+    STAGE_ENCODE,
+    STAGE_OFFLOAD,
+    STAGE_QUERY,
+    STAGE_S3,
+    STAGE_TO_RECORDS,
+    stage,
+)
+from app.infrastructure.dependencies import (
+    get_batch_executor,
+    get_jockey_cache,
+    get_response_cache,
+    get_s3_accessor,
+    get_single_flight,
+)
+from app.infrastructure.disk_cache import release_mapped_data
+from app.infrastructure.s3_accessor import ObjectData, S3Object
+from app.infrastructure.storage_formats import (
+    FILE_EXTENSIONS,
+    STORAGE_FORMAT_PICKLE,
+    STORAGE_FORMATS,
+    MissingColumnsError,
+    deserialize_dataframe,
+    is_format_available,
+    select_columns,
+)
+from app.models.batch import BatchItem
+from app.models.exceptions import (
+    InvalidQueryError,
+    JockeyDataException,
+    JockeyNotFoundError,
+    PickleDeserializeError,
+    S3AccessError,
+    SSMConfigError,
+)
+from app.models.page import EncodedPage, JockeyPage, ObjectVersion, VersionedFrame
+from app.models.query import DATE_COLUMN, DEFAULT_QUERY, JockeyQuery
+from app.services.date_index import get_date_index
+from app.services.decode_pool import DecodePool, get_decode_pool
+from app.services.json_encoder import UnsupportedColumnError, encode_records_json
 
 logger = get_logger(__name__)
 
@@ -23,37 +80,113 @@ class JockeyService:
         """
         JockeyServiceの初期化
 
-        S3Accessorのシングルトンインスタンスを取得します。
+        S3Accessor・各キャッシュ・SingleFlightのシングルトンインスタンスを取得し、
+        以下の環境変数から保存形式の設定を読み込みます。
+
+        - JOCKEY_STORAGE_FORMAT: 優先して読み込む保存形式（pickle / feather / parquet、デフォルト: pickle）
+        - JOCKEY_STORAGE_PICKLE_FALLBACK: 優先形式のオブジェクトが存在しない場合に
+          pickleを読み込むかどうか（デフォルト: true）
         """
         self.s3_accessor = get_s3_accessor()
+        self.cache = get_jockey_cache()
+        self.response_cache = get_response_cache()
+        self.flights = get_single_flight()
+        self.storage_formats = self._resolve_storage_formats(
+            get_env_str("JOCKEY_STORAGE_FORMAT", STORAGE_FORMAT_PICKLE).lower(),
+            get_env_bool("JOCKEY_STORAGE_PICKLE_FALLBACK", True),
+        )
+
+    @classmethod
+    def for_worker(cls) -> "JockeyService":
+        """
+        プロセスプールのワーカー用のインスタンスを生成
+
+        S3Accessor・キャッシュを使用せず、encode_object_page によるデコード・条件の適用・
+        JSONエンコードのみを行います。
+
+        Returns:
+            JockeyServiceインスタンス
+        """
+        service = cls.__new__(cls)
+        service.storage_formats = [STORAGE_FORMAT_PICKLE]
+        return service
+
+    def _resolve_storage_formats(self, preferred: str, pickle_fallback: bool) -> List[str]:
+        """
+        読み込みを試行する保存形式の順序を決定
 
-    def _generate_s3_key(self, jockey_id: str) -> str:
+        Args:
+            preferred: 優先する保存形式
+            pickle_fallback: pickleへのフォールバックを許可するかどうか
+
+        Returns:
+            試行順の保存形式リスト
+        """
+        if preferred not in STORAGE_FORMATS or not is_format_available(preferred):
+            logger.warning(
+                "Storage format is unavailable, using pickle",
+                extra={"storage_format": preferred}
+            )
+            return [STORAGE_FORMAT_PICKLE]
+
+        if preferred != STORAGE_FORMAT_PICKLE and pickle_fallback:
+            return [preferred, STORAGE_FORMAT_PICKLE]
+        return [preferred]
+
+    def _generate_s3_key(self, jockey_id: str, storage_format: str = STORAGE_FORMAT_PICKLE) -> str:
         """
         騎手IDからS3オブジェクトキーを生成
 
         Args:
             jockey_id: 騎手ID（例: "05339"）
+            storage_format: 保存形式（デフォルト: pickle）
 
         Returns:
-            S3オブジェクトキー（例: "05339.pickle"）
+            S3オブジェクトキー（例: "05339.pickle"、"05339.parquet"）
         """
-        return f"{jockey_id}.pickle"
+        return f"{jockey_id}.{FILE_EXTENSIONS[storage_format]}"
 
-    def get_jockey_data_binary(self, jockey_id: str) -> bytes:
+    def get_jockey_data_binary(
+        self, jockey_id: str, storage_format: str = STORAGE_FORMAT_PICKLE
+    ) -> ObjectData:
         """
         騎手IDに基づいてS3からバイナリデータを取得
 
         Args:
             jockey_id: 騎手ID
+            storage_format: 保存形式（デフォルト: pickle）
+
+        Returns:
+            S3から取得したオブジェクトのバイナリデータ
+
+        Raises:
+            JockeyNotFoundError: 指定された騎手IDのデータが見つからない場合
+            S3AccessError: S3接続エラーが発生した場合
+        """
+        return self._object_data(self.get_jockey_object(jockey_id, storage_format), jockey_id)
+
+    def get_jockey_object(
+        self,
+        jockey_id: str,
+        storage_format: str = STORAGE_FORMAT_PICKLE,
+        if_none_match: Optional[str] = None,
+    ) -> S3Object:
+        """
+        騎手IDに基づいてS3からオブジェクトをETag・最終更新日時とともに取得
+
+        Args:
+            jockey_id: 騎手ID
+            storage_format: 保存形式（デフォルト: pickle）
+            if_none_match: 手元のオブジェクトのETag（指定時は条件付き取得）
 
         Returns:
-            S3から取得したpickleファイルのバイナリデータ
+            S3から取得したオブジェクト（変更されていない場合は data=None）
 
         Raises:
             JockeyNotFoundError: 指定された騎手IDのデータが見つからない場合
             S3AccessError: S3接続エラーが発生した場合
         """
-        s3_key = self._generate_s3_key(jockey_id)
+        s3_key = self._generate_s3_key(jockey_id, storage_format)
 
         logger.info(
             "Fetching jockey data from S3",
@@ -61,21 +194,11 @@ class JockeyService:
         )
 
         try:
-            data = self.s3_accessor.get_object(s3_key)
-
-            if data is None:
-                logger.warning(
-                    "Jockey data not found",
-                    extra={"jockey_id": jockey_id, "s3_key": s3_key}
+            with stage(STAGE_S3):
+                s3_object = self.s3_accessor.get_object_with_metadata(
+                    s3_key, if_none_match=if_none_match
                 )
-                raise JockeyNotFoundError(jockey_id)
-
-            result: bytes = data
-            logger.info(
-                "Successfully retrieved jockey data",
-                extra={"jockey_id": jockey_id, "data_size": len(result)}
-            )
-            return result
+            return self._checked_object(s3_object, jockey_id, s3_key)
 
         except S3AccessError as e:
             logger.error(
@@ -88,7 +211,140 @@ class JockeyService:
             )
             raise
 
-    def deserialize_pickle(self, pickle_data: bytes, jockey_id: str) -> pd.DataFrame:
+    def _checked_object(
+        self, s3_object: Optional[S3Object], jockey_id: str, s3_key: str
+    ) -> S3Object:
+        """取得結果を確認（オブジェクトが存在しない場合はJockeyNotFoundError）"""
+        if s3_object is None:
+            logger.warning(
+                "Jockey data not found",
+                extra={"jockey_id": jockey_id, "s3_key": s3_key}
+            )
+            raise JockeyNotFoundError(jockey_id)
+
+        if s3_object.not_modified:
+            logger.info(
+                "Jockey data not modified",
+                extra={"jockey_id": jockey_id, "s3_key": s3_key, "etag": s3_object.etag}
+            )
+        else:
+            logger.info(
+                "Successfully retrieved jockey data",
+                extra={"jockey_id": jockey_id, "data_size": len(self._object_data(s3_object, jockey_id))}
+            )
+        return s3_object
+
+    def _object_data(self, s3_object: S3Object, jockey_id: str) -> ObjectData:
+        """オブジェクトのバイナリデータを取得（条件付き取得で転送されなかった場合はエラー）"""
+        if s3_object.data is None:
+            raise PickleDeserializeError(jockey_id, Exception("Object body was not transferred"))
+        return s3_object.data
+
+    def fetch_jockey_object(
+        self, jockey_id: str, if_none_match: Optional[str] = None
+    ) -> Tuple[S3Object, str]:
+        """
+        設定された保存形式の順に騎手データのオブジェクトをS3から取得
+
+        Args:
+            jockey_id: 騎手ID
+            if_none_match: 手元のオブジェクトのETag（指定時は条件付き取得）
+
+        Returns:
+            (S3から取得したオブジェクト, 保存形式) のタプル
+
+        Raises:
+            JockeyNotFoundError: いずれの形式でもデータが見つからない場合
+            S3AccessError: S3接続エラーが発生した場合
+        """
+        for storage_format in self.storage_formats[:-1]:
+            try:
+                s3_object = self.get_jockey_object(jockey_id, storage_format, if_none_match)
+                return s3_object, storage_format
+            except JockeyNotFoundError:
+                logger.info(
+                    "Falling back to next storage format",
+                    extra={"jockey_id": jockey_id, "storage_format": storage_format}
+                )
+
+        storage_format = self.storage_formats[-1]
+        return self.get_jockey_object(jockey_id, storage_format, if_none_match), storage_format
+
+    def deserialize(
+        self,
+        data: ObjectData,
+        jockey_id: str,
+        storage_format: str,
+        columns: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        保存形式に応じてバイナリデータをpandas DataFrameにデシリアライズ
+
+        Feather・Parquetでは columns で指定された列のみをデコードします。
+
+        Args:
+            data: バイナリデータ
+            jockey_id: 騎手ID（エラーログ用）
+            storage_format: 保存形式（pickle / feather / parquet）
+            columns: 読み込む列名のリスト（省略時は全列）
+
+        Returns:
+            pandas DataFrame
+
+        Raises:
+            InvalidQueryError: 指定された列が存在しない場合
+            PickleDeserializeError: デシリアライズに失敗した場合
+        """
+        with stage(STAGE_DESERIALIZE):
+            df = self._deserialize(data, jockey_id, storage_format, columns)
+        observe_dataframe_rows(len(df))
+        return df
+
+    def _deserialize(
+        self,
+        data: ObjectData,
+        jockey_id: str,
+        storage_format: str,
+        columns: Optional[Sequence[str]],
+    ) -> pd.DataFrame:
+        """保存形式に応じてバイナリデータをデシリアライズ（deserialize の本体）"""
+        if storage_format == STORAGE_FORMAT_PICKLE:
+            df = self.deserialize_pickle(data, jockey_id)
+            return self._select_columns(df, columns) if columns is not None else df
+
+        try:
+            logger.debug(
+                "Deserializing columnar data",
+                extra={
+                    "jockey_id": jockey_id,
+                    "storage_format": storage_format,
+                    "data_size": len(data),
+                }
+            )
+            df = deserialize_dataframe(data, storage_format, columns)
+
+            logger.info(
+                "Successfully deserialized columnar data",
+                extra={
+                    "jockey_id": jockey_id,
+                    "storage_format": storage_format,
+                    "rows": len(df),
+                    "columns": len(df.columns),
+                }
+            )
+            return df
+
+        except MissingColumnsError as e:
+            raise InvalidQueryError(f"Unknown columns: {', '.join(e.columns)}") from e
+
+        except Exception as e:
+            logger.error(
+                "Failed to deserialize columnar data",
+                extra={"jockey_id": jockey_id, "storage_format": storage_format, "error": str(e)}
+            )
+            raise PickleDeserializeError(jockey_id, e) from e
+
+    def deserialize_pickle(self, pickle_data: ObjectData, jockey_id: str) -> pd.DataFrame:
         """
         pickleバイナリデータをpandas DataFrameにデシリアライズ
 
@@ -149,15 +405,8 @@ class JockeyService:
                 "Converting DataFrame to JSON",
                 extra={"jockey_id": jockey_id, "rows": len(df)}
             )
-
-            # 日付列をISO 8601形式に変換
-            df_copy = df.copy()
-            for col in df_copy.columns:
-                if pd.api.types.is_datetime64_any_dtype(df_copy[col]):
-                    df_copy[col] = df_copy[col].dt.strftime("%Y-%m-%dT%H:%M:%S")
-
-            # orient='records'でJSON形式に変換
-            result: List[dict[str, Any]] = df_copy.to_dict(orient="records")
+            with stage(STAGE_TO_RECORDS):
+                result = self._to_records(df)
 
             logger.info(
                 "Successfully converted DataFrame to JSON",
@@ -172,15 +421,352 @@ class JockeyService:
             )
             raise PickleDeserializeError(jockey_id, e) from e
 
-    def get_jockey_data(self, jockey_id: str) -> List[dict[str, Any]]:
+    def _to_records(self, df: pd.DataFrame) -> List[dict[str, Any]]:
+        """DataFrameをレコードのリストに変換（dataframe_to_json の本体）"""
+        # 日付列をISO 8601形式に変換
+        df_copy = df.copy()
+        for col in df_copy.columns:
+            if pd.api.types.is_datetime64_any_dtype(df_copy[col]):
+                df_copy[col] = df_copy[col].dt.strftime("%Y-%m-%dT%H:%M:%S")
+
+        # orient='records'でJSON形式に変換
+        result: List[dict[str, Any]] = df_copy.to_dict(orient="records")
+        return result
+
+    def get_jockey_dataframe(
+        self, jockey_id: str, columns: Optional[Sequence[str]] = None
+    ) -> pd.DataFrame:
+        """
+        騎手IDに基づいてデシリアライズ済みのDataFrameを取得
+
+        キャッシュに存在すればそれを返し、存在しなければS3から取得して
+        デシリアライズした結果をキャッシュに格納します。同一騎手IDへの
+        同時リクエストではS3への取得は1回のみ実行されます。
+
+        columns が指定され、保存形式が列単位の読み込みに対応している場合
+        （Feather・Parquet）は、指定された列のみをデコードしてキャッシュします。
+
+        返却されるDataFrameはキャッシュと共有されるため、変更しないでください。
+
+        Args:
+            jockey_id: 騎手ID
+            columns: 必要な列名のリスト（省略時は全列）
+
+        Returns:
+            pandas DataFrame
+
+        Raises:
+            JockeyNotFoundError: 指定された騎手IDのデータが見つからない場合
+            S3AccessError: S3接続エラーが発生した場合
+            InvalidQueryError: 指定された列が存在しない場合
+            PickleDeserializeError: デシリアライズに失敗した場合
+        """
+        df = self._load_frame(jockey_id, columns).data
+        return self._select_columns(df, columns) if columns is not None else df
+
+    def _load_frame(
+        self, jockey_id: str, columns: Optional[Sequence[str]] = None
+    ) -> VersionedFrame:
+        """
+        キャッシュと共有されるDataFrameを取得元オブジェクトの情報とともに取得
+
+        返却されるDataFrameは columns をすべて含みますが、それ以外の列を
+        含む場合があります（pickle形式では常に全列）。期限切れのエントリは
+        S3の条件付き取得で再検証します。
+        """
+        cache_key, decode_columns = self._dataframe_cache_key(jockey_id, columns)
+
+        def load() -> VersionedFrame:
+            s3_object, storage_format = self.fetch_jockey_object(jockey_id)
+            return self._decode_object(s3_object, jockey_id, storage_format, decode_columns)
+
+        def revalidate(stale: VersionedFrame) -> VersionedFrame:
+            if not self._can_revalidate(stale):
+                return load()
+            try:
+                s3_object = self.get_jockey_object(
+                    jockey_id, stale.storage_format, stale.version.etag
+                )
+            except JockeyNotFoundError:
+                return load()
+            if s3_object.not_modified:
+                return stale
+            return self._decode_object(s3_object, jockey_id, stale.storage_format, decode_columns)
+
+        frame: VersionedFrame = self.cache.get_or_load(cache_key, load, revalidate)
+        if columns is not None and decode_columns is None:
+            self._require_columns(frame.data, columns)
+        return frame
+
+    def _decode_object(
+        self,
+        s3_object: S3Object,
+        jockey_id: str,
+        storage_format: str,
+        columns: Optional[Sequence[str]],
+    ) -> VersionedFrame:
+        """
+        S3から取得したオブジェクトをデシリアライズしてキャッシュに格納する形式に変換
+
+        ディスクキャッシュからmmapで読み込んだデータは、デシリアライズ後に閉じます。
+        """
+        data = self._object_data(s3_object, jockey_id)
+        try:
+            df = self.deserialize(data, jockey_id, storage_format, columns)
+        finally:
+            release_mapped_data(data)
+        return VersionedFrame(df, storage_format, s3_object.version)
+
+    def _can_revalidate(self, stale: VersionedFrame) -> bool:
+        """期限切れのDataFrameを取得元オブジェクトの条件付き取得で再検証できるかどうか"""
+        # フォールバック先の形式から読み込んだ場合は、優先形式のオブジェクトから取得し直す
+        return stale.version.etag is not None and stale.storage_format == self.storage_formats[0]
+
+    def _cached_version(self, jockey_id: str, query: JockeyQuery) -> Optional[ObjectVersion]:
+        """キャッシュ済みのレスポンスまたはDataFrameの取得元オブジェクトのバージョン情報"""
+        encoded: Optional[EncodedPage] = self.response_cache.peek((jockey_id, query))
+        if encoded is not None and encoded.version.etag is not None:
+            return encoded.version
+
+        cache_key, _ = self._dataframe_cache_key(jockey_id, query.required_columns())
+        frame: Optional[VersionedFrame] = self.cache.peek(cache_key)
+        if frame is not None and frame.version.etag is not None:
+            return frame.version
+        return None
+
+    def check_not_modified(
+        self, jockey_id: str, query: JockeyQuery, etags: Sequence[str]
+    ) -> Optional[ObjectVersion]:
+        """
+        クライアントが保持するETagが最新かどうかを、デコードせずに判定
+
+        キャッシュにバージョン情報があればS3にアクセスせずに判定します。
+        キャッシュにない場合はクライアントのETagでS3から条件付き取得し、
+        変更されていればデシリアライズした結果をキャッシュに格納します
+        （続く get_jockey_page_json などで再利用されます）。
+
+        Args:
+            jockey_id: 騎手ID
+            query: 取得条件
+            etags: If-None-Matchヘッダーで指定されたETagのリスト
+
+        Returns:
+            最新の場合はオブジェクトのバージョン情報（変更されている・判定できない場合はNone）
+
+        Raises:
+            JockeyNotFoundError: 指定された騎手IDのデータが見つからない場合
+            S3AccessError: S3接続エラーが発生した場合
+            InvalidQueryError: 指定された列が存在しない場合
+            PickleDeserializeError: デシリアライズに失敗した場合
+        """
+        version = self._cached_version(jockey_id, query)
+        if version is not None:
+            return version if version.etag in etags else None
+        if len(etags) != 1:
+            return None
+
+        s3_object, storage_format = self.fetch_jockey_object(jockey_id, etags[0])
+        if s3_object.not_modified:
+            return s3_object.version
+
+        cache_key, decode_columns = self._dataframe_cache_key(jockey_id, query.required_columns())
+        self.cache.put(
+            cache_key, self._decode_object(s3_object, jockey_id, storage_format, decode_columns)
+        )
+        return None
+
+    def _dataframe_cache_key(
+        self, jockey_id: str, columns: Optional[Sequence[str]]
+    ) -> Tuple[Hashable, Optional[Tuple[str, ...]]]:
+        """
+        DataFrameキャッシュのキーとデコード対象の列を決定
+
+        Returns:
+            (キャッシュキー, デコードする列名のタプル（全列の場合はNone）)
+        """
+        if columns is None or self.storage_formats == [STORAGE_FORMAT_PICKLE]:
+            # pickleは全体をデコードする必要があるため、全列のDataFrameを共有する
+            return jockey_id, None
+        column_tuple = tuple(columns)
+        return (jockey_id, column_tuple), column_tuple
+
+    def _require_columns(self, df: pd.DataFrame, columns: Sequence[str]) -> None:
+        """指定された列がすべて存在することを確認（存在しない列はInvalidQueryError）"""
+        missing = [column for column in columns if column not in df.columns]
+        if missing:
+            raise InvalidQueryError(f"Unknown columns: {', '.join(missing)}")
+
+    def _select_columns(self, df: pd.DataFrame, columns: Sequence[str]) -> pd.DataFrame:
+        """DataFrameから列を選択（存在しない列はInvalidQueryError）"""
+        try:
+            return select_columns(df, columns)
+        except MissingColumnsError as e:
+            raise InvalidQueryError(f"Unknown columns: {', '.join(e.columns)}") from e
+
+    def apply_query(self, df: pd.DataFrame, query: JockeyQuery) -> pd.DataFrame:
+        """
+        DataFrameに日付範囲・等価条件・列選択を適用
+
+        ページネーションは適用しません（get_jockey_page を使用してください）。
+
+        Args:
+            df: pandas DataFrame
+            query: 取得条件
+
+        Returns:
+            条件を適用したDataFrame
+
+        Raises:
+            InvalidQueryError: 存在しない列や列の型に合わない値が指定された場合
+        """
+        if query.is_default:
+            return df
+
+        mask = self._row_mask(df, query)
+        if mask is not None:
+            df = df[mask]
+
+        if query.fields is not None:
+            df = self._select_columns(df, query.fields)
+        return df
+
+    def _row_mask(self, df: pd.DataFrame, query: JockeyQuery) -> Optional[np.ndarray]:
+        """日付範囲・等価条件に一致する行のマスクを生成（行フィルタがない場合はNone）"""
+        if not query.has_row_filters:
+            return None
+
+        mask = np.ones(len(df), dtype=bool)
+
+        if query.date_from is not None or query.date_to is not None:
+            mask &= self._date_range_mask(df, query)
+
+        values_by_column: dict[str, List[str]] = {}
+        for column, value in query.filters:
+            values_by_column.setdefault(column, []).append(value)
+        for column, values in values_by_column.items():
+            mask &= self._equality_mask(df, column, values)
+
+        return mask
+
+    def _date_range_mask(self, df: pd.DataFrame, query: JockeyQuery) -> np.ndarray:
+        """日付列が [date_from, date_to] の範囲内にある行のマスクを生成"""
+        if DATE_COLUMN not in df.columns or not pd.api.types.is_datetime64_any_dtype(
+            df[DATE_COLUMN]
+        ):
+            raise InvalidQueryError(f"Date range filter requires a '{DATE_COLUMN}' date column")
+
+        dates = df[DATE_COLUMN]
+        tz = getattr(dates.dt, "tz", None)
+        mask = np.ones(len(df), dtype=bool)
+        if query.date_from is not None:
+            lower = pd.Timestamp(query.date_from, tz=tz)
+            mask &= (dates >= lower).to_numpy()
+        if query.date_to is not None:
+            upper = pd.Timestamp(query.date_to, tz=tz) + pd.Timedelta(days=1)
+            mask &= (dates < upper).to_numpy()
+        return mask
+
+    def _equality_mask(self, df: pd.DataFrame, column: str, values: List[str]) -> np.ndarray:
+        """列の値がいずれかの値に一致する行のマスクを生成"""
+        if column not in df.columns:
+            raise InvalidQueryError(f"Unknown filter column: {column}")
+
+        series = df[column]
+        candidates: List[Any] = list(values)
+        try:
+            if pd.api.types.is_bool_dtype(series):
+                candidates = [value.lower() in ("true", "1") for value in values]
+            elif pd.api.types.is_numeric_dtype(series):
+                candidates = [float(value) for value in values]
+            elif pd.api.types.is_datetime64_any_dtype(series):
+                candidates = [pd.Timestamp(value) for value in values]
+        except ValueError as e:
+            raise InvalidQueryError(
+                f"Invalid filter value for column '{column}': {', '.join(values)}"
+            ) from e
+
+        mask: np.ndarray = series.isin(candidates).to_numpy()
+        return mask
+
+    def get_jockey_page(self, jockey_id: str, query: JockeyQuery = DEFAULT_QUERY) -> JockeyPage:
+        """
+        騎手IDと取得条件に基づいて、条件を適用済みのDataFrameを取得
+
+        query.limit が指定されている場合は、日付・レース番号の降順に並べた
+        インデックスからカーソルの次の行をlimit行取り出します。インデックスは
+        キャッシュ済みのDataFrameごとに1回だけ構築されるため、行フィルタを
+        伴わないページの取り出しは二分探索とスライスのみで行われます。
+
+        Args:
+            jockey_id: 騎手ID
+            query: 取得条件
+
+        Returns:
+            条件を適用したDataFrameと次ページのカーソル
+
+        Raises:
+            JockeyNotFoundError: 指定された騎手IDのデータが見つからない場合
+            S3AccessError: S3接続エラーが発生した場合
+            InvalidQueryError: 取得条件が不正な場合
+            PickleDeserializeError: デシリアライズに失敗した場合
+        """
+        frame = self._load_frame(jockey_id, query.required_columns())
+        return self._page_from_frame(frame, query)
+
+    def _page_from_frame(self, frame: VersionedFrame, query: JockeyQuery) -> JockeyPage:
+        """キャッシュと共有されるDataFrameに条件・ページネーションを適用"""
+        with stage(STAGE_QUERY):
+            return self._apply_page(frame, query)
+
+    def _apply_page(self, frame: VersionedFrame, query: JockeyQuery) -> JockeyPage:
+        """条件・ページネーションを適用（_page_from_frame の本体）"""
+        df = frame.data
+        if query.limit is None:
+            return JockeyPage(self.apply_query(df, query), version=frame.version)
+
+        positions, next_cursor = get_date_index(df).page(
+            query.limit, query.cursor, self._row_mask(df, query)
+        )
+        page = df.iloc[positions]
+        if query.fields is not None:
+            page = self._select_columns(page, query.fields)
+        return JockeyPage(page, next_cursor, frame.version)
+
+    def get_jockey_query_dataframe(self, jockey_id: str, query: JockeyQuery) -> pd.DataFrame:
+        """
+        騎手IDと取得条件に基づいて、条件を適用済みのDataFrameを取得
+
+        Args:
+            jockey_id: 騎手ID
+            query: 取得条件
+
+        Returns:
+            条件を適用したDataFrame
+
+        Raises:
+            JockeyNotFoundError: 指定された騎手IDのデータが見つからない場合
+            S3AccessError: S3接続エラーが発生した場合
+            InvalidQueryError: 取得条件が不正な場合
+            PickleDeserializeError: デシリアライズに失敗した場合
+        """
+        return self.get_jockey_page(jockey_id, query).data
+
+    def get_jockey_data(
+        self, jockey_id: str, query: JockeyQuery = DEFAULT_QUERY
+    ) -> List[dict[str, Any]]:
         """
         騎手IDに基づいてS3からデータを取得し、JSON形式で返却
 
         S3からpickleファイルを取得 → デシリアライズ → JSON変換の
-        完全なフローを実行します。
+        完全なフローを実行します。デシリアライズ済みのDataFrameが
+        キャッシュに存在する場合はS3取得とデシリアライズを省略します。
+
+        同一騎手ID・条件への同時呼び出しは1回の実行にまとめられ、結果（または例外）を
+        共有します。返却されるリストは呼び出し元の間で共有されるため、変更しないでください。
 
         Args:
             jockey_id: 騎手ID
+            query: 列選択・行フィルタの条件（省略時は全件・全列）
 
         Returns:
             JSON形式のレースデータリスト
@@ -188,21 +774,750 @@ class JockeyService:
         Raises:
             JockeyNotFoundError: 指定された騎手IDのデータが見つからない場合
             S3AccessError: S3接続エラーが発生した場合
+            InvalidQueryError: 取得条件が不正な場合
             PickleDeserializeError: デシリアライズまたはJSON変換に失敗した場合
         """
         logger.info("Starting jockey data retrieval", extra={"jockey_id": jockey_id})
 
-        # S3からバイナリデータを取得
-        binary_data = self.get_jockey_data_binary(jockey_id)
+        def load() -> List[dict[str, Any]]:
+            # S3からの取得とデシリアライズ（キャッシュ経由）、条件の適用
+            df = self.get_jockey_query_dataframe(jockey_id, query)
 
-        # pickleデシリアライズ
-        df = self.deserialize_pickle(binary_data, jockey_id)
+            # JSON変換
+            return self.dataframe_to_json(df, jockey_id)
 
-        # JSON変換
-        json_data = self.dataframe_to_json(df, jockey_id)
+        json_data: List[dict[str, Any]] = self.flights.do(("records", jockey_id, query), load)
 
         logger.info(
             "Completed jockey data retrieval",
             extra={"jockey_id": jockey_id, "record_count": len(json_data)}
         )
         return json_data
+
+    def encode_json(self, records: List[dict[str, Any]], jockey_id: str) -> bytes:
+        """
+        JSONレコードリストをレスポンスボディのバイト列にエンコード
+
+        FastAPIのレスポンス（response_model経由のJSONResponse）と同一のバイト列を
+        生成します。NaN・無限大はnullに変換されます。
+
+        Args:
+            records: JSON形式のレコードリスト
+            jockey_id: 騎手ID（エラーログ用）
+
+        Returns:
+            UTF-8エンコード済みのJSONバイト列
+
+        Raises:
+            PickleDeserializeError: JSONエンコードに失敗した場合
+        """
+        try:
+            with stage(STAGE_ENCODE):
+                return self._dump_records(records)
+
+        except Exception as e:
+            logger.error(
+                "Failed to encode JSON response",
+                extra={"jockey_id": jockey_id, "error": str(e)}
+            )
+            raise PickleDeserializeError(jockey_id, e) from e
+
+    def _dump_records(self, records: List[dict[str, Any]]) -> bytes:
+        """レコードのリストをJSONバイト列にエンコード（encode_json の本体）"""
+        normalized = [
+            {
+                key: None if isinstance(value, float) and not math.isfinite(value) else value
+                for key, value in record.items()
+            }
+            for record in records
+        ]
+        return json.dumps(
+            normalized,
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+    def dataframe_to_json_bytes(self, df: pd.DataFrame, jockey_id: str) -> bytes:
+        """
+        pandas DataFrameをレスポンスボディのJSONバイト列に直接エンコード
+
+        行ごとのdictを生成せずに列単位でエンコードします。出力は
+        dataframe_to_json → encode_json の結果とバイト単位で一致します。
+
+        Args:
+            df: pandas DataFrame
+            jockey_id: 騎手ID（エラーログ用）
+
+        Returns:
+            UTF-8エンコード済みのJSONバイト列
+
+        Raises:
+            PickleDeserializeError: JSON変換に失敗した場合
+        """
+        body = self._encode_dataframe(df, jockey_id)
+        logger.info(
+            "Successfully encoded DataFrame to JSON",
+            extra={"jockey_id": jockey_id, "rows": len(df), "size": len(body)}
+        )
+        return body
+
+    def _encode_dataframe(self, df: pd.DataFrame, jockey_id: str) -> bytes:
+        """
+        DataFrameを列単位でJSONバイト列にエンコード
+
+        列単位エンコードに対応していない列が含まれる場合は、
+        dataframe_to_json → encode_json にフォールバックします。
+        """
+        try:
+            with stage(STAGE_ENCODE):
+                return encode_records_json(df)
+
+        except UnsupportedColumnError as e:
+            logger.warning(
+                "Falling back to record-based JSON encoding",
+                extra={"jockey_id": jockey_id, "error": str(e)}
+            )
+            return self.encode_json(self.dataframe_to_json(df, jockey_id), jockey_id)
+
+        except Exception as e:
+            logger.error(
+                "Failed to encode DataFrame to JSON",
+                extra={"jockey_id": jockey_id, "error": str(e)}
+            )
+            raise PickleDeserializeError(jockey_id, e) from e
+
+    def get_jockey_data_json(self, jockey_id: str, query: JockeyQuery = DEFAULT_QUERY) -> bytes:
+        """
+        騎手IDに基づいてエンコード済みのJSONレスポンスボディを取得
+
+        Args:
+            jockey_id: 騎手ID
+            query: 列選択・行フィルタの条件（省略時は全件・全列）
+
+        Returns:
+            UTF-8エンコード済みのJSONバイト列
+
+        Raises:
+            JockeyNotFoundError: 指定された騎手IDのデータが見つからない場合
+            S3AccessError: S3接続エラーが発生した場合
+            InvalidQueryError: 取得条件が不正な場合
+            PickleDeserializeError: デシリアライズまたはJSON変換に失敗した場合
+        """
+        return self.get_jockey_page_json(jockey_id, query).body
+
+    def get_jockey_page_json(
+        self, jockey_id: str, query: JockeyQuery = DEFAULT_QUERY
+    ) -> EncodedPage:
+        """
+        騎手IDに基づいてエンコード済みのJSONレスポンスボディと次ページのカーソルを取得
+
+        DataFrameは条件を適用した後に列単位でJSONにエンコードされます。
+        エンコード済みのバイト列が（騎手ID・条件ごとに）キャッシュに存在する
+        場合は、JSON変換を行わずにそのまま返却します。期限切れのバイト列は、
+        取得元オブジェクトが変更されていなければ再エンコードせずに再利用します。
+        同一騎手ID・条件への同時呼び出しは（キャッシュが無効な場合も）1回の実行にまとめられます。
+
+        Args:
+            jockey_id: 騎手ID
+            query: 列選択・行フィルタ・ページネーションの条件（省略時は全件・全列）
+
+        Returns:
+            エンコード済みのJSONバイト列と次ページのカーソル
+
+        Raises:
+            JockeyNotFoundError: 指定された騎手IDのデータが見つからない場合
+            S3AccessError: S3接続エラーが発生した場合
+            InvalidQueryError: 取得条件が不正な場合
+            PickleDeserializeError: デシリアライズまたはJSON変換に失敗した場合
+        """
+        cache_key = (jockey_id, query)
+        stale: Optional[EncodedPage] = self.response_cache.get_stale(cache_key)
+        encoded: Optional[EncodedPage] = self.response_cache.get(cache_key)
+        if encoded is None:
+            encoded = self.flights.do(
+                ("page_json", jockey_id, query),
+                lambda: self._load_page_json(jockey_id, query, stale),
+            )
+
+        logger.info(
+            "Completed jockey JSON retrieval",
+            extra={"jockey_id": jockey_id, "size": len(encoded.body)}
+        )
+        return encoded
+
+    def _load_page_json(
+        self, jockey_id: str, query: JockeyQuery, stale: Optional[EncodedPage]
+    ) -> EncodedPage:
+        """キャッシュにないエンコード済みのバイト列を生成してキャッシュに格納（期限切れの値があれば再検証）"""
+        pool = self._offload_pool(jockey_id, query) if stale is None else None
+        if pool is not None:
+            s3_object, storage_format = self.fetch_jockey_object(jockey_id)
+            encoded = self._encode_fetched_page(pool, s3_object, jockey_id, storage_format, query)
+        else:
+            frame = self._load_frame(jockey_id, query.required_columns())
+            if stale is not None and self._is_current(stale, frame):
+                self.response_cache.record_revalidation()
+                encoded = stale
+            else:
+                encoded = self._encode_page(self._page_from_frame(frame, query), jockey_id)
+        self.response_cache.put((jockey_id, query), encoded)
+        return encoded
+
+    def get_jockeys_data_json(
+        self,
+        jockey_ids: Sequence[str],
+        query: JockeyQuery = DEFAULT_QUERY,
+        executor: Optional[Executor] = None,
+    ) -> List[BatchItem]:
+        """
+        複数の騎手IDのエンコード済みJSONレスポンスボディを並行して取得
+
+        騎手ごとのS3取得・デシリアライズ・JSON変換をワーカープールで並行に
+        実行します。騎手ごとの失敗（データが見つからない場合など）は
+        結果に含めて返却し、他の騎手の取得は継続します。
+
+        Args:
+            jockey_ids: 騎手IDのリスト（重複は除外）
+            query: 全騎手に適用する列選択・行フィルタの条件
+            executor: 使用するワーカープール（省略時は共有のプール）
+
+        Returns:
+            騎手IDの最初の出現順に並べた取得結果のリスト
+
+        Raises:
+            SSMConfigError: SSM設定取得エラーが発生した場合
+        """
+        if executor is None:
+            executor = get_batch_executor()
+
+        unique_ids = list(dict.fromkeys(jockey_ids))
+        futures = [
+            (
+                jockey_id,
+                # 処理段階の計測（app.core.timing）のためにリクエストのコンテキストを引き継ぐ
+                executor.submit(
+                    contextvars.copy_context().run, self.get_jockey_data_json, jockey_id, query
+                ),
+            )
+            for jockey_id in unique_ids
+        ]
+
+        items: List[BatchItem] = []
+        for jockey_id, future in futures:
+            try:
+                items.append(BatchItem(jockey_id, body=future.result()))
+            except SSMConfigError:
+                raise
+            except JockeyDataException as e:
+                logger.warning(
+                    "Batch item failed",
+                    extra={"jockey_id": jockey_id, "error_type": type(e).__name__, "error": str(e)}
+                )
+                items.append(BatchItem(jockey_id, error=e))
+
+        logger.info(
+            "Completed jockey batch retrieval",
+            extra={
+                "requested": len(unique_ids),
+                "failed": sum(1 for item in items if item.error is not None),
+            }
+        )
+        return items
+
+    def _encode_page(self, page: JockeyPage, jockey_id: str) -> EncodedPage:
+        """条件を適用したDataFrameをJSONバイト列にエンコード"""
+        return EncodedPage(
+            self.dataframe_to_json_bytes(page.data, jockey_id), page.next_cursor, page.version
+        )
+
+    def _is_current(self, encoded: EncodedPage, frame: VersionedFrame) -> bool:
+        """エンコード済みのレスポンスがDataFrameと同じオブジェクトから生成されたかどうか"""
+        return encoded.version.etag is not None and encoded.version == frame.version
+
+    def _offload_pool(self, jockey_id: str, query: JockeyQuery) -> Optional[DecodePool]:
+        """
+        S3から取得したオブジェクトのサイズによってはプロセスプールで処理するかどうかを判定
+
+        DataFrameがキャッシュに存在する場合（期限切れを含む）は、キャッシュを使用するためNone。
+
+        Returns:
+            使用するプロセスプール（無効・DataFrameがキャッシュ済みの場合はNone）
+        """
+        pool = get_decode_pool()
+        if pool is None:
+            return None
+        cache_key, _ = self._dataframe_cache_key(jockey_id, query.required_columns())
+        return pool if self.cache.get_stale(cache_key) is None else None
+
+    def _encode_fetched_page(
+        self,
+        pool: DecodePool,
+        s3_object: S3Object,
+        jockey_id: str,
+        storage_format: str,
+        query: JockeyQuery,
+    ) -> EncodedPage:
+        """
+        S3から取得したオブジェクトを、閾値以上のサイズであればプロセスプールでエンコード
+
+        閾値未満の場合（またはプロセスプールが異常終了した場合）はこのプロセスで
+        デシリアライズし、DataFrameをキャッシュに格納してからエンコードします。
+        """
+        data = self._object_data(s3_object, jockey_id)
+        if pool.should_offload(len(data)):
+            _, decode_columns = self._dataframe_cache_key(jockey_id, query.required_columns())
+            try:
+                with stage(STAGE_OFFLOAD):
+                    body, next_cursor = pool.encode_page(
+                        data, jockey_id, storage_format, decode_columns, query
+                    )
+                release_mapped_data(data)
+                return EncodedPage(body, next_cursor, s3_object.version)
+            except BrokenProcessPool as e:
+                logger.error(
+                    "Decode pool is broken, decoding in process",
+                    extra={"jockey_id": jockey_id, "error": str(e)}
+                )
+        return self._encode_in_process(s3_object, jockey_id, storage_format, query)
+
+    def _encode_in_process(
+        self, s3_object: S3Object, jockey_id: str, storage_format: str, query: JockeyQuery
+    ) -> EncodedPage:
+        """S3から取得したオブジェクトをこのプロセスでデシリアライズ・キャッシュしてエンコード"""
+        columns = query.required_columns()
+        cache_key, decode_columns = self._dataframe_cache_key(jockey_id, columns)
+        frame = self._decode_object(s3_object, jockey_id, storage_format, decode_columns)
+        self.cache.put(cache_key, frame)
+        if columns is not None and decode_columns is None:
+            self._require_columns(frame.data, columns)
+        return self._encode_page(self._page_from_frame(frame, query), jockey_id)
+
+    def encode_object_page(
+        self,
+        data: ObjectData,
+        jockey_id: str,
+        storage_format: str,
+        decode_columns: Optional[Sequence[str]],
+        query: JockeyQuery,
+    ) -> Tuple[bytes, Optional[str]]:
+        """
+        オブジェクトのデータをデシリアライズし、条件を適用してJSONバイト列にエンコード
+
+        プロセスプールのワーカーで実行されます（DataFrameはキャッシュしません）。
+
+        Args:
+            data: S3から取得したオブジェクトのデータ
+            jockey_id: 騎手ID
+            storage_format: 保存形式
+            decode_columns: デコードする列名（全列の場合はNone）
+            query: 取得条件
+
+        Returns:
+            (エンコード済みのJSONバイト列, 次ページのカーソル)
+
+        Raises:
+            InvalidQueryError: 取得条件が不正な場合
+            PickleDeserializeError: デシリアライズまたはJSON変換に失敗した場合
+        """
+        df = self.deserialize(data, jockey_id, storage_format, decode_columns)
+        columns = query.required_columns()
+        if columns is not None and decode_columns is None:
+            self._require_columns(df, columns)
+        page = self._page_from_frame(VersionedFrame(df, storage_format), query)
+        return self._encode_dataframe(page.data, jockey_id), page.next_cursor
+
+    async def get_jockey_data_binary_async(
+        self, jockey_id: str, storage_format: str = STORAGE_FORMAT_PICKLE
+    ) -> ObjectData:
+        """
+        騎手IDに基づいてS3からバイナリデータを非同期に取得
+
+        Args:
+            jockey_id: 騎手ID
+            storage_format: 保存形式（デフォルト: pickle）
+
+        Returns:
+            S3から取得したオブジェクトのバイナリデータ
+
+        Raises:
+            JockeyNotFoundError: 指定された騎手IDのデータが見つからない場合
+            S3AccessError: S3接続エラーが発生した場合
+        """
+        s3_object = await self.get_jockey_object_async(jockey_id, storage_format)
+        return self._object_data(s3_object, jockey_id)
+
+    async def get_jockey_object_async(
+        self,
+        jockey_id: str,
+        storage_format: str = STORAGE_FORMAT_PICKLE,
+        if_none_match: Optional[str] = None,
+    ) -> S3Object:
+        """
+        get_jockey_object の非同期版
+
+        Args:
+            jockey_id: 騎手ID
+            storage_format: 保存形式（デフォルト: pickle）
+            if_none_match: 手元のオブジェクトのETag（指定時は条件付き取得）
+
+        Returns:
+            S3から取得したオブジェクト（変更されていない場合は data=None）
+
+        Raises:
+            JockeyNotFoundError: 指定された騎手IDのデータが見つからない場合
+            S3AccessError: S3接続エラーが発生した場合
+        """
+        s3_key = self._generate_s3_key(jockey_id, storage_format)
+        logger.info(
+            "Fetching jockey data from S3 (async)",
+            extra={"jockey_id": jockey_id, "s3_key": s3_key}
+        )
+
+        with stage(STAGE_S3):
+            s3_object = await self.s3_accessor.get_object_with_metadata_async(
+                s3_key, if_none_match=if_none_match
+            )
+        return self._checked_object(s3_object, jockey_id, s3_key)
+
+    async def fetch_jockey_object_async(
+        self, jockey_id: str, if_none_match: Optional[str] = None
+    ) -> Tuple[S3Object, str]:
+        """
+        設定された保存形式の順に騎手データのオブジェクトをS3から非同期に取得
+
+        Args:
+            jockey_id: 騎手ID
+            if_none_match: 手元のオブジェクトのETag（指定時は条件付き取得）
+
+        Returns:
+            (S3から取得したオブジェクト, 保存形式) のタプル
+
+        Raises:
+            JockeyNotFoundError: いずれの形式でもデータが見つからない場合
+            S3AccessError: S3接続エラーが発生した場合
+        """
+        for storage_format in self.storage_formats[:-1]:
+            try:
+                s3_object = await self.get_jockey_object_async(
+                    jockey_id, storage_format, if_none_match
+                )
+                return s3_object, storage_format
+            except JockeyNotFoundError:
+                logger.info(
+                    "Falling back to next storage format",
+                    extra={"jockey_id": jockey_id, "storage_format": storage_format}
+                )
+
+        storage_format = self.storage_formats[-1]
+        s3_object = await self.get_jockey_object_async(jockey_id, storage_format, if_none_match)
+        return s3_object, storage_format
+
+    async def _load_frame_async(
+        self, jockey_id: str, columns: Optional[Sequence[str]] = None
+    ) -> VersionedFrame:
+        """
+        キャッシュと共有されるDataFrameを非同期に取得
+
+        S3からの取得はイベントループ上で、デシリアライズはスレッドで実行します。
+        期限切れのエントリはS3の条件付き取得で再検証します。キャッシュにない場合の
+        同時呼び出しは1回の取得にまとめます。
+        """
+        cache_key, decode_columns = self._dataframe_cache_key(jockey_id, columns)
+
+        stale: Optional[VersionedFrame] = self.cache.get_stale(cache_key)
+        frame: Optional[VersionedFrame] = self.cache.get(cache_key)
+        if frame is None:
+            async def load() -> VersionedFrame:
+                loaded = await self._fetch_frame_async(jockey_id, decode_columns, stale)
+                self.cache.put(cache_key, loaded)
+                return loaded
+
+            frame = await self.flights.do_async(("frame", cache_key), load)
+
+        if columns is not None and decode_columns is None:
+            self._require_columns(frame.data, columns)
+        return frame
+
+    async def _fetch_frame_async(
+        self,
+        jockey_id: str,
+        decode_columns: Optional[Sequence[str]],
+        stale: Optional[VersionedFrame],
+    ) -> VersionedFrame:
+        """S3から非同期に取得（期限切れのエントリがあれば条件付き取得で再検証）"""
+        if stale is not None and self._can_revalidate(stale):
+            try:
+                s3_object = await self.get_jockey_object_async(
+                    jockey_id, stale.storage_format, stale.version.etag
+                )
+            except JockeyNotFoundError:
+                pass
+            else:
+                if s3_object.not_modified:
+                    self.cache.record_revalidation()
+                    return stale
+                return await asyncio.to_thread(
+                    self._decode_object, s3_object, jockey_id, stale.storage_format, decode_columns
+                )
+
+        s3_object, storage_format = await self.fetch_jockey_object_async(jockey_id)
+        return await asyncio.to_thread(
+            self._decode_object, s3_object, jockey_id, storage_format, decode_columns
+        )
+
+    async def check_not_modified_async(
+        self, jockey_id: str, query: JockeyQuery, etags: Sequence[str]
+    ) -> Optional[ObjectVersion]:
+        """
+        check_not_modified の非同期版
+
+        Args:
+            jockey_id: 騎手ID
+            query: 取得条件
+            etags: If-None-Matchヘッダーで指定されたETagのリスト
+
+        Returns:
+            最新の場合はオブジェクトのバージョン情報（変更されている・判定できない場合はNone）
+
+        Raises:
+            JockeyNotFoundError: 指定された騎手IDのデータが見つからない場合
+            S3AccessError: S3接続エラーが発生した場合
+            InvalidQueryError: 指定された列が存在しない場合
+            PickleDeserializeError: デシリアライズに失敗した場合
+        """
+        version = self._cached_version(jockey_id, query)
+        if version is not None:
+            return version if version.etag in etags else None
+        if len(etags) != 1:
+            return None
+
+        s3_object, storage_format = await self.fetch_jockey_object_async(jockey_id, etags[0])
+        if s3_object.not_modified:
+            return s3_object.version
+
+        cache_key, decode_columns = self._dataframe_cache_key(jockey_id, query.required_columns())
+        frame = await asyncio.to_thread(
+            self._decode_object, s3_object, jockey_id, storage_format, decode_columns
+        )
+        self.cache.put(cache_key, frame)
+        return None
+
+    async def get_jockey_page_async(
+        self, jockey_id: str, query: JockeyQuery = DEFAULT_QUERY
+    ) -> JockeyPage:
+        """
+        get_jockey_page の非同期版
+
+        S3からの取得は非同期に行い、イベントループをブロックしません。
+        デシリアライズと条件の適用はスレッドで実行します。
+
+        Args:
+            jockey_id: 騎手ID
+            query: 取得条件
+
+        Returns:
+            条件を適用したDataFrameと次ページのカーソル
+
+        Raises:
+            JockeyNotFoundError: 指定された騎手IDのデータが見つからない場合
+            S3AccessError: S3接続エラーが発生した場合
+            InvalidQueryError: 取得条件が不正な場合
+            PickleDeserializeError: デシリアライズに失敗した場合
+        """
+        frame = await self._load_frame_async(jockey_id, query.required_columns())
+        return await asyncio.to_thread(self._page_from_frame, frame, query)
+
+    async def get_jockey_page_json_async(
+        self, jockey_id: str, query: JockeyQuery = DEFAULT_QUERY
+    ) -> EncodedPage:
+        """
+        get_jockey_page_json の非同期版
+
+        エンコード済みのバイト列がキャッシュに存在しない場合は、S3から非同期に
+        取得し、デシリアライズ・条件の適用・JSON変換をスレッドで実行します。
+        同一騎手ID・条件への同時呼び出しは1回の実行にまとめられます。
+
+        Args:
+            jockey_id: 騎手ID
+            query: 列選択・行フィルタ・ページネーションの条件（省略時は全件・全列）
+
+        Returns:
+            エンコード済みのJSONバイト列と次ページのカーソル
+
+        Raises:
+            JockeyNotFoundError: 指定された騎手IDのデータが見つからない場合
+            S3AccessError: S3接続エラーが発生した場合
+            InvalidQueryError: 取得条件が不正な場合
+            PickleDeserializeError: デシリアライズまたはJSON変換に失敗した場合
+        """
+        cache_key = (jockey_id, query)
+        stale: Optional[EncodedPage] = self.response_cache.get_stale(cache_key)
+        encoded: Optional[EncodedPage] = self.response_cache.get(cache_key)
+        if encoded is None:
+            encoded = await self.flights.do_async(
+                ("page_json", jockey_id, query),
+                lambda: self._load_page_json_async(jockey_id, query, stale),
+            )
+
+        logger.info(
+            "Completed jockey JSON retrieval",
+            extra={"jockey_id": jockey_id, "size": len(encoded.body)}
+        )
+        return encoded
+
+    async def _load_page_json_async(
+        self, jockey_id: str, query: JockeyQuery, stale: Optional[EncodedPage]
+    ) -> EncodedPage:
+        """キャッシュにないエンコード済みのバイト列を生成してキャッシュに格納（期限切れの値があれば再検証）"""
+        pool = self._offload_pool(jockey_id, query) if stale is None else None
+        if pool is not None:
+            encoded = await self._encode_fetched_page_async(pool, jockey_id, query)
+        else:
+            frame = await self._load_frame_async(jockey_id, query.required_columns())
+            if stale is not None and self._is_current(stale, frame):
+                self.response_cache.record_revalidation()
+                encoded = stale
+            else:
+                page = await asyncio.to_thread(self._page_from_frame, frame, query)
+                encoded = await asyncio.to_thread(self._encode_page, page, jockey_id)
+        self.response_cache.put((jockey_id, query), encoded)
+        return encoded
+
+    async def _encode_fetched_page_async(
+        self, pool: DecodePool, jockey_id: str, query: JockeyQuery
+    ) -> EncodedPage:
+        """S3から非同期に取得し、_encode_fetched_page と同様にプロセスプールでエンコード"""
+        s3_object, storage_format = await self.fetch_jockey_object_async(jockey_id)
+        data = self._object_data(s3_object, jockey_id)
+        if pool.should_offload(len(data)):
+            _, decode_columns = self._dataframe_cache_key(jockey_id, query.required_columns())
+            try:
+                with stage(STAGE_OFFLOAD):
+                    body, next_cursor = await pool.encode_page_async(
+                        data, jockey_id, storage_format, decode_columns, query
+                    )
+                release_mapped_data(data)
+                return EncodedPage(body, next_cursor, s3_object.version)
+            except BrokenProcessPool as e:
+                logger.error(
+                    "Decode pool is broken, decoding in process",
+                    extra={"jockey_id": jockey_id, "error": str(e)}
+                )
+        return await asyncio.to_thread(
+            self._encode_in_process, s3_object, jockey_id, storage_format, query
+        )
+
+    async def get_jockeys_data_json_async(
+        self, jockey_ids: Sequence[str], query: JockeyQuery = DEFAULT_QUERY
+    ) -> List[BatchItem]:
+        """
+        get_jockeys_data_json の非同期版
+
+        騎手ごとのS3取得をイベントループ上で同時に実行します。同時に実行される
+        S3リクエスト数は非同期S3クライアントのコネクションプールで制限されます。
+
+        Args:
+            jockey_ids: 騎手IDのリスト（重複は除外）
+            query: 全騎手に適用する列選択・行フィルタの条件
+
+        Returns:
+            騎手IDの最初の出現順に並べた取得結果のリスト
+
+        Raises:
+            SSMConfigError: SSM設定取得エラーが発生した場合
+        """
+        unique_ids = list(dict.fromkeys(jockey_ids))
+        results = await asyncio.gather(
+            *(self.get_jockey_page_json_async(jockey_id, query) for jockey_id in unique_ids),
+            return_exceptions=True,
+        )
+
+        items: List[BatchItem] = []
+        for jockey_id, result in zip(unique_ids, results, strict=True):
+            if isinstance(result, EncodedPage):
+                items.append(BatchItem(jockey_id, body=result.body))
+            elif isinstance(result, JockeyDataException) and not isinstance(
+                result, SSMConfigError
+            ):
+                logger.warning(
+                    "Batch item failed",
+                    extra={
+                        "jockey_id": jockey_id,
+                        "error_type": type(result).__name__,
+                        "error": str(result),
+                    }
+                )
+                items.append(BatchItem(jockey_id, error=result))
+            else:
+                raise result
+
+        logger.info(
+            "Completed jockey batch retrieval",
+            extra={
+                "requested": len(unique_ids),
+                "failed": sum(1 for item in items if item.error is not None),
+            }
+        )
+        return items
+
+    def stream_jockey_data_json(
+        self, jockey_id: str, batch_rows: int, query: JockeyQuery = DEFAULT_QUERY
+    ) -> Iterator[bytes]:
+        """
+        騎手IDに基づいてJSONレスポンスボディを行バッチ単位で生成するイテレータを取得
+
+        DataFrameの取得（S3取得・デシリアライズ）はこのメソッドの呼び出し時に
+        行われるため、データが見つからない場合などのエラーはレスポンスの
+        送信開始前に送出されます。生成されるバイト列を連結した結果は
+        get_jockey_data_json の結果とバイト単位で一致します。
+
+        Args:
+            jockey_id: 騎手ID
+            batch_rows: 1チャンクあたりの行数
+            query: 列選択・行フィルタの条件（省略時は全件・全列）
+
+        Returns:
+            JSONバイト列のチャンクを生成するイテレータ
+
+        Raises:
+            JockeyNotFoundError: 指定された騎手IDのデータが見つからない場合
+            S3AccessError: S3接続エラーが発生した場合
+            InvalidQueryError: 取得条件が不正な場合
+            PickleDeserializeError: デシリアライズに失敗した場合
+        """
+        df = self.get_jockey_query_dataframe(jockey_id, query)
+        return self.stream_dataframe_json(df, jockey_id, batch_rows)
+
+    def stream_dataframe_json(
+        self, df: pd.DataFrame, jockey_id: str, batch_rows: int
+    ) -> Iterator[bytes]:
+        """
+        DataFrameを行バッチごとにエンコードしてJSON配列の断片を生成するイテレータを取得
+
+        Args:
+            df: pandas DataFrame
+            jockey_id: 騎手ID（ログ用）
+            batch_rows: 1チャンクあたりの行数
+
+        Returns:
+            JSONバイト列のチャンクを生成するイテレータ
+        """
+        return self._iter_json_batches(df, jockey_id, max(batch_rows, 1))
+
+    def _iter_json_batches(
+        self, df: pd.DataFrame, jockey_id: str, batch_rows: int
+    ) -> Iterator[bytes]:
+        """DataFrameを行バッチごとにエンコードしてJSON配列の断片を生成"""
+        yield b"["
+        for start in range(0, len(df), batch_rows):
+            # 各バッチの "[" と "]" を除いたレコード列を "," で連結する
+            records = self._encode_dataframe(df.iloc[start:start + batch_rows], jockey_id)[1:-1]
+            yield records if start == 0 else b"," + records
+        yield b"]"
+
+        logger.info(
+            "Completed jockey JSON streaming",
+            extra={"jockey_id": jockey_id, "rows": len(df), "batch_rows": batch_rows}
+        )
@@ -0,0 +1,175 @@
+"""
+DataFrame JSON Encoder - 列単位のJSONエンコーダー
+
+DataFrameをorient="records"形式のJSON配列として、行ごとのdictを生成せずに
+列単位でエンコードします。出力は JockeyService.dataframe_to_json の結果を
+FastAPIのJSONResponseでエンコードしたものとバイト単位で一致します。
+
+- 日付列: ISO 8601形式（%Y-%m-%dT%H:%M:%S）の文字列
+- NaN・無限大・NaT: null
+- 列名・文字列値: ensure_ascii=False（日本語はそのまま出力）
+"""
+
+import json
+from itertools import chain, repeat
+from typing import Any, Iterable, List, Mapping, Tuple
+
+import numpy as np
+import pandas as pd
+
+_encode_string = json.encoder.encode_basestring  # type: ignore[attr-defined]
+
+DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+
+class UnsupportedColumnError(ValueError):
+    """列単位エンコードに対応していない列・値が含まれる場合に発生する例外"""
+    pass
+
+
+def _encode_float_array(values: np.ndarray) -> List[str]:
+    """float配列をJSON値の文字列リストに変換（非有限値はnull）"""
+    floats = values.astype(np.float64, copy=False)
+    encoded: List[str] = list(map(float.__repr__, floats.tolist()))
+    for i in np.flatnonzero(~np.isfinite(floats)).tolist():
+        encoded[i] = "null"
+    return encoded
+
+
+def _encode_datetime_array(values: np.ndarray) -> List[str]:
+    """datetime64配列をISO 8601形式のJSON文字列リストに変換（NaTはnull）"""
+    formatted = np.datetime_as_string(values.astype("datetime64[s]"), unit="s")
+    encoded: List[str] = list(map('"{}"'.format, formatted.tolist()))
+    for i in np.flatnonzero(np.isnat(values)).tolist():
+        encoded[i] = "null"
+    return encoded
+
+
+def _encode_scalar(value: Any) -> str:
+    """単一のPython値をJSON値の文字列に変換"""
+    if value is None:
+        return "null"
+    if isinstance(value, str):
+        return _encode_string(value)
+    if isinstance(value, (bool, np.bool_)):
+        return "true" if value else "false"
+    if isinstance(value, (int, np.integer)):
+        return int.__repr__(int(value))
+    if isinstance(value, (float, np.floating)):
+        number = float(value)
+        return float.__repr__(number) if np.isfinite(number) else "null"
+    raise UnsupportedColumnError(f"Unsupported value type: {type(value).__name__}")
+
+
+def _encode_object_values(values: np.ndarray) -> List[str]:
+    """object配列をJSON値の文字列リストに変換"""
+    if pd.api.types.infer_dtype(values, skipna=False) == "string":
+        return list(map(_encode_string, values.tolist()))
+    return [_encode_scalar(value) for value in values.tolist()]
+
+
+def _encode_column(series: pd.Series) -> List[str]:
+    """
+    1列分の値をJSON値の文字列リストに変換
+
+    Raises:
+        UnsupportedColumnError: 対応していないdtypeの場合
+    """
+    dtype = series.dtype
+
+    if isinstance(dtype, np.dtype):
+        kind = dtype.kind
+        if kind == "M":
+            return _encode_datetime_array(series.to_numpy())
+        if kind == "f":
+            return _encode_float_array(series.to_numpy())
+        if kind in "iu":
+            return list(map(int.__repr__, series.to_numpy().tolist()))
+        if kind == "b":
+            booleans: List[str] = np.where(series.to_numpy(), "true", "false").tolist()
+            return booleans
+        if kind == "O":
+            return _encode_object_values(series.to_numpy())
+    elif isinstance(dtype, pd.DatetimeTZDtype):
+        # タイムゾーン付きの場合はローカル時刻で書式化する
+        return _encode_object_values(series.dt.strftime(DATETIME_FORMAT).to_numpy(dtype=object))
+    elif isinstance(dtype, pd.StringDtype):
+        return _encode_object_values(series.to_numpy(dtype=object, na_value=None))
+
+    raise UnsupportedColumnError(f"Unsupported column dtype: {dtype}")
+
+
+def _encode_key(column: Any) -> str:
+    """列名をJSONオブジェクトのキー文字列に変換"""
+    if not isinstance(column, str):
+        raise UnsupportedColumnError(f"Unsupported column label: {column!r}")
+    return _encode_string(column)
+
+
+def iter_records_json(df: pd.DataFrame) -> Iterable[str]:
+    """
+    DataFrameをorient="records"形式のJSON断片として順に生成
+
+    全断片を連結すると "," で始まるレコード列になります（先頭の "," は呼び出し側で除去）。
+
+    Args:
+        df: pandas DataFrame
+
+    Returns:
+        JSON断片のイテラブル
+
+    Raises:
+        UnsupportedColumnError: 対応していない列・値が含まれる場合
+    """
+    if len(df.columns) == 0 or not df.columns.is_unique:
+        raise UnsupportedColumnError("DataFrame must have unique, non-empty columns")
+
+    parts: List[Iterable[str]] = []
+    for position, (column, series) in enumerate(df.items()):
+        separator = ",{" if position == 0 else ","
+        parts.append(repeat(f"{separator}{_encode_key(column)}:"))
+        parts.append(_encode_column(series))
+    parts.append(repeat("}"))
+
+    return chain.from_iterable(zip(*parts, strict=False))
+
+
+def encode_records_json(df: pd.DataFrame) -> bytes:
+    """
+    DataFrameをorient="records"形式のJSON配列バイト列にエンコード
+
+    Args:
+        df: pandas DataFrame
+
+    Returns:
+        UTF-8エンコード済みのJSONバイト列
+
+    Raises:
+        UnsupportedColumnError: 対応していない列・値が含まれる場合
+    """
+    if len(df) == 0:
+        return b"[]"
+    body = "".join(iter_records_json(df))
+    return ("[" + body[1:] + "]").encode("utf-8")
+
+
+def encode_batch_json(
+    results: Iterable[Tuple[str, bytes]], errors: Mapping[str, Mapping[str, Any]]
+) -> bytes:
+    """
+    騎手ごとのエンコード済みJSONを1つのJSONオブジェクトに連結
+
+    各騎手のJSON配列は再エンコードせずにそのまま埋め込みます。
+
+    Args:
+        results: (騎手ID, エンコード済みJSON配列) のイテラブル
+        errors: 騎手IDごとのエラー内容
+
+    Returns:
+        {"results": {騎手ID: [...]}, "errors": {騎手ID: {...}}} 形式のJSONバイト列
+    """
+    members = b",".join(
+        _encode_string(jockey_id).encode("utf-8") + b":" + body for jockey_id, body in results
+    )
+    encoded_errors = json.dumps(errors, ensure_ascii=False, separators=(",", ":"))
+    return b'{"results":{' + members + b'},"errors":' + encoded_errors.encode("utf-8") + b"}"
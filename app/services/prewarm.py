@@ -0,0 +1,359 @@
+"""
+Prewarm - 起動時の騎手データキャッシュのプリウォーム
+
+アプリケーションの起動後にバックグラウンドでS3Accessorを初期化し
+（SSM Parameter Storeへのアクセス）、リクエスト数の多い騎手のデータを
+騎手データキャッシュ・レスポンスキャッシュに読み込みます。
+
+対象の騎手は以下の順に決定します。
+
+- JOCKEY_PREWARM_MANIFEST_KEY: S3バケット内のマニフェスト
+  （騎手IDのJSON配列、または1行に1つの騎手ID。先頭から優先）
+- JOCKEY_HIT_COUNTS_FILE: 永続化されたリクエスト数（多い順）
+
+進捗は /health で、読み込みの完了は /health/ready で確認できます。
+
+また、コールドスタートを短縮するためにモジュールの読み込み時には読み込まない
+サービス層のモジュール（pandas・numpy・boto3）を、起動直後にバックグラウンドの
+スレッドで読み込みます（JOCKEY_PRELOAD_MODULES）。
+"""
+
+import asyncio
+import importlib
+import json
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.core.config import get_env_bool, get_env_float, get_env_int, get_env_str
+from app.core.hit_counter import HitCounter
+from app.core.logging import get_logger
+from app.infrastructure.dependencies import get_hit_counter, get_s3_accessor
+
+logger = get_logger(__name__)
+
+DEFAULT_PREWARM_CONCURRENCY = 4
+DEFAULT_HIT_COUNTS_SAVE_INTERVAL_SECONDS = 300.0
+
+PREWARM_DISABLED = "disabled"
+PREWARM_PENDING = "pending"
+PREWARM_RUNNING = "running"
+PREWARM_COMPLETED = "completed"
+PREWARM_FAILED = "failed"
+
+SOURCE_MANIFEST = "manifest"
+SOURCE_HIT_COUNTS = "hit_counts"
+
+# 起動直後にバックグラウンドで読み込むモジュール（pandas・numpy・boto3を含む）
+PRELOAD_MODULES = ("app.services.jockey_service",)
+
+# グローバルなPrewarmerインスタンス
+_prewarmer: Optional["Prewarmer"] = None
+_prewarmer_lock = threading.Lock()
+
+
+def parse_manifest(data: Any) -> List[str]:
+    """
+    マニフェストを騎手IDのリストに変換
+
+    Args:
+        data: マニフェストの内容（JSON配列、または1行に1つの騎手IDのテキスト）
+
+    Returns:
+        騎手IDのリスト（重複は除去し、先頭の出現順を保持）
+
+    Raises:
+        ValueError: JSON配列として解析できない場合
+    """
+    text = bytes(data).decode("utf-8").strip()
+    if text.startswith("["):
+        loaded = json.loads(text)
+        if not isinstance(loaded, list):
+            raise ValueError("Manifest must be a JSON array")
+        ids = [str(item).strip() for item in loaded]
+    else:
+        ids = [line.strip() for line in text.splitlines()]
+    return list(dict.fromkeys(jockey_id for jockey_id in ids if jockey_id))
+
+
+class Prewarmer:
+    """
+    騎手データキャッシュのプリウォーム
+
+    start で実行中のイベントループにバックグラウンドタスクを作成し、
+    騎手ごとの読み込みをスレッドで concurrency 並列に実行します。
+    読み込みに失敗した騎手はスキップします。
+    """
+
+    def __init__(
+        self,
+        count: int,
+        manifest_key: Optional[str] = None,
+        hit_counter: Optional[HitCounter] = None,
+        concurrency: int = DEFAULT_PREWARM_CONCURRENCY,
+        block_readiness: bool = False,
+    ):
+        """
+        Prewarmerの初期化
+
+        Args:
+            count: 読み込む騎手の最大数（0の場合は無効）
+            manifest_key: マニフェストのS3オブジェクトキー
+            hit_counter: リクエスト数のカウンター（マニフェストがない場合に使用）
+            concurrency: 同時に読み込む騎手数
+            block_readiness: 完了するまで ready をFalseとするか
+        """
+        self.count = count
+        self.manifest_key = manifest_key
+        self.hit_counter = hit_counter
+        self.concurrency = max(concurrency, 1)
+        self.block_readiness = block_readiness
+        self._lock = threading.Lock()
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._status = PREWARM_DISABLED
+        self._source: Optional[str] = None
+        self._total = 0
+        self._loaded = 0
+        self._failed = 0
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+        self._reset_progress()
+
+    @property
+    def enabled(self) -> bool:
+        """プリウォームが有効かどうか（件数と対象の決定方法が設定されている場合）"""
+        has_source = self.manifest_key is not None or (
+            self.hit_counter is not None and self.hit_counter.enabled
+        )
+        return self.count > 0 and has_source
+
+    @property
+    def ready(self) -> bool:
+        """リクエストを受け付ける準備ができているかどうか"""
+        if not self.block_readiness:
+            return True
+        with self._lock:
+            return self._status in (PREWARM_DISABLED, PREWARM_COMPLETED, PREWARM_FAILED)
+
+    def start(self) -> None:
+        """
+        プリウォームをバックグラウンドタスクとして開始（無効な場合は何もしない）
+
+        実行中のイベントループから呼び出してください。
+        """
+        self._reset_progress()
+        if not self.enabled:
+            return
+        self._task = asyncio.get_running_loop().create_task(self.run())
+
+    async def stop(self) -> None:
+        """実行中のプリウォームを中止（アプリケーション終了時）"""
+        task, self._task = self._task, None
+        if task is None or task.done():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def run(self) -> None:
+        """
+        S3Accessorを初期化し、対象の騎手のデータをキャッシュに読み込み
+        """
+        with self._lock:
+            self._status = PREWARM_RUNNING
+            self._started_at = time.monotonic()
+
+        try:
+            await asyncio.to_thread(get_s3_accessor)
+            source, jockey_ids = await asyncio.to_thread(self._resolve_targets)
+        except Exception as e:
+            logger.error("Prewarm failed", extra={"error": str(e)})
+            self._finish(PREWARM_FAILED)
+            return
+
+        with self._lock:
+            self._source = source
+            self._total = len(jockey_ids)
+        logger.info(
+            "Prewarm started",
+            extra={"source": source, "jockeys": len(jockey_ids), "concurrency": self.concurrency}
+        )
+
+        from app.services.jockey_service import JockeyService
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        service = await asyncio.to_thread(JockeyService)
+
+        async def load(jockey_id: str) -> None:
+            async with semaphore:
+                try:
+                    await asyncio.to_thread(service.get_jockey_page_json, jockey_id)
+                except Exception as e:
+                    logger.warning(
+                        "Failed to prewarm jockey data",
+                        extra={"jockey_id": jockey_id, "error": str(e)}
+                    )
+                    with self._lock:
+                        self._failed += 1
+                    return
+                with self._lock:
+                    self._loaded += 1
+
+        await asyncio.gather(*(load(jockey_id) for jockey_id in jockey_ids))
+        self._finish(PREWARM_COMPLETED)
+
+    def progress(self) -> Dict[str, Any]:
+        """
+        プリウォームの進捗を取得
+
+        Returns:
+            状態・対象の決定方法・対象数・読み込み済み数・失敗数・経過時間（秒）の辞書
+        """
+        with self._lock:
+            elapsed = None
+            if self._started_at is not None:
+                end = self._finished_at if self._finished_at is not None else time.monotonic()
+                elapsed = round(end - self._started_at, 3)
+            return {
+                "status": self._status,
+                "source": self._source,
+                "total": self._total,
+                "loaded": self._loaded,
+                "failed": self._failed,
+                "elapsed_seconds": elapsed,
+            }
+
+    def _resolve_targets(self) -> Tuple[str, List[str]]:
+        """対象の騎手IDのリストと決定方法を取得"""
+        if self.manifest_key is not None:
+            data = get_s3_accessor().get_object(self.manifest_key)
+            if data is None:
+                raise ValueError(f"Prewarm manifest not found: {self.manifest_key}")
+            return SOURCE_MANIFEST, parse_manifest(data)[:self.count]
+
+        assert self.hit_counter is not None
+        return SOURCE_HIT_COUNTS, self.hit_counter.most_common(self.count)
+
+    def _reset_progress(self) -> None:
+        """進捗を開始前の状態に戻す"""
+        with self._lock:
+            self._status = PREWARM_PENDING if self.enabled else PREWARM_DISABLED
+            self._source = None
+            self._total = 0
+            self._loaded = 0
+            self._failed = 0
+            self._started_at = None
+            self._finished_at = None
+
+    def _finish(self, status: str) -> None:
+        """終了した状態を記録"""
+        with self._lock:
+            self._status = status
+            self._finished_at = time.monotonic()
+            progress = {"loaded": self._loaded, "failed": self._failed, "total": self._total}
+        logger.info("Prewarm finished", extra={"status": status, **progress})
+
+
+def build_prewarmer() -> Prewarmer:
+    """
+    環境変数からPrewarmerを生成
+
+    - JOCKEY_PREWARM_COUNT: 読み込む騎手の最大数（デフォルト: 0 = 無効）
+    - JOCKEY_PREWARM_MANIFEST_KEY: マニフェストのS3オブジェクトキー
+    - JOCKEY_PREWARM_CONCURRENCY: 同時に読み込む騎手数（デフォルト: 4）
+    - JOCKEY_PREWARM_BLOCK_READINESS: 完了するまで /health/ready を503とするか（デフォルト: false）
+
+    マニフェストが未設定の場合は JOCKEY_HIT_COUNTS_FILE のリクエスト数を使用します。
+
+    Returns:
+        Prewarmerインスタンス
+    """
+    return Prewarmer(
+        count=max(get_env_int("JOCKEY_PREWARM_COUNT", 0), 0),
+        manifest_key=get_env_str("JOCKEY_PREWARM_MANIFEST_KEY", "") or None,
+        hit_counter=get_hit_counter(),
+        concurrency=get_env_int("JOCKEY_PREWARM_CONCURRENCY", DEFAULT_PREWARM_CONCURRENCY),
+        block_readiness=get_env_bool("JOCKEY_PREWARM_BLOCK_READINESS", False),
+    )
+
+
+def get_prewarmer() -> Prewarmer:
+    """
+    Prewarmerのシングルトンインスタンスを取得（最初の呼び出し時に環境変数から生成）
+
+    Returns:
+        Prewarmerインスタンス
+    """
+    global _prewarmer
+
+    with _prewarmer_lock:
+        if _prewarmer is None:
+            _prewarmer = build_prewarmer()
+    return _prewarmer
+
+
+def reset_prewarmer() -> None:
+    """
+    Prewarmerをリセット（主にテスト用）
+    """
+    global _prewarmer
+    with _prewarmer_lock:
+        _prewarmer = None
+
+
+def preload_modules(modules: Sequence[str] = PRELOAD_MODULES) -> None:
+    """
+    モジュールを読み込み（失敗した場合は警告のみ、最初のリクエストで再度読み込まれる）
+
+    Args:
+        modules: 読み込むモジュール名のリスト
+    """
+    started = time.perf_counter()
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            logger.warning("Failed to preload module", extra={"module": module, "error": str(e)})
+    logger.info(
+        "Modules preloaded",
+        extra={
+            "modules": list(modules),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+    )
+
+
+def start_module_preload() -> Optional[threading.Thread]:
+    """
+    サービス層のモジュールの読み込みをバックグラウンドのスレッドで開始
+
+    JOCKEY_PRELOAD_MODULES（デフォルト: true）がfalseの場合は何もしません。
+    読み込み中に届いたリクエストはモジュールの読み込みの完了を待ちます。
+
+    Returns:
+        読み込みを行うスレッド（無効な場合はNone）
+    """
+    if not get_env_bool("JOCKEY_PRELOAD_MODULES", True):
+        return None
+    thread = threading.Thread(target=preload_modules, name="module-preload", daemon=True)
+    thread.start()
+    return thread
+
+
+async def save_hit_counts_periodically(hit_counter: HitCounter) -> None:
+    """
+    リクエスト数をJOCKEY_HIT_COUNTS_SAVE_INTERVAL_SECONDSごとにファイルへ書き出し
+
+    終了時に呼ばれない環境（Lambdaなど）でも集計結果が失われないようにします。
+
+    Args:
+        hit_counter: リクエスト数のカウンター
+    """
+    interval = get_env_float(
+        "JOCKEY_HIT_COUNTS_SAVE_INTERVAL_SECONDS", DEFAULT_HIT_COUNTS_SAVE_INTERVAL_SECONDS
+    )
+    while True:
+        await asyncio.sleep(max(interval, 1.0))
+        await asyncio.to_thread(hit_counter.save)
@@ -0,0 +1,121 @@
+"""
+Benchmark Baselines
+
+ベンチマーク結果のJSONファイルへの保存と、保存したベースラインとの比較を提供します。
+
+結果は {シナリオ名: {指標名: 値}} の辞書で、指標ごとに値が大きいほど良いか（RPSなど）
+小さいほど良いか（レイテンシ・メモリなど）を指定して比較します。
+ベースラインは計測したマシンに依存するため、同じマシン（CIのランナー）で保存・比較してください。
+"""
+
+import json
+import os
+import platform
+import sys
+import time
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional
+
+HIGHER_IS_BETTER = "higher"
+LOWER_IS_BETTER = "lower"
+
+Results = Dict[str, Dict[str, float]]
+
+
+class Regression(NamedTuple):
+    """ベースラインより悪化した指標"""
+
+    scenario: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """ベースラインからの変化率（+0.1 は10%増加）"""
+        return self.current / self.baseline - 1.0 if self.baseline else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.scenario} {self.metric}: {self.baseline:.4g} -> {self.current:.4g} "
+            f"({self.change:+.1%})"
+        )
+
+
+def save_baseline(path: str, results: Results, settings: Optional[Mapping[str, Any]] = None) -> None:
+    """
+    ベンチマーク結果をベースラインとして保存
+
+    Args:
+        path: 保存先のJSONファイル（ディレクトリがなければ作成）
+        results: シナリオごとの指標の値
+        settings: 計測の設定（比較時に同じ条件かどうかを確認するために保存）
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    document = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "machine": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "settings": dict(settings or {}),
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def load_baseline(path: str) -> Optional[Dict[str, Any]]:
+    """
+    保存したベースラインを読み込み
+
+    Args:
+        path: ベースラインのJSONファイル
+
+    Returns:
+        save_baseline で保存した内容（ファイルが存在しない場合はNone）
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        document: Dict[str, Any] = json.load(f)
+    return document
+
+
+def find_regressions(
+    results: Results,
+    baseline: Results,
+    directions: Mapping[str, str],
+    tolerance: float,
+) -> List[Regression]:
+    """
+    ベースラインから tolerance を超えて悪化した指標を抽出
+
+    ベースラインにないシナリオ・指標は比較しません。
+
+    Args:
+        results: 今回の結果
+        baseline: ベースラインの結果
+        directions: 比較する指標と、値が大きいほど良い（"higher"）か小さいほど良い（"lower"）か
+        tolerance: 許容する悪化の割合（0.1 は10%）
+
+    Returns:
+        悪化した指標のリスト
+    """
+    regressions = []
+    for scenario, metrics in results.items():
+        base_metrics = baseline.get(scenario, {})
+        for metric, direction in directions.items():
+            current, base = metrics.get(metric), base_metrics.get(metric)
+            if current is None or base is None or base <= 0:
+                continue
+            if direction == HIGHER_IS_BETTER:
+                worse = current < base * (1.0 - tolerance)
+            else:
+                worse = current > base * (1.0 + tolerance)
+            if worse:
+                regressions.append(Regression(scenario, metric, base, current))
+    return regressions
@@ -0,0 +1,187 @@
+"""
+Decode Pool Tail-Latency Benchmark
+
+小さな騎手データと大きな騎手データへのリクエストが混在する場合の、小さな騎手データの
+レイテンシ（p50 / p99）を以下の方法で比較します。
+
+- in_process: すべてのデコード・エンコードをリクエストのスレッドで実行（デフォルト）
+- offload: 閾値以上のオブジェクトをプロセスプール（app.services.decode_pool）で実行
+
+uvicornのワーカー1つのスレッドプールを模して、--small-clients 個と --large-clients 個のスレッドが
+それぞれ小さな騎手・大きな騎手の JockeyService.get_jockey_page_json を --duration 秒間繰り返し呼び出します。
+S3の取得はメモリ上のpickleを返すモックで置き換えます。キャッシュの設定は --configs で選択します。
+
+- default: DataFrame・レスポンスのキャッシュをデフォルトの設定で使用（リリースされる構成）。
+  レスポンスのキャッシュにヒットしないよう、リクエストごとに limit を変えて取得します
+  （プロセス内の処理ではDataFrameのキャッシュが使われ、オフロードした騎手は毎回プロセスプールで処理されます）
+- uncached: DataFrame・レスポンスのキャッシュを無効にし、毎回全件をデコード・エンコード
+
+オフロードで改善するのは小さな騎手データの待ち時間で、大きな騎手データのリクエスト自体は
+共有メモリへのコピーとプロセス間の受け渡しの分だけ遅くなる場合があります。
+CPU数がワーカープロセス数より少ない環境では、ワーカープロセスと親プロセスがCPUを奪い合います。
+
+実行方法:
+    uv run python -m benchmarks.bench_decode_pool
+    uv run python -m benchmarks.bench_decode_pool --large-rows 200000 --pool-workers 2 --duration 20
+    uv run python -m benchmarks.bench_decode_pool --configs default
+"""
+
+import argparse
+import logging
+import os
+import pickle
+import threading
+import time
+from typing import Dict, List
+from unittest.mock import patch
+
+import numpy as np
+
+from app.infrastructure.dependencies import reset_jockey_cache, reset_response_cache
+from app.models.query import DEFAULT_QUERY, MAX_PAGE_LIMIT, JockeyQuery
+from app.services.decode_pool import shutdown_decode_pool
+from app.services.jockey_service import JockeyService
+from benchmarks.datagen import make_race_dataframe
+from tests.s3_stub import make_s3_accessor_mock
+
+SMALL_PREFIX = "small"
+LARGE_PREFIX = "large"
+MODES = ("in_process", "offload")
+CONFIGS = ("default", "uncached")
+CACHE_ENV_VARS = ("JOCKEY_CACHE_MAX_ENTRIES", "JOCKEY_RESPONSE_CACHE_MAX_ENTRIES")
+
+
+def _make_objects(small_rows: int, large_rows: int, count: int) -> Dict[str, bytes]:
+    """騎手IDごとのpickleバイト列（S3オブジェクトキー → データ）"""
+    objects = {}
+    for prefix, rows in ((SMALL_PREFIX, small_rows), (LARGE_PREFIX, large_rows)):
+        data = pickle.dumps(make_race_dataframe(rows), protocol=pickle.HIGHEST_PROTOCOL)
+        for i in range(count):
+            objects[f"{prefix}{i}.pickle"] = data
+    return objects
+
+
+def _client(
+    service: JockeyService,
+    prefix: str,
+    count: int,
+    deadline: float,
+    latencies: List[float],
+    vary_query: bool,
+) -> None:
+    """deadline まで騎手データの取得を繰り返し、1リクエストあたりの所要時間（秒）を記録"""
+    i = 0
+    while time.perf_counter() < deadline:
+        query = JockeyQuery(limit=i % MAX_PAGE_LIMIT + 1) if vary_query else DEFAULT_QUERY
+        start = time.perf_counter()
+        service.get_jockey_page_json(f"{prefix}{i % count}", query)
+        latencies.append(time.perf_counter() - start)
+        i += 1
+
+
+def run_mode(
+    config: str, mode: str, objects: Dict[str, bytes], args: argparse.Namespace
+) -> Dict[str, Dict[str, float]]:
+    """
+    指定したキャッシュの設定・方法で小さな騎手・大きな騎手の取得を並行して実行
+
+    Returns:
+        small・large ごとの requests・p50_ms・p99_ms・max_ms の辞書
+    """
+    for name in CACHE_ENV_VARS:
+        if config == "uncached":
+            os.environ[name] = "0"
+        else:
+            os.environ.pop(name, None)
+    os.environ["JOCKEY_DECODE_POOL_WORKERS"] = str(args.pool_workers if mode == "offload" else 0)
+    os.environ["JOCKEY_DECODE_POOL_THRESHOLD_BYTES"] = str(args.threshold_bytes)
+    shutdown_decode_pool()
+    reset_jockey_cache()
+    reset_response_cache()
+
+    accessor = make_s3_accessor_mock()
+    accessor.get_object.side_effect = objects.get
+    with patch("app.services.jockey_service.get_s3_accessor", return_value=accessor):
+        service = JockeyService()
+
+    # ワーカープロセスの起動とモジュールの読み込みを計測から除外
+    for prefix in (SMALL_PREFIX, LARGE_PREFIX):
+        service.get_jockey_page_json(f"{prefix}0")
+
+    latencies: Dict[str, List[float]] = {SMALL_PREFIX: [], LARGE_PREFIX: []}
+    deadline = time.perf_counter() + args.duration
+    threads = [
+        threading.Thread(
+            target=_client,
+            args=(service, prefix, args.ids, deadline, latencies[prefix], config == "default"),
+        )
+        for prefix, clients in ((SMALL_PREFIX, args.small_clients), (LARGE_PREFIX, args.large_clients))
+        for _ in range(clients)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    shutdown_decode_pool()
+
+    results = {}
+    for prefix, samples in latencies.items():
+        if not samples:
+            continue
+        values = np.array(samples) * 1000
+        results[prefix] = {
+            "requests": len(samples),
+            "p50_ms": round(float(np.percentile(values, 50)), 2),
+            "p99_ms": round(float(np.percentile(values, 99)), 2),
+            "max_ms": round(float(values.max()), 2),
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--small-rows", type=int, default=200)
+    parser.add_argument("--large-rows", type=int, default=100000)
+    parser.add_argument("--ids", type=int, default=4, help="小さな騎手・大きな騎手それぞれの騎手数")
+    parser.add_argument("--small-clients", type=int, default=6)
+    parser.add_argument("--large-clients", type=int, default=2)
+    parser.add_argument("--pool-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--threshold-bytes", type=int, default=1024 * 1024)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--configs", nargs="+", choices=CONFIGS, default=list(CONFIGS))
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    # ワーカープロセスのログ出力も抑制する（_init_worker が LOG_LEVEL を参照する）
+    os.environ["LOG_LEVEL"] = "WARNING"
+
+    objects = _make_objects(args.small_rows, args.large_rows, args.ids)
+    small_size = len(objects[f"{SMALL_PREFIX}0.pickle"])
+    large_size = len(objects[f"{LARGE_PREFIX}0.pickle"])
+    print(
+        f"small: {args.small_rows} rows / {small_size} bytes, "
+        f"large: {args.large_rows} rows / {large_size} bytes, "
+        f"threshold: {args.threshold_bytes} bytes, cpus: {os.cpu_count()}"
+    )
+    if not small_size < args.threshold_bytes <= large_size:
+        print("warning: the threshold does not separate small and large objects")
+
+    print(
+        f"\n{'config':<9} {'mode':<12} {'kind':<6} {'requests':>9} "
+        f"{'p50 ms':>9} {'p99 ms':>9} {'max ms':>9}"
+    )
+    for config in args.configs:
+        for mode in args.modes:
+            for kind, result in run_mode(config, mode, objects, args).items():
+                print(
+                    f"{config:<9} {mode:<12} {kind:<6} {result['requests']:>9} "
+                    f"{result['p50_ms']:>9.2f} {result['p99_ms']:>9.2f} {result['max_ms']:>9.2f}",
+                    flush=True,
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+JSON Encoder Benchmark
+
+DataFrame → JSONバイト列のエンコードについて、以下の経路の1行あたりのコストを比較します。
+
+- fastapi: dataframe_to_json → response_model（pydantic）→ JSONResponse（modelモード）
+- records: dataframe_to_json → encode_json
+- columnar: 列単位エンコーダー（rawモード）
+
+実行方法:
+    uv run python -m benchmarks.bench_json_encoder
+"""
+
+import argparse
+import time
+from typing import Any, Callable, List
+from unittest.mock import MagicMock
+
+import pandas as pd
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.services.jockey_service import JockeyService
+from app.services.json_encoder import encode_records_json
+from benchmarks.datagen import make_race_dataframe
+
+
+def _best_of(func: Callable[[], bytes], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 5000, 20000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    service = JockeyService.__new__(JockeyService)
+    service.s3_accessor = MagicMock()
+
+    response_adapter = TypeAdapter(List[dict[str, Any]])
+
+    print(
+        f"{'rows':>8} {'fastapi us/row':>15} {'records us/row':>15} "
+        f"{'columnar us/row':>16} {'speedup':>8}"
+    )
+    for rows in args.sizes:
+        df = make_race_dataframe(rows)
+
+        def fastapi_model(df: pd.DataFrame = df) -> bytes:
+            records = service.dataframe_to_json(df, "bench")
+            content = response_adapter.dump_python(records, mode="json")
+            return bytes(JSONResponse(content).body)
+
+        def records(df: pd.DataFrame = df) -> bytes:
+            return service.encode_json(service.dataframe_to_json(df, "bench"), "bench")
+
+        def columnar(df: pd.DataFrame = df) -> bytes:
+            return encode_records_json(df)
+
+        assert fastapi_model() == records() == columnar(), "encoders disagree"
+
+        fastapi_time = _best_of(fastapi_model, args.repeat)
+        records_time = _best_of(records, args.repeat)
+        columnar_time = _best_of(columnar, args.repeat)
+        print(
+            f"{rows:>8} {fastapi_time / rows * 1e6:>15.2f} {records_time / rows * 1e6:>15.2f} "
+            f"{columnar_time / rows * 1e6:>16.2f} {fastapi_time / columnar_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
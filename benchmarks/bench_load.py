@@ -0,0 +1,338 @@
+"""
+Load Test Benchmark
+
+ローカルのS3スタブサーバーに RaceRecord スキーマの合成データ（10〜20,000行）を配置し、
+uvicornで起動したアプリケーションに並行クライアントから GET /api/jockey/{jockey_id} を送信して、
+シナリオごとのスループット（RPS）・レイテンシ（p50 / p95 / p99）・サーバーのピークRSSを計測します。
+
+シナリオごとにサーバーを起動し直すため、キャッシュとピークRSSはシナリオ間で共有されません。
+ピークRSSはサーバーの各プロセス（--workers 指定時はワーカーを含む）のVmHWMの合計です（Linuxのみ）。
+
+結果は --save-baseline でベースライン（JSON）として保存でき、以降の実行ではベースラインとの差を表示します。
+--check を指定すると、RPSの低下・レイテンシ・ピークRSSの増加が --tolerance を超えた場合に終了コード1で終了します。
+ベースラインは計測したマシンに依存するため、同じマシンで保存・比較してください。
+
+実行方法:
+    uv run python -m benchmarks.bench_load
+    uv run python -m benchmarks.bench_load --scenarios large_uncached --concurrency 32 --workers 4
+    uv run python -m benchmarks.bench_load --save-baseline
+    uv run python -m benchmarks.bench_load --check --tolerance 0.1
+"""
+
+import argparse
+import asyncio
+import itertools
+import multiprocessing
+import os
+import pickle
+import socket
+import subprocess
+import sys
+import time
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import httpx
+import numpy as np
+
+from benchmarks.baseline import (
+    HIGHER_IS_BETTER,
+    LOWER_IS_BETTER,
+    Results,
+    find_regressions,
+    load_baseline,
+    save_baseline,
+)
+from benchmarks.datagen import make_race_dataframe
+from tests.s3_stub import StubS3Server
+
+BUCKET = "jockey-data"
+
+S3_CONFIG_ENV = {
+    "S3_ACCESS_KEY_ID": "bench",
+    "S3_SECRET_ACCESS_KEY": "bench",
+    "S3_REGION_NAME": "ap-northeast-1",
+    "S3_BUCKET_NAME": BUCKET,
+}
+
+# キャッシュを無効にするシナリオの環境変数
+NO_CACHE_ENV = {"JOCKEY_CACHE_MAX_ENTRIES": "0", "JOCKEY_RESPONSE_CACHE_MAX_ENTRIES": "0"}
+
+DEFAULT_BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baselines", "bench_load.json")
+
+# 比較する指標と、値が大きいほど良いか小さいほど良いか
+METRIC_DIRECTIONS = {
+    "rps": HIGHER_IS_BETTER,
+    "p50_ms": LOWER_IS_BETTER,
+    "p95_ms": LOWER_IS_BETTER,
+    "p99_ms": LOWER_IS_BETTER,
+    "peak_rss_mib": LOWER_IS_BETTER,
+}
+
+
+class Scenario(NamedTuple):
+    """負荷試験のシナリオ"""
+
+    rows: Tuple[int, ...]
+    cache: bool
+    description: str
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "small_cached": Scenario((10,), True, "10行・キャッシュあり（レスポンスキャッシュのヒット）"),
+    "typical_cached": Scenario((1000,), True, "1,000行・キャッシュあり"),
+    "typical_uncached": Scenario((1000,), False, "1,000行・キャッシュなし（毎回S3取得・デコード・エンコード）"),
+    "large_uncached": Scenario((20000,), False, "20,000行・キャッシュなし"),
+    "mixed_uncached": Scenario((10, 100, 1000, 20000), False, "10〜20,000行の混在・キャッシュなし"),
+}
+
+
+def _jockey_ids(rows: Sequence[int], ids_per_size: int) -> List[Tuple[str, int]]:
+    """行数ごとに ids_per_size 件の騎手IDを割り当て（例: 2行目の行数の3件目は "20003"）"""
+    return [
+        (f"{size_index + 1}{i:04d}", size)
+        for size_index, size in enumerate(rows)
+        for i in range(ids_per_size)
+    ]
+
+
+def _populate(server: StubS3Server, rows: Sequence[int], ids_per_size: int) -> None:
+    """シナリオの騎手データをpickleでS3スタブサーバーに配置"""
+    payloads = {size: make_race_dataframe(size, seed=size) for size in rows}
+    for jockey_id, size in _jockey_ids(rows, ids_per_size):
+        df = payloads[size].assign(jockey_id=jockey_id)
+        server.put(BUCKET, f"{jockey_id}.pickle", pickle.dumps(df, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def _start_app(port: int, workers: int, env: Dict[str, str]) -> subprocess.Popen:
+    """uvicornでアプリケーションを起動し、/health が応答するまで待機"""
+    command = [
+        sys.executable, "-m", "uvicorn", "app.main:app",
+        "--host", "127.0.0.1", "--port", str(port),
+        "--workers", str(workers), "--log-level", "warning", "--no-access-log",
+    ]
+    process = subprocess.Popen(command, env={**os.environ, **env}, stdout=subprocess.DEVNULL)
+    deadline = time.monotonic() + 30.0
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"uvicorn exited with code {process.returncode}")
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health", timeout=1.0).status_code == 200:
+                return process
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("uvicorn did not become healthy within 30 seconds")
+
+
+def _process_tree(pid: int) -> List[int]:
+    """プロセスとその子孫のPID（/proc から取得、Linux以外では空）"""
+    pids, pending = [], [pid]
+    while pending:
+        current = pending.pop()
+        pids.append(current)
+        try:
+            with open(f"/proc/{current}/task/{current}/children") as f:
+                pending.extend(int(child) for child in f.read().split())
+        except OSError:
+            continue
+    return pids
+
+
+def _peak_rss_mib(pid: int) -> Optional[float]:
+    """プロセスとその子孫のピークRSS（VmHWM）の合計（MiB、取得できない場合はNone）"""
+    total_kib, found = 0, False
+    for process_id in _process_tree(pid):
+        try:
+            with open(f"/proc/{process_id}/status") as f:
+                for line in f:
+                    if line.startswith("VmHWM:"):
+                        total_kib += int(line.split()[1])
+                        found = True
+        except OSError:
+            continue
+    return total_kib / 1024 if found else None
+
+
+async def _drive(
+    base_url: str, paths: Sequence[str], concurrency: int, warmup: float, duration: float
+) -> Tuple[List[float], int]:
+    """
+    concurrency 個のクライアントでリクエストを送信
+
+    Returns:
+        計測期間中に完了したリクエストのレイテンシ（秒）のリスト, そのうちのエラー数
+    """
+    next_path = itertools.cycle(paths).__next__
+    latencies: List[float] = []
+    errors = 0
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+        measure_from = time.perf_counter() + warmup
+        deadline = measure_from + duration
+
+        async def worker() -> None:
+            nonlocal errors
+            while True:
+                start = time.perf_counter()
+                if start >= deadline:
+                    return
+                try:
+                    response = await client.get(next_path())
+                    failed = response.status_code != 200
+                except httpx.HTTPError:
+                    failed = True
+                end = time.perf_counter()
+                if measure_from <= end <= deadline:
+                    latencies.append(end - start)
+                    errors += failed
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors
+
+
+def _client_process(
+    base_url: str, paths: Sequence[str], concurrency: int, warmup: float, duration: float
+) -> Tuple[List[float], int]:
+    """クライアントプロセスのエントリーポイント"""
+    return asyncio.run(_drive(base_url, paths, concurrency, warmup, duration))
+
+
+def run_scenario(
+    server: StubS3Server, name: str, args: argparse.Namespace
+) -> Dict[str, float]:
+    """
+    シナリオを実行して指標を計測
+
+    Returns:
+        rps・p50_ms・p95_ms・p99_ms・errors・requests・peak_rss_mib の辞書
+    """
+    scenario = SCENARIOS[name]
+    ids = _jockey_ids(scenario.rows, args.ids_per_size)
+    paths = [f"/api/jockey/{jockey_id}" for jockey_id, _ in ids]
+    env = {
+        **S3_CONFIG_ENV,
+        "S3_ENDPOINT_URL": server.endpoint_url,
+        "LOG_LEVEL": "WARNING",
+        "JOCKEY_METRICS": "false",
+        **({} if scenario.cache else NO_CACHE_ENV),
+    }
+    port = _free_port()
+    app = _start_app(port, args.workers, env)
+    try:
+        base_url = f"http://127.0.0.1:{port}"
+        # クライアントプロセスごとに開始位置をずらして同じ騎手への集中を避ける
+        offsets = [i * len(paths) // args.client_processes for i in range(args.client_processes)]
+        shards = [paths[offset:] + paths[:offset] for offset in offsets]
+        per_process = max(args.concurrency // args.client_processes, 1)
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(args.client_processes) as pool:
+            outputs = pool.starmap(
+                _client_process,
+                [(base_url, shard, per_process, args.warmup, args.duration) for shard in shards],
+            )
+        peak_rss = _peak_rss_mib(app.pid)
+    finally:
+        app.terminate()
+        app.wait(timeout=30)
+
+    latencies = np.array([latency for output in outputs for latency in output[0]])
+    result: Dict[str, float] = {
+        "rps": round(len(latencies) / args.duration, 1),
+        "errors": sum(output[1] for output in outputs),
+        "requests": len(latencies),
+    }
+    if len(latencies):
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) * 1e3
+        result.update(p50_ms=round(p50, 2), p95_ms=round(p95, 2), p99_ms=round(p99, 2))
+    if peak_rss is not None:
+        result["peak_rss_mib"] = round(peak_rss, 1)
+    return result
+
+
+def _print_results(results: Results, baseline: Optional[Results]) -> None:
+    print(
+        f"{'scenario':<18} {'rps':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+        f"{'errors':>7} {'rss MiB':>8}"
+    )
+    for name, result in results.items():
+        p50, p95, p99 = (result.get(key, float("nan")) for key in ("p50_ms", "p95_ms", "p99_ms"))
+        print(
+            f"{name:<18} {result['rps']:>9.1f} {p50:>8.2f} {p95:>8.2f} {p99:>8.2f} "
+            f"{result['errors']:>7.0f} {result.get('peak_rss_mib', float('nan')):>8.1f}"
+        )
+        base = (baseline or {}).get(name)
+        if base:
+            changes = "  ".join(
+                f"{metric} {result[metric] / base[metric] - 1:+.1%}"
+                for metric in METRIC_DIRECTIONS
+                if result.get(metric) and base.get(metric)
+            )
+            print(f"{'  vs baseline':<18} {changes}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--concurrency", type=int, default=16, help="同時に送信するリクエスト数の合計")
+    parser.add_argument("--client-processes", type=int, default=2, help="クライアントのプロセス数")
+    parser.add_argument("--workers", type=int, default=1, help="uvicornのワーカープロセス数")
+    parser.add_argument("--duration", type=float, default=10.0, help="計測期間（秒）")
+    parser.add_argument("--warmup", type=float, default=2.0, help="計測前のウォームアップ（秒）")
+    parser.add_argument("--ids-per-size", type=int, default=20, help="行数ごとの騎手IDの数")
+    parser.add_argument("--s3-latency", type=float, default=0.005, help="S3スタブの応答遅延（秒）")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH, help="ベースラインのJSONファイル")
+    parser.add_argument("--save-baseline", action="store_true", help="結果をベースラインとして保存")
+    parser.add_argument("--check", action="store_true", help="悪化した場合は終了コード1で終了")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="許容する悪化の割合")
+    args = parser.parse_args()
+
+    settings = {
+        key: getattr(args, key)
+        for key in ("concurrency", "client_processes", "workers", "duration", "ids_per_size", "s3_latency")
+    }
+    document = load_baseline(args.baseline)
+    baseline: Optional[Results] = document["results"] if document else None
+    if document and document.get("settings") != settings:
+        print(f"warning: baseline settings differ: {document.get('settings')}")
+
+    server = StubS3Server(latency=args.s3_latency).start()
+    try:
+        results: Results = {}
+        for name in args.scenarios:
+            scenario = SCENARIOS[name]
+            _populate(server, scenario.rows, args.ids_per_size)
+            print(f"running {name}: {scenario.description}", flush=True)
+            results[name] = run_scenario(server, name, args)
+    finally:
+        server.stop()
+
+    print(
+        f"\nconcurrency {args.concurrency} ({args.client_processes} client processes), "
+        f"uvicorn workers {args.workers}, S3 latency {args.s3_latency * 1e3:.0f} ms, "
+        f"{args.duration:.0f} s per scenario"
+    )
+    _print_results(results, baseline)
+
+    if args.save_baseline:
+        save_baseline(args.baseline, results, settings)
+        print(f"\nbaseline saved: {args.baseline}")
+        return
+    if baseline is not None:
+        regressions = find_regressions(results, baseline, METRIC_DIRECTIONS, args.tolerance)
+        for regression in regressions:
+            print(f"regression: {regression}")
+        if regressions and args.check:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Logging Formatter Benchmark
+
+ログレコード1件あたりのフォーマットのコストを、以下のフォーマッターで比較します。
+
+- legacy: 4つの extra のみを含む辞書を str() で出力（JSONではない、以前の実装）
+- json_naive: extra をすべて含む辞書を毎回 formatTime・json.dumps で出力
+- structured: StructuredFormatter（タイムスタンプのキャッシュ・エンコーダーの再利用）
+
+実行方法:
+    uv run python -m benchmarks.bench_logging
+"""
+
+import argparse
+import json
+import logging
+import time
+from typing import Any, Callable, Dict, List
+
+from app.core.logging import StructuredFormatter
+
+DATEFMT = "%Y-%m-%d %H:%M:%S"
+
+# 1リクエストで出力される典型的なログ（extra のフィールド数が異なる）
+EXTRAS: List[Dict[str, Any]] = [
+    {"jockey_id": "05339"},
+    {"bucket": "jockey-data", "key": "05339.pickle", "etag": '"abc123"'},
+    {"jockey_id": "05339", "data_size": 183_224, "elapsed_ms": 12.5},
+    {"jockey_id": "05339", "rows": 1520, "record_count": 1520, "size": 401_553},
+]
+
+
+class LegacyFormatter(logging.Formatter):
+    """以前の StructuredFormatter（比較用）"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        log_data: Dict[str, Any] = {
+            "timestamp": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key in ("jockey_id", "bucket", "key", "error"):
+            if hasattr(record, key):
+                log_data[key] = getattr(record, key)
+        return str(log_data)
+
+
+class NaiveJsonFormatter(logging.Formatter):
+    """キャッシュを行わないJSONフォーマッター（比較用）"""
+
+    reserved = frozenset(logging.makeLogRecord({}).__dict__) | {"message", "asctime"}
+
+    def format(self, record: logging.LogRecord) -> str:
+        log_data: Dict[str, Any] = {
+            "timestamp": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in self.reserved:
+                log_data[key] = value
+        return json.dumps(log_data, ensure_ascii=False, default=str)
+
+
+def _make_records(count: int) -> List[logging.LogRecord]:
+    logger = logging.getLogger("app.services.jockey_service")
+    records = []
+    for i in range(count):
+        records.append(
+            logger.makeRecord(
+                logger.name, logging.INFO, __file__, 0, "Jockey data retrieved", (), None,
+                extra=EXTRAS[i % len(EXTRAS)],
+            )
+        )
+    return records
+
+
+def _best_of(func: Callable[[], None], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    records = _make_records(args.records)
+    formatters = {
+        "legacy": LegacyFormatter(datefmt=DATEFMT),
+        "json_naive": NaiveJsonFormatter(datefmt=DATEFMT),
+        "structured": StructuredFormatter(datefmt=DATEFMT),
+    }
+    for record in records[:len(EXTRAS)]:
+        json.loads(formatters["structured"].format(record))
+
+    print(f"{'formatter':>12} {'us/record':>10} {'valid json':>11} {'extras kept':>12}")
+    for name, formatter in formatters.items():
+        elapsed = _best_of(lambda f=formatter: [f.format(r) for r in records] and None, args.repeat)
+        sample = formatter.format(records[2])
+        try:
+            parsed = json.loads(sample)
+            valid, kept = "yes", str("data_size" in parsed and "elapsed_ms" in parsed)
+        except ValueError:
+            valid, kept = "no", "False"
+        print(f"{name:>12} {elapsed / len(records) * 1e6:>10.2f} {valid:>11} {kept:>12}")
+
+
+if __name__ == "__main__":
+    main()
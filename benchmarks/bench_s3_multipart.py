@@ -0,0 +1,96 @@
+"""
+S3 Multipart Download Benchmark
+
+レイテンシと接続あたりの帯域を制限したローカルのS3スタブサーバーから、
+1回のGetObjectと、Range取得による並行ダウンロード（S3_MULTIPART_*）の所要時間を比較します。
+
+実行方法:
+    uv run python -m benchmarks.bench_s3_multipart
+    uv run python -m benchmarks.bench_s3_multipart --latency 0.05 --bandwidth-mib 20
+"""
+
+import argparse
+import os
+import time
+from typing import List, Optional, Tuple
+from unittest.mock import patch
+
+from app.infrastructure.s3_accessor import S3Accessor
+from tests.s3_stub import StubS3Server
+
+BUCKET = "jockey-data"
+
+S3_CONFIG_ENV = {
+    "S3_ACCESS_KEY_ID": "bench",
+    "S3_SECRET_ACCESS_KEY": "bench",
+    "S3_REGION_NAME": "ap-northeast-1",
+    "S3_BUCKET_NAME": BUCKET,
+}
+
+MIB = 1024 * 1024
+
+
+def _make_accessor(endpoint_url: str, part_mib: int, concurrency: Optional[int]) -> S3Accessor:
+    env = {
+        **S3_CONFIG_ENV,
+        "S3_ENDPOINT_URL": endpoint_url,
+        "S3_MULTIPART_THRESHOLD_BYTES": str(part_mib * MIB if concurrency else 0),
+        "S3_MULTIPART_PART_BYTES": str(part_mib * MIB),
+        "S3_MULTIPART_CONCURRENCY": str(concurrency or 1),
+        "S3_MAX_POOL_CONNECTIONS": str(max(concurrency or 1, 10)),
+    }
+    with patch.dict(os.environ, env):
+        return S3Accessor()
+
+
+def _best_of(accessor: S3Accessor, key: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        accessor.get_object(key)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes-mib", type=int, nargs="+", default=[8, 32])
+    parser.add_argument("--part-mib", type=int, default=2)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[2, 4, 8])
+    parser.add_argument("--latency", type=float, default=0.02, help="リクエストごとの遅延（秒）")
+    parser.add_argument("--bandwidth-mib", type=float, default=10.0, help="接続あたりの帯域（MiB/秒）")
+    parser.add_argument("--repeat", type=int, default=2)
+    args = parser.parse_args()
+
+    server = StubS3Server(latency=args.latency, bandwidth=args.bandwidth_mib * MIB).start()
+    try:
+        variants: List[Tuple[str, Optional[int]]] = [("single", None)]
+        variants += [(f"multipart x{n}", n) for n in args.concurrency]
+        accessors = [
+            (name, _make_accessor(server.endpoint_url, args.part_mib, concurrency))
+            for name, concurrency in variants
+        ]
+
+        print(
+            f"latency {args.latency * 1e3:.0f} ms, {args.bandwidth_mib:.0f} MiB/s per connection, "
+            f"part {args.part_mib} MiB"
+        )
+        print(f"{'size MiB':>8} {'mode':<14} {'ms':>8} {'MiB/s':>8} {'speedup':>8}")
+        for size_mib in args.sizes_mib:
+            key = f"{size_mib}.pickle"
+            server.put(BUCKET, key, os.urandom(size_mib * MIB))
+
+            baseline = None
+            for name, accessor in accessors:
+                elapsed = _best_of(accessor, key, args.repeat)
+                baseline = baseline or elapsed
+                print(
+                    f"{size_mib:>8} {name:<14} {elapsed * 1e3:>8.1f} "
+                    f"{size_mib / elapsed:>8.1f} {baseline / elapsed:>7.2f}x"
+                )
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+S3 Body Read Benchmark
+
+ローカルのS3スタブサーバーから取得したpickleをDataFrameにデコードするまでの
+1リクエストあたりのボディ読み込み時のピークメモリ（tracemalloc）と、デコードまでの所要時間を
+以下の読み込み方法で比較します。
+
+- read: StreamingBody.read() でボディ全体のbytesを生成
+- readinto: ContentLengthから確保したbytearrayへ分割して readinto（read_body）
+- async read / async readinto: aiobotocoreでの同様の比較（aiobotocoreがインストールされている場合）
+
+実行方法:
+    uv run python -m benchmarks.bench_s3_read
+"""
+
+import argparse
+import asyncio
+import pickle
+import time
+import tracemalloc
+from typing import Any, Callable, Tuple
+
+import boto3
+
+from app.infrastructure.s3_accessor import (
+    build_client_config,
+    is_async_available,
+    read_body,
+    read_body_async,
+)
+from benchmarks.datagen import make_race_dataframe
+from tests.s3_stub import StubS3Server
+
+BUCKET = "jockey-data"
+
+
+def _read_all(client: Any, key: str) -> Any:
+    body = client.get_object(Bucket=BUCKET, Key=key)["Body"]
+    return body.read()
+
+
+def _read_into(client: Any, key: str) -> Any:
+    response = client.get_object(Bucket=BUCKET, Key=key)
+    return read_body(response["Body"], response["ContentLength"])
+
+
+async def _read_all_async(client: Any, key: str) -> Any:
+    body = (await client.get_object(Bucket=BUCKET, Key=key))["Body"]
+    async with body:
+        return await body.read()
+
+
+async def _read_into_async(client: Any, key: str) -> Any:
+    response = await client.get_object(Bucket=BUCKET, Key=key)
+    body = response["Body"]
+    async with body:
+        return await read_body_async(body, response["ContentLength"])
+
+
+def _measure(read: Callable[[], Any], repeat: int) -> Tuple[float, int]:
+    best = float("inf")
+    peak = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        tracemalloc.start()
+        data = read()
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        pickle.loads(data)
+        best = min(best, time.perf_counter() - start)
+    return best, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[2000, 20000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    server = StubS3Server().start()
+    try:
+        client_kwargs = {
+            "aws_access_key_id": "bench",
+            "aws_secret_access_key": "bench",
+            "region_name": "ap-northeast-1",
+            "endpoint_url": server.endpoint_url,
+            "config": build_client_config(server.endpoint_url),
+        }
+        client = boto3.client("s3", **client_kwargs)
+        loop = asyncio.new_event_loop()
+        async_client = None
+        if is_async_available():
+            from aiobotocore.session import get_session
+
+            async_client = loop.run_until_complete(
+                get_session().create_client("s3", **client_kwargs).__aenter__()
+            )
+
+        print(
+            f"{'rows':>7} {'size KiB':>9} {'method':<15} {'ms':>8} "
+            f"{'read peak KiB':>13} {'peak/size':>9}"
+        )
+        for rows in args.sizes:
+            key = f"{rows}.pickle"
+            data = pickle.dumps(make_race_dataframe(rows))
+            server.put(BUCKET, key, data)
+
+            readers = [
+                ("read", lambda: _read_all(client, key)),  # noqa: B023
+                ("readinto", lambda: _read_into(client, key)),  # noqa: B023
+            ]
+            if async_client is not None:
+                readers += [
+                    ("async read", lambda: loop.run_until_complete(_read_all_async(async_client, key))),  # noqa: B023
+                    ("async readinto", lambda: loop.run_until_complete(_read_into_async(async_client, key))),  # noqa: B023
+                ]
+            for name, reader in readers:
+                elapsed, peak = _measure(reader, args.repeat)
+                print(
+                    f"{rows:>7} {len(data) / 1024:>9.1f} {name:<15} {elapsed * 1e3:>8.2f} "
+                    f"{peak / 1024:>13.1f} {peak / len(data):>9.2f}"
+                )
+
+        if async_client is not None:
+            loop.run_until_complete(async_client.__aexit__(None, None, None))
+        loop.close()
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+JockeyService Stage Micro-Benchmark
+
+JockeyServiceのデコード・エンコードの各段階を、DataFrameの行数と列の型の組み合わせ
+（benchmarks.datagen.DTYPE_MIXES）ごとに計測します。
+
+- deserialize_pickle: pickleバイト列 → DataFrame
+- dataframe_to_json: DataFrame → レコードのリスト（modelモード）
+- fastapi_response: dataframe_to_json の出力 → response_model（pydantic）→ JSONResponse のボディ
+- encode_raw: DataFrame → JSONバイト列（rawモードの列単位エンコード）
+
+各ケースは1ラウンドが --min-round-ms 以上になるよう呼び出し回数を調整し、--rounds ラウンドの
+1回あたりの所要時間の最小値・中央値・平均・標準偏差（マイクロ秒）を求めます。
+計測中はINFO以下のログ出力を無効にします（関数自体のコストのみを計測するため）。
+
+結果は --save-baseline でベースライン（JSON）として保存でき、以降の実行ではベースラインとの差を表示します。
+--check を指定すると、中央値が --tolerance を超えて悪化したケースがある場合に終了コード1で終了します。
+CIではベースブランチで --save-baseline を実行したファイルを、ブランチでの --check に渡してください。
+
+実行方法:
+    uv run python -m benchmarks.bench_service_stages
+    uv run python -m benchmarks.bench_service_stages --sizes 1000 --mixes race nan_float
+    uv run python -m benchmarks.bench_service_stages --save-baseline --baseline /tmp/base.json
+    uv run python -m benchmarks.bench_service_stages --check --baseline /tmp/base.json --tolerance 0.1
+"""
+
+import argparse
+import logging
+import os
+import pickle
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+from unittest.mock import MagicMock
+
+import pandas as pd
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.services.jockey_service import JockeyService
+from benchmarks.baseline import (
+    LOWER_IS_BETTER,
+    Results,
+    find_regressions,
+    load_baseline,
+    save_baseline,
+)
+from benchmarks.datagen import DTYPE_MIXES, make_dtype_mix_dataframe
+
+DEFAULT_BASELINE_PATH = os.path.join(
+    os.path.dirname(__file__), "baselines", "bench_service_stages.json"
+)
+
+# 比較する指標（中央値のみ、最小値は参考値）
+METRIC_DIRECTIONS = {"median_us": LOWER_IS_BETTER}
+
+STAGES = ("deserialize_pickle", "dataframe_to_json", "fastapi_response", "encode_raw")
+
+
+def _make_cases(
+    service: JockeyService, df: pd.DataFrame
+) -> Dict[str, Callable[[], Any]]:
+    """DataFrameに対する各段階の計測対象の関数"""
+    data = pickle.dumps(df, protocol=pickle.HIGHEST_PROTOCOL)
+    records = service.dataframe_to_json(df, "bench")
+    response_adapter = TypeAdapter(List[dict[str, Any]])
+
+    def fastapi_response() -> bytes:
+        content = response_adapter.dump_python(records, mode="json")
+        return bytes(JSONResponse(content).body)
+
+    return {
+        "deserialize_pickle": lambda: service.deserialize_pickle(data, "bench"),
+        "dataframe_to_json": lambda: service.dataframe_to_json(df, "bench"),
+        "fastapi_response": fastapi_response,
+        "encode_raw": lambda: service.dataframe_to_json_bytes(df, "bench"),
+    }
+
+
+def measure(func: Callable[[], Any], rounds: int, min_round_seconds: float) -> Dict[str, float]:
+    """
+    関数の1回あたりの所要時間を計測
+
+    1ラウンドが min_round_seconds 以上になるよう呼び出し回数を決め、rounds ラウンド計測します。
+
+    Returns:
+        min_us・median_us・mean_us・stddev_us・rounds・iterations の辞書
+    """
+    func()
+    iterations = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        if time.perf_counter() - start >= min_round_seconds:
+            break
+        iterations *= 2
+
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        samples.append((time.perf_counter() - start) / iterations * 1e6)
+    return {
+        "min_us": round(min(samples), 2),
+        "median_us": round(statistics.median(samples), 2),
+        "mean_us": round(statistics.fmean(samples), 2),
+        "stddev_us": round(statistics.stdev(samples), 2) if len(samples) > 1 else 0.0,
+        "rounds": rounds,
+        "iterations": iterations,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 20000])
+    parser.add_argument("--mixes", nargs="+", choices=DTYPE_MIXES, default=list(DTYPE_MIXES))
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES))
+    parser.add_argument("--rounds", type=int, default=7)
+    parser.add_argument("--min-round-ms", type=float, default=50.0)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH, help="ベースラインのJSONファイル")
+    parser.add_argument("--save-baseline", action="store_true", help="結果をベースラインとして保存")
+    parser.add_argument("--check", action="store_true", help="悪化した場合は終了コード1で終了")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="許容する悪化の割合")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    service = JockeyService.__new__(JockeyService)
+    service.s3_accessor = MagicMock()
+
+    document = load_baseline(args.baseline)
+    baseline: Optional[Results] = document["results"] if document else None
+
+    results: Results = {}
+    print(f"{'case':<36} {'median us':>11} {'min us':>11} {'stddev':>8} {'vs base':>8}")
+    for mix in args.mixes:
+        for rows in args.sizes:
+            cases = _make_cases(service, make_dtype_mix_dataframe(rows, mix))
+            for stage in args.stages:
+                name = f"{stage}/{mix}/{rows}"
+                result = measure(cases[stage], args.rounds, args.min_round_ms / 1000)
+                results[name] = result
+                base = (baseline or {}).get(name, {}).get("median_us")
+                change = f"{result['median_us'] / base - 1:+.1%}" if base else "-"
+                print(
+                    f"{name:<36} {result['median_us']:>11.1f} {result['min_us']:>11.1f} "
+                    f"{result['stddev_us']:>8.1f} {change:>8}",
+                    flush=True,
+                )
+
+    if args.save_baseline:
+        save_baseline(args.baseline, results, {"rounds": args.rounds, "min_round_ms": args.min_round_ms})
+        print(f"\nbaseline saved: {args.baseline}")
+        return
+    if baseline is not None:
+        regressions = find_regressions(results, baseline, METRIC_DIRECTIONS, args.tolerance)
+        for regression in regressions:
+            print(f"regression: {regression}")
+        if regressions and args.check:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Storage Format Benchmark
+
+騎手DataFrameの保存形式（pickle / Feather / Parquet）ごとに、
+オブジェクトサイズと全列・一部の列のデコード時間を比較します。
+
+実行方法:
+    uv run --extra columnar python -m benchmarks.bench_storage_formats
+"""
+
+import argparse
+import time
+from typing import Callable, List, Optional, Tuple
+
+from app.infrastructure.storage_formats import deserialize_dataframe, serialize_dataframe
+from benchmarks.datagen import make_race_dataframe
+
+# 多くのクライアントが必要とする列
+PROJECTED_COLUMNS = ["日付", "開催", "着 順", "人 気", "単勝"]
+
+# (表示名, 保存形式, 圧縮方式)
+VARIANTS: List[Tuple[str, str, Optional[str]]] = [
+    ("pickle", "pickle", None),
+    ("feather", "feather", "uncompressed"),
+    ("feather+lz4", "feather", "lz4"),
+    ("feather+zstd", "feather", "zstd"),
+    ("parquet+snappy", "parquet", "snappy"),
+    ("parquet+zstd", "parquet", "zstd"),
+]
+
+
+def _best_of(func: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 2000, 20000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"{'rows':>7} {'format':<15} {'size KiB':>9} {'decode ms':>10} "
+        f"{f'{len(PROJECTED_COLUMNS)} cols ms':>10}"
+    )
+    for rows in args.sizes:
+        df = make_race_dataframe(rows)
+        for name, storage_format, compression in VARIANTS:
+            data = serialize_dataframe(df, storage_format, compression)
+            assert deserialize_dataframe(data, storage_format).equals(df)
+
+            full = _best_of(lambda: deserialize_dataframe(data, storage_format), args.repeat)  # noqa: B023
+            projected = _best_of(
+                lambda: deserialize_dataframe(data, storage_format, PROJECTED_COLUMNS),  # noqa: B023
+                args.repeat,
+            )
+            print(
+                f"{rows:>7} {name:<15} {len(data) / 1024:>9.1f} "
+                f"{full * 1e3:>10.2f} {projected * 1e3:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Synthetic Race Data Generator
+
+ベンチマーク用に RaceRecord スキーマ（全28列）と同じ列・dtypeを持つ
+騎手レースデータのDataFrameを生成します。
+"""
+
+import numpy as np
+import pandas as pd
+
+_VENUES = ["1東京2", "4中山9", "3阪神5", "2京都4", "船橋", "大井", "川崎", "2新潟6", "1札幌3"]
+_WEATHER = ["晴", "曇", "雨", "小雨", "雪"]
+_RACE_NAMES = [
+    "スプリンターズS(GI)", "マリーンC(JpnIII)", "茨城新聞杯(2勝クラス)", "3歳未勝利",
+    "2歳新馬", "1勝クラス", "東京優駿(GI)", "オープン特別", "ジャパンカップ(GI)",
+]
+_KANA = list("アイウエオカキクケコサシスセソタチツテトナニヌネノハヒフヘホマミムメモヤユヨラリルレロワン")
+_SURFACES = ["芝", "ダ"]
+_DISTANCES = [1000, 1200, 1400, 1600, 1800, 2000, 2200, 2400, 2500, 3000, 3200]
+_CONDITIONS = ["良", "稍", "重", "不"]
+
+
+def _horse_names(rng: np.random.Generator, n: int) -> list:
+    lengths = rng.integers(4, 10, size=n)
+    return ["".join(rng.choice(_KANA, size=length)) for length in lengths]
+
+
+def make_race_dataframe(rows: int, jockey_id: str = "05339", seed: int = 0) -> pd.DataFrame:
+    """
+    RaceRecordスキーマの合成DataFrameを生成
+
+    Args:
+        rows: 行数
+        jockey_id: 騎手ID
+        seed: 乱数シード
+
+    Returns:
+        pandas DataFrame（日付の降順）
+    """
+    rng = np.random.default_rng(seed)
+    heads = rng.integers(8, 19, size=rows)
+    finish = np.minimum(rng.integers(1, 19, size=rows), heads)
+    popularity = np.minimum(rng.integers(1, 19, size=rows), heads)
+    days = np.sort(rng.integers(0, 365 * 20, size=rows))
+    corners = rng.integers(1, 19, size=(rows, 4))
+    weights = rng.integers(400, 560, size=rows)
+    weight_diff = rng.integers(-12, 13, size=rows)
+    prize = np.round(rng.uniform(50, 30000, size=rows), 1)
+    prize[finish > 5] = np.nan
+
+    return pd.DataFrame(
+        {
+            "日付": pd.Timestamp("2025-10-02") - pd.to_timedelta(days, unit="D"),
+            "開催": rng.choice(_VENUES, size=rows).astype(object),
+            "天 気": rng.choice(_WEATHER, size=rows).astype(object),
+            "R": rng.integers(1, 13, size=rows),
+            "レース名": rng.choice(_RACE_NAMES, size=rows).astype(object),
+            "映像": np.full(rows, np.nan),
+            "頭 数": heads,
+            "枠 番": rng.integers(1, 9, size=rows),
+            "馬 番": np.minimum(rng.integers(1, 19, size=rows), heads),
+            "単勝": np.round(rng.uniform(1.0, 300.0, size=rows), 1),
+            "人 気": popularity,
+            "着 順": finish,
+            "馬名": _horse_names(rng, rows),
+            "騎手": np.full(rows, np.nan),
+            "斤量": rng.integers(52, 61, size=rows),
+            "距離": [
+                f"{surface}{distance}"
+                for surface, distance in zip(
+                    rng.choice(_SURFACES, size=rows),
+                    rng.choice(_DISTANCES, size=rows),
+                    strict=True,
+                )
+            ],
+            "水分量": np.where(rng.random(rows) < 0.9, np.nan, np.round(rng.uniform(5, 20, rows), 1)),
+            "馬 場": rng.choice(_CONDITIONS, size=rows).astype(object),
+            "タイム": [
+                f"{m}:{s:04.1f}"
+                for m, s in zip(
+                    rng.integers(1, 4, size=rows), rng.uniform(0, 59.9, size=rows), strict=True
+                )
+            ],
+            "着差": np.round(rng.uniform(0, 3, size=rows), 1),
+            "通過": ["-".join(map(str, row)) for row in corners.tolist()],
+            "ペース": [
+                f"{a:.1f}-{b:.1f}"
+                for a, b in zip(
+                    rng.uniform(33, 40, size=rows), rng.uniform(33, 40, size=rows), strict=True
+                )
+            ],
+            "上り": np.round(rng.uniform(32, 42, size=rows), 1),
+            "馬体重": [f"{w}({d:+d})" if d else f"{w}(0)" for w, d in zip(weights, weight_diff, strict=True)],
+            "勝ち馬": _horse_names(rng, rows),
+            "賞金 (万円)": prize,
+            "page_number": np.arange(rows) // 20 + 1,
+            "jockey_id": np.full(rows, jockey_id, dtype=object),
+        }
+    )
+
+
+# make_dtype_mix_dataframe で生成できる列の型の組み合わせ
+DTYPE_MIXES = ("race", "datetime", "nan_float", "object_str")
+
+
+def make_dtype_mix_dataframe(rows: int, mix: str, seed: int = 0) -> pd.DataFrame:
+    """
+    特定の型の列が多いDataFrameを生成（型ごとのデコード・エンコードのコストの比較用）
+
+    - race: RaceRecordスキーマ（make_race_dataframe）
+    - datetime: datetime64の列8列
+    - nan_float: 約半数がNaNのfloat64の列8列
+    - object_str: 可変長の文字列（object）の列8列
+
+    Args:
+        rows: 行数
+        mix: 列の型の組み合わせ（DTYPE_MIXES のいずれか）
+        seed: 乱数シード
+
+    Returns:
+        pandas DataFrame
+    """
+    if mix == "race":
+        return make_race_dataframe(rows, seed=seed)
+
+    rng = np.random.default_rng(seed)
+    columns = [f"col{i}" for i in range(8)]
+    if mix == "datetime":
+        base = pd.Timestamp("2005-01-01")
+        return pd.DataFrame({
+            column: base + pd.to_timedelta(rng.integers(0, 20 * 365 * 86400, size=rows), unit="s")
+            for column in columns
+        })
+    if mix == "nan_float":
+        data = {}
+        for column in columns:
+            values = np.round(rng.uniform(0, 1000, size=rows), 1)
+            values[rng.random(rows) < 0.5] = np.nan
+            data[column] = values
+        return pd.DataFrame(data)
+    if mix == "object_str":
+        return pd.DataFrame({
+            column: np.array(_horse_names(rng, rows), dtype=object) for column in columns
+        })
+    raise ValueError(f"Unknown dtype mix: {mix}")
@@ -0,0 +1,50 @@
+"""
+Shared pytest fixtures
+"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from app.infrastructure.dependencies import (
+    reset_hit_counter,
+    reset_jockey_cache,
+    reset_response_cache,
+    reset_single_flight,
+)
+from app.services.prewarm import reset_prewarmer
+from tests.s3_stub import make_s3_accessor_mock
+
+
+@pytest.fixture(autouse=True)
+def reset_caches():
+    """テスト間でプロセス内キャッシュ・同時リクエストの集約・プリウォームの状態が共有されないようにリセットする"""
+    reset_jockey_cache()
+    reset_response_cache()
+    reset_single_flight()
+    reset_hit_counter()
+    reset_prewarmer()
+    yield
+    reset_jockey_cache()
+    reset_response_cache()
+    reset_single_flight()
+    reset_hit_counter()
+    reset_prewarmer()
+
+
+@pytest.fixture(scope="session")
+def pickle_data():
+    """実際のpickleファイルのデータ"""
+    pickle_path = os.path.join(os.path.dirname(__file__), "test_data.pickle")
+    with open(pickle_path, "rb") as f:
+        return f.read()
+
+
+@pytest.fixture
+def s3_accessor(pickle_data):
+    """JockeyServiceが使用する、実際のpickleファイルを返すS3Accessorのモック"""
+    accessor = make_s3_accessor_mock()
+    accessor.get_object.return_value = pickle_data
+    with patch("app.services.jockey_service.get_s3_accessor", return_value=accessor):
+        yield accessor
@@ -0,0 +1,212 @@
+"""
+Stub S3 Server
+
+テスト用のローカルS3スタブサーバー。
+
+パス形式（http://127.0.0.1:{port}/{bucket}/{key}）の GetObject（Range・If-None-Match・
+If-Match対応）・PutObject・ListObjectsV2 のみに対応し、署名は検証しません。S3_ENDPOINT_URL に
+endpoint_url を設定することで、boto3・aiobotocore の両方から利用できます。
+
+latency（リクエストごとの遅延秒数）と bandwidth（接続あたりの転送速度 bytes/秒）を
+指定すると、ネットワーク越しのS3を模擬できます（ベンチマーク用）。
+
+あわせて、get_object の設定のみで get_object_with_metadata も応答する
+S3Accessorのモックを提供します。
+"""
+
+import hashlib
+import re
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from unittest.mock import MagicMock
+from urllib.parse import parse_qs, unquote, urlsplit
+from xml.sax.saxutils import escape
+
+from app.infrastructure.s3_accessor import S3Object
+
+_RANGE_PATTERN = re.compile(r"bytes=(\d+)-(\d*)$")
+
+# bandwidth指定時の1回あたりの送信サイズ
+_SEND_CHUNK_BYTES = 64 * 1024
+
+
+def make_s3_accessor_mock() -> MagicMock:
+    """
+    S3Accessorのモックを生成
+
+    get_object_with_metadata（S3Object）の呼び出しを get_object（バイト列）に委譲するため、
+    get_object.return_value / side_effect の設定と呼び出しの検証がそのまま使えます。
+    ETag・最終更新日時は常にNoneです。
+    """
+    accessor = MagicMock()
+
+    def get_object_with_metadata(key: str, if_none_match: Optional[str] = None) -> Optional[S3Object]:
+        data = accessor.get_object(key)
+        return S3Object(data) if data is not None else None
+
+    accessor.get_object_with_metadata.side_effect = get_object_with_metadata
+    return accessor
+
+
+class StubS3Server:
+    """バックグラウンドスレッドで動作するS3スタブサーバー"""
+
+    def __init__(self, latency: float = 0.0, bandwidth: Optional[float] = None) -> None:
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.objects: Dict[Tuple[str, str], bytes] = {}
+        self.last_modified: Dict[Tuple[str, str], str] = {}
+        self.not_modified_count = 0
+        self.request_count = 0
+        self.range_request_count = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+
+    @property
+    def endpoint_url(self) -> str:
+        """スタブサーバーのエンドポイントURL"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubS3Server":
+        """サーバーを起動"""
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """サーバーを停止"""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def put(self, bucket: str, key: str, data: bytes) -> None:
+        """オブジェクトを登録"""
+        with self._lock:
+            self.objects[(bucket, key)] = data
+            self.last_modified[(bucket, key)] = formatdate(usegmt=True)
+
+    def _handler_class(self) -> type:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+            def _parse(self) -> Tuple[str, str, Dict[str, list]]:
+                url = urlsplit(self.path)
+                bucket, _, key = unquote(url.path).lstrip("/").partition("/")
+                return bucket, key, parse_qs(url.query)
+
+            def _send(self, status: int, body: bytes, headers: Dict[str, str]) -> None:
+                if stub.latency:
+                    time.sleep(stub.latency)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if not stub.bandwidth:
+                    self.wfile.write(body)
+                    return
+                view = memoryview(body)
+                for start in range(0, len(body), _SEND_CHUNK_BYTES):
+                    chunk = view[start:start + _SEND_CHUNK_BYTES]
+                    self.wfile.write(chunk)
+                    time.sleep(len(chunk) / stub.bandwidth)
+
+            def _send_error(self, status: int, code: str, message: str) -> None:
+                body = (
+                    "<?xml version=\"1.0\" encoding=\"UTF-8\"?>"
+                    f"<Error><Code>{code}</Code><Message>{message}</Message></Error>"
+                ).encode("utf-8")
+                self._send(status, body, {"Content-Type": "application/xml"})
+
+            def do_GET(self) -> None:
+                with stub._lock:
+                    stub.request_count += 1
+                bucket, key, params = self._parse()
+                if not key and params.get("list-type") == ["2"]:
+                    self._list_objects(bucket, params)
+                    return
+
+                with stub._lock:
+                    data = stub.objects.get((bucket, key))
+                    last_modified = stub.last_modified.get((bucket, key), "")
+                if data is None:
+                    self._send_error(404, "NoSuchKey", "The specified key does not exist.")
+                    return
+                headers = {
+                    "ETag": f"\"{hashlib.md5(data).hexdigest()}\"",
+                    "Last-Modified": last_modified,
+                }
+                if_match = self.headers.get("If-Match")
+                if if_match is not None and if_match != headers["ETag"]:
+                    self._send_error(412, "PreconditionFailed", "At least one of the pre-conditions you specified did not hold")
+                    return
+                if self.headers.get("If-None-Match") == headers["ETag"]:
+                    with stub._lock:
+                        stub.not_modified_count += 1
+                    self._send(304, b"", headers)
+                    return
+
+                range_header = self.headers.get("Range")
+                if range_header is not None:
+                    self._send_range(data, range_header, headers)
+                    return
+                self._send(200, data, {"Content-Type": "application/octet-stream", **headers})
+
+            def _send_range(self, data: bytes, range_header: str, headers: Dict[str, str]) -> None:
+                with stub._lock:
+                    stub.range_request_count += 1
+                match = _RANGE_PATTERN.match(range_header)
+                if match is None or int(match.group(1)) >= len(data):
+                    self._send_error(416, "InvalidRange", "The requested range is not satisfiable")
+                    return
+                start = int(match.group(1))
+                end = min(int(match.group(2)) if match.group(2) else len(data) - 1, len(data) - 1)
+                self._send(206, data[start:end + 1], {
+                    "Content-Type": "application/octet-stream",
+                    "Content-Range": f"bytes {start}-{end}/{len(data)}",
+                    **headers,
+                })
+
+            def do_PUT(self) -> None:
+                with stub._lock:
+                    stub.request_count += 1
+                bucket, key, _ = self._parse()
+                length = int(self.headers.get("Content-Length", "0"))
+                data = self.rfile.read(length)
+                stub.put(bucket, key, data)
+                self._send(200, b"", {"ETag": f"\"{hashlib.md5(data).hexdigest()}\""})
+
+            def _list_objects(self, bucket: str, params: Dict[str, list]) -> None:
+                prefix = params.get("prefix", [""])[0]
+                with stub._lock:
+                    matched = sorted(
+                        (key, len(data))
+                        for (object_bucket, key), data in stub.objects.items()
+                        if object_bucket == bucket and key.startswith(prefix)
+                    )
+                contents = "".join(
+                    f"<Contents><Key>{escape(key)}</Key><Size>{size}</Size>"
+                    "<LastModified>2025-01-01T00:00:00.000Z</LastModified></Contents>"
+                    for key, size in matched
+                )
+                body = (
+                    "<?xml version=\"1.0\" encoding=\"UTF-8\"?>"
+                    "<ListBucketResult xmlns=\"http://s3.amazonaws.com/doc/2006-03-01/\">"
+                    f"<Name>{escape(bucket)}</Name><Prefix>{escape(prefix)}</Prefix>"
+                    f"<KeyCount>{len(matched)}</KeyCount><IsTruncated>false</IsTruncated>"
+                    f"{contents}</ListBucketResult>"
+                ).encode("utf-8")
+                self._send(200, body, {"Content-Type": "application/xml"})
+
+        return Handler
@@ -4,14 +4,18 @@ Jockey API Endpoint Tests
 FastAPIのTestClientを使用してAPIエンドポイントをテストします。
 """
 
+import asyncio
 import os
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
+from fastapi.responses import JSONResponse
 from fastapi.testclient import TestClient
 
 from app.main import app
 from app.models.exceptions import S3AccessError, SSMConfigError
+from app.services.jockey_service import JockeyService
+from tests.s3_stub import make_s3_accessor_mock
 
 client = TestClient(app)
 
@@ -43,6 +47,15 @@ class TestJockeyAPI:
         assert response.status_code == 200
         assert elapsed_time < 5.0, f"Response time {elapsed_time}s exceeds 5 seconds"
 
+    def test_health_stats(self):
+        """統計情報エンドポイントがキャッシュ統計を返却することのテスト"""
+        response = client.get("/health/stats")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [cache["name"] for cache in data["caches"]] == ["jockey_dataframe", "jockey_response"]
+        assert "s3_pool" in data
+
     def test_root_endpoint(self):
         """ルートエンドポイントのテスト"""
         response = client.get("/")
@@ -52,7 +65,7 @@ class TestJockeyAPI:
     @patch("app.services.jockey_service.get_s3_accessor")
     def test_get_jockey_data_success(self, mock_get_s3_accessor, real_pickle_data):
         """騎手データ取得成功のテスト"""
-        mock_s3_accessor = MagicMock()
+        mock_s3_accessor = make_s3_accessor_mock()
         mock_s3_accessor.get_object.return_value = real_pickle_data
         mock_get_s3_accessor.return_value = mock_s3_accessor
 
@@ -72,7 +85,7 @@ class TestJockeyAPI:
     @patch("app.services.jockey_service.get_s3_accessor")
     def test_get_jockey_data_not_found(self, mock_get_s3_accessor):
         """騎手データが見つからない場合のテスト（404レスポンス）"""
-        mock_s3_accessor = MagicMock()
+        mock_s3_accessor = make_s3_accessor_mock()
         mock_s3_accessor.get_object.return_value = None
         mock_get_s3_accessor.return_value = mock_s3_accessor
 
@@ -91,7 +104,7 @@ class TestJockeyAPI:
     @patch("app.services.jockey_service.get_s3_accessor")
     def test_get_jockey_data_s3_error(self, mock_get_s3_accessor):
         """S3接続エラーのテスト（500レスポンス）"""
-        mock_s3_accessor = MagicMock()
+        mock_s3_accessor = make_s3_accessor_mock()
         mock_s3_accessor.get_object.side_effect = S3AccessError(
             "S3 connection failed",
             bucket="test-bucket",
@@ -113,7 +126,7 @@ class TestJockeyAPI:
     @patch("app.services.jockey_service.get_s3_accessor")
     def test_get_jockey_data_pickle_error(self, mock_get_s3_accessor):
         """pickleデシリアライズエラーのテスト（500レスポンス）"""
-        mock_s3_accessor = MagicMock()
+        mock_s3_accessor = make_s3_accessor_mock()
         # 破損したpickleデータを返す
         mock_s3_accessor.get_object.return_value = b"corrupted pickle data"
         mock_get_s3_accessor.return_value = mock_s3_accessor
@@ -156,3 +169,258 @@ class TestJockeyAPI:
         """API自動ドキュメントにアクセスできることを確認"""
         response = client.get("/docs")
         assert response.status_code == 200
+
+    @patch("app.services.jockey_service.get_s3_accessor")
+    def test_raw_response_mode_matches_model_mode(
+        self, mock_get_s3_accessor, real_pickle_data, monkeypatch
+    ):
+        """rawモードのレスポンスがmodelモードとバイト単位で一致することのテスト"""
+        mock_s3_accessor = make_s3_accessor_mock()
+        mock_s3_accessor.get_object.return_value = real_pickle_data
+        mock_get_s3_accessor.return_value = mock_s3_accessor
+
+        monkeypatch.setenv("JOCKEY_RESPONSE_MODE", "model")
+        model_response = client.get("/api/jockey/05339")
+        monkeypatch.setenv("JOCKEY_RESPONSE_MODE", "raw")
+        raw_response = client.get("/api/jockey/05339")
+
+        assert raw_response.status_code == 200
+        assert raw_response.headers["content-type"] == "application/json"
+        assert raw_response.content == model_response.content
+
+    def test_model_mode_encodes_outside_event_loop(self, s3_accessor, monkeypatch):
+        """modelモードのJSONエンコードがイベントループ外（スレッドプール）で行われることのテスト"""
+        monkeypatch.setenv("JOCKEY_RESPONSE_MODE", "model")
+        on_event_loop = []
+
+        def json_response(*args, **kwargs):
+            try:
+                asyncio.get_running_loop()
+                on_event_loop.append(True)
+            except RuntimeError:
+                on_event_loop.append(False)
+            return JSONResponse(*args, **kwargs)
+
+        with patch("app.api.jockey.JSONResponse", side_effect=json_response):
+            response = client.get("/api/jockey/05339", params={"limit": 2})
+
+        assert response.status_code == 200
+        assert len(response.json()) == 2
+        assert "X-Next-Cursor" in response.headers
+        assert on_event_loop == [False]
+
+    @patch("app.services.jockey_service.get_s3_accessor")
+    def test_raw_response_mode_uses_response_cache(
+        self, mock_get_s3_accessor, real_pickle_data, monkeypatch
+    ):
+        """rawモードの2回目のリクエストでJSON変換が省略されることのテスト"""
+        monkeypatch.setenv("JOCKEY_RESPONSE_MODE", "raw")
+        mock_s3_accessor = make_s3_accessor_mock()
+        mock_s3_accessor.get_object.return_value = real_pickle_data
+        mock_get_s3_accessor.return_value = mock_s3_accessor
+
+        with patch.object(
+            JockeyService, "dataframe_to_json_bytes", autospec=True,
+            side_effect=JockeyService.dataframe_to_json_bytes,
+        ) as mock_to_json:
+            first = client.get("/api/jockey/05339")
+            second = client.get("/api/jockey/05339")
+
+        assert first.content == second.content
+        assert mock_to_json.call_count == 1
+
+    @patch("app.services.jockey_service.get_s3_accessor")
+    def test_raw_response_mode_not_found(self, mock_get_s3_accessor, monkeypatch):
+        """rawモードでもデータが見つからない場合は404を返すことのテスト"""
+        monkeypatch.setenv("JOCKEY_RESPONSE_MODE", "raw")
+        mock_s3_accessor = make_s3_accessor_mock()
+        mock_s3_accessor.get_object.return_value = None
+        mock_get_s3_accessor.return_value = mock_s3_accessor
+
+        response = client.get("/api/jockey/99999")
+
+        assert response.status_code == 404
+        assert response.json()["jockey_id"] == "99999"
+
+    @patch("app.services.jockey_service.get_s3_accessor")
+    def test_stream_response_mode_matches_raw_mode(
+        self, mock_get_s3_accessor, real_pickle_data, monkeypatch
+    ):
+        """streamモードのレスポンスがrawモードとバイト単位で一致することのテスト"""
+        mock_s3_accessor = make_s3_accessor_mock()
+        mock_s3_accessor.get_object.return_value = real_pickle_data
+        mock_get_s3_accessor.return_value = mock_s3_accessor
+
+        raw_response = client.get("/api/jockey/05339")
+        monkeypatch.setenv("JOCKEY_RESPONSE_MODE", "stream")
+        monkeypatch.setenv("JOCKEY_STREAM_BATCH_ROWS", "2")
+        stream_response = client.get("/api/jockey/05339")
+
+        assert stream_response.status_code == 200
+        assert stream_response.headers["content-type"] == "application/json"
+        assert "content-length" not in stream_response.headers
+        assert stream_response.content == raw_response.content
+
+    @patch("app.services.jockey_service.get_s3_accessor")
+    def test_stream_response_mode_not_found(self, mock_get_s3_accessor, monkeypatch):
+        """streamモードでもデータが見つからない場合は送信開始前に404を返すことのテスト"""
+        monkeypatch.setenv("JOCKEY_RESPONSE_MODE", "stream")
+        mock_s3_accessor = make_s3_accessor_mock()
+        mock_s3_accessor.get_object.return_value = None
+        mock_get_s3_accessor.return_value = mock_s3_accessor
+
+        response = client.get("/api/jockey/99999")
+
+        assert response.status_code == 404
+        assert response.json()["jockey_id"] == "99999"
+
+    @pytest.mark.parametrize("response_mode", ["model", "raw", "stream"])
+    @patch("app.services.jockey_service.get_s3_accessor")
+    def test_get_jockey_data_with_query(
+        self, mock_get_s3_accessor, response_mode, real_pickle_data, monkeypatch
+    ):
+        """fields・from・to・filterパラメータが各モードで適用されることのテスト"""
+        monkeypatch.setenv("JOCKEY_RESPONSE_MODE", response_mode)
+        mock_s3_accessor = make_s3_accessor_mock()
+        mock_s3_accessor.get_object.return_value = real_pickle_data
+        mock_get_s3_accessor.return_value = mock_s3_accessor
+
+        response = client.get(
+            "/api/jockey/05339",
+            params={
+                "fields": "日付,着 順",
+                "from": "2025-09-01",
+                "to": "2025-09-30",
+                "filter": ["馬 場:良"],
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) > 0
+        for record in data:
+            assert list(record) == ["日付", "着 順"]
+            assert "2025-09-01" <= record["日付"][:10] <= "2025-09-30"
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"fields": "存在しない列"},
+            {"filter": "開催"},
+            {"filter": "着 順:一着"},
+            {"from": "2025-10-01", "to": "2025-09-01"},
+        ],
+    )
+    @patch("app.services.jockey_service.get_s3_accessor")
+    def test_get_jockey_data_invalid_query(
+        self, mock_get_s3_accessor, params, real_pickle_data
+    ):
+        """不正なクエリパラメータで400を返すことのテスト"""
+        mock_s3_accessor = make_s3_accessor_mock()
+        mock_s3_accessor.get_object.return_value = real_pickle_data
+        mock_get_s3_accessor.return_value = mock_s3_accessor
+
+        response = client.get("/api/jockey/05339", params=params)
+
+        assert response.status_code == 400
+        assert response.json()["error"] == "Bad Request"
+
+    @pytest.mark.parametrize("response_mode", ["model", "raw", "stream"])
+    @patch("app.services.jockey_service.get_s3_accessor")
+    def test_get_jockey_data_pagination(
+        self, mock_get_s3_accessor, response_mode, real_pickle_data, monkeypatch
+    ):
+        """limit・cursorで全行を日付の降順にページ分割して取得できることのテスト"""
+        monkeypatch.setenv("JOCKEY_RESPONSE_MODE", response_mode)
+        mock_s3_accessor = make_s3_accessor_mock()
+        mock_s3_accessor.get_object.return_value = real_pickle_data
+        mock_get_s3_accessor.return_value = mock_s3_accessor
+        all_records = client.get("/api/jockey/05339").json()
+
+        pages = []
+        params = {"limit": 2, "fields": "日付,R"}
+        while True:
+            response = client.get("/api/jockey/05339", params=params)
+            assert response.status_code == 200
+            pages.append(response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+            params["cursor"] = cursor
+
+        records = sum(pages, [])
+        assert all(len(page) == 2 for page in pages[:-1])
+        assert len(records) == len(all_records)
+        keys = [(record["日付"], record["R"]) for record in records]
+        assert keys == sorted(keys, reverse=True)
+
+    @pytest.mark.parametrize("params", [{"limit": 0}, {"limit": 2, "cursor": "%%%"}])
+    @patch("app.services.jockey_service.get_s3_accessor")
+    def test_get_jockey_data_invalid_pagination(
+        self, mock_get_s3_accessor, params, real_pickle_data
+    ):
+        """不正なlimit・cursorで400を返すことのテスト"""
+        mock_s3_accessor = make_s3_accessor_mock()
+        mock_s3_accessor.get_object.return_value = real_pickle_data
+        mock_get_s3_accessor.return_value = mock_s3_accessor
+
+        response = client.get("/api/jockey/05339", params=params)
+
+        assert response.status_code == 400
+
+    @patch("app.services.jockey_service.get_s3_accessor")
+    def test_batch_reports_errors_per_id(self, mock_get_s3_accessor, real_pickle_data):
+        """一括取得で見つからない騎手IDのみがerrorsに含まれることのテスト"""
+        mock_s3_accessor = make_s3_accessor_mock()
+        mock_s3_accessor.get_object.side_effect = (
+            lambda key: None if key.startswith("99999") else real_pickle_data
+        )
+        mock_get_s3_accessor.return_value = mock_s3_accessor
+        single = client.get("/api/jockey/05339", params={"fields": "日付,着 順"})
+
+        response = client.post(
+            "/api/jockeys:batch",
+            params={"fields": "日付,着 順"},
+            json={"ids": ["05339", "99999", "01170", "05339"]},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert list(data["results"]) == ["05339", "01170"]
+        assert data["results"]["05339"] == single.json()
+        assert data["errors"] == {
+            "99999": {
+                "status": 404,
+                "error": "Not Found",
+                "message": "Jockey with ID '99999' not found",
+            }
+        }
+
+    @patch("app.services.jockey_service.get_s3_accessor")
+    def test_batch_s3_error_does_not_fail_batch(
+        self, mock_get_s3_accessor, real_pickle_data
+    ):
+        """一括取得で一部の騎手のS3エラーがバッチ全体を失敗させないことのテスト"""
+        mock_s3_accessor = make_s3_accessor_mock()
+
+        def get_object(key):
+            if key.startswith("01170"):
+                raise S3AccessError("S3 connection failed")
+            return real_pickle_data
+
+        mock_s3_accessor.get_object.side_effect = get_object
+        mock_get_s3_accessor.return_value = mock_s3_accessor
+
+        response = client.post("/api/jockeys:batch", json={"ids": ["05339", "01170"]})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert list(data["results"]) == ["05339"]
+        assert data["errors"]["01170"]["status"] == 500
+
+    @pytest.mark.parametrize("payload", [{"ids": []}, {"ids": ["1"] * 51}, {}])
+    def test_batch_invalid_request(self, payload):
+        """一括取得のリクエストボディが不正な場合に422を返すことのテスト"""
+        response = client.post("/api/jockeys:batch", json=payload)
+
+        assert response.status_code == 422
@@ -0,0 +1,357 @@
+"""
+Async S3 Access Tests
+
+ローカルのS3スタブサーバーを使用して、S3Accessorの非同期メソッドと
+非同期アクセス方式（JOCKEY_S3_ACCESS_MODE=async）のAPI、
+ETag・If-None-Matchによる条件付きリクエストをテストします。
+"""
+
+import asyncio
+import hashlib
+import os
+import pickle
+import time
+from io import BytesIO
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+from fastapi.testclient import TestClient
+
+from app.infrastructure.dependencies import reset_jockey_cache, reset_response_cache
+from app.infrastructure.s3_accessor import S3Accessor
+from app.main import app
+from tests.s3_stub import StubS3Server
+
+pytest.importorskip("aiobotocore")
+
+BUCKET = "jockey-data"
+
+S3_CONFIG_ENV = {
+    "S3_ACCESS_KEY_ID": "test-access-key",
+    "S3_SECRET_ACCESS_KEY": "test-secret-key",
+    "S3_REGION_NAME": "ap-northeast-1",
+    "S3_BUCKET_NAME": BUCKET,
+}
+
+
+@pytest.fixture
+def real_pickle_data():
+    """実際のpickleファイルを読み込むフィクスチャ"""
+    pickle_path = os.path.join(os.path.dirname(__file__), "test_data.pickle")
+    with open(pickle_path, "rb") as f:
+        return f.read()
+
+
+@pytest.fixture
+def s3_stub(real_pickle_data):
+    """騎手データを登録したS3スタブサーバーを起動するフィクスチャ"""
+    server = StubS3Server().start()
+    server.put(BUCKET, "05339.pickle", real_pickle_data)
+    server.put(BUCKET, "01170.pickle", real_pickle_data)
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def s3_accessor(s3_stub, monkeypatch):
+    """S3スタブサーバーに接続するS3Accessorを生成するフィクスチャ"""
+    monkeypatch.setenv("S3_ENDPOINT_URL", s3_stub.endpoint_url)
+    for name, value in S3_CONFIG_ENV.items():
+        monkeypatch.setenv(name, value)
+    return S3Accessor()
+
+
+class TestS3AccessorAsync:
+    """S3Accessorの非同期メソッドのテストクラス"""
+
+    def test_get_object_async(self, s3_accessor, real_pickle_data):
+        """非同期取得の結果が同期取得と一致し、存在しないキーはNoneとなることのテスト"""
+
+        async def fetch():
+            try:
+                return (
+                    await s3_accessor.get_object_async("05339.pickle"),
+                    await s3_accessor.get_object_async("99999.pickle"),
+                )
+            finally:
+                await s3_accessor.aclose()
+
+        data, missing = asyncio.run(fetch())
+
+        assert data == real_pickle_data
+        assert data == s3_accessor.get_object("05339.pickle")
+        assert missing is None
+
+    def test_body_read_into_preallocated_buffer(self, s3_stub, s3_accessor, monkeypatch):
+        """同期・非同期ともにContentLengthの大きさのバッファへ分割して読み込まれることのテスト"""
+        monkeypatch.setattr("app.infrastructure.s3_accessor.READ_CHUNK_BYTES", 1000)
+        payload = os.urandom(10_500)
+        s3_stub.put(BUCKET, "large.pickle", payload)
+
+        async def fetch():
+            try:
+                return await s3_accessor.get_object_async("large.pickle")
+            finally:
+                await s3_accessor.aclose()
+
+        sync_data = s3_accessor.get_object("large.pickle")
+        async_data = asyncio.run(fetch())
+
+        assert isinstance(sync_data, bytearray)
+        assert isinstance(async_data, bytearray)
+        assert sync_data == async_data == payload
+        stats = s3_accessor.read_stats()
+        assert stats["preallocated_requests"] == 2
+        assert stats["allocated_bytes_per_request"] == len(payload)
+
+    def test_list_objects_async(self, s3_accessor):
+        """非同期のオブジェクト一覧取得のテスト"""
+
+        async def list_keys():
+            try:
+                return await s3_accessor.list_objects_async("0")
+            finally:
+                await s3_accessor.aclose()
+
+        objects = asyncio.run(list_keys())
+
+        assert [obj["Key"] for obj in objects] == ["01170.pickle", "05339.pickle"]
+
+
+class TestAsyncAccessMode:
+    """非同期アクセス方式のAPIのテストクラス"""
+
+    @pytest.mark.parametrize("response_mode", ["model", "raw", "stream"])
+    def test_async_mode_matches_sync_mode(self, s3_accessor, response_mode, monkeypatch):
+        """非同期アクセス方式のレスポンスが同期アクセス方式と一致することのテスト"""
+        monkeypatch.setenv("JOCKEY_RESPONSE_MODE", response_mode)
+
+        with patch("app.services.jockey_service.get_s3_accessor", return_value=s3_accessor):
+            with TestClient(app) as client:
+                monkeypatch.setenv("JOCKEY_S3_ACCESS_MODE", "sync")
+                sync_response = client.get("/api/jockey/05339", params={"limit": 3})
+                # 非同期アクセス方式でS3から取得させるためにキャッシュを空にする
+                reset_jockey_cache()
+                reset_response_cache()
+                monkeypatch.setenv("JOCKEY_S3_ACCESS_MODE", "async")
+                async_response = client.get("/api/jockey/05339", params={"limit": 3})
+                not_found = client.get("/api/jockey/99999")
+                client.portal.call(s3_accessor.aclose)
+
+        assert async_response.status_code == 200
+        assert async_response.content == sync_response.content
+        assert async_response.headers["x-next-cursor"] == sync_response.headers["x-next-cursor"]
+        assert not_found.status_code == 404
+
+    def test_async_batch(self, s3_accessor, monkeypatch):
+        """非同期アクセス方式の一括取得で騎手ごとの結果とエラーが返却されることのテスト"""
+        monkeypatch.setenv("JOCKEY_S3_ACCESS_MODE", "async")
+
+        with patch("app.services.jockey_service.get_s3_accessor", return_value=s3_accessor):
+            with TestClient(app) as client:
+                response = client.post(
+                    "/api/jockeys:batch", json={"ids": ["05339", "99999", "01170"]}
+                )
+                client.portal.call(s3_accessor.aclose)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert list(data["results"]) == ["05339", "01170"]
+        assert data["errors"]["99999"]["status"] == 404
+
+
+@pytest.mark.parametrize("access_mode", ["sync", "async"])
+class TestConditionalGet:
+    """ETag・If-None-Matchによる条件付きリクエストのテストクラス"""
+
+    def _get(self, s3_accessor, *requests):
+        """TestClientで順にGETリクエストを送信（各要素は (パス, ヘッダー) か呼び出し可能オブジェクト）"""
+        responses = []
+        with patch("app.services.jockey_service.get_s3_accessor", return_value=s3_accessor):
+            with TestClient(app) as client:
+                for request in requests:
+                    if callable(request):
+                        request()
+                    else:
+                        path, headers = request
+                        responses.append(client.get(path, headers=headers))
+                client.portal.call(s3_accessor.aclose)
+        return responses
+
+    def test_not_modified_from_cache(self, s3_stub, s3_accessor, access_mode, monkeypatch):
+        """ETag・Last-Modified・Cache-Controlを返し、一致するIf-None-MatchにS3へアクセスせず304を返すことのテスト"""
+        monkeypatch.setenv("JOCKEY_S3_ACCESS_MODE", access_mode)
+        first, = self._get(s3_accessor, ("/api/jockey/05339", {}))
+        etag = first.headers["etag"]
+        requests_before = s3_stub.request_count
+
+        second, third = self._get(
+            s3_accessor,
+            ("/api/jockey/05339", {"If-None-Match": etag}),
+            ("/api/jockey/05339", {"If-None-Match": "\"stale\""}),
+        )
+
+        assert first.status_code == 200
+        assert etag == f"\"{hashlib.md5(s3_stub.objects[(BUCKET, '05339.pickle')]).hexdigest()}\""
+        assert first.headers["last-modified"] == s3_stub.last_modified[(BUCKET, "05339.pickle")]
+        assert first.headers["cache-control"] == "public, no-cache"
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == etag
+        assert third.status_code == 200
+        assert third.content == first.content
+        assert s3_stub.request_count == requests_before
+
+    def test_not_modified_from_s3_conditional_get(
+        self, s3_stub, s3_accessor, access_mode, monkeypatch
+    ):
+        """キャッシュにない場合はS3の条件付き取得で304を判定することのテスト"""
+        monkeypatch.setenv("JOCKEY_S3_ACCESS_MODE", access_mode)
+        etag = self._get(s3_accessor, ("/api/jockey/05339", {}))[0].headers["etag"]
+        reset_jockey_cache()
+        reset_response_cache()
+
+        response, = self._get(s3_accessor, ("/api/jockey/05339", {"If-None-Match": f"W/{etag}"}))
+
+        assert response.status_code == 304
+        assert s3_stub.not_modified_count == 1
+
+    def test_expired_cache_is_revalidated(
+        self, s3_stub, s3_accessor, real_pickle_data, access_mode, monkeypatch
+    ):
+        """期限切れのキャッシュがS3の条件付き取得で再検証され、変更後は新しいデータを返すことのテスト"""
+        monkeypatch.setenv("JOCKEY_S3_ACCESS_MODE", access_mode)
+        monkeypatch.setenv("JOCKEY_CACHE_TTL_SECONDS", "0.05")
+        monkeypatch.setenv("JOCKEY_RESPONSE_CACHE_TTL_SECONDS", "0.05")
+        updated = pickle.dumps(pickle.loads(real_pickle_data).head(2))
+
+        first, revalidated, changed = self._get(
+            s3_accessor,
+            ("/api/jockey/05339", {}),
+            lambda: time.sleep(0.1),
+            ("/api/jockey/05339", {}),
+            lambda: (time.sleep(0.1), s3_stub.put(BUCKET, "05339.pickle", updated)),
+            ("/api/jockey/05339", {}),
+        )
+
+        assert revalidated.content == first.content
+        assert revalidated.headers["etag"] == first.headers["etag"]
+        assert s3_stub.not_modified_count == 1
+        assert len(changed.json()) == 2
+        assert changed.headers["etag"] != first.headers["etag"]
+
+
+@pytest.mark.parametrize("access_mode", ["sync", "async"])
+class TestMultipartDownload:
+    """Range取得による大きなオブジェクトの並行ダウンロードのテストクラス"""
+
+    @pytest.fixture
+    def multipart_accessor(self, s3_stub, monkeypatch):
+        """閾値・パートを64KiBとしたS3Accessorを生成するフィクスチャ"""
+        monkeypatch.setenv("S3_ENDPOINT_URL", s3_stub.endpoint_url)
+        monkeypatch.setenv("S3_MULTIPART_THRESHOLD_BYTES", "65536")
+        monkeypatch.setenv("S3_MULTIPART_PART_BYTES", "65536")
+        monkeypatch.setenv("S3_MULTIPART_CONCURRENCY", "3")
+        for name, value in S3_CONFIG_ENV.items():
+            monkeypatch.setenv(name, value)
+        return S3Accessor()
+
+    def _get(self, accessor, access_mode, key):
+        if access_mode == "sync":
+            return accessor.get_object(key)
+
+        async def fetch():
+            try:
+                return await accessor.get_object_async(key)
+            finally:
+                await accessor.aclose()
+
+        return asyncio.run(fetch())
+
+    def test_large_object_is_assembled_from_parts(self, s3_stub, multipart_accessor, access_mode):
+        """閾値を超えるオブジェクトがパートごとのRange取得で1つのバッファに組み立てられることのテスト"""
+        payload = os.urandom(300_000)
+        s3_stub.put(BUCKET, "large.pickle", payload)
+
+        data = self._get(multipart_accessor, access_mode, "large.pickle")
+
+        assert isinstance(data, bytearray)
+        assert data == payload
+        # 先頭の64KiB + 残りの4パート
+        assert s3_stub.range_request_count == 5
+        assert multipart_accessor.pool_stats()["requests"] == 5
+
+    def test_small_and_empty_objects(self, s3_stub, multipart_accessor, access_mode):
+        """閾値以下のオブジェクトは1回の取得で、空のオブジェクトは通常の取得で読み込まれることのテスト"""
+        s3_stub.put(BUCKET, "empty.pickle", b"")
+
+        small = self._get(multipart_accessor, access_mode, "05339.pickle")
+        empty = self._get(multipart_accessor, access_mode, "empty.pickle")
+
+        assert small == s3_stub.objects[(BUCKET, "05339.pickle")]
+        assert empty == b""
+        # 空のオブジェクトはRange取得（416）の後に通常の取得を行う
+        assert s3_stub.range_request_count == 2
+        assert multipart_accessor.pool_stats()["requests"] == 3
+
+
+class FakeAsyncBody:
+    """aiobotocoreのStreamingBodyの代わりにメモリ上のデータを返すボディ"""
+
+    def __init__(self, data):
+        self._stream = BytesIO(data)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def readinto(self, view):
+        return self._stream.readinto(view)
+
+
+class TestMultipartFailure:
+    """非同期のRange取得でパートの取得に失敗した場合のテストクラス"""
+
+    def test_failed_part_cancels_other_parts(self, s3_stub, monkeypatch):
+        """1つのパートの取得に失敗すると、取得中の他のパートがキャンセルされることのテスト"""
+        monkeypatch.setenv("S3_ENDPOINT_URL", s3_stub.endpoint_url)
+        monkeypatch.setenv("S3_MULTIPART_THRESHOLD_BYTES", "65536")
+        monkeypatch.setenv("S3_MULTIPART_PART_BYTES", "65536")
+        monkeypatch.setenv("S3_MULTIPART_CONCURRENCY", "3")
+        for name, value in S3_CONFIG_ENV.items():
+            monkeypatch.setenv(name, value)
+        accessor = S3Accessor()
+        cancelled = []
+
+        async def get_object(**request):
+            start = int(request["Range"].split("=")[1].split("-")[0])
+            if start == 0:
+                return {
+                    "Body": FakeAsyncBody(b"x" * 65536),
+                    "ContentLength": 65536,
+                    "ContentRange": "bytes 0-65535/327680",
+                    "ETag": "\"v1\"",
+                }
+            if start == 65536:
+                raise ClientError({"Error": {"Code": "PreconditionFailed"}}, "GetObject")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(start)
+                raise
+
+        client = MagicMock()
+        client.get_object.side_effect = get_object
+        request = {"Bucket": BUCKET, "Key": "large.pickle"}
+
+        started = time.monotonic()
+        with pytest.raises(ClientError):
+            asyncio.run(accessor._get_object_body_async(client, request))
+
+        assert time.monotonic() - started < 5
+        # 失敗したパートの取得中に開始されていたパート（セマフォの解放後に開始したパートを含む）
+        assert {131072, 196608} <= set(cancelled)
+        assert accessor.pool_stats()["in_flight"] == 0
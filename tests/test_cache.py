@@ -0,0 +1,202 @@
+"""
+TTLCache Unit Tests
+
+プロセス内キャッシュの上限・TTL・統計・同時ミス制御をテストします。
+"""
+
+import threading
+import time
+
+import pytest
+
+from app.core.cache import TTLCache
+
+
+class FakeClock:
+    """テスト用の手動で進める時計"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_cache(max_entries=10, max_bytes=0, ttl_seconds=0, clock=None):
+    return TTLCache(
+        max_entries=max_entries,
+        max_bytes=max_bytes,
+        ttl_seconds=ttl_seconds,
+        sizeof=len,
+        clock=clock or time.monotonic,
+    )
+
+
+class TestTTLCache:
+    """TTLCacheのテストクラス"""
+
+    def test_get_put_and_stats(self):
+        """格納した値の取得とヒット/ミス統計のテスト"""
+        cache = make_cache()
+
+        assert cache.get("a") is None
+        cache.put("a", b"xyz")
+        assert cache.get("a") == b"xyz"
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+        assert stats["total_bytes"] == 3
+
+    def test_evicts_least_recently_used_by_entry_count(self):
+        """最大エントリ数を超えた場合にLRU順で削除されることのテスト"""
+        cache = make_cache(max_entries=2)
+        cache.put("a", b"1")
+        cache.put("b", b"2")
+        cache.get("a")
+        cache.put("c", b"3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == b"1"
+        assert cache.get("c") == b"3"
+        assert cache.stats()["evictions"] == 1
+
+    def test_evicts_by_total_bytes(self):
+        """最大合計バイト数を超えた場合に削除されることのテスト"""
+        cache = make_cache(max_bytes=10)
+        cache.put("a", b"x" * 6)
+        cache.put("b", b"x" * 6)
+
+        assert cache.get("a") is None
+        assert cache.get("b") is not None
+        assert cache.stats()["total_bytes"] == 6
+
+    def test_value_larger_than_budget_is_not_cached(self):
+        """最大合計バイト数を超える単一の値は格納されないことのテスト"""
+        cache = make_cache(max_bytes=4)
+        cache.put("a", b"x" * 5)
+
+        assert len(cache) == 0
+
+    def test_entries_expire_after_ttl(self):
+        """TTL経過後のエントリがミスとして扱われることのテスト"""
+        clock = FakeClock()
+        cache = make_cache(ttl_seconds=10, clock=clock)
+        cache.put("a", b"1")
+
+        clock.now = 9.9
+        assert cache.get("a") == b"1"
+        clock.now = 10.0
+        assert cache.get("a") is None
+        assert cache.stats()["expirations"] == 1
+
+    def test_disabled_cache_always_calls_loader(self):
+        """max_entries=0の場合はキャッシュせずに毎回loaderを呼ぶことのテスト"""
+        cache = make_cache(max_entries=0)
+        calls = []
+
+        for _ in range(3):
+            cache.get_or_load("a", lambda: calls.append(1) or b"v")
+
+        assert len(calls) == 3
+        assert len(cache) == 0
+
+    def test_concurrent_misses_share_single_load(self):
+        """同一キーへの同時ミスでloaderが1回のみ実行されることのテスト"""
+        cache = make_cache()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            started.set()
+            release.wait(timeout=5)
+            return b"value"
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_or_load("a", loader)))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        started.wait(timeout=5)
+        release.set()
+        for t in threads:
+            t.join(timeout=5)
+
+        assert len(calls) == 1
+        assert results == [b"value"] * 8
+
+    def test_concurrent_misses_share_load_error(self):
+        """loaderの例外が待機中の呼び出しにも共有され、キャッシュされないことのテスト"""
+        cache = make_cache()
+        started = threading.Event()
+        release = threading.Event()
+
+        def loader():
+            started.set()
+            release.wait(timeout=5)
+            raise ValueError("boom")
+
+        errors = []
+
+        def call():
+            try:
+                cache.get_or_load("a", loader)
+            except ValueError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call) for _ in range(4)]
+        for t in threads:
+            t.start()
+        started.wait(timeout=5)
+        release.set()
+        for t in threads:
+            t.join(timeout=5)
+
+        assert len(errors) == 4
+        assert len(cache) == 0
+        with pytest.raises(ValueError):
+            cache.get_or_load("a", loader)
+
+    def test_expired_entry_is_revalidated(self):
+        """期限切れのエントリがloaderではなくrevalidateで検証され、変更がなければ延長されることのテスト"""
+        clock = FakeClock()
+        cache = make_cache(ttl_seconds=10, clock=clock)
+        value = b"v1"
+        cache.put("a", value)
+        loads = []
+
+        def loader():
+            loads.append(1)
+            return b"v2"
+
+        clock.now = 10.0
+        assert cache.get_or_load("a", loader, revalidate=lambda stale: stale) is value
+        assert loads == []
+        assert cache.stats()["revalidations"] == 1
+
+        # 延長された有効期限内はrevalidateも呼ばれない
+        clock.now = 19.9
+        assert cache.get_or_load("a", loader, revalidate=lambda stale: b"changed") is value
+
+        clock.now = 20.0
+        assert cache.get_or_load("a", loader, revalidate=lambda stale: b"changed") == b"changed"
+        assert cache.get("a") == b"changed"
+        assert cache.stats()["revalidations"] == 1
+
+    def test_peek_and_get_stale(self):
+        """peekは有効な値のみ、get_staleは期限切れの値も統計を更新せずに返すことのテスト"""
+        clock = FakeClock()
+        cache = make_cache(ttl_seconds=10, clock=clock)
+        cache.put("a", b"1")
+
+        assert cache.peek("a") == b"1"
+        clock.now = 10.0
+        assert cache.peek("a") is None
+        assert cache.get_stale("a") == b"1"
+        assert cache.stats()["hits"] == 0
+        assert cache.stats()["misses"] == 0
@@ -0,0 +1,90 @@
+"""
+Date Index Unit Tests
+
+日付・レース番号の降順インデックスとカーソルによるページ分割をテストします。
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.models.exceptions import InvalidQueryError
+from app.services.date_index import DateIndex, get_date_index
+
+
+@pytest.fixture
+def race_dataframe():
+    """日付・レース番号が重複を含む順不同のDataFrameを生成するフィクスチャ"""
+    return pd.DataFrame(
+        {
+            "日付": pd.to_datetime(
+                ["2025-09-28", "2025-10-02", "2025-09-28", None, "2025-09-28", "2025-09-01"]
+            ),
+            "R": [3, 1, 11, 5, 3, 7],
+            "開催": ["中山", "船橋", "中山", "中山", "中山", "船橋"],
+        }
+    )
+
+
+def collect_pages(index, limit, mask=None):
+    """カーソルを辿って全ページの行位置を連結"""
+    positions, cursor = index.page(limit, mask=mask)
+    pages = [positions.tolist()]
+    while cursor is not None:
+        positions, cursor = index.page(limit, cursor, mask)
+        pages.append(positions.tolist())
+    return pages
+
+
+class TestDateIndex:
+    """DateIndexのテストクラス"""
+
+    def test_order_is_date_then_race_descending(self, race_dataframe):
+        """日付・レース番号の降順（日付欠損は末尾、同一キーは元の順）に並ぶことのテスト"""
+        index = DateIndex(race_dataframe)
+
+        assert index.order.tolist() == [1, 2, 0, 4, 5, 3]
+
+    @pytest.mark.parametrize("limit", [1, 2, 4, 6, 10])
+    def test_pages_cover_all_rows(self, race_dataframe, limit):
+        """カーソルを辿ると全行が重複・欠落なく返却されることのテスト"""
+        index = DateIndex(race_dataframe)
+
+        pages = collect_pages(index, limit)
+
+        assert sum(pages, []) == index.order.tolist()
+        assert all(len(page) == limit for page in pages[:-1])
+
+    def test_pages_with_mask(self, race_dataframe):
+        """行フィルタのマスクを指定した場合に一致する行のみを返却することのテスト"""
+        index = DateIndex(race_dataframe)
+        mask = (race_dataframe["開催"] == "中山").to_numpy()
+
+        pages = collect_pages(index, 2, mask)
+
+        assert pages == [[2, 0], [4, 3]]
+
+    def test_last_page_has_no_cursor(self, race_dataframe):
+        """最終ページでは次ページのカーソルがNoneとなることのテスト"""
+        positions, cursor = DateIndex(race_dataframe).page(len(race_dataframe))
+
+        assert len(positions) == len(race_dataframe)
+        assert cursor is None
+
+    def test_invalid_cursor_raises(self, race_dataframe):
+        """不正なカーソルでInvalidQueryErrorが発生することのテスト"""
+        with pytest.raises(InvalidQueryError):
+            DateIndex(race_dataframe).page(2, "not-a-cursor")
+
+    def test_missing_columns_raises(self):
+        """日付列・レース番号列がない場合にInvalidQueryErrorが発生することのテスト"""
+        with pytest.raises(InvalidQueryError):
+            DateIndex(pd.DataFrame({"日付": pd.to_datetime(["2025-09-28"])}))
+
+    def test_index_is_built_once_per_dataframe(self, race_dataframe):
+        """同一のDataFrameに対してはインデックスを再利用することのテスト"""
+        index = get_date_index(race_dataframe)
+
+        assert get_date_index(race_dataframe) is index
+        assert get_date_index(race_dataframe.copy()) is not index
+        assert np.array_equal(index.order, DateIndex(race_dataframe).order)
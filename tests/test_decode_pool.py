@@ -0,0 +1,129 @@
+"""
+Decode Pool Tests
+
+大きな騎手データのデコード・エンコードのプロセスプールへのオフロードをテストします。
+"""
+
+import asyncio
+import copy
+import os
+import pickle
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.core.timing import end_request_timings, start_request_timings
+from app.infrastructure.s3_accessor import S3Object
+from app.models.exceptions import (
+    InvalidQueryError,
+    JockeyNotFoundError,
+    PickleDeserializeError,
+    S3AccessError,
+    SSMConfigError,
+)
+from app.models.query import JockeyQuery
+from app.services.decode_pool import get_decode_pool, shutdown_decode_pool
+from app.services.jockey_service import JockeyService
+
+SHM_DIR = "/dev/shm"
+
+
+@pytest.fixture
+def decode_pool(monkeypatch):
+    """すべてのオブジェクトをオフロードするプロセスプールを有効にするフィクスチャ"""
+    monkeypatch.setenv("JOCKEY_DECODE_POOL_WORKERS", "1")
+    monkeypatch.setenv("JOCKEY_DECODE_POOL_THRESHOLD_BYTES", "1")
+    shutdown_decode_pool()
+    yield get_decode_pool()
+    shutdown_decode_pool()
+
+
+@pytest.fixture
+def service(s3_accessor, pickle_data):
+    """実際のpickleファイルを返すS3Accessorのモックを使用するJockeyService"""
+    s3_accessor.get_object_with_metadata_async = AsyncMock(
+        side_effect=lambda key, if_none_match=None: S3Object(pickle_data)
+    )
+    return JockeyService()
+
+
+def shared_memory_segments():
+    """/dev/shm の共有メモリの一覧（Linux以外では空）"""
+    return set(os.listdir(SHM_DIR)) if os.path.isdir(SHM_DIR) else set()
+
+
+class TestDecodePool:
+    """プロセスプールへのオフロードのテストクラス"""
+
+    def test_offloaded_body_matches_in_process(self, service, decode_pool):
+        """オフロードしたエンコード結果がプロセス内の結果と一致し、DataFrameはキャッシュされないことのテスト"""
+        query = JockeyQuery(fields=("日付", "着 順"), limit=5)
+        before = shared_memory_segments()
+        timings, token = start_request_timings()
+        try:
+            offloaded = service.get_jockey_page_json("05339", query)
+        finally:
+            end_request_timings(token)
+
+        assert {"s3", "offload"} <= set(timings.stages())
+        assert "deserialize" not in timings.stages()
+        assert len(service.cache) == 0
+        expected = service._encode_page(service.get_jockey_page("05339", query), "05339")
+        assert offloaded == expected
+        assert shared_memory_segments() <= before
+
+    def test_small_objects_stay_in_process(self, service, decode_pool, pickle_data):
+        """閾値未満のオブジェクトはプロセス内でデコードしてキャッシュすることのテスト"""
+        decode_pool.threshold_bytes = len(pickle_data) + 1
+
+        service.get_jockey_data_json("05339")
+
+        assert len(service.cache) == 1
+
+    def test_worker_errors_are_raised(self, service, decode_pool):
+        """ワーカーで発生した例外が呼び出し元で同じ型として送出されることのテスト"""
+        with pytest.raises(InvalidQueryError, match="no_such_column"):
+            service.get_jockey_page_json("05339", JockeyQuery(fields=("no_such_column",)))
+
+        service.s3_accessor.get_object.return_value = b"not a pickle"
+        with pytest.raises(PickleDeserializeError) as exc_info:
+            service.get_jockey_data_json("01170")
+        assert exc_info.value.jockey_id == "01170"
+
+    def test_async_offload(self, service, decode_pool):
+        """非同期版でもオフロードした結果が返却されることのテスト"""
+        encoded = asyncio.run(service.get_jockey_page_json_async("05339"))
+
+        assert encoded.body == service.get_jockey_data_json("05339")
+        assert len(service.cache) == 0
+
+    def test_disabled_by_default(self, monkeypatch):
+        """JOCKEY_DECODE_POOL_WORKERS が未設定の場合は無効であることのテスト"""
+        monkeypatch.delenv("JOCKEY_DECODE_POOL_WORKERS", raising=False)
+        shutdown_decode_pool()
+
+        assert get_decode_pool() is None
+
+
+class TestExceptionPickling:
+    """プロセス間で受け渡す例外のテストクラス"""
+
+    def test_round_trip(self):
+        """騎手IDを引数に取る例外がpickle化の前後で同じ属性・メッセージとなることのテスト"""
+        not_found = pickle.loads(pickle.dumps(JockeyNotFoundError("05339")))
+        deserialize = pickle.loads(
+            pickle.dumps(PickleDeserializeError("05339", ValueError("broken")))
+        )
+
+        assert (not_found.jockey_id, str(not_found)) == ("05339", "Jockey with ID '05339' not found")
+        assert deserialize.jockey_id == "05339"
+        assert str(deserialize) == "Failed to deserialize data for jockey 05339: broken"
+
+    def test_copy_keeps_attributes(self):
+        """メッセージを組み立てる例外・追加の属性を持つ例外が複製の前後で同じ属性・メッセージとなることのテスト"""
+        ssm = copy.copy(SSMConfigError("/jockey/bucket", ValueError("boom")))
+        s3 = copy.copy(S3AccessError("S3 error", bucket="bucket", key="05339.pickle"))
+
+        assert str(ssm) == "Failed to retrieve SSM parameter '/jockey/bucket': boom"
+        assert ssm.parameter_name == "/jockey/bucket"
+        assert (str(s3), s3.bucket, s3.key) == ("S3 error", "bucket", "05339.pickle")
@@ -0,0 +1,222 @@
+"""
+Disk Cache Tests
+
+S3オブジェクトのディスクキャッシュの読み書き・LRU削除と、
+S3Accessorからの利用（ローカルのS3スタブサーバーを使用）をテストします。
+"""
+
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from app.infrastructure.disk_cache import DiskCache, build_disk_cache, release_mapped_data
+from app.infrastructure.s3_accessor import S3Accessor
+from tests.s3_stub import StubS3Server
+
+BUCKET = "jockey-data"
+
+S3_CONFIG_ENV = {
+    "S3_ACCESS_KEY_ID": "test-access-key",
+    "S3_SECRET_ACCESS_KEY": "test-secret-key",
+    "S3_REGION_NAME": "ap-northeast-1",
+    "S3_BUCKET_NAME": BUCKET,
+}
+
+
+def cache_files(directory):
+    """キャッシュディレクトリ内のエントリファイルの一覧"""
+    return sorted(
+        os.path.join(root, name)
+        for root, _, names in os.walk(directory)
+        for name in names
+        if name.endswith(".obj")
+    )
+
+
+class TestDiskCache:
+    """DiskCacheのテストクラス"""
+
+    def test_put_and_get(self, tmp_path):
+        """保存したオブジェクトがETag・最終更新日時とともに読み込まれることのテスト"""
+        cache = DiskCache(str(tmp_path), max_bytes=1024 * 1024)
+        last_modified = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+        assert cache.get("bucket/a.pickle") is None
+        cache.put("bucket/a.pickle", "\"v1\"", last_modified, b"data-v1")
+        entry = cache.get("bucket/a.pickle")
+
+        assert isinstance(entry.data, bytearray)
+        assert entry.data == b"data-v1"
+        assert entry.etag == "\"v1\""
+        assert entry.last_modified == last_modified
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_new_etag_replaces_old_version(self, tmp_path):
+        """同じキーの新しいETagを保存すると古いファイルが削除されることのテスト"""
+        cache = DiskCache(str(tmp_path), max_bytes=1024 * 1024)
+        cache.put("bucket/a.pickle", "\"v1\"", None, b"data-v1")
+        old_entry = cache.get("bucket/a.pickle")
+
+        cache.put("bucket/a.pickle", "\"v2\"", None, b"data-v2")
+
+        assert len(cache_files(tmp_path)) == 1
+        assert cache.get("bucket/a.pickle").data == b"data-v2"
+        # 読み込み済みのデータは削除後も参照できる
+        assert old_entry.data == b"data-v1"
+
+    def test_large_object_is_mapped_and_released(self, tmp_path):
+        """mmap_min_bytes 以上のオブジェクトはmmapで読み込まれ、release_mapped_data で閉じられることのテスト"""
+        cache = DiskCache(str(tmp_path), max_bytes=1024 * 1024, mmap_min_bytes=100)
+        cache.put("bucket/a", "\"a\"", None, b"a" * 100)
+        entry = cache.get("bucket/a")
+
+        assert isinstance(entry.data, memoryview)
+        assert entry.data == b"a" * 100
+        mapped = entry.data.obj
+
+        release_mapped_data(entry.data)
+
+        assert mapped.closed
+        # 解放済みのデータ・mmap以外のデータでは何もしない
+        release_mapped_data(entry.data)
+        release_mapped_data(bytearray(b"data"))
+
+    def test_directory_is_scanned_only_over_limit(self, tmp_path):
+        """合計バイト数の見積もりが上限以下の間はディレクトリを走査しないことのテスト"""
+        cache = DiskCache(str(tmp_path), max_bytes=10 * 1024)
+
+        with patch.object(DiskCache, "_scan", autospec=True, side_effect=DiskCache._scan) as scan:
+            for i in range(5):
+                cache.put(f"bucket/{i}", "\"a\"", None, b"a" * 1000)
+            # 同じキーの置き換えは見積もりを増やさない
+            for _ in range(10):
+                cache.put("bucket/0", "\"b\"", None, b"b" * 1000)
+            assert scan.call_count == 1
+
+            for i in range(5, 12):
+                cache.put(f"bucket/{i}", "\"a\"", None, b"a" * 1000)
+            assert scan.call_count > 1
+
+        assert sum(os.path.getsize(path) for path in cache_files(tmp_path)) <= 10 * 1024
+
+    def test_lru_eviction_by_bytes(self, tmp_path):
+        """合計バイト数が上限を超えると最終アクセス日時の古いファイルから削除されることのテスト"""
+        cache = DiskCache(str(tmp_path), max_bytes=2500)
+
+        cache.put("bucket/a", "\"a\"", None, b"a" * 1000)
+        time.sleep(0.02)
+        cache.put("bucket/b", "\"b\"", None, b"b" * 1000)
+        time.sleep(0.02)
+        cache.get("bucket/a")
+        time.sleep(0.02)
+        cache.put("bucket/c", "\"c\"", None, b"c" * 1000)
+
+        assert cache.get("bucket/b") is None
+        assert cache.get("bucket/a") is not None
+        assert cache.get("bucket/c") is not None
+        assert cache.stats()["evictions"] == 1
+
+    def test_object_larger_than_cap_is_not_stored(self, tmp_path):
+        """上限を超えるオブジェクトは保存されないことのテスト"""
+        cache = DiskCache(str(tmp_path), max_bytes=100)
+        cache.put("bucket/a", "\"a\"", None, b"a" * 101)
+
+        assert cache.get("bucket/a") is None
+        assert cache_files(tmp_path) == []
+
+    def test_corrupted_file_is_a_miss(self, tmp_path):
+        """壊れたファイルはミスとして扱われることのテスト"""
+        cache = DiskCache(str(tmp_path), max_bytes=1024 * 1024)
+        cache.put("bucket/a", "\"a\"", None, b"data")
+        path, = cache_files(tmp_path)
+        with open(path, "wb") as f:
+            f.write(b"garbage")
+
+        assert cache.get("bucket/a") is None
+
+    def test_concurrent_writers_share_directory(self, tmp_path):
+        """同じディレクトリを共有する複数のキャッシュから同時に読み書きできることのテスト"""
+        caches = [DiskCache(str(tmp_path), max_bytes=64 * 1024) for _ in range(4)]
+        errors = []
+
+        def worker(cache, index):
+            try:
+                for i in range(20):
+                    data = bytes([index]) * 4096
+                    cache.put(f"bucket/{i % 5}", f"\"{index}-{i}\"", None, data)
+                    entry = cache.get(f"bucket/{i % 5}")
+                    if entry is not None:
+                        assert len(entry.data) == 4096
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(cache, i)) for i, cache in enumerate(caches)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert sum(os.path.getsize(path) for path in cache_files(tmp_path)) <= 64 * 1024
+        assert not [name for _, _, names in os.walk(tmp_path) for name in names if name.endswith(".tmp")]
+
+    def test_build_disk_cache_from_env(self, tmp_path, monkeypatch):
+        """S3_DISK_CACHE_DIRが未設定の場合は無効となることのテスト"""
+        monkeypatch.delenv("S3_DISK_CACHE_DIR", raising=False)
+        assert build_disk_cache() is None
+
+        monkeypatch.setenv("S3_DISK_CACHE_DIR", str(tmp_path / "cache"))
+        monkeypatch.setenv("S3_DISK_CACHE_MAX_BYTES", "4096")
+        cache = build_disk_cache()
+
+        assert cache.directory == str(tmp_path / "cache")
+        assert cache.max_bytes == 4096
+
+
+class TestS3AccessorDiskCache:
+    """S3Accessorのディスクキャッシュのテストクラス"""
+
+    @pytest.fixture
+    def s3_stub(self):
+        """S3スタブサーバーを起動するフィクスチャ"""
+        server = StubS3Server().start()
+        server.put(BUCKET, "05339.pickle", b"pickle-data")
+        yield server
+        server.stop()
+
+    def make_accessor(self, s3_stub, tmp_path, monkeypatch):
+        monkeypatch.setenv("S3_ENDPOINT_URL", s3_stub.endpoint_url)
+        monkeypatch.setenv("S3_DISK_CACHE_DIR", str(tmp_path))
+        for name, value in S3_CONFIG_ENV.items():
+            monkeypatch.setenv(name, value)
+        return S3Accessor()
+
+    def test_restarted_accessor_uses_disk_cache(self, s3_stub, tmp_path, monkeypatch):
+        """再起動後のS3Accessorがボディを転送せずにディスクキャッシュのデータを返すことのテスト"""
+        first = self.make_accessor(s3_stub, tmp_path, monkeypatch).get_object_with_metadata(
+            "05339.pickle"
+        )
+
+        restarted = self.make_accessor(s3_stub, tmp_path, monkeypatch)
+        cached = restarted.get_object_with_metadata("05339.pickle")
+
+        assert isinstance(first.data, bytearray)
+        assert cached.data == b"pickle-data"
+        assert cached.version == first.version
+        assert s3_stub.not_modified_count == 1
+        assert restarted.disk_cache_stats()["hits"] == 1
+
+    def test_changed_object_replaces_disk_cache(self, s3_stub, tmp_path, monkeypatch):
+        """S3のオブジェクトが変更された場合は新しいデータを取得してディスクキャッシュを更新することのテスト"""
+        accessor = self.make_accessor(s3_stub, tmp_path, monkeypatch)
+        accessor.get_object("05339.pickle")
+        s3_stub.put(BUCKET, "05339.pickle", b"updated")
+
+        assert accessor.get_object("05339.pickle") == b"updated"
+        assert bytes(accessor.get_object("05339.pickle")) == b"updated"
+        assert len(cache_files(tmp_path)) == 1
@@ -0,0 +1,69 @@
+"""
+Import Time Tests
+
+`python -X importtime` でアプリケーションのモジュール（app.main）の読み込み時間を計測し、
+コールドスタートの予算を超えていないことをテストします。
+
+予算は環境変数 IMPORT_TIME_BUDGET_MS（デフォルト: 1000ミリ秒）で変更できます。
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+DEFAULT_IMPORT_TIME_BUDGET_MS = 1000.0
+
+# app.main の読み込み時には読み込まないモジュール（起動後にバックグラウンドで読み込む）
+DEFERRED_MODULES = ("pandas", "numpy", "boto3", "botocore", "app.services.jockey_service")
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_times(module):
+    """
+    別プロセスで -X importtime を付けてモジュールを読み込み、モジュールごとの累積時間を取得
+
+    Args:
+        module: 読み込むモジュール名
+
+    Returns:
+        モジュール名と累積の読み込み時間（マイクロ秒）の辞書
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestImportTime:
+    """app.main の読み込み時間のテストクラス"""
+
+    def test_heavy_modules_deferred(self):
+        """app.main の読み込み時にpandas・numpy・boto3が読み込まれないことのテスト"""
+        times = import_times("app.main")
+
+        assert "app.main" in times
+        assert [module for module in DEFERRED_MODULES if module in times] == []
+
+    def test_import_time_budget(self):
+        """app.main の読み込み時間が予算以内であることのテスト（3回の計測の最小値）"""
+        budget_ms = float(
+            os.getenv("IMPORT_TIME_BUDGET_MS", str(DEFAULT_IMPORT_TIME_BUDGET_MS))
+        )
+        elapsed_ms = min(import_times("app.main")["app.main"] for _ in range(3)) / 1000
+
+        if elapsed_ms > budget_ms:
+            pytest.fail(f"import app.main took {elapsed_ms:.0f}ms (budget: {budget_ms:.0f}ms)")
@@ -5,13 +5,14 @@ Integration Tests
 """
 
 import os
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 from fastapi.testclient import TestClient
 
 from app.main import app
 from app.models.exceptions import S3AccessError, SSMConfigError
+from tests.s3_stub import make_s3_accessor_mock
 
 client = TestClient(app)
 
@@ -35,7 +36,7 @@ class TestIntegration:
         実際のpickleファイルを使用してJSON変換の整合性を検証
         """
         # モックS3 Accessorの設定
-        mock_s3_accessor = MagicMock()
+        mock_s3_accessor = make_s3_accessor_mock()
         mock_s3_accessor.get_object.return_value = real_pickle_data
         mock_get_s3_accessor.return_value = mock_s3_accessor
 
@@ -70,7 +71,7 @@ class TestIntegration:
         API→サービス→S3Accessor→404エラー→HTTPException
         """
         # S3がNoneを返す（データが見つからない）
-        mock_s3_accessor = MagicMock()
+        mock_s3_accessor = make_s3_accessor_mock()
         mock_s3_accessor.get_object.return_value = None
         mock_get_s3_accessor.return_value = mock_s3_accessor
 
@@ -93,7 +94,7 @@ class TestIntegration:
         API→サービス→S3Accessor→接続エラー→500エラー
         """
         # S3接続エラーを発生させる
-        mock_s3_accessor = MagicMock()
+        mock_s3_accessor = make_s3_accessor_mock()
         mock_s3_accessor.get_object.side_effect = S3AccessError(
             "Connection timeout", bucket="test-bucket", key="05339.pickle"
         )
@@ -166,7 +167,7 @@ class TestIntegration:
         """
         # Originヘッダーを含むGETリクエスト
         with patch("app.services.jockey_service.get_s3_accessor") as mock_get_s3_accessor:
-            mock_s3_accessor = MagicMock()
+            mock_s3_accessor = make_s3_accessor_mock()
             # 簡単なモックデータ
             import pickle
 
@@ -4,15 +4,19 @@ Jockey Service Unit Tests
 JockeyServiceの実際のpickleファイルを使用してテストします。
 """
 
+import json
 import os
 import pickle
-from unittest.mock import MagicMock, patch
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 
 import pandas as pd
 import pytest
 
 from app.models.exceptions import JockeyNotFoundError, PickleDeserializeError, S3AccessError
 from app.services.jockey_service import JockeyService
+from tests.s3_stub import make_s3_accessor_mock
 
 
 class TestJockeyService:
@@ -35,7 +39,7 @@ class TestJockeyService:
     @patch("app.services.jockey_service.get_s3_accessor")
     def test_generate_s3_key(self, mock_get_s3_accessor):
         """S3キー生成のテスト"""
-        mock_s3_accessor = MagicMock()
+        mock_s3_accessor = make_s3_accessor_mock()
         mock_get_s3_accessor.return_value = mock_s3_accessor
 
         service = JockeyService()
@@ -46,7 +50,7 @@ class TestJockeyService:
     @patch("app.services.jockey_service.get_s3_accessor")
     def test_get_jockey_data_binary_success(self, mock_get_s3_accessor, real_pickle_data):
         """騎手データ取得成功のテスト（実データ使用）"""
-        mock_s3_accessor = MagicMock()
+        mock_s3_accessor = make_s3_accessor_mock()
         mock_s3_accessor.get_object.return_value = real_pickle_data
         mock_get_s3_accessor.return_value = mock_s3_accessor
 
@@ -60,7 +64,7 @@ class TestJockeyService:
     @patch("app.services.jockey_service.get_s3_accessor")
     def test_get_jockey_data_binary_not_found(self, mock_get_s3_accessor):
         """騎手データが見つからない場合のテスト"""
-        mock_s3_accessor = MagicMock()
+        mock_s3_accessor = make_s3_accessor_mock()
         mock_s3_accessor.get_object.return_value = None
         mock_get_s3_accessor.return_value = mock_s3_accessor
 
@@ -75,7 +79,7 @@ class TestJockeyService:
     @patch("app.services.jockey_service.get_s3_accessor")
     def test_get_jockey_data_binary_s3_error(self, mock_get_s3_accessor):
         """S3アクセスエラーのテスト"""
-        mock_s3_accessor = MagicMock()
+        mock_s3_accessor = make_s3_accessor_mock()
         mock_s3_accessor.get_object.side_effect = S3AccessError(
             "S3 connection failed",
             bucket="test-bucket",
@@ -94,7 +98,7 @@ class TestJockeyService:
     @patch("app.services.jockey_service.get_s3_accessor")
     def test_deserialize_pickle_success(self, mock_get_s3_accessor, real_pickle_data):
         """pickleデシリアライズ成功のテスト"""
-        mock_s3_accessor = MagicMock()
+        mock_s3_accessor = make_s3_accessor_mock()
         mock_get_s3_accessor.return_value = mock_s3_accessor
 
         service = JockeyService()
@@ -107,7 +111,7 @@ class TestJockeyService:
     @patch("app.services.jockey_service.get_s3_accessor")
     def test_deserialize_pickle_invalid_data(self, mock_get_s3_accessor):
         """無効なpickleデータのデシリアライズテスト"""
-        mock_s3_accessor = MagicMock()
+        mock_s3_accessor = make_s3_accessor_mock()
         mock_get_s3_accessor.return_value = mock_s3_accessor
 
         service = JockeyService()
@@ -121,7 +125,7 @@ class TestJockeyService:
     @patch("app.services.jockey_service.get_s3_accessor")
     def test_deserialize_pickle_corrupted_data(self, mock_get_s3_accessor):
         """破損したpickleデータのデシリアライズテスト"""
-        mock_s3_accessor = MagicMock()
+        mock_s3_accessor = make_s3_accessor_mock()
         mock_get_s3_accessor.return_value = mock_s3_accessor
 
         service = JockeyService()
@@ -135,7 +139,7 @@ class TestJockeyService:
     @patch("app.services.jockey_service.get_s3_accessor")
     def test_dataframe_to_json_success(self, mock_get_s3_accessor, real_dataframe):
         """DataFrame→JSON変換成功のテスト"""
-        mock_s3_accessor = MagicMock()
+        mock_s3_accessor = make_s3_accessor_mock()
         mock_get_s3_accessor.return_value = mock_s3_accessor
 
         service = JockeyService()
@@ -155,7 +159,7 @@ class TestJockeyService:
     @patch("app.services.jockey_service.get_s3_accessor")
     def test_get_jockey_data_full_flow(self, mock_get_s3_accessor, real_pickle_data):
         """完全フロー（S3取得→デシリアライズ→JSON変換）のテスト"""
-        mock_s3_accessor = MagicMock()
+        mock_s3_accessor = make_s3_accessor_mock()
         mock_s3_accessor.get_object.return_value = real_pickle_data
         mock_get_s3_accessor.return_value = mock_s3_accessor
 
@@ -173,3 +177,70 @@ class TestJockeyService:
 
         # S3アクセスが呼ばれたことを確認
         mock_s3_accessor.get_object.assert_called_once_with("05339.pickle")
+
+    @patch("app.services.jockey_service.get_s3_accessor")
+    def test_get_jockey_data_uses_cache(self, mock_get_s3_accessor, real_pickle_data):
+        """2回目以降の取得でS3アクセスとデシリアライズが省略されることのテスト"""
+        mock_s3_accessor = make_s3_accessor_mock()
+        mock_s3_accessor.get_object.return_value = real_pickle_data
+        mock_get_s3_accessor.return_value = mock_s3_accessor
+
+        first = JockeyService().get_jockey_data("05339")
+        second = JockeyService().get_jockey_data("05339")
+
+        assert len(first) == len(second)
+        assert [r["日付"] for r in first] == [r["日付"] for r in second]
+        mock_s3_accessor.get_object.assert_called_once_with("05339.pickle")
+
+    @patch("app.services.jockey_service.get_s3_accessor")
+    def test_get_jockey_data_not_found_is_not_cached(self, mock_get_s3_accessor, real_pickle_data):
+        """データが見つからなかった結果はキャッシュされないことのテスト"""
+        mock_s3_accessor = make_s3_accessor_mock()
+        mock_s3_accessor.get_object.side_effect = [None, real_pickle_data]
+        mock_get_s3_accessor.return_value = mock_s3_accessor
+
+        with pytest.raises(JockeyNotFoundError):
+            JockeyService().get_jockey_data("05339")
+        result = JockeyService().get_jockey_data("05339")
+
+        assert len(result) > 0
+        assert mock_s3_accessor.get_object.call_count == 2
+
+    @patch("app.services.jockey_service.get_s3_accessor")
+    def test_stream_jockey_data_json_batches(self, mock_get_s3_accessor, real_pickle_data):
+        """ストリーミング出力が行バッチごとに分割され、連結結果が一括出力と一致することのテスト"""
+        mock_s3_accessor = make_s3_accessor_mock()
+        mock_s3_accessor.get_object.return_value = real_pickle_data
+        mock_get_s3_accessor.return_value = mock_s3_accessor
+
+        service = JockeyService()
+        chunks = list(service.stream_jockey_data_json("05339", batch_rows=2))
+        rows = len(service.get_jockey_dataframe("05339"))
+
+        # "[" + ceil(rows / 2)個のバッチ + "]"
+        assert len(chunks) == 2 + (rows + 1) // 2
+        assert b"".join(chunks) == service.get_jockey_data_json("05339")
+        assert json.loads(b"".join(chunks))[0]["jockey_id"] == "05339"
+
+    @patch("app.services.jockey_service.get_s3_accessor")
+    def test_get_jockeys_data_json_fetches_concurrently(
+        self, mock_get_s3_accessor, real_pickle_data
+    ):
+        """一括取得でS3からの取得が並行して実行されることのテスト"""
+        jockey_ids = ["05339", "01170", "01126"]
+        barrier = threading.Barrier(len(jockey_ids), timeout=5)
+
+        def get_object(key):
+            # すべての取得が同時に実行中でなければタイムアウトする
+            barrier.wait()
+            return real_pickle_data
+
+        mock_s3_accessor = make_s3_accessor_mock()
+        mock_s3_accessor.get_object.side_effect = get_object
+        mock_get_s3_accessor.return_value = mock_s3_accessor
+
+        with ThreadPoolExecutor(max_workers=len(jockey_ids)) as executor:
+            items = JockeyService().get_jockeys_data_json(jockey_ids, executor=executor)
+
+        assert [item.jockey_id for item in items] == jockey_ids
+        assert all(item.error is None for item in items)
@@ -0,0 +1,93 @@
+"""
+JSON Encoder Unit Tests
+
+列単位エンコーダーの出力が従来の経路（dataframe_to_json → FastAPIのエンコード）と
+バイト単位で一致することをテストします。
+"""
+
+import os
+import pickle
+from typing import Any, List
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.services.jockey_service import JockeyService
+from app.services.json_encoder import UnsupportedColumnError, encode_records_json
+
+_response_adapter = TypeAdapter(List[dict[str, Any]])
+
+
+def fastapi_encode(df: pd.DataFrame) -> bytes:
+    """従来の経路（modelモード）でDataFrameをエンコード"""
+    service = JockeyService.__new__(JockeyService)
+    records = service.dataframe_to_json(df, "test")
+    content = _response_adapter.dump_python(records, mode="json")
+    return bytes(JSONResponse(content).body)
+
+
+class TestJsonEncoder:
+    """列単位JSONエンコーダーのテストクラス"""
+
+    @pytest.fixture
+    def real_dataframe(self):
+        """実際のpickleファイルからDataFrameを読み込むフィクスチャ"""
+        pickle_path = os.path.join(os.path.dirname(__file__), "test_data.pickle")
+        with open(pickle_path, "rb") as f:
+            return pickle.load(f)
+
+    def test_matches_fastapi_encoding_for_real_data(self, real_dataframe):
+        """実データで従来の経路とバイト単位で一致することのテスト"""
+        assert encode_records_json(real_dataframe) == fastapi_encode(real_dataframe)
+
+    def test_matches_fastapi_encoding_for_edge_values(self):
+        """NaN・無限大・NaT・エスケープが必要な文字列などで一致することのテスト"""
+        df = pd.DataFrame(
+            {
+                "日付": pd.to_datetime(["2024-09-29 12:34:56.789", None, "1969-12-31 23:59:59.5"]),
+                "賞金 (万円)": [1050.0, np.nan, np.inf],
+                "単勝": np.array([0.1, 1e16, -0.0], dtype=np.float32),
+                "着 順": np.array([1, 2, 3], dtype=np.int64),
+                "枠 番": np.array([1, 2, 255], dtype=np.uint8),
+                "取消": [True, False, True],
+                "レース名": ['"引用"\\S(GI)', "改行\n", "\x00タブ\t"],
+                "着差": ["ハナ", 0.3, None],
+                "映像": [None, None, None],
+            }
+        )
+
+        assert encode_records_json(df) == fastapi_encode(df)
+
+    def test_matches_fastapi_encoding_for_timezone_aware_dates(self):
+        """タイムゾーン付き日付列で一致することのテスト"""
+        df = pd.DataFrame(
+            {"日付": pd.to_datetime(["2024-09-29 00:00:00", None]).tz_localize("Asia/Tokyo")}
+        )
+
+        assert encode_records_json(df) == fastapi_encode(df)
+
+    def test_empty_dataframe(self, real_dataframe):
+        """0行のDataFrameが空配列になることのテスト"""
+        assert encode_records_json(real_dataframe.iloc[0:0]) == b"[]"
+
+    def test_unsupported_dtype_raises(self):
+        """対応していないdtypeで例外が発生することのテスト"""
+        df = pd.DataFrame({"経過": pd.to_timedelta([1, 2], unit="s")})
+
+        with pytest.raises(UnsupportedColumnError):
+            encode_records_json(df)
+
+    @patch("app.services.jockey_service.get_s3_accessor")
+    def test_service_falls_back_for_unsupported_columns(self, mock_get_s3_accessor):
+        """対応していない列を含む場合にサービスが従来の経路にフォールバックすることのテスト"""
+        mock_get_s3_accessor.return_value = MagicMock()
+        df = pd.DataFrame({"R": [1, 2], "区分": pd.Categorical(["A", "B"])})
+
+        service = JockeyService()
+        body = service.dataframe_to_json_bytes(df, "05339")
+
+        assert body == fastapi_encode(df)
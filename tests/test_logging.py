@@ -0,0 +1,180 @@
+"""
+Logging Tests
+
+構造化ログフォーマッター（StructuredFormatter）の出力をテストします。
+"""
+
+import json
+import logging
+import queue
+import sys
+from datetime import datetime
+
+import pytest
+
+from app.core.logging import (
+    DroppingQueueHandler,
+    SamplingFilter,
+    StructuredFormatter,
+    get_logging_stats,
+    parse_sample_rates,
+    setup_logging,
+    shutdown_logging,
+)
+
+
+@pytest.fixture
+def restore_logging():
+    """テスト後にログ設定を同期出力に戻すフィクスチャ"""
+    yield
+    setup_logging("INFO")
+
+
+def make_record(
+    msg="Jockey data retrieved",
+    args=(),
+    extra=None,
+    exc_info=None,
+    created=None,
+    name="app.test",
+    level=logging.INFO,
+):
+    """テスト用のログレコードを生成"""
+    logger = logging.getLogger(name)
+    record = logger.makeRecord(logger.name, level, __file__, 1, msg, args, exc_info, extra=extra)
+    if created is not None:
+        record.created = created
+        record.msecs = (created - int(created)) * 1000
+    return record
+
+
+class TestStructuredFormatter:
+    """StructuredFormatterのテストクラス"""
+
+    def test_outputs_json_with_all_extras(self):
+        """1行のJSONとして出力され、extra のフィールドがすべて含まれることのテスト"""
+        formatter = StructuredFormatter(datefmt="%Y-%m-%d %H:%M:%S")
+        record = make_record(
+            "Fetched %s", ("05339",), extra={"data_size": 1024, "rows": 10, "列": "着 順"}
+        )
+
+        output = formatter.format(record)
+
+        assert "\n" not in output
+        log = json.loads(output)
+        assert log["level"] == "INFO"
+        assert log["logger"] == "app.test"
+        assert log["message"] == "Fetched 05339"
+        assert (log["data_size"], log["rows"], log["列"]) == (1024, 10, "着 順")
+        assert "args" not in log and "pathname" not in log
+
+    def test_non_serializable_extras(self):
+        """JSONに変換できない extra の値が文字列として出力されることのテスト"""
+        formatter = StructuredFormatter()
+        circular: list = []
+        circular.append(circular)
+        record = make_record(
+            extra={"last_modified": datetime(2024, 1, 2, 3, 4, 5), "circular": circular}
+        )
+
+        log = json.loads(formatter.format(record))
+
+        assert log["last_modified"] == "2024-01-02 03:04:05"
+        assert log["circular"] == "[[...]]"
+
+    def test_exception(self):
+        """例外情報がトレースバックとして出力されることのテスト"""
+        formatter = StructuredFormatter()
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = make_record(exc_info=sys.exc_info())
+
+        log = json.loads(formatter.format(record))
+
+        assert "ValueError: boom" in log["exception"]
+
+    def test_extras_do_not_override_header(self):
+        """extra と同名の先頭のフィールドが上書きされないことのテスト"""
+        formatter = StructuredFormatter()
+        record = make_record(extra={"level": "fake", "timestamp": "fake"})
+
+        log = json.loads(formatter.format(record))
+
+        assert log["level"] == "INFO"
+        assert log["timestamp"] != "fake"
+
+    def test_timestamp_cache(self):
+        """キャッシュしたタイムスタンプが秒の変化で更新され、ミリ秒が付与されることのテスト"""
+        formatter = StructuredFormatter()
+        base = datetime(2024, 1, 2, 3, 4, 5).timestamp()
+
+        first = json.loads(formatter.format(make_record(created=base + 0.25)))
+        same = json.loads(formatter.format(make_record(created=base + 0.5)))
+        later = json.loads(formatter.format(make_record(created=base + 1.75)))
+
+        assert first["timestamp"] == "2024-01-02 03:04:05,250"
+        assert same["timestamp"] == "2024-01-02 03:04:05,500"
+        assert later["timestamp"] == "2024-01-02 03:04:06,750"
+
+
+class TestSamplingFilter:
+    """SamplingFilterのテストクラス"""
+
+    def test_samples_info_per_logger(self):
+        """設定したロガー（とその子）のINFOのみがN件に1件となることのテスト"""
+        sampling = SamplingFilter({"app.infrastructure": 3})
+
+        passed = [
+            sampling.filter(make_record(name="app.infrastructure.s3_accessor")) for _ in range(6)
+        ]
+        others = [sampling.filter(make_record(name="app.api.jockey")) for _ in range(3)]
+
+        assert passed == [True, False, False, True, False, False]
+        assert others == [True, True, True]
+        assert sampling.sampled_out == 4
+
+    def test_warnings_always_pass(self):
+        """WARNING以上のレコードは間引かれないことのテスト"""
+        sampling = SamplingFilter({"app.test": 100})
+
+        assert sampling.filter(make_record(level=logging.INFO))
+        assert all(sampling.filter(make_record(level=logging.WARNING)) for _ in range(5))
+        assert all(sampling.filter(make_record(level=logging.ERROR)) for _ in range(5))
+
+    def test_parse_sample_rates(self):
+        """サンプリングの設定の解析で不正な項目が無視されることのテスト"""
+        rates = parse_sample_rates("app.infrastructure.s3_accessor=10, app.api=x,=3,app.core=0")
+
+        assert rates == {"app.infrastructure.s3_accessor": 10}
+
+
+class TestQueueLogging:
+    """キューモードのテストクラス"""
+
+    def test_full_queue_drops(self):
+        """キューが満杯の場合はレコードを破棄して件数を数えることのテスト"""
+        handler = DroppingQueueHandler(queue.Queue(maxsize=2))
+
+        for i in range(5):
+            handler.handle(make_record("record %d", (i,)))
+
+        assert handler.dropped == 3
+        assert handler.queue.get_nowait().msg == "record 0"
+
+    def test_writes_in_background(self, capsys, restore_logging):
+        """キューモードのレコードが書き出し用のスレッドからJSONで出力されることのテスト"""
+        setup_logging("INFO", queue_size=100, sample_rates={"app.sampled": 2})
+        sampled = logging.getLogger("app.sampled")
+        for i in range(4):
+            sampled.info("fetched %d", i, extra={"rows": i})
+        sampled.error("failed")
+
+        stats = get_logging_stats()
+        shutdown_logging()
+
+        lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert [line["message"] for line in lines] == ["fetched 0", "fetched 2", "failed"]
+        assert lines[1]["rows"] == 2
+        assert stats["queue"] and stats["max_queue_size"] == 100
+        assert (stats["dropped"], stats["sampled_out"]) == (0, 2)
@@ -0,0 +1,196 @@
+"""
+Metrics Tests
+
+/metrics エンドポイントとPrometheus形式のメトリクスの記録をテストします。
+"""
+
+import os
+import subprocess
+import sys
+import textwrap
+from io import BytesIO
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+from fastapi.testclient import TestClient
+
+from app.core.cache import TTLCache
+from app.core.metrics import generate_metrics, reset_metrics
+from app.core.timing import stage
+from app.infrastructure.s3_accessor import S3Accessor
+from app.main import app
+from app.models.exceptions import S3AccessError
+
+pytest.importorskip("prometheus_client")
+from prometheus_client.parser import text_string_to_metric_families  # noqa: E402
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def fresh_metrics(monkeypatch):
+    """テスト間でメトリクスが共有されないように再生成するフィクスチャ"""
+    monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+    monkeypatch.delenv("JOCKEY_METRICS", raising=False)
+    reset_metrics()
+    yield
+    reset_metrics()
+
+
+def samples(text):
+    """Prometheusのテキスト形式を (サンプル名, ラベルのタプル) と値の辞書に変換"""
+    return {
+        (sample.name, tuple(sorted(sample.labels.items()))): sample.value
+        for family in text_string_to_metric_families(text)
+        for sample in family.samples
+    }
+
+
+def current_samples():
+    """現在のメトリクスを取得"""
+    body, _ = generate_metrics()
+    return samples(body.decode())
+
+
+class TestMetricsEndpoint:
+    """/metrics エンドポイントのテストクラス"""
+
+    def test_request_latency_per_route(self, s3_accessor):
+        """ルートのパステンプレートごとにリクエストの所要時間が記録されることのテスト"""
+        client.get("/api/jockey/05339")
+        client.get("/api/jockey/01170")
+        client.get("/no/such/path")
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        values = samples(response.text)
+        route = (
+            "jockey_http_request_duration_seconds_count",
+            (("method", "GET"), ("route", "/api/jockey/{jockey_id}"), ("status", "200")),
+        )
+        unmatched = (
+            "jockey_http_request_duration_seconds_count",
+            (("method", "GET"), ("route", "unmatched"), ("status", "404")),
+        )
+        assert values[route] == 2
+        assert values[unmatched] == 1
+
+    def test_stages_and_rows(self, s3_accessor):
+        """デシリアライズ・エンコードの所要時間とDataFrameの行数が記録されることのテスト"""
+        client.get("/api/jockey/05339")
+
+        values = samples(client.get("/metrics").text)
+
+        for name in ("s3", "deserialize", "encode"):
+            assert values[("jockey_stage_duration_seconds_count", (("stage", name),))] == 1
+        assert values[("jockey_dataframe_rows_count", ())] == 1
+        assert values[("jockey_dataframe_rows_sum", ())] > 0
+
+    def test_stages_without_server_timing(self, s3_accessor, monkeypatch):
+        """Server-Timingの計測が無効な場合やリクエスト外でも処理段階が記録されることのテスト"""
+        monkeypatch.setenv("JOCKEY_STAGE_TIMING", "false")
+        client.get("/api/jockey/05339")
+        with stage("s3"):
+            pass
+
+        values = current_samples()
+
+        assert values[("jockey_stage_duration_seconds_count", (("stage", "s3"),))] == 2
+        assert values[("jockey_stage_duration_seconds_count", (("stage", "encode"),))] == 1
+
+    def test_disabled(self, s3_accessor, monkeypatch):
+        """JOCKEY_METRICS=false の場合は404を返すことのテスト"""
+        monkeypatch.setenv("JOCKEY_METRICS", "false")
+        reset_metrics()
+
+        client.get("/api/jockey/05339")
+        response = client.get("/metrics")
+
+        assert response.status_code == 404
+
+
+class TestCacheMetrics:
+    """キャッシュのヒット・ミスのメトリクスのテストクラス"""
+
+    def test_cache_lookups(self):
+        """キャッシュ名ごとにヒット・ミスが数えられることのテスト"""
+        cache: TTLCache[str] = TTLCache(
+            max_entries=10, max_bytes=0, ttl_seconds=0, sizeof=len, name="test"
+        )
+        cache.get("a")
+        cache.get_or_load("a", lambda: "value")
+        cache.get("a")
+
+        values = current_samples()
+
+        assert values[("jockey_cache_lookups_total", (("cache", "test"), ("result", "miss")))] == 2
+        assert values[("jockey_cache_lookups_total", (("cache", "test"), ("result", "hit")))] == 1
+
+
+class TestS3Metrics:
+    """S3 GetObjectのメトリクスのテストクラス"""
+
+    @patch("app.infrastructure.s3_accessor.boto3")
+    def test_outcomes_and_bytes(self, mock_boto3, monkeypatch):
+        """GetObjectの結果ごとの所要時間と受信バイト数が記録されることのテスト"""
+        monkeypatch.setenv("S3_ACCESS_KEY_ID", "key")
+        monkeypatch.setenv("S3_SECRET_ACCESS_KEY", "secret")
+        monkeypatch.setenv("S3_REGION_NAME", "ap-northeast-1")
+        monkeypatch.setenv("S3_BUCKET_NAME", "bucket")
+        mock_s3 = MagicMock()
+        mock_boto3.client.return_value = mock_s3
+        body = MagicMock()
+        body.readinto.side_effect = BytesIO(b"0123456789").readinto
+        mock_s3.get_object.side_effect = [
+            {"Body": body, "ContentLength": 10},
+            ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject"),
+            ClientError({"Error": {"Code": "AccessDenied"}}, "GetObject"),
+        ]
+        accessor = S3Accessor()
+
+        accessor.get_object("found.pickle")
+        assert accessor.get_object("missing.pickle") is None
+        with pytest.raises(S3AccessError):
+            accessor.get_object("denied.pickle")
+
+        values = current_samples()
+        for outcome in ("ok", "not_found", "error"):
+            key = ("jockey_s3_get_object_duration_seconds_count", (("outcome", outcome),))
+            assert values[key] == 1
+        assert values[("jockey_s3_received_bytes_total", ())] == 10
+
+
+class TestMultiprocessMetrics:
+    """multiprocessモードのテストクラス"""
+
+    def test_values_are_aggregated_across_processes(self, tmp_path):
+        """複数のプロセスで記録した値が合算して出力されることのテスト"""
+        env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path)}
+        record = textwrap.dedent(
+            """
+            from app.core.metrics import observe_request, record_cache_lookup
+            observe_request("/api/jockey/{jockey_id}", "GET", 200, 0.01)
+            record_cache_lookup("jockey", True)
+            """
+        )
+        for _ in range(2):
+            subprocess.run([sys.executable, "-c", record], cwd=ROOT_DIR, env=env, check=True)
+
+        scrape = "from app.core.metrics import generate_metrics; print(generate_metrics()[0].decode())"
+        output = subprocess.run(
+            [sys.executable, "-c", scrape],
+            cwd=ROOT_DIR, env=env, check=True, capture_output=True, text=True,
+        ).stdout
+
+        values = samples(output)
+        route = (
+            "jockey_http_request_duration_seconds_count",
+            (("method", "GET"), ("route", "/api/jockey/{jockey_id}"), ("status", "200")),
+        )
+        assert values[route] == 2
+        assert values[("jockey_cache_lookups_total", (("cache", "jockey"), ("result", "hit")))] == 2
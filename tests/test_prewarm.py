@@ -0,0 +1,235 @@
+"""
+Prewarm Tests
+
+起動時のキャッシュのプリウォームと、騎手IDごとのリクエスト数の集計をテストします。
+"""
+
+import asyncio
+import json
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.hit_counter import HitCounter
+from app.infrastructure.dependencies import get_response_cache
+from app.main import app
+from app.services.prewarm import Prewarmer, parse_manifest, start_module_preload
+from tests.s3_stub import make_s3_accessor_mock
+
+
+@pytest.fixture
+def real_pickle_data():
+    """実際のpickleファイルを読み込むフィクスチャ"""
+    pickle_path = os.path.join(os.path.dirname(__file__), "test_data.pickle")
+    with open(pickle_path, "rb") as f:
+        return f.read()
+
+
+@pytest.fixture
+def s3_accessor(real_pickle_data):
+    """マニフェストと騎手05339のデータのみを返すS3Accessorのモック"""
+    objects = {
+        "prewarm/manifest.json": b'["05339", "99999", "05339"]',
+        "05339.pickle": real_pickle_data,
+    }
+    accessor = make_s3_accessor_mock()
+    accessor.get_object.side_effect = objects.get
+    with patch("app.services.prewarm.get_s3_accessor", return_value=accessor), patch(
+        "app.services.jockey_service.get_s3_accessor", return_value=accessor
+    ):
+        yield accessor
+
+
+class TestParseManifest:
+    """マニフェストの解析のテストクラス"""
+
+    def test_json_array(self):
+        """JSON配列の騎手IDが重複を除いて先頭から順に返されることのテスト"""
+        assert parse_manifest(b'["05339", "01170", "05339"]') == ["05339", "01170"]
+
+    def test_lines(self):
+        """1行に1つの騎手IDのテキストが解析されることのテスト"""
+        assert parse_manifest(bytearray(b"05339\n\n 01170 \n")) == ["05339", "01170"]
+
+    def test_invalid_json(self):
+        """JSON配列でない場合はValueErrorとなることのテスト"""
+        with pytest.raises(ValueError):
+            parse_manifest(b"[05339")
+
+
+class TestHitCounter:
+    """HitCounterのテストクラス"""
+
+    def test_save_and_load(self, tmp_path):
+        """リクエスト数がファイルに書き出され、次回の初期化時に読み込まれることのテスト"""
+        path = str(tmp_path / "hits.json")
+        counter = HitCounter(path)
+        for jockey_id in ["01170", "05339", "05339", "00666", "05339", "01170"]:
+            counter.record(jockey_id)
+
+        assert counter.save()
+        assert not counter.save()
+
+        restored = HitCounter(path)
+        assert restored.most_common(2) == ["05339", "01170"]
+
+    def test_save_merges_with_other_workers(self, tmp_path):
+        """複数のワーカーの書き出しが上書きされずに加算されることのテスト"""
+        path = str(tmp_path / "hits.json")
+        first = HitCounter(path)
+        second = HitCounter(path)
+        first.record("05339")
+        first.record("05339")
+        second.record("05339")
+        second.record("01170")
+
+        assert first.save()
+        assert second.save()
+        first.record("01170")
+        assert first.save()
+
+        with open(path, encoding="utf-8") as f:
+            assert json.load(f) == {"05339": 3, "01170": 2}
+        assert first.most_common(2) == ["05339", "01170"]
+
+    def test_save_keeps_most_common_keys(self, tmp_path):
+        """ファイルにはリクエスト数の多い max_keys 件のみが書き出されることのテスト"""
+        path = str(tmp_path / "hits.json")
+        counter = HitCounter(path, max_keys=2)
+        for jockey_id in ["05339", "05339", "05339", "01170", "01170", "00666"]:
+            counter.record(jockey_id)
+
+        assert counter.save()
+
+        with open(path, encoding="utf-8") as f:
+            assert json.load(f) == {"05339": 3, "01170": 2}
+
+    def test_disabled(self):
+        """パスが未指定の場合は集計を行わないことのテスト"""
+        counter = HitCounter()
+        counter.record("05339")
+
+        assert not counter.enabled
+        assert counter.most_common(10) == []
+        assert not counter.save()
+
+    def test_malformed_file(self, tmp_path):
+        """不正なファイルは無視して0件から開始することのテスト"""
+        path = tmp_path / "hits.json"
+        path.write_text("not json", encoding="utf-8")
+
+        assert HitCounter(str(path)).most_common(10) == []
+
+
+class TestPrewarmer:
+    """Prewarmerのテストクラス"""
+
+    def test_prewarm_from_manifest(self, s3_accessor):
+        """マニフェストの騎手のデータがキャッシュに読み込まれ、失敗した騎手は数えられることのテスト"""
+        prewarmer = Prewarmer(count=10, manifest_key="prewarm/manifest.json")
+
+        asyncio.run(prewarmer.run())
+
+        progress = prewarmer.progress()
+        assert progress["status"] == "completed"
+        assert progress["source"] == "manifest"
+        assert (progress["total"], progress["loaded"], progress["failed"]) == (2, 1, 1)
+        assert get_response_cache().stats()["entries"] == 1
+
+    def test_prewarm_from_hit_counts(self, s3_accessor, tmp_path):
+        """マニフェストがない場合はリクエスト数の多い順にcount件が読み込まれることのテスト"""
+        counter = HitCounter(str(tmp_path / "hits.json"))
+        for jockey_id in ["99999", "05339", "05339"]:
+            counter.record(jockey_id)
+        prewarmer = Prewarmer(count=1, hit_counter=counter)
+
+        asyncio.run(prewarmer.run())
+
+        progress = prewarmer.progress()
+        assert progress["source"] == "hit_counts"
+        assert (progress["total"], progress["loaded"]) == (1, 1)
+
+    def test_missing_manifest_fails(self, s3_accessor):
+        """マニフェストが存在しない場合は失敗となり、レディネスを妨げないことのテスト"""
+        prewarmer = Prewarmer(count=10, manifest_key="missing.json", block_readiness=True)
+        assert not prewarmer.ready
+
+        asyncio.run(prewarmer.run())
+
+        assert prewarmer.progress()["status"] == "failed"
+        assert prewarmer.ready
+
+    def test_disabled_without_source(self):
+        """対象の決定方法が設定されていない場合は無効となることのテスト"""
+        prewarmer = Prewarmer(count=10, hit_counter=HitCounter(), block_readiness=True)
+
+        assert not prewarmer.enabled
+        assert prewarmer.progress()["status"] == "disabled"
+        assert prewarmer.ready
+
+
+class TestModulePreload:
+    """サービス層のモジュールのバックグラウンドでの読み込みのテストクラス"""
+
+    def test_preload_in_background(self):
+        """サービス層のモジュールがバックグラウンドのスレッドで読み込まれることのテスト"""
+        thread = start_module_preload()
+        assert thread is not None
+        thread.join(timeout=30)
+
+        assert "app.services.jockey_service" in sys.modules
+
+    def test_preload_disabled(self, monkeypatch):
+        """JOCKEY_PRELOAD_MODULES=false の場合は読み込みを開始しないことのテスト"""
+        monkeypatch.setenv("JOCKEY_PRELOAD_MODULES", "false")
+
+        assert start_module_preload() is None
+
+
+class TestPrewarmLifespan:
+    """アプリケーションの起動・終了時の動作のテストクラス"""
+
+    def test_health_reports_warmup_progress(self, s3_accessor, monkeypatch):
+        """起動時にプリウォームが実行され、/health・/health/readyに進捗が返されることのテスト"""
+        monkeypatch.setenv("JOCKEY_PREWARM_COUNT", "5")
+        monkeypatch.setenv("JOCKEY_PREWARM_MANIFEST_KEY", "prewarm/manifest.json")
+        monkeypatch.setenv("JOCKEY_PREWARM_BLOCK_READINESS", "true")
+
+        with TestClient(app) as client:
+            for _ in range(100):
+                ready = client.get("/health/ready")
+                if ready.status_code == 200:
+                    break
+                assert ready.json()["status"] == "warming_up"
+                client.portal.call(asyncio.sleep, 0.05)
+            health = client.get("/health")
+
+        assert ready.status_code == 200
+        assert health.json()["warmup"]["status"] == "completed"
+        assert health.json()["warmup"]["loaded"] == 1
+
+    def test_hit_counts_saved_on_shutdown(self, s3_accessor, tmp_path, monkeypatch):
+        """APIへのリクエスト数が終了時にファイルへ書き出されることのテスト"""
+        path = tmp_path / "hits.json"
+        monkeypatch.setenv("JOCKEY_HIT_COUNTS_FILE", str(path))
+
+        with TestClient(app) as client:
+            client.get("/api/jockey/05339")
+            client.get("/api/jockey/05339")
+            client.post("/api/jockeys:batch", json={"ids": ["05339"]})
+
+        assert json.loads(path.read_text(encoding="utf-8")) == {"05339": 3}
+
+    def test_failed_requests_are_not_counted(self, s3_accessor, tmp_path, monkeypatch):
+        """存在しない騎手IDへのリクエストは集計されないことのテスト"""
+        path = tmp_path / "hits.json"
+        monkeypatch.setenv("JOCKEY_HIT_COUNTS_FILE", str(path))
+
+        with TestClient(app) as client:
+            assert client.get("/api/jockey/99999").status_code == 404
+            client.post("/api/jockeys:batch", json={"ids": ["05339", "99999"]})
+
+        assert json.loads(path.read_text(encoding="utf-8")) == {"05339": 1}
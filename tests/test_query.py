@@ -0,0 +1,154 @@
+"""
+Jockey Query Unit Tests
+
+クエリパラメータの解析と、JockeyServiceでの列選択・行フィルタの適用をテストします。
+"""
+
+import os
+import pickle
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.infrastructure.storage_formats import STORAGE_FORMAT_PARQUET, serialize_dataframe
+from app.models.exceptions import InvalidQueryError
+from app.models.query import DEFAULT_QUERY, JockeyQuery, parse_jockey_query
+from app.services.jockey_service import JockeyService
+from tests.s3_stub import make_s3_accessor_mock
+
+
+@pytest.fixture
+def real_dataframe():
+    """実際のpickleファイルからDataFrameを読み込むフィクスチャ"""
+    pickle_path = os.path.join(os.path.dirname(__file__), "test_data.pickle")
+    with open(pickle_path, "rb") as f:
+        return pickle.load(f)
+
+
+class TestParseJockeyQuery:
+    """parse_jockey_queryのテストクラス"""
+
+    def test_no_parameters_returns_default(self):
+        """パラメータ未指定の場合にデフォルト条件となることのテスト"""
+        query = parse_jockey_query()
+
+        assert query == DEFAULT_QUERY
+        assert query.is_default
+        assert query.required_columns() is None
+
+    def test_parse_fields_and_filters(self):
+        """列名・等価条件の解析のテスト"""
+        query = parse_jockey_query(
+            fields="日付, 着 順,日付",
+            date_from=date(2025, 9, 1),
+            filters=["開催:船橋", "馬 場:良"],
+        )
+
+        assert query.fields == ("日付", "着 順")
+        assert query.filters == (("開催", "船橋"), ("馬 場", "良"))
+        assert query.required_columns() == ("日付", "着 順", "開催", "馬 場")
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"fields": " , "},
+            {"date_from": date(2025, 10, 2), "date_to": date(2025, 9, 1)},
+            {"filters": ["開催"]},
+            {"filters": [":船橋"]},
+        ],
+    )
+    def test_invalid_parameters_raise(self, kwargs):
+        """不正なパラメータでInvalidQueryErrorが発生することのテスト"""
+        with pytest.raises(InvalidQueryError):
+            parse_jockey_query(**kwargs)
+
+
+class TestJockeyServiceQuery:
+    """JockeyServiceの条件適用のテストクラス"""
+
+    @patch("app.services.jockey_service.get_s3_accessor")
+    def test_apply_date_range_and_filters(self, mock_get_s3_accessor, real_dataframe):
+        """日付範囲・等価条件・列選択が適用されることのテスト"""
+        mock_get_s3_accessor.return_value = MagicMock()
+        query = JockeyQuery(
+            fields=("着 順", "開催"),
+            date_from=date(2025, 9, 28),
+            date_to=date(2025, 9, 28),
+            filters=(("馬 場", "良"),),
+        )
+
+        result = JockeyService().apply_query(real_dataframe, query)
+
+        expected = real_dataframe[
+            (real_dataframe["日付"] == "2025-09-28") & (real_dataframe["馬 場"] == "良")
+        ]
+        assert list(result.columns) == ["着 順", "開催"]
+        assert result["着 順"].tolist() == expected["着 順"].tolist()
+
+    @patch("app.services.jockey_service.get_s3_accessor")
+    def test_numeric_filter(self, mock_get_s3_accessor, real_dataframe):
+        """数値列の等価条件が数値として比較されることのテスト"""
+        mock_get_s3_accessor.return_value = MagicMock()
+        first_place = real_dataframe["着 順"].iloc[0]
+        query = JockeyQuery(filters=(("着 順", str(first_place)),))
+
+        result = JockeyService().apply_query(real_dataframe, query)
+
+        assert len(result) == (real_dataframe["着 順"] == first_place).sum()
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            JockeyQuery(fields=("存在しない列",)),
+            JockeyQuery(filters=(("存在しない列", "1"),)),
+            JockeyQuery(filters=(("着 順", "一着"),)),
+        ],
+    )
+    @patch("app.services.jockey_service.get_s3_accessor")
+    def test_invalid_query_raises(self, mock_get_s3_accessor, query, real_dataframe):
+        """存在しない列や型に合わない値でInvalidQueryErrorが発生することのテスト"""
+        mock_get_s3_accessor.return_value = MagicMock()
+
+        with pytest.raises(InvalidQueryError):
+            JockeyService().apply_query(real_dataframe, query)
+
+    @patch("app.services.jockey_service.get_s3_accessor")
+    def test_columns_pushed_down_to_columnar_decode(
+        self, mock_get_s3_accessor, real_dataframe, monkeypatch
+    ):
+        """列単位の保存形式では必要な列のみがデコードされることのテスト"""
+        pytest.importorskip("pyarrow")
+        monkeypatch.setenv("JOCKEY_STORAGE_FORMAT", "parquet")
+        mock_s3_accessor = make_s3_accessor_mock()
+        mock_s3_accessor.get_object.return_value = serialize_dataframe(
+            real_dataframe, STORAGE_FORMAT_PARQUET
+        )
+        mock_get_s3_accessor.return_value = mock_s3_accessor
+        query = JockeyQuery(fields=("着 順",), filters=(("開催", "船橋"),))
+
+        service = JockeyService()
+        with patch.object(
+            service, "deserialize", wraps=service.deserialize
+        ) as mock_deserialize:
+            result = service.get_jockey_query_dataframe("05339", query)
+
+        assert mock_deserialize.call_args.args[3] == ("着 順", "開催")
+        assert list(result.columns) == ["着 順"]
+        assert len(result) == (real_dataframe["開催"] == "船橋").sum()
+
+    @patch("app.services.jockey_service.get_s3_accessor")
+    def test_unknown_column_in_columnar_decode(
+        self, mock_get_s3_accessor, real_dataframe, monkeypatch
+    ):
+        """列単位の保存形式で存在しない列を指定した場合にInvalidQueryErrorとなることのテスト"""
+        pytest.importorskip("pyarrow")
+        monkeypatch.setenv("JOCKEY_STORAGE_FORMAT", "parquet")
+        mock_s3_accessor = make_s3_accessor_mock()
+        mock_s3_accessor.get_object.return_value = serialize_dataframe(
+            real_dataframe, STORAGE_FORMAT_PARQUET
+        )
+        mock_get_s3_accessor.return_value = mock_s3_accessor
+
+        with pytest.raises(InvalidQueryError):
+            JockeyService().get_jockey_dataframe("05339", ["存在しない列"])
@@ -4,21 +4,27 @@ S3Accessor Unit Tests
 S3Accessorの基本機能をモックを使用してテストします。
 """
 
+from datetime import datetime, timezone
+from io import BytesIO
 from unittest.mock import MagicMock, patch
 
+import pandas as pd
 import pytest
 from botocore.exceptions import ClientError
 
-from app.infrastructure.s3_accessor import S3Accessor
+from app.infrastructure.s3_accessor import PoolUsage, S3Accessor, S3Object
+from app.infrastructure.storage_formats import deserialize_dataframe
 from app.models.exceptions import S3AccessError
+from app.models.page import ObjectVersion
 
 
 @pytest.fixture
 def mock_aws_clients():
     """AWS clientsのモックを提供するフィクスチャ"""
     mock_ssm = MagicMock()
-    mock_ssm.get_parameter.side_effect = lambda Name, WithDecryption: {
-        "Parameter": {"Value": f"mock_{Name}"}
+    mock_ssm.get_parameters.side_effect = lambda Names, WithDecryption: {
+        "Parameters": [{"Name": name, "Value": f"mock_{name}"} for name in Names],
+        "InvalidParameters": [],
     }
 
     mock_s3 = MagicMock()
@@ -93,3 +99,204 @@ class TestS3Accessor:
 
         with pytest.raises(S3AccessError):
             accessor.get_object("test.pickle")
+
+    @patch("app.infrastructure.s3_accessor.boto3")
+    def test_get_object_reads_into_preallocated_buffer(self, mock_boto3, mock_aws_clients):
+        """ContentLengthがある場合は事前確保したバッファにreadintoで読み込まれることのテスト"""
+        mock_ssm, mock_s3, client_factory = mock_aws_clients
+        mock_boto3.client.side_effect = client_factory
+
+        stream = BytesIO(b"test_data")
+        mock_body = MagicMock()
+        mock_body.readinto.side_effect = stream.readinto
+        mock_s3.get_object.return_value = {"Body": mock_body, "ContentLength": 9}
+
+        accessor = S3Accessor()
+        result = accessor.get_object("test.pickle")
+
+        assert result == bytearray(b"test_data")
+        mock_body.read.assert_not_called()
+        assert accessor.read_stats()["preallocated_requests"] == 1
+        assert accessor.read_stats()["max_allocated_bytes"] == 9
+
+    @patch("app.infrastructure.s3_accessor.boto3")
+    def test_get_object_incomplete_body(self, mock_boto3, mock_aws_clients):
+        """ボディがContentLengthより短い場合はS3AccessErrorとなることのテスト"""
+        mock_ssm, mock_s3, client_factory = mock_aws_clients
+        mock_boto3.client.side_effect = client_factory
+
+        stream = BytesIO(b"short")
+        mock_body = MagicMock()
+        mock_body.readinto.side_effect = stream.readinto
+        mock_s3.get_object.return_value = {"Body": mock_body, "ContentLength": 9}
+
+        with pytest.raises(S3AccessError):
+            S3Accessor().get_object("test.pickle")
+
+    @patch("app.infrastructure.s3_accessor.boto3")
+    def test_multipart_object_changed_during_download(
+        self, mock_boto3, mock_aws_clients, monkeypatch
+    ):
+        """パートの取得中にオブジェクトが更新された場合（IfMatchの不一致）はS3AccessErrorとなることのテスト"""
+        mock_ssm, mock_s3, client_factory = mock_aws_clients
+        mock_boto3.client.side_effect = client_factory
+        monkeypatch.setenv("S3_MULTIPART_THRESHOLD_BYTES", "65536")
+
+        first_body = MagicMock()
+        first_body.readinto.side_effect = BytesIO(b"x" * 65536).readinto
+        mock_s3.get_object.side_effect = [
+            {
+                "Body": first_body,
+                "ContentLength": 65536,
+                "ContentRange": "bytes 0-65535/100000",
+                "ETag": "\"v1\"",
+            },
+            ClientError({"Error": {"Code": "PreconditionFailed"}}, "GetObject"),
+        ]
+
+        with pytest.raises(S3AccessError):
+            S3Accessor().get_object("large.pickle")
+
+        assert mock_s3.get_object.call_args_list[0].kwargs["Range"] == "bytes=0-65535"
+        assert mock_s3.get_object.call_args_list[1].kwargs == {
+            "Bucket": "mock_BUCKET_NAME",
+            "Key": "large.pickle",
+            "Range": "bytes=65536-99999",
+            "IfMatch": "\"v1\"",
+        }
+
+    @patch("app.infrastructure.s3_accessor.boto3")
+    def test_get_object_with_metadata(self, mock_boto3, mock_aws_clients):
+        """オブジェクトとともにETag・最終更新日時が取得されることのテスト"""
+        mock_ssm, mock_s3, client_factory = mock_aws_clients
+        mock_boto3.client.side_effect = client_factory
+
+        last_modified = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        mock_body = MagicMock()
+        mock_body.read.return_value = b"test_data"
+        mock_s3.get_object.return_value = {
+            "Body": mock_body, "ETag": "\"abc\"", "LastModified": last_modified
+        }
+
+        result = S3Accessor().get_object_with_metadata("test.pickle")
+
+        assert result == S3Object(b"test_data", "\"abc\"", last_modified)
+        assert not result.not_modified
+
+    @patch("app.infrastructure.s3_accessor.boto3")
+    def test_get_object_with_metadata_not_modified(self, mock_boto3, mock_aws_clients):
+        """条件付き取得で304が返された場合にボディなしのS3Objectとなることのテスト"""
+        mock_ssm, mock_s3, client_factory = mock_aws_clients
+        mock_boto3.client.side_effect = client_factory
+
+        error_response = {
+            "Error": {"Code": "304", "Message": "Not Modified"},
+            "ResponseMetadata": {
+                "HTTPStatusCode": 304,
+                "HTTPHeaders": {
+                    "etag": "\"abc\"",
+                    "last-modified": "Wed, 01 Jan 2025 00:00:00 GMT",
+                },
+            },
+        }
+        mock_s3.get_object.side_effect = ClientError(error_response, "GetObject")
+
+        result = S3Accessor().get_object_with_metadata("test.pickle", if_none_match="\"abc\"")
+
+        assert result.not_modified
+        assert result.version == ObjectVersion(
+            "\"abc\"", datetime(2025, 1, 1, tzinfo=timezone.utc)
+        )
+        mock_s3.get_object.assert_called_once_with(
+            Bucket="mock_BUCKET_NAME", Key="test.pickle", IfNoneMatch="\"abc\""
+        )
+
+    @patch("app.infrastructure.s3_accessor.boto3")
+    def test_upload_dataframe_with_storage_format(self, mock_boto3, mock_aws_clients):
+        """指定形式でDataFrameがアップロードされることのテスト"""
+        pytest.importorskip("pyarrow")
+
+        mock_ssm, mock_s3, client_factory = mock_aws_clients
+        mock_boto3.client.side_effect = client_factory
+        df = pd.DataFrame({"着 順": [1, 2], "開催": ["船橋", "4中山9"]})
+
+        accessor = S3Accessor()
+        accessor.upload_dataframe(df, "05339.parquet", storage_format="parquet")
+
+        file_obj, bucket, key = mock_s3.upload_fileobj.call_args[0]
+        assert (bucket, key) == ("mock_BUCKET_NAME", "05339.parquet")
+        assert deserialize_dataframe(file_obj.getvalue(), "parquet").equals(df)
+
+    @patch("app.infrastructure.s3_accessor.boto3")
+    def test_client_config_from_env(self, mock_boto3, mock_aws_clients, monkeypatch):
+        """環境変数からコネクションプール・タイムアウト・リトライの設定を行うことのテスト"""
+        mock_ssm, mock_s3, client_factory = mock_aws_clients
+        mock_boto3.client.side_effect = client_factory
+        monkeypatch.setenv("S3_MAX_POOL_CONNECTIONS", "32")
+        monkeypatch.setenv("S3_CONNECT_TIMEOUT_SECONDS", "2.5")
+        monkeypatch.setenv("S3_READ_TIMEOUT_SECONDS", "10")
+        monkeypatch.setenv("S3_RETRY_MODE", "adaptive")
+        monkeypatch.setenv("S3_MAX_ATTEMPTS", "5")
+        monkeypatch.setenv("S3_TCP_KEEPALIVE", "false")
+
+        accessor = S3Accessor()
+
+        config = mock_boto3.client.call_args_list[-1].kwargs["config"]
+        assert config.max_pool_connections == 32
+        assert config.connect_timeout == 2.5
+        assert config.read_timeout == 10.0
+        assert config.retries == {"mode": "adaptive", "total_max_attempts": 5}
+        assert config.tcp_keepalive is False
+        assert accessor.pool_stats()["max_pool_connections"] == 32
+
+    @patch("app.infrastructure.s3_accessor.boto3")
+    def test_client_config_defaults(self, mock_boto3, mock_aws_clients, monkeypatch):
+        """不正なリトライ方式はデフォルト（standard）となり、キープアライブが有効となることのテスト"""
+        mock_ssm, mock_s3, client_factory = mock_aws_clients
+        mock_boto3.client.side_effect = client_factory
+        monkeypatch.setenv("S3_RETRY_MODE", "aggressive")
+
+        S3Accessor()
+
+        config = mock_boto3.client.call_args_list[-1].kwargs["config"]
+        assert config.max_pool_connections == 10
+        assert config.retries["mode"] == "standard"
+        assert config.tcp_keepalive is True
+
+    @patch("app.infrastructure.s3_accessor.boto3")
+    def test_get_object_tracks_pool_usage(self, mock_boto3, mock_aws_clients):
+        """オブジェクト取得がコネクションプールの使用状況に記録されることのテスト"""
+        mock_ssm, mock_s3, client_factory = mock_aws_clients
+        mock_boto3.client.side_effect = client_factory
+        accessor = S3Accessor()
+
+        def get_object(Bucket, Key):
+            # 取得中は実行中として数えられる
+            assert accessor.pool_stats()["in_flight"] == 1
+            body = MagicMock()
+            body.read.return_value = b"test_data"
+            return {"Body": body}
+
+        mock_s3.get_object.side_effect = get_object
+        accessor.get_object("test.pickle")
+
+        stats = accessor.pool_stats()
+        assert stats["in_flight"] == 0
+        assert stats["requests"] == 1
+        assert stats["peak_in_flight"] == 1
+
+
+class TestPoolUsage:
+    """PoolUsageのテストクラス"""
+
+    def test_saturated_requests(self):
+        """最大接続数以上の同時実行で飽和時のリクエスト数が記録されることのテスト"""
+        usage = PoolUsage(max_connections=2)
+
+        with usage.track(), usage.track(), usage.track():
+            assert usage.stats()["in_flight"] == 3
+
+        stats = usage.stats()
+        assert stats["in_flight"] == 0
+        assert stats["peak_in_flight"] == 3
+        assert stats["saturated_requests"] == 1
@@ -0,0 +1,205 @@
+"""
+S3 Config Tests
+
+S3Accessorの接続設定の解決（環境変数・設定キャッシュ・SSMのGetParameters）をテストします。
+"""
+
+import json
+import os
+import stat
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.infrastructure.s3_accessor import S3Accessor
+from app.infrastructure.s3_config import (
+    ConfigCache,
+    build_config_cache,
+    is_encryption_available,
+    resolve_s3_config,
+)
+from app.models.exceptions import SSMConfigError
+
+S3_CONFIG_ENV = {
+    "S3_ACCESS_KEY_ID": "env-access-key",
+    "S3_SECRET_ACCESS_KEY": "env-secret-key",
+    "S3_REGION_NAME": "ap-northeast-1",
+    "S3_BUCKET_NAME": "env-bucket",
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_config_env(monkeypatch):
+    """接続設定・設定キャッシュの環境変数を未設定にするフィクスチャ"""
+    for name in [*S3_CONFIG_ENV, "S3_CONFIG_CACHE_FILE", "S3_CONFIG_CACHE_KEY"]:
+        monkeypatch.delenv(name, raising=False)
+
+
+@pytest.fixture
+def mock_aws_clients():
+    """GetParametersに応答するSSMクライアントとS3クライアントのモックを提供するフィクスチャ"""
+    mock_ssm = MagicMock()
+    mock_ssm.get_parameters.side_effect = lambda Names, WithDecryption: {
+        "Parameters": [{"Name": name, "Value": f"mock_{name}"} for name in Names],
+        "InvalidParameters": [],
+    }
+    mock_s3 = MagicMock()
+
+    def client_factory(service_name, **kwargs):
+        return mock_ssm if service_name == "ssm" else mock_s3
+
+    with patch("app.infrastructure.s3_accessor.boto3") as mock_boto3:
+        mock_boto3.client.side_effect = client_factory
+        yield mock_boto3, mock_ssm
+
+
+def fetch_from(values):
+    """パラメータ名と値の辞書から取得する fetch_parameters のモック"""
+    return MagicMock(side_effect=lambda names: {name: values[name] for name in names})
+
+
+SSM_VALUES = {
+    "ACCESS_KEY": "ssm-access-key",
+    "SECRET_ACCESS_KEY": "ssm-secret-key",
+    "REGION_NAME": "us-west-2",
+    "BUCKET_NAME": "ssm-bucket",
+}
+
+
+class TestResolveS3Config:
+    """resolve_s3_configのテストクラス"""
+
+    def test_env_overrides_skip_ssm(self, monkeypatch):
+        """すべての項目が環境変数で指定された場合はSSMにアクセスしないことのテスト"""
+        for name, value in S3_CONFIG_ENV.items():
+            monkeypatch.setenv(name, value)
+        fetch = fetch_from(SSM_VALUES)
+
+        config, source = resolve_s3_config(fetch)
+
+        assert source == "env"
+        assert config.bucket_name == "env-bucket"
+        fetch.assert_not_called()
+
+    def test_partial_env_fetches_only_missing(self, monkeypatch):
+        """環境変数で指定されていない項目のみをSSMから取得することのテスト"""
+        monkeypatch.setenv("S3_BUCKET_NAME", "env-bucket")
+        fetch = fetch_from(SSM_VALUES)
+
+        config, source = resolve_s3_config(fetch)
+
+        assert source == "ssm"
+        assert config.bucket_name == "env-bucket"
+        assert config.region_name == "us-west-2"
+        fetch.assert_called_once_with(["ACCESS_KEY", "SECRET_ACCESS_KEY", "REGION_NAME"])
+
+    def test_cache_round_trip(self, tmp_path):
+        """SSMから取得した設定がキャッシュされ、2回目はSSMにアクセスしないことのテスト"""
+        cache = ConfigCache(str(tmp_path / "s3-config.json"), ttl_seconds=60)
+        fetch = fetch_from(SSM_VALUES)
+
+        first, first_source = resolve_s3_config(fetch, cache)
+        second, second_source = resolve_s3_config(fetch, cache)
+
+        assert (first_source, second_source) == ("ssm", "cache")
+        assert first == second
+        assert fetch.call_count == 1
+        assert stat.S_IMODE(os.stat(cache.path).st_mode) == 0o600
+
+    def test_expired_cache_refetches(self, tmp_path):
+        """有効期限の切れたキャッシュはミスとして扱われることのテスト"""
+        cache = ConfigCache(str(tmp_path / "s3-config.json"), ttl_seconds=-1)
+        fetch = fetch_from(SSM_VALUES)
+
+        resolve_s3_config(fetch, cache)
+        _, source = resolve_s3_config(fetch, cache)
+
+        assert source == "ssm"
+        assert fetch.call_count == 2
+
+
+@pytest.mark.skipif(not is_encryption_available(), reason="cryptography is not installed")
+class TestEncryptedConfigCache:
+    """暗号化した設定キャッシュのテストクラス"""
+
+    def test_encrypted_round_trip(self, tmp_path):
+        """暗号化したキャッシュが読み書きでき、ファイルに平文が含まれないことのテスト"""
+        from cryptography.fernet import Fernet
+
+        cache = ConfigCache(
+            str(tmp_path / "s3-config.bin"), ttl_seconds=60, key=Fernet.generate_key().decode()
+        )
+        cache.save({"secret_access_key": "ssm-secret-key"})
+
+        assert cache.encrypted
+        assert b"ssm-secret-key" not in (tmp_path / "s3-config.bin").read_bytes()
+        assert cache.load() == {"secret_access_key": "ssm-secret-key"}
+
+    def test_wrong_key_is_miss(self, tmp_path):
+        """異なるキーで暗号化されたキャッシュはミスとして扱われることのテスト"""
+        from cryptography.fernet import Fernet
+
+        path = str(tmp_path / "s3-config.bin")
+        ConfigCache(path, 60, Fernet.generate_key().decode()).save({"region_name": "x"})
+
+        assert ConfigCache(path, 60, Fernet.generate_key().decode()).load() is None
+
+    def test_invalid_key_disables_cache(self, tmp_path, monkeypatch):
+        """不正なキーが指定された場合はキャッシュが無効となることのテスト"""
+        monkeypatch.setenv("S3_CONFIG_CACHE_FILE", str(tmp_path / "s3-config.bin"))
+        monkeypatch.setenv("S3_CONFIG_CACHE_KEY", "not-a-fernet-key")
+
+        assert build_config_cache() is None
+
+
+class TestS3AccessorConfig:
+    """S3Accessorの初期化時の接続設定の取得のテストクラス"""
+
+    def test_single_get_parameters_call(self, mock_aws_clients):
+        """SSMパラメータが1回のGetParametersでまとめて取得されることのテスト"""
+        _, mock_ssm = mock_aws_clients
+
+        accessor = S3Accessor()
+
+        assert accessor.bucket_name == "mock_BUCKET_NAME"
+        mock_ssm.get_parameters.assert_called_once_with(
+            Names=["ACCESS_KEY", "SECRET_ACCESS_KEY", "REGION_NAME", "BUCKET_NAME"],
+            WithDecryption=True,
+        )
+        mock_ssm.get_parameter.assert_not_called()
+
+    def test_invalid_parameters(self, mock_aws_clients):
+        """存在しないパラメータがある場合はSSMConfigErrorとなることのテスト"""
+        _, mock_ssm = mock_aws_clients
+        mock_ssm.get_parameters.side_effect = None
+        mock_ssm.get_parameters.return_value = {
+            "Parameters": [],
+            "InvalidParameters": ["BUCKET_NAME"],
+        }
+
+        with pytest.raises(SSMConfigError, match="BUCKET_NAME"):
+            S3Accessor()
+
+    def test_env_overrides_skip_ssm_client(self, mock_aws_clients, monkeypatch):
+        """環境変数で上書きした場合はSSMクライアントを生成しないことのテスト"""
+        mock_boto3, mock_ssm = mock_aws_clients
+        for name, value in S3_CONFIG_ENV.items():
+            monkeypatch.setenv(name, value)
+
+        accessor = S3Accessor()
+
+        assert accessor.bucket_name == "env-bucket"
+        assert all(call.args[0] != "ssm" for call in mock_boto3.client.call_args_list)
+
+    def test_restart_uses_config_cache(self, mock_aws_clients, tmp_path, monkeypatch):
+        """再起動後の初期化ではキャッシュした設定を使用しSSMにアクセスしないことのテスト"""
+        _, mock_ssm = mock_aws_clients
+        path = tmp_path / "s3-config.json"
+        monkeypatch.setenv("S3_CONFIG_CACHE_FILE", str(path))
+
+        S3Accessor()
+        restarted = S3Accessor()
+
+        assert restarted.region_name == "mock_REGION_NAME"
+        assert mock_ssm.get_parameters.call_count == 1
+        assert json.loads(path.read_text())["values"]["bucket_name"] == "mock_BUCKET_NAME"
@@ -0,0 +1,125 @@
+"""
+Server-Timing Tests
+
+処理段階ごとの所要時間の計測（Server-Timingヘッダー・ヒストグラム）をテストします。
+"""
+
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.timing import (
+    RequestTimings,
+    StageHistogram,
+    end_request_timings,
+    get_stage_stats,
+    reset_stage_stats,
+    stage,
+    start_request_timings,
+)
+from app.main import app
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def clear_stage_stats():
+    """テスト間でヒストグラムが共有されないようにリセットするフィクスチャ"""
+    reset_stage_stats()
+    yield
+    reset_stage_stats()
+
+
+def parse_server_timing(value):
+    """Server-Timingヘッダーを処理段階の名前と所要時間（ミリ秒）の辞書に変換"""
+    stages = {}
+    for entry in value.split(","):
+        name, _, duration = entry.strip().partition(";dur=")
+        stages[name] = float(duration)
+    return stages
+
+
+class TestStageTiming:
+    """処理段階の計測のテストクラス"""
+
+    def test_stage_outside_request(self):
+        """リクエストのコンテキスト外でもヒストグラムに記録されることのテスト"""
+        with stage("s3"):
+            pass
+
+        assert get_stage_stats()["s3"]["count"] == 1
+
+    def test_stage_accumulates(self):
+        """同じ処理段階の所要時間が合計され、例外で終了した場合も記録されることのテスト"""
+        timings, token = start_request_timings()
+        try:
+            with stage("s3"):
+                pass
+            with pytest.raises(ValueError), stage("s3"):
+                raise ValueError("boom")
+        finally:
+            end_request_timings(token)
+
+        assert list(timings.stages()) == ["s3"]
+        assert get_stage_stats()["s3"]["count"] == 2
+
+    def test_server_timing_format(self):
+        """Server-Timingヘッダーの値がミリ秒で出力されることのテスト"""
+        timings = RequestTimings()
+        timings.add("s3", 0.0123)
+        timings.add("encode", 0.002)
+
+        assert timings.server_timing(0.02) == "s3;dur=12.3, encode;dur=2.0, total;dur=20.0"
+
+    def test_histogram_buckets(self):
+        """所要時間がバケットの上限以下の最初のバケットに数えられることのテスト"""
+        histogram = StageHistogram([1.0, 10.0])
+        for elapsed_ms in [0.5, 1.0, 5.0, 50.0]:
+            histogram.observe(elapsed_ms)
+
+        snapshot = histogram.snapshot()
+        assert snapshot["buckets"] == {"1": 2, "10": 1, "+Inf": 1}
+        assert (snapshot["count"], snapshot["sum_ms"]) == (4, 56.5)
+
+
+class TestServerTimingHeader:
+    """Server-Timingヘッダーのテストクラス"""
+
+    def test_raw_mode_stages(self, s3_accessor, monkeypatch):
+        """rawモードでS3取得・デシリアライズ・エンコードの所要時間が返却されることのテスト"""
+        monkeypatch.setenv("JOCKEY_RESPONSE_MODE", "raw")
+
+        response = client.get("/api/jockey/05339")
+
+        stages = parse_server_timing(response.headers["Server-Timing"])
+        assert {"s3", "deserialize", "query", "encode", "total"} <= set(stages)
+        assert stages["total"] >= stages["s3"]
+        stats = client.get("/health/stats").json()["stages"]
+        assert stats["s3"]["count"] == 1
+
+    def test_model_mode_response_stage(self, s3_accessor, monkeypatch):
+        """modelモードでFastAPIによるエンコードの所要時間が返却されることのテスト"""
+        monkeypatch.setenv("JOCKEY_RESPONSE_MODE", "model")
+
+        response = client.get("/api/jockey/05339")
+
+        stages = parse_server_timing(response.headers["Server-Timing"])
+        assert {"to_records", "response", "total"} <= set(stages)
+
+    def test_batch_stages(self, s3_accessor):
+        """一括取得でワーカースレッドの処理段階が記録されることのテスト"""
+        response = client.post("/api/jockeys:batch", json={"ids": ["05339", "01170"]})
+
+        stages = parse_server_timing(response.headers["Server-Timing"])
+        assert {"s3", "deserialize", "encode"} <= set(stages)
+
+    def test_disabled(self, s3_accessor, monkeypatch):
+        """JOCKEY_STAGE_TIMING=false の場合はヘッダーを返却せず、ヒストグラムには記録することのテスト"""
+        monkeypatch.setenv("JOCKEY_STAGE_TIMING", "false")
+
+        response = client.get("/api/jockey/05339")
+
+        assert response.status_code == 200
+        assert "Server-Timing" not in response.headers
+        assert {"s3", "deserialize", "encode"} <= set(get_stage_stats())
+        assert "total" not in get_stage_stats()
@@ -0,0 +1,321 @@
+"""
+SingleFlight Tests
+
+同一キーに対する同時呼び出しの集約と、JockeyServiceでの同時リクエストの集約をテストします。
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from app.core.single_flight import SingleFlight, _copy_error
+from app.infrastructure.s3_accessor import S3Object
+from app.models.exceptions import JockeyNotFoundError, SSMConfigError
+from app.models.query import JockeyQuery
+from app.services.jockey_service import JockeyService
+
+
+def wait_until(predicate, timeout=5.0):
+    """predicate が真になるまで待機"""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+class Gate:
+    """最初の呼び出しを処理の途中で止め、run_concurrently が開くまで待機させる"""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def wait(self):
+        """処理の開始を通知し、開かれるまで待機"""
+        self.started.set()
+        self.release.wait(timeout=5)
+
+    def wrap(self, func):
+        """待機してから func を同じ引数で実行する関数"""
+        def gated(*args):
+            self.wait()
+            return func(*args)
+        return gated
+
+
+def run_concurrently(flight, call, count, gate):
+    """
+    最初の call が gate で止まっている間に残りの call を開始し、それらが flight で
+    待機を始めてから gate を開く
+
+    Args:
+        flight: 呼び出しを集約するSingleFlight
+        call: 各スレッドで呼び出す関数
+        count: 呼び出し数
+        gate: 最初の呼び出しの処理中に待機するGate
+
+    Returns:
+        呼び出しごとの戻り値または例外のリスト
+    """
+    results = []
+
+    def target():
+        try:
+            results.append(call())
+        except Exception as e:
+            results.append(e)
+
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    threads[0].start()
+    gate.started.wait(timeout=5)
+    for t in threads[1:]:
+        t.start()
+    wait_until(lambda: flight.stats()["shared"] == count - 1)
+    gate.release.set()
+    for t in threads:
+        t.join(timeout=5)
+    return results
+
+
+def run_flight_concurrently(flight, key, func, count):
+    """同一キーの flight.do を count 個のスレッドから同時に呼び出す"""
+    gate = Gate()
+    return run_concurrently(flight, lambda: flight.do(key, gate.wrap(func)), count, gate)
+
+
+class TestSingleFlight:
+    """SingleFlightのテストクラス"""
+
+    def test_concurrent_calls_share_result(self):
+        """同一キーへの同時呼び出しで関数が1回のみ実行され、結果を共有することのテスト"""
+        flight = SingleFlight()
+        calls = []
+
+        results = run_flight_concurrently(flight, "a", lambda: calls.append(1) or ["value"], 4)
+
+        assert len(calls) == 1
+        assert results == [["value"]] * 4
+        assert all(result is results[0] for result in results)
+        assert flight.stats() == {"name": "single_flight", "in_flight": 0, "executions": 1, "shared": 3}
+
+    def test_concurrent_calls_share_error(self):
+        """関数の例外が待機中の呼び出しにも共有され、完了後の呼び出しでは再実行されることのテスト"""
+        flight = SingleFlight()
+
+        def fail():
+            raise ValueError("boom")
+
+        results = run_flight_concurrently(flight, "a", fail, 3)
+
+        assert [type(result) for result in results] == [ValueError] * 3
+        assert flight.do("a", lambda: "retried") == "retried"
+
+    def test_waiters_raise_copies_of_error(self):
+        """待機していた呼び出しには、元の例外を __cause__ とする別の例外オブジェクトが送出されることのテスト"""
+        flight = SingleFlight()
+
+        def fail():
+            raise ValueError("boom")
+
+        results = run_flight_concurrently(flight, "a", fail, 3)
+
+        originals = [result for result in results if result.__cause__ is None]
+        assert len(originals) == 1
+        copies = [result for result in results if result is not originals[0]]
+        assert len({id(result) for result in copies}) == 2
+        assert all(result.__cause__ is originals[0] for result in copies)
+        assert all(str(result) == "boom" for result in copies)
+
+    def test_domain_errors_keep_message(self):
+        """メッセージを組み立てる例外の複製でメッセージが二重にならないことのテスト"""
+        flight = SingleFlight()
+
+        def fail():
+            raise SSMConfigError("/jockey/bucket", ValueError("boom"))
+
+        results = run_flight_concurrently(flight, "a", fail, 3)
+
+        assert [str(result) for result in results] == [
+            "Failed to retrieve SSM parameter '/jockey/bucket': boom"
+        ] * 3
+        assert all(result.parameter_name == "/jockey/bucket" for result in results)
+
+    def test_client_error_is_shared(self):
+        """ClientError が待機中の呼び出しにもエラーコード・メッセージを保って送出されることのテスト"""
+        flight = SingleFlight()
+        error = ClientError({"Error": {"Code": "AccessDenied", "Message": "denied"}}, "GetObject")
+
+        def fail():
+            raise error
+
+        results = run_flight_concurrently(flight, "a", fail, 3)
+
+        assert [type(result) for result in results] == [ClientError] * 3
+        assert all(str(result) == str(error) for result in results)
+        assert all(result.response["Error"]["Code"] == "AccessDenied" for result in results)
+
+    def test_uncopyable_error_is_shared(self):
+        """コンストラクタの引数が args と異なり複製できない例外は、元の例外がそのまま送出されることのテスト"""
+        flight = SingleFlight()
+
+        class OperationError(Exception):
+            def __init__(self, code, operation):
+                super().__init__(f"{operation} failed with {code}")
+
+        error = OperationError("AccessDenied", "GetObject")
+
+        def fail():
+            raise error
+
+        results = run_flight_concurrently(flight, "a", fail, 3)
+
+        assert results == [error] * 3
+
+    def test_base_exceptions_are_not_copied(self):
+        """Exception 以外の例外は複製しないことのテスト"""
+        error = KeyboardInterrupt()
+
+        assert _copy_error(error) is error
+
+    def test_different_keys_are_not_shared(self):
+        """異なるキーの呼び出しは集約されないことのテスト"""
+        flight = SingleFlight()
+
+        assert flight.do("a", lambda: 1) == 1
+        assert flight.do("b", lambda: 2) == 2
+        assert flight.stats()["executions"] == 2
+
+    def test_async_calls_share_result(self):
+        """非同期版でも同一キーへの同時呼び出しで結果を共有することのテスト"""
+        flight = SingleFlight()
+        calls = []
+
+        async def load():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "value"
+
+        async def main():
+            return await asyncio.gather(*(flight.do_async("a", load) for _ in range(5)))
+
+        assert asyncio.run(main()) == ["value"] * 5
+        assert len(calls) == 1
+        assert flight.stats()["in_flight"] == 0
+
+    def test_async_calls_share_error(self):
+        """非同期版で例外が待機中の呼び出しにも共有されることのテスト"""
+        flight = SingleFlight()
+
+        async def load():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        async def main():
+            return await asyncio.gather(
+                *(flight.do_async("a", load) for _ in range(3)), return_exceptions=True
+            )
+
+        results = asyncio.run(main())
+
+        assert [type(result) for result in results] == [ValueError] * 3
+        assert results[0].__cause__ is None
+        assert all(result.__cause__ is results[0] for result in results[1:])
+
+    def test_cancelled_caller_does_not_cancel_shared_call(self):
+        """最初の呼び出し元がキャンセルされても、待機中の呼び出しは結果を受け取れることのテスト"""
+        flight = SingleFlight()
+
+        async def load():
+            await asyncio.sleep(0.05)
+            return "value"
+
+        async def main():
+            leader = asyncio.create_task(flight.do_async("a", load))
+            await asyncio.sleep(0)
+            follower = asyncio.create_task(flight.do_async("a", load))
+            await asyncio.sleep(0)
+            leader.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            return await follower
+
+        assert asyncio.run(main()) == "value"
+        assert flight.stats()["executions"] == 1
+
+
+@pytest.fixture
+def uncached_service(monkeypatch, s3_accessor):
+    """キャッシュを無効にしたJockeyService（集約の効果をキャッシュと区別するため）"""
+    monkeypatch.setenv("JOCKEY_CACHE_MAX_ENTRIES", "0")
+    monkeypatch.setenv("JOCKEY_RESPONSE_CACHE_MAX_ENTRIES", "0")
+    return JockeyService()
+
+
+class TestJockeyServiceCoalescing:
+    """JockeyServiceでの同時リクエストの集約のテストクラス"""
+
+    def test_get_jockey_data_fetches_once(self, uncached_service, pickle_data):
+        """同一騎手ID・条件への同時のget_jockey_dataでS3取得が1回のみ実行されることのテスト"""
+        gate = Gate()
+        uncached_service.s3_accessor.get_object.side_effect = gate.wrap(lambda key: pickle_data)
+        query = JockeyQuery(limit=3)
+
+        results = run_concurrently(
+            uncached_service.flights,
+            lambda: uncached_service.get_jockey_data("05339", query),
+            4,
+            gate,
+        )
+
+        assert uncached_service.s3_accessor.get_object.call_count == 1
+        assert len(results) == 4
+        assert all(result is results[0] for result in results)
+        assert len(results[0]) == 3
+
+    def test_get_jockey_data_shares_error(self, uncached_service):
+        """S3取得の例外が同時の呼び出しにも共有されることのテスト"""
+        gate = Gate()
+        uncached_service.s3_accessor.get_object.side_effect = gate.wrap(lambda key: None)
+
+        results = run_concurrently(
+            uncached_service.flights, lambda: uncached_service.get_jockey_data("99999"), 3, gate
+        )
+
+        assert [type(result) for result in results] == [JockeyNotFoundError] * 3
+        assert uncached_service.s3_accessor.get_object.call_count == 1
+
+    def test_cached_page_json_is_not_coalesced(self, s3_accessor):
+        """キャッシュ済みのレスポンスは集約を経由せずに返却されることのテスト"""
+        service = JockeyService()
+
+        first = service.get_jockey_page_json("05339")
+        executions = service.flights.stats()["executions"]
+
+        assert service.get_jockey_page_json("05339") is first
+        assert service.flights.stats()["executions"] == executions
+
+    def test_async_page_json_fetches_once(self, uncached_service, pickle_data):
+        """非同期版で同一騎手ID・条件への同時リクエストのS3取得が1回のみ実行されることのテスト"""
+        async def get_object(key, if_none_match=None):
+            await asyncio.sleep(0.01)
+            return S3Object(pickle_data) if key == "05339.pickle" else None
+
+        fetch = AsyncMock(side_effect=get_object)
+        uncached_service.s3_accessor.get_object_with_metadata_async = fetch
+
+        async def main():
+            return await asyncio.gather(
+                *(uncached_service.get_jockey_page_json_async(jockey_id)
+                  for jockey_id in ["05339"] * 4 + ["99999"] * 2),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(main())
+
+        assert fetch.await_count == 2
+        assert len({result.body for result in results[:4]}) == 1
+        assert [type(result) for result in results[4:]] == [JockeyNotFoundError] * 2
@@ -0,0 +1,130 @@
+"""
+Storage Formats Unit Tests
+
+pickle / Feather / Parquet 形式のシリアライズと、
+JockeyServiceの保存形式の切り替え・フォールバックをテストします。
+"""
+
+import os
+import pickle
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.infrastructure.storage_formats import (
+    STORAGE_FORMAT_FEATHER,
+    STORAGE_FORMAT_PARQUET,
+    STORAGE_FORMAT_PICKLE,
+    deserialize_dataframe,
+    serialize_dataframe,
+)
+from app.models.exceptions import JockeyNotFoundError
+from app.services.jockey_service import JockeyService
+from tests.s3_stub import make_s3_accessor_mock
+
+COLUMNAR_FORMATS = [STORAGE_FORMAT_FEATHER, STORAGE_FORMAT_PARQUET]
+
+
+@pytest.fixture
+def real_dataframe():
+    """実際のpickleファイルからDataFrameを読み込むフィクスチャ"""
+    pickle_path = os.path.join(os.path.dirname(__file__), "test_data.pickle")
+    with open(pickle_path, "rb") as f:
+        return pickle.load(f)
+
+
+class TestStorageFormats:
+    """保存形式ごとのシリアライズのテストクラス"""
+
+    @pytest.mark.parametrize("storage_format", [STORAGE_FORMAT_PICKLE, *COLUMNAR_FORMATS])
+    def test_round_trip(self, storage_format, real_dataframe):
+        """シリアライズ → デシリアライズで元のDataFrameと一致することのテスト"""
+        if storage_format != STORAGE_FORMAT_PICKLE:
+            pytest.importorskip("pyarrow")
+
+        data = serialize_dataframe(real_dataframe, storage_format)
+        result = deserialize_dataframe(data, storage_format)
+
+        assert result.equals(real_dataframe)
+        assert result.dtypes.equals(real_dataframe.dtypes)
+
+    @pytest.mark.parametrize("storage_format", COLUMNAR_FORMATS)
+    def test_column_projection(self, storage_format, real_dataframe):
+        """指定した列のみが読み込まれることのテスト"""
+        pytest.importorskip("pyarrow")
+
+        data = serialize_dataframe(real_dataframe, storage_format)
+        result = deserialize_dataframe(data, storage_format, columns=["日付", "着 順"])
+
+        assert list(result.columns) == ["日付", "着 順"]
+        assert result["着 順"].tolist() == real_dataframe["着 順"].tolist()
+
+    def test_unknown_format_raises(self, real_dataframe):
+        """未知の形式で例外が発生することのテスト"""
+        with pytest.raises(ValueError):
+            serialize_dataframe(real_dataframe, "csv")
+
+
+class TestJockeyServiceStorageFormats:
+    """JockeyServiceの保存形式切り替えのテストクラス"""
+
+    @patch("app.services.jockey_service.get_s3_accessor")
+    def test_generate_s3_key_per_format(self, mock_get_s3_accessor):
+        """保存形式ごとのS3キー生成のテスト"""
+        mock_get_s3_accessor.return_value = MagicMock()
+
+        service = JockeyService()
+
+        assert service._generate_s3_key("05339", STORAGE_FORMAT_PARQUET) == "05339.parquet"
+        assert service._generate_s3_key("05339", STORAGE_FORMAT_FEATHER) == "05339.feather"
+
+    @patch("app.services.jockey_service.get_s3_accessor")
+    def test_reads_preferred_columnar_format(
+        self, mock_get_s3_accessor, real_dataframe, monkeypatch
+    ):
+        """優先形式のオブジェクトを読み込み、pickleと同一のJSONを返すことのテスト"""
+        pytest.importorskip("pyarrow")
+        monkeypatch.setenv("JOCKEY_STORAGE_FORMAT", "parquet")
+        mock_s3_accessor = make_s3_accessor_mock()
+        mock_s3_accessor.get_object.return_value = serialize_dataframe(
+            real_dataframe, STORAGE_FORMAT_PARQUET
+        )
+        mock_get_s3_accessor.return_value = mock_s3_accessor
+
+        service = JockeyService()
+        body = service.get_jockey_data_json("05339")
+
+        assert body == service.dataframe_to_json_bytes(real_dataframe, "05339")
+        mock_s3_accessor.get_object.assert_called_once_with("05339.parquet")
+
+    @patch("app.services.jockey_service.get_s3_accessor")
+    def test_falls_back_to_pickle(
+        self, mock_get_s3_accessor, real_dataframe, monkeypatch
+    ):
+        """優先形式のオブジェクトが存在しない場合にpickleを読み込むことのテスト"""
+        pytest.importorskip("pyarrow")
+        monkeypatch.setenv("JOCKEY_STORAGE_FORMAT", "feather")
+        mock_s3_accessor = make_s3_accessor_mock()
+        mock_s3_accessor.get_object.side_effect = [None, pickle.dumps(real_dataframe)]
+        mock_get_s3_accessor.return_value = mock_s3_accessor
+
+        df = JockeyService().get_jockey_dataframe("05339")
+
+        assert df.equals(real_dataframe)
+        keys = [call.args[0] for call in mock_s3_accessor.get_object.call_args_list]
+        assert keys == ["05339.feather", "05339.pickle"]
+
+    @patch("app.services.jockey_service.get_s3_accessor")
+    def test_pickle_fallback_disabled(self, mock_get_s3_accessor, monkeypatch):
+        """pickleフォールバック無効時はpickleを読み込まずに404となることのテスト"""
+        pytest.importorskip("pyarrow")
+        monkeypatch.setenv("JOCKEY_STORAGE_FORMAT", "parquet")
+        monkeypatch.setenv("JOCKEY_STORAGE_PICKLE_FALLBACK", "false")
+        mock_s3_accessor = make_s3_accessor_mock()
+        mock_s3_accessor.get_object.return_value = None
+        mock_get_s3_accessor.return_value = mock_s3_accessor
+
+        with pytest.raises(JockeyNotFoundError):
+            JockeyService().get_jockey_dataframe("05339")
+
+        mock_s3_accessor.get_object.assert_called_once_with("05339.parquet")